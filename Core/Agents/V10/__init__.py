@@ -16,6 +16,7 @@ from .llm_provider_decorator import (
     openai_llm_provider,
     local_llm_provider,
     local_subprocess_llm_provider,
+    cached_llm_provider,
     LLMProviderDecorator,
     LLMProviderType,
     LLMRequest,
@@ -43,6 +44,7 @@ __all__ = [
     'openai_llm_provider',
     'local_llm_provider',
     'local_subprocess_llm_provider',
+    'cached_llm_provider',
     'LLMProviderDecorator',
     'LLMProviderType',
     'LLMRequest',
@@ -8,7 +8,7 @@ Créé par Alma, Architecte Démoniaque du Nexus Luciforme.
 """
 
 import asyncio
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -31,10 +31,16 @@ class V10Response:
 class V10Assistant:
     """Assistant principal V10 avec orchestration multi-agents."""
     
-    def __init__(self):
-        """Initialise l'Assistant V10."""
+    def __init__(self, on_llm_chunk: Optional[Callable] = None):
+        """
+        Initialise l'Assistant V10.
+        
+        Args:
+            on_llm_chunk: Appelé avec (étape, StreamChunk) dès que le LLM produit
+                un fragment, avant la fin de la génération
+        """
         self.temporal_integration = V10TemporalIntegration()
-        self.dev_agent = V10DevAgent(self.temporal_integration)
+        self.dev_agent = V10DevAgent(self.temporal_integration, on_llm_chunk=on_llm_chunk)
         self.tool_agent = V10ToolAgent(self.temporal_integration)
         self.session_id = None
         self.user_id = None
@@ -215,9 +221,9 @@ class V10Assistant:
 
 
 # Interface simplifiée pour utilisation directe
-async def create_v10_assistant(user_id: str) -> V10Assistant:
+async def create_v10_assistant(user_id: str, on_llm_chunk: Optional[Callable] = None) -> V10Assistant:
     """Crée et initialise un Assistant V10."""
-    assistant = V10Assistant()
+    assistant = V10Assistant(on_llm_chunk=on_llm_chunk)
     success = await assistant.initialize(user_id)
     
     if not success:
@@ -8,7 +8,7 @@ Créé par Alma, Architecte Démoniaque du Nexus Luciforme.
 """
 
 import asyncio
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -61,8 +61,14 @@ class ExecutionResult:
 class V10DevAgent:
     """Agent spécialisé dans le raisonnement métier et la logique de développement."""
     
-    def __init__(self, temporal_integration: V10TemporalIntegration, llm_provider: Any = None):
-        """Initialise l'agent développeur."""
+    def __init__(self, temporal_integration: V10TemporalIntegration, llm_provider: Any = None,
+                 on_llm_chunk: Optional[Callable] = None):
+        """
+        Initialise l'agent développeur.
+        
+        Args:
+            on_llm_chunk: Appelé avec (étape, StreamChunk) à chaque fragment LLM streamé
+        """
         self.temporal_integration = temporal_integration
         self.context_manager = V10ContextManager()
         self.planning_engine = V10PlanningEngine()
@@ -71,6 +77,7 @@ class V10DevAgent:
         self._llm_mode = get_llm_mode()
         self.llm_provider = llm_provider
         self._llm_ready = llm_provider is not None
+        self.on_llm_chunk = on_llm_chunk
     
     async def initialize_session(self, user_id: str) -> None:
         """Initialise une session pour l'utilisateur."""
@@ -96,6 +103,10 @@ class V10DevAgent:
             }.get(self._llm_mode, "gemini")
             # Config de base minimale
             default_cfg = ProviderFactory.create_default_config(provider_type)
+            # Priorité interactive : passe devant la réflexion de fond si LLM_SCHEDULER est actif.
+            # Le cache (LLM_CACHE) est appliqué par la factory ; les appels de l'agent
+            # (température 0.7) ne sont cachés que si LLM_CACHE_MAX_TEMPERATURE >= 0.7.
+            default_cfg.setdefault("priority", "interactive")
             self.llm_provider, validation = await ProviderFactory.create_and_validate_provider(provider_type, **default_cfg)
             if not validation.valid:
                 print(f"⚠️ Validation provider échouée: {validation.error} ({validation.provider_type}) - fallback mock")
@@ -109,6 +120,20 @@ class V10DevAgent:
             self.llm_provider = None
             self._llm_mode = "mock"
     
+    async def _llm_complete(self, llm_prompt: str, step: str, max_tokens: int) -> Any:
+        """Appel LLM réel, streamé quand le provider le permet."""
+        provider = self.llm_provider
+        if hasattr(provider, 'generate_streaming'):
+            def on_chunk(chunk):
+                if chunk.index == 0:
+                    print(f"⚡ Dev Agent ({step}): premier token après {chunk.elapsed:.2f}s")
+                if self.on_llm_chunk is not None:
+                    return self.on_llm_chunk(step, chunk)
+            return await provider.generate_streaming(llm_prompt, on_chunk=on_chunk, max_tokens=max_tokens)
+        if hasattr(provider, 'generate_text'):
+            return await provider.generate_text(llm_prompt, max_tokens=max_tokens)
+        return await provider.generate_response(llm_prompt, max_tokens=max_tokens)
+    
     @mock_llm_provider
     async def analyze_task(self, user_request: str, prompt: str = "", model: str = "gpt-4", temperature: float = 0.7) -> TaskAnalysis:
         """Analyse la tâche utilisateur et crée un plan d'action."""
@@ -138,11 +163,12 @@ Tu es un agent développeur. Analyse la requête suivante et propose un type de
 REQUÊTE: {user_request}
 CONTEXTE: {context}
 """
-                resp = await self.llm_provider.generate_text(llm_prompt, max_tokens=256)
+                resp = await self._llm_complete(llm_prompt, "analyze_task", max_tokens=256)
                 # Pour l’instant, on n’exige pas de parsing strict; trace seulement
                 await self.temporal_integration.create_temporal_node(
                     content="LLM Enrichment (analyze_task)",
-                    metadata={"provider": "real", "excerpt": getattr(resp, 'content', '')[:200]},
+                    metadata={"provider": "real", "excerpt": getattr(resp, 'content', '')[:200],
+                              "first_token_latency": (getattr(resp, 'metadata', None) or {}).get('first_token_latency')},
                     session_id=self.session_id
                 )
             except Exception as e:
@@ -188,10 +214,11 @@ CONTEXTE: {context}
         if self.llm_provider is not None and self._llm_mode != "mock":
             try:
                 llm_prompt = prompt or f"Refine this plan steps for: {task_analysis.task_type}."
-                resp = await self.llm_provider.generate_text(llm_prompt, max_tokens=200)
+                resp = await self._llm_complete(llm_prompt, "create_execution_plan", max_tokens=200)
                 await self.temporal_integration.create_temporal_node(
                     content="LLM Enrichment (create_execution_plan)",
-                    metadata={"provider": "real", "excerpt": getattr(resp, 'content', '')[:200]},
+                    metadata={"provider": "real", "excerpt": getattr(resp, 'content', '')[:200],
+                              "first_token_latency": (getattr(resp, 'metadata', None) or {}).get('first_token_latency')},
                     session_id=self.session_id
                 )
             except Exception as e:
@@ -360,10 +387,11 @@ CONTEXTE: {context}
         if self.llm_provider is not None and self._llm_mode != "mock":
             try:
                 llm_prompt = prompt or f"Synthétise en 3 phrases clés ces résultats: {synthesis}"
-                resp = await self.llm_provider.generate_text(llm_prompt, max_tokens=180)
+                resp = await self._llm_complete(llm_prompt, "synthesize_results", max_tokens=180)
                 await self.temporal_integration.create_temporal_node(
                     content="LLM Enrichment (synthesize_results)",
-                    metadata={"provider": "real", "excerpt": getattr(resp, 'content', '')[:200]},
+                    metadata={"provider": "real", "excerpt": getattr(resp, 'content', '')[:200],
+                              "first_token_latency": (getattr(resp, 'metadata', None) or {}).get('first_token_latency')},
                     session_id=self.session_id
                 )
             except Exception as e:
@@ -247,6 +247,19 @@ def local_subprocess_llm_provider(func: Callable) -> Callable:
     return decorator(func)
 
 
+def cached_llm_provider(provider: Any, **cache_options) -> Any:
+    """
+    Enveloppe un LLMProvider réel dans le cache de réponses adressé par contenu.
+    
+    Les options (max_temperature, max_entries, cache_dir, ttl, persist) sont
+    celles de CachedLLMProvider ; seuls les appels à température au plus
+    max_temperature (défaut : LLM_CACHE_MAX_TEMPERATURE) sont cachés.
+    """
+    from Core.Providers.LLMProviders.cached_provider import with_response_cache, get_llm_cache_max_temperature
+    cache_options.setdefault('max_temperature', get_llm_cache_max_temperature())
+    return with_response_cache(provider, **cache_options)
+
+
 # Utilitaire pour configurer les réponses mock
 class MockResponseConfigurator:
     """Configurateur de réponses mock pour V10."""
@@ -7,6 +7,10 @@ Environment variables:
 - LLM_MODE: "auto" | "gemini" | "openai" | "local_http" | "local_subprocess" | "mock" (default: auto)
 - TEMPORAL_ENGINE: "on" | "off" (default: "off")
 - MCP_ENABLED: "1" | "0" | "true" | "false" (default: "0")
+- LLM_CACHE: "1" | "0" | "true" | "false" (default: "0") — response cache for deterministic LLM calls
+- LLM_CACHE_MAX_TEMPERATURE: float (default: 0.0) — highest sampling temperature still served from the response cache
+- LLM_SCHEDULER: "1" | "0" | "true" | "false" (default: "0") — shared admission/coalescing scheduler for LLM calls
+- LLM_MAX_IN_FLIGHT: integer (default: 2) — concurrent calls admitted per model host by the scheduler
 """
 from __future__ import annotations
 import os
@@ -48,6 +52,28 @@ def is_mcp_enabled() -> bool:
     """Whether MCP integration should be attempted at runtime."""
     return _get_env_bool("MCP_ENABLED", default=False)
 
+def is_llm_cache_enabled() -> bool:
+    """Whether real LLM providers are wrapped in the content-addressed response cache."""
+    return _get_env_bool("LLM_CACHE", default=False)
+
+def get_llm_cache_max_temperature() -> float:
+    """Highest temperature whose generations are cached (hotter calls bypass the cache)."""
+    try:
+        return max(0.0, float(os.getenv("LLM_CACHE_MAX_TEMPERATURE", "0")))
+    except ValueError:
+        return 0.0
+
+def is_llm_scheduler_enabled() -> bool:
+    """Whether LLM providers share a scheduler (max in-flight, priorities, in-flight prompt coalescing)."""
+    return _get_env_bool("LLM_SCHEDULER", default=False)
+
+def get_llm_max_in_flight() -> int:
+    """Concurrent LLM calls admitted per scheduler (per model host)."""
+    try:
+        return max(1, int(os.getenv("LLM_MAX_IN_FLIGHT", "2")))
+    except ValueError:
+        return 2
+
 def allow_mock_fallback() -> bool:
     """Whether mock LLM fallback is allowed outside explicit mock mode.
 
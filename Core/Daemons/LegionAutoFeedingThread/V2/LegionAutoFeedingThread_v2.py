@@ -294,7 +294,8 @@ class LegionAutoFeedingThread(BaseAutoFeedingThread):
                     "model": "qwen2.5:7b-instruct",
                     "ollama_host": "http://localhost:11434",
                     "timeout": 60,
-                    "temperature": 0.666  # Rituel démoniaque
+                    "temperature": 0.666,  # Rituel démoniaque
+                    "priority": "background"  # Cède la place aux appels interactifs (LLM_SCHEDULER)
                 }
                 self.provider = ProviderFactory.create_provider("local", **config)
                 self.log_debug_action("provider_initialized", {
@@ -324,7 +325,8 @@ class LegionAutoFeedingThread(BaseAutoFeedingThread):
                     "model": "qwen2.5:7b-instruct",
                     "ollama_host": "http://localhost:11434",
                     "timeout": 60,
-                    "temperature": 0.666
+                    "temperature": 0.666,
+                    "priority": "background"
                 }
                 self.provider = ProviderFactory.create_provider("local", **config)
                 self.log_debug_action("provider_async_initialized", {"status": "success"})
@@ -337,13 +339,7 @@ class LegionAutoFeedingThread(BaseAutoFeedingThread):
             await self._initialize_provider()
             
             if self.provider:
-                response = await self.provider.generate_response(prompt)
-                daemon_response = response.content if hasattr(response, 'content') else str(response)
-                self.log_debug_action("llm_call_success", {
-                    "prompt_length": len(prompt),
-                    "response_length": len(daemon_response)
-                })
-                return daemon_response
+                return await self._generate_with_provider(prompt)
             else:
                 # Mode mock
                 mock_response = self._generate_mock_response("mock_input")
@@ -13,7 +13,7 @@ from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from collections import OrderedDict
 
-from Core.LLMProviders import LLMProvider
+from Core.Providers.LLMProviders import LLMProvider
 from .intelligent_parser import IntrospectiveMessage
 
 
@@ -12,7 +12,7 @@ import time
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict, field
 
-from Core.LLMProviders import LLMProvider
+from Core.Providers.LLMProviders import LLMProvider, with_response_cache_if_enabled
 
 
 @dataclass
@@ -70,7 +70,8 @@ class IntelligentIntrospectiveParser:
     """Parser intelligent basé sur l'analyse sémantique"""
     
     def __init__(self, provider: LLMProvider):
-        self.provider = provider
+        # Cache de réponses si LLM_CACHE est actif (températures ≤ LLM_CACHE_MAX_TEMPERATURE)
+        self.provider = with_response_cache_if_enabled(provider)
         self.analysis_prompt = self._create_analysis_prompt()
     
     def _create_analysis_prompt(self) -> str:
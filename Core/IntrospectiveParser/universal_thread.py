@@ -12,7 +12,7 @@ from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 from collections import deque
 
-from Core.LLMProviders import LLMProvider
+from Core.Providers.LLMProviders import LLMProvider
 from .intelligent_parser import IntelligentIntrospectiveParser, IntrospectiveMessage
 from .intelligent_cache import IntelligentCache
 
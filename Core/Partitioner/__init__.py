@@ -48,6 +48,7 @@ from .ast_partitioners.tree_sitter_partitioner import TreeSitterPartitioner
 from .fallback_strategies.emergency_partitioner import EmergencyPartitioner
 from .fallback_strategies.regex_partitioner import RegexPartitioner
 from .fallback_strategies.textual_partitioner import TextualPartitioner
+from .fallback_strategies.streaming_partitioner import StreamingPartitioner
 
 # Variables globales
 global_error_logger = PartitioningErrorLogger()
@@ -58,6 +59,10 @@ def partition_file(file_path: str, **kwargs):
     """Fonction utilitaire pour partitionner un fichier"""
     return global_language_registry.partition_file(file_path, **kwargs)
 
+def partition_files(file_paths, workers: int = 1, **kwargs):
+    """Fonction utilitaire pour partitionner un lot de fichiers (en parallèle si workers > 1)"""
+    return global_language_registry.partition_files(file_paths, workers=workers, **kwargs)
+
 def detect_language(file_path: str) -> str:
     """Fonction utilitaire pour détecter le langage"""
     return global_language_registry.detect_language(file_path)
@@ -114,9 +119,11 @@ __all__ = [
     'EmergencyPartitioner',
     'RegexPartitioner',
     'TextualPartitioner',
+    'StreamingPartitioner',
     
     # Fonctions utilitaires
     'partition_file',
+    'partition_files',
     'detect_language',
     'get_supported_languages',
 ]
@@ -5,12 +5,15 @@ Ce module contient tous les analyseurs d'imports et de dépendances du système
 """
 
 from .import_analyzer import ImportAnalyzer, ImportAnalysisResult, DependencyGraph
-from .import_analysis_cache import ImportAnalysisCache, ImportAnalysisOptimizer
+from .graph_index import IndexedGraph
+from .import_analysis_cache import ImportAnalysisCache, ImportAnalysisOptimizer, PersistentImportCache
 
 __all__ = [
     'ImportAnalyzer',
     'ImportAnalysisResult',
     'DependencyGraph',
+    'IndexedGraph',
     'ImportAnalysisCache',
-    'ImportAnalysisOptimizer'
+    'ImportAnalysisOptimizer',
+    'PersistentImportCache'
 ] 
\ No newline at end of file
@@ -0,0 +1,283 @@
+"""
+🕸️ Graphe orienté indexé par entiers pour les requêtes de dépendances
+
+Chaque nœud (chemin de fichier) reçoit un identifiant entier à son insertion ;
+l'adjacence est une liste de listes d'entiers. Tous les parcours sont
+itératifs (aucune récursion, donc aucune limite de profondeur) et linéaires
+en nœuds + arêtes :
+
+- composantes fortement connexes (Tarjan itératif) et cycles concrets,
+- plus court chemin (BFS) et accessibilité, dans les deux sens,
+- couches topologiques sur le graphe condensé des composantes.
+
+Les composantes sont mémorisées jusqu'à la prochaine mutation du graphe.
+
+Créé par Alma, Architecte Démoniaque du Nexus Luciforme.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+class IndexedGraph:
+    """Graphe orienté à adjacence entière, sans doublon d'arêtes."""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.names: List[str] = []
+        self.adjacency: List[List[int]] = []
+        self._edge_set: Set[Tuple[int, int]] = set()
+        self._reverse: Optional[List[List[int]]] = None
+        self._components: Optional[List[List[int]]] = None
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple[str, str]], nodes: Iterable[str] = ()) -> 'IndexedGraph':
+        """Construit un graphe depuis des nœuds isolés et des arêtes (source, cible)."""
+        graph = cls()
+        for node in nodes:
+            graph.add_node(node)
+        for source, target in edges:
+            graph.add_edge(source, target)
+        return graph
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, node: str) -> bool:
+        return node in self.ids
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._edge_set)
+
+    def _invalidate(self):
+        self._reverse = None
+        self._components = None
+
+    def add_node(self, node: str) -> int:
+        """Identifiant entier d'un nœud (créé au besoin)."""
+        node_id = self.ids.get(node)
+        if node_id is None:
+            node_id = len(self.names)
+            self.ids[node] = node_id
+            self.names.append(node)
+            self.adjacency.append([])
+            self._invalidate()
+        return node_id
+
+    def add_edge(self, source: str, target: str) -> bool:
+        """Ajoute l'arête source → cible ; False si elle existait déjà."""
+        edge = (self.add_node(source), self.add_node(target))
+        if edge in self._edge_set:
+            return False
+        self._edge_set.add(edge)
+        self.adjacency[edge[0]].append(edge[1])
+        self._invalidate()
+        return True
+
+    def _reverse_adjacency(self) -> List[List[int]]:
+        if self._reverse is None:
+            reverse = [[] for _ in self.names]
+            for source, targets in enumerate(self.adjacency):
+                for target in targets:
+                    reverse[target].append(source)
+            self._reverse = reverse
+        return self._reverse
+
+    # ----- Composantes fortement connexes -----
+
+    def _strongly_connected_ids(self) -> List[List[int]]:
+        """Tarjan itératif ; composantes émises puits d'abord (ordre topologique inverse)."""
+        if self._components is not None:
+            return self._components
+
+        adjacency = self.adjacency
+        count = len(adjacency)
+        index = [-1] * count
+        low = [0] * count
+        on_stack = [False] * count
+        stack: List[int] = []
+        components: List[List[int]] = []
+        counter = 0
+
+        for root in range(count):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            # Pile d'appels explicite : (nœud, position dans ses successeurs)
+            work = [(root, 0)]
+            while work:
+                node, position = work[-1]
+                successors = adjacency[node]
+                if position < len(successors):
+                    work[-1] = (node, position + 1)
+                    successor = successors[position]
+                    if index[successor] == -1:
+                        index[successor] = low[successor] = counter
+                        counter += 1
+                        stack.append(successor)
+                        on_stack[successor] = True
+                        work.append((successor, 0))
+                    elif on_stack[successor] and index[successor] < low[node]:
+                        low[node] = index[successor]
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+        self._components = components
+        return components
+
+    def strongly_connected_components(self, include_trivial: bool = False) -> List[List[str]]:
+        """
+        Composantes fortement connexes, puits d'abord.
+
+        Args:
+            include_trivial: Inclure aussi les nœuds isolés hors de tout cycle
+        """
+        names = self.names
+        return [
+            sorted(names[member] for member in component)
+            for component in self._strongly_connected_ids()
+            if include_trivial or self._is_cyclic(component)
+        ]
+
+    def _is_cyclic(self, component: List[int]) -> bool:
+        if len(component) > 1:
+            return True
+        node = component[0]
+        return node in self.adjacency[node]
+
+    def _cycle_in_component(self, component: List[int]) -> List[int]:
+        """Plus court cycle passant par le plus petit nœud de la composante."""
+        members = set(component)
+        start = min(component, key=self.names.__getitem__)
+        parents = {start: None}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for successor in self.adjacency[node]:
+                if successor == start:
+                    cycle = [start]
+                    while node is not None:
+                        cycle.append(node)
+                        node = parents[node]
+                    cycle.reverse()
+                    return cycle
+                if successor in members and successor not in parents:
+                    parents[successor] = node
+                    queue.append(successor)
+        return []
+
+    def cycles(self) -> List[List[str]]:
+        """
+        Un cycle concret par composante cyclique, fermé ([a, b, ..., a]).
+
+        Chaque cycle démarre sur le plus petit chemin de sa composante ; la
+        liste est triée pour un rapport déterministe.
+        """
+        names = self.names
+        cycles = [
+            [names[node] for node in self._cycle_in_component(component)]
+            for component in self._strongly_connected_ids()
+            if self._is_cyclic(component)
+        ]
+        return sorted(cycles)
+
+    # ----- Chemins et accessibilité -----
+
+    def shortest_path(self, source: str, target: str) -> List[str]:
+        """Plus court chemin source → cible (BFS), [] si aucun."""
+        source_id, target_id = self.ids.get(source), self.ids.get(target)
+        if source_id is None or target_id is None:
+            return []
+        if source_id == target_id:
+            return [source]
+
+        parents = [-1] * len(self.names)
+        parents[source_id] = source_id
+        queue = deque([source_id])
+        adjacency = self.adjacency
+        while queue:
+            node = queue.popleft()
+            for successor in adjacency[node]:
+                if parents[successor] != -1:
+                    continue
+                parents[successor] = node
+                if successor == target_id:
+                    path = [successor]
+                    while path[-1] != source_id:
+                        path.append(parents[path[-1]])
+                    path.reverse()
+                    return [self.names[node_id] for node_id in path]
+                queue.append(successor)
+        return []
+
+    def reachable(self, source: str, reverse: bool = False) -> Set[str]:
+        """
+        Nœuds accessibles depuis source (source exclue sauf si elle est sur un cycle).
+
+        Args:
+            reverse: Suivre les arêtes à l'envers (fichiers qui dépendent de source)
+        """
+        source_id = self.ids.get(source)
+        if source_id is None:
+            return set()
+        adjacency = self._reverse_adjacency() if reverse else self.adjacency
+        seen = [False] * len(self.names)
+        stack = list(adjacency[source_id])
+        reached = []
+        while stack:
+            node = stack.pop()
+            if seen[node]:
+                continue
+            seen[node] = True
+            reached.append(node)
+            stack.extend(adjacency[node])
+        return {self.names[node] for node in reached}
+
+    def topological_layers(self) -> List[List[str]]:
+        """
+        Couches topologiques du graphe condensé, dépendances d'abord.
+
+        La couche 0 contient les nœuds sans dépendance ; un nœud est placé une
+        couche au-dessus de sa dépendance la plus haute. Les membres d'un même
+        cycle partagent la même couche.
+        """
+        components = self._strongly_connected_ids()
+        component_of = [0] * len(self.names)
+        for component_id, component in enumerate(components):
+            for member in component:
+                component_of[member] = component_id
+
+        # Tarjan émet les puits d'abord : les successeurs sont déjà placés
+        component_layer = [0] * len(components)
+        layers: List[List[str]] = []
+        for component_id, component in enumerate(components):
+            layer = 0
+            for member in component:
+                for successor in self.adjacency[member]:
+                    successor_component = component_of[successor]
+                    if successor_component != component_id and component_layer[successor_component] >= layer:
+                        layer = component_layer[successor_component] + 1
+            component_layer[component_id] = layer
+            if layer == len(layers):
+                layers.append([])
+            layers[layer].extend(self.names[member] for member in component)
+
+        return [sorted(layer) for layer in layers]
@@ -4,16 +4,22 @@
 
 Système de cache intelligent pour éviter les analyses redondantes d'imports.
 Compatible avec le nouveau ImportAnalyzer redesigné.
-Implémente les stratégies 1 (Cache temporel avec hashes) et 2 (Watcher de fichiers).
+Implémente les stratégies 1 (Cache temporel avec hashes) et 2 (Watcher de fichiers),
+et un cache persistant sur disque partagé entre processus (PersistentImportCache).
 
 Auteur: Alma (via Lucie Defraiteur)
 Date: 2025-08-07
 """
 
 import os
+import json
+import shutil
 import hashlib
 import asyncio
-from typing import Dict, Set, Optional, Any, List
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Dict, Set, Optional, Any, List, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 import logging
@@ -43,6 +49,261 @@ class ImportAnalysisCache:
         return (datetime.now() - self.analysis_timestamp).total_seconds()
 
 
+CACHE_FORMAT_VERSION = 1
+
+
+class PersistentImportCache:
+    """
+    Cache disque des analyses d'imports, partagé entre processus.
+    
+    Une entrée par fichier, clé (chemin, hash du contenu, configuration du
+    résolveur) : imports parsés et classifiés, résolutions des imports locaux.
+    Les écritures sont atomiques (fichier temporaire unique + os.replace), si
+    bien que plusieurs écrivains concurrents ne laissent jamais d'entrée
+    corrompue. Chaque dépendance est matérialisée par un fichier marqueur
+    ``dependents/<cible>/<source>`` : quand un fichier change, ses dépendants
+    sont invalidés transitivement.
+    """
+    
+    def __init__(self, cache_dir: str = None, project_root: str = None,
+                 config: Dict[str, Any] = None):
+        """
+        Args:
+            cache_dir: Répertoire du cache (défaut: <project_root>/.shadeos/import_cache)
+            project_root: Racine du projet analysé
+            config: Configuration du résolveur ; une autre config utilise un autre espace
+        """
+        self.project_root = os.path.abspath(project_root or os.getcwd())
+        self.config = dict(config or {})
+        config_payload = json.dumps(
+            {'version': CACHE_FORMAT_VERSION, 'project_root': self.project_root, **self.config},
+            sort_keys=True, default=str
+        )
+        self.config_key = hashlib.sha256(config_payload.encode('utf-8')).hexdigest()[:16]
+        
+        base_dir = Path(cache_dir) if cache_dir else Path(self.project_root) / '.shadeos' / 'import_cache'
+        self.cache_dir = base_dir / self.config_key
+        self.files_dir = self.cache_dir / 'files'
+        self.dependents_dir = self.cache_dir / 'dependents'
+        self.graphs_dir = self.cache_dir / 'graphs'
+        for directory in (self.files_dir, self.dependents_dir, self.graphs_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+        
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.invalidations = 0
+    
+    # ----- Stockage -----
+    
+    @staticmethod
+    def _normalize(path: str) -> str:
+        return os.path.normpath(os.path.abspath(path))
+    
+    def _key(self, path: str) -> str:
+        return hashlib.sha1(self._normalize(path).encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def _sharded(directory: Path, key: str) -> Path:
+        return directory / key[:2] / f"{key}.json"
+    
+    @staticmethod
+    def _read_json(file_path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError):
+            return None
+        except OSError as e:
+            logger.warning(f"⚠️ Entrée de cache illisible {file_path}: {e}")
+            return None
+    
+    def _write_json(self, file_path: Path, data: Dict[str, Any]):
+        """Écriture atomique : un écrivain concurrent ne voit jamais de fichier partiel."""
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = file_path.with_name(f"{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, default=str)
+        os.replace(tmp_file, file_path)
+        with self.lock:
+            self.writes += 1
+    
+    # ----- Empreintes -----
+    
+    @staticmethod
+    def fingerprint(file_path: str) -> Optional[Dict[str, Any]]:
+        """Empreinte (mtime, taille, hash du contenu) d'un fichier, ou None s'il n'existe pas."""
+        try:
+            stat = os.stat(file_path)
+            with open(file_path, 'rb') as f:
+                content_hash = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+        return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'content_hash': content_hash}
+    
+    @staticmethod
+    def _matches(stored: Dict[str, Any], file_path: str) -> bool:
+        """Vrai si le fichier a toujours le contenu de l'empreinte stockée."""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        # Chemin rapide : même mtime et même taille, pas besoin de relire
+        if stat.st_mtime_ns == stored.get('mtime_ns') and stat.st_size == stored.get('size'):
+            return True
+        try:
+            with open(file_path, 'rb') as f:
+                return hashlib.sha256(f.read()).hexdigest() == stored.get('content_hash')
+        except OSError:
+            return False
+    
+    # ----- Entrées par fichier -----
+    
+    def get_file(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Entrée valide d'un fichier ({'analysis', 'resolved', ...}) ou None.
+        
+        Un fichier modifié ou supprimé invalide son entrée et, transitivement,
+        celles des fichiers qui en dépendent.
+        """
+        entry = self._read_json(self._sharded(self.files_dir, self._key(file_path)))
+        if entry is None:
+            with self.lock:
+                self.misses += 1
+            return None
+        if not self._matches(entry.get('fingerprint', {}), file_path):
+            self.invalidate(file_path)
+            with self.lock:
+                self.misses += 1
+            return None
+        with self.lock:
+            self.hits += 1
+        return entry
+    
+    def put_file(self, file_path: str, analysis: Dict[str, Any],
+                 resolved: Dict[str, Optional[str]] = None,
+                 fingerprint: Dict[str, Any] = None):
+        """
+        Enregistre l'analyse d'un fichier et ses résolutions d'imports.
+        
+        Args:
+            fingerprint: Empreinte prise avant le parsing (recalculée si absente)
+        """
+        fingerprint = fingerprint or self.fingerprint(file_path)
+        if fingerprint is None:
+            return
+        resolved = dict(resolved or {})
+        key = self._key(file_path)
+        entry_file = self._sharded(self.files_dir, key)
+        
+        # Marqueurs de dépendance : ajout des nouveaux, retrait des obsolètes
+        previous = self._read_json(entry_file) or {}
+        old_targets = {self._key(p) for p in (previous.get('resolved') or {}).values() if p}
+        new_targets = {self._key(p) for p in resolved.values() if p}
+        for target in new_targets - old_targets:
+            marker = self.dependents_dir / target / key
+            marker.parent.mkdir(parents=True, exist_ok=True)
+            marker.touch()
+        for target in old_targets - new_targets:
+            (self.dependents_dir / target / key).unlink(missing_ok=True)
+        
+        self._write_json(entry_file, {
+            'path': self._normalize(file_path),
+            'fingerprint': fingerprint,
+            'analysis': analysis,
+            'resolved': resolved
+        })
+    
+    def has_file(self, file_path: str) -> bool:
+        """Vrai si une entrée existe pour ce fichier (sans la valider)."""
+        return self._sharded(self.files_dir, self._key(file_path)).exists()
+    
+    def invalidate(self, file_path: str) -> Set[str]:
+        """Invalide l'entrée d'un fichier et de tous ses dépendants (transitivement)."""
+        invalidated = set()
+        queue = deque([self._key(file_path)])
+        seen = set(queue)
+        while queue:
+            key = queue.popleft()
+            entry_file = self._sharded(self.files_dir, key)
+            entry = self._read_json(entry_file)
+            if entry is not None:
+                invalidated.add(entry.get('path', key))
+            entry_file.unlink(missing_ok=True)
+            
+            dependents = self.dependents_dir / key
+            try:
+                dependent_keys = os.listdir(dependents)
+            except FileNotFoundError:
+                continue
+            for dependent_key in dependent_keys:
+                if dependent_key not in seen:
+                    seen.add(dependent_key)
+                    queue.append(dependent_key)
+            shutil.rmtree(dependents, ignore_errors=True)
+        
+        if invalidated:
+            with self.lock:
+                self.invalidations += len(invalidated)
+            logger.debug(f"🗑️ {len(invalidated)} entrées invalidées depuis {file_path}")
+        return invalidated
+    
+    # ----- Résultats d'analyse complets (par fichier racine) -----
+    
+    def _graph_key(self, root_path: str, options: Dict[str, Any]) -> str:
+        payload = json.dumps({'root': self._normalize(root_path), **(options or {})},
+                             sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+    
+    def get_graph(self, root_path: str, options: Dict[str, Any] = None) -> Optional[Any]:
+        """Résultat d'une analyse complète, valide si aucun fichier de sa fermeture n'a changé."""
+        entry = self._read_json(self._sharded(self.graphs_dir, self._graph_key(root_path, options)))
+        if entry is None:
+            with self.lock:
+                self.misses += 1
+            return None
+        for file_path, stored in entry.get('closure', {}).items():
+            if not self._matches(stored, file_path):
+                with self.lock:
+                    self.misses += 1
+                return None
+        with self.lock:
+            self.hits += 1
+        return entry.get('result')
+    
+    def put_graph(self, root_path: str, options: Dict[str, Any], result: Any,
+                  closure: Iterable[str]):
+        """Enregistre le résultat d'une analyse et l'empreinte de chaque fichier parcouru."""
+        fingerprints = {}
+        for file_path in closure:
+            fingerprint = self.fingerprint(file_path)
+            if fingerprint is not None:
+                fingerprints[self._normalize(file_path)] = fingerprint
+        self._write_json(self._sharded(self.graphs_dir, self._graph_key(root_path, options)),
+                         {'closure': fingerprints, 'result': result})
+    
+    # ----- Maintenance -----
+    
+    def clear(self):
+        """Vide le cache de cette configuration."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        for directory in (self.files_dir, self.dependents_dir, self.graphs_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'cache_dir': str(self.cache_dir),
+                'hits': self.hits,
+                'misses': self.misses,
+                'writes': self.writes,
+                'invalidations': self.invalidations,
+                'hit_ratio': self.hits / lookups if lookups else 0.0
+            }
+
+
 class FileChangeWatcher:
     """Watcher intelligent pour détecter les changements de fichiers"""
     
@@ -104,8 +365,14 @@ class FileChangeWatcher:
 class ImportAnalysisOptimizer:
     """Optimiseur d'analyse d'imports avec cache intelligent - Compatible avec le nouveau ImportAnalyzer"""
     
-    def __init__(self, memory_engine=None):
+    def __init__(self, memory_engine=None, persistent_cache: PersistentImportCache = None):
+        """
+        Args:
+            memory_engine: MemoryEngine optionnel
+            persistent_cache: Cache disque partagé entre invocations (optionnel)
+        """
         self.memory_engine = memory_engine
+        self.persistent_cache = persistent_cache
         self.cache: Dict[str, ImportAnalysisCache] = {}
         self.file_watcher = FileChangeWatcher()
         self.max_cache_age = 3600  # 1 heure par défaut
@@ -144,6 +411,14 @@ class ImportAnalysisOptimizer:
                     self.hit_count += 1
                     return cached_analysis.fractal_nodes
         
+        # Cache disque (autre processus ou invocation précédente)
+        if self.persistent_cache:
+            fractal_nodes = self.persistent_cache.get_graph(file_path, {'max_depth': max_depth})
+            if fractal_nodes is not None:
+                logger.info(f"💾 Cache disque hit pour {file_path}")
+                self.hit_count += 1
+                return fractal_nodes
+        
         # Cache miss ou invalide - nouvelle analyse
         logger.info(f"🔄 Nouvelle analyse pour {file_path}")
         self.miss_count += 1
@@ -181,7 +456,7 @@ class ImportAnalysisOptimizer:
             from .import_analyzer import ImportAnalyzer
             
             # Analyser les imports avec le nouveau ImportAnalyzer
-            analyzer = ImportAnalyzer()
+            analyzer = ImportAnalyzer(persistent_cache=self.persistent_cache)
             analysis = analyzer.analyze_files([file_path], max_depth=2)  # Profondeur limitée pour le hash
             
             # Collecter tous les fichiers importés depuis la nouvelle structure
@@ -217,12 +492,16 @@ class ImportAnalysisOptimizer:
             # Import local pour éviter les dépendances circulaires
             from .import_analyzer import ImportAnalyzer
             
-            analyzer = ImportAnalyzer()
+            analyzer = ImportAnalyzer(persistent_cache=self.persistent_cache)
             analysis_result = analyzer.analyze_files([file_path], max_depth=max_depth, debug=debug)
             
             # Convertir en format fractal optimisé
             fractal_nodes = self._convert_to_fractal_nodes(analysis_result)
             
+            if self.persistent_cache and not analysis_result['analysis_metadata'].get('partial'):
+                self.persistent_cache.put_graph(file_path, {'max_depth': max_depth}, fractal_nodes,
+                                                analysis_result.get('files_analysis', {}).keys())
+            
             return fractal_nodes
         except Exception as e:
             logger.error(f"❌ Erreur lors de l'analyse de {file_path}: {e}")
@@ -332,7 +611,7 @@ class ImportAnalysisOptimizer:
         total_age = sum(entry.get_age_seconds() for entry in self.cache.values())
         avg_age = total_age / total_entries if total_entries > 0 else 0
         
-        return {
+        stats = {
             'total_entries': total_entries,
             'average_age_seconds': avg_age,
             'max_cache_age': self.max_cache_age,
@@ -341,6 +620,9 @@ class ImportAnalysisOptimizer:
             'miss_count': self.miss_count,
             'total_requests': self.hit_count + self.miss_count
         }
+        if self.persistent_cache:
+            stats['persistent'] = self.persistent_cache.get_stats()
+        return stats
     
     def _calculate_hit_ratio(self) -> float:
         """Calcule le ratio de hits du cache"""
@@ -366,11 +648,11 @@ class ImportAnalysisOptimizer:
 # Instance globale pour faciliter l'utilisation
 _global_optimizer: Optional[ImportAnalysisOptimizer] = None
 
-def get_import_optimizer(memory_engine=None) -> ImportAnalysisOptimizer:
+def get_import_optimizer(memory_engine=None, persistent_cache: PersistentImportCache = None) -> ImportAnalysisOptimizer:
     """Retourne l'instance globale de l'optimiseur"""
     global _global_optimizer
     if _global_optimizer is None:
-        _global_optimizer = ImportAnalysisOptimizer(memory_engine)
+        _global_optimizer = ImportAnalysisOptimizer(memory_engine, persistent_cache)
     return _global_optimizer
 
 def set_import_optimizer(optimizer: ImportAnalysisOptimizer):
@@ -24,6 +24,11 @@ import argparse
 import time
 import ast
 import importlib.util
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Dict, List, Set, Optional, Any, Tuple
 from dataclasses import dataclass, field
@@ -31,6 +36,8 @@ from datetime import datetime
 import logging
 from collections import defaultdict
 
+from .graph_index import IndexedGraph
+
 # Configuration du logging
 logging.basicConfig(
     level=logging.INFO,
@@ -85,6 +92,18 @@ class ImportAnalysisResult:
     analysis_timestamp: datetime = field(default_factory=datetime.now)
     error_messages: List[str] = field(default_factory=list)
     resolved_paths: Dict[str, str] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Forme sérialisable (cache persistant)."""
+        data = dict(self.__dict__)
+        data['analysis_timestamp'] = self.analysis_timestamp.isoformat()
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ImportAnalysisResult':
+        data = dict(data)
+        data['analysis_timestamp'] = datetime.fromisoformat(data['analysis_timestamp'])
+        return cls(**data)
 
 
 @dataclass
@@ -95,52 +114,51 @@ class DependencyGraph:
     edges: List[tuple] = field(default_factory=list)
     cycles: List[List[str]] = field(default_factory=list)
     file_depths: Dict[str, int] = field(default_factory=dict)
+    _edge_set: Set[tuple] = field(default_factory=set, repr=False)
+    _index: IndexedGraph = field(default_factory=IndexedGraph, repr=False)
     
     def add_node(self, file_path: str, analysis_result: ImportAnalysisResult):
         """Ajoute un nœud au graphe"""
         self.nodes[file_path] = analysis_result
+        self._index.add_node(file_path)
     
     def add_edge(self, source: str, target: str):
-        """Ajoute une arête au graphe"""
+        """Ajoute une arête au graphe (une seule fois)"""
+        if (source, target) in self._edge_set:
+            return
+        self._edge_set.add((source, target))
         self.edges.append((source, target))
+        self._index.add_edge(source, target)
     
     def detect_cycles(self) -> List[List[str]]:
-        """Détecte les cycles dans le graphe de dépendances"""
-        visited = set()
-        rec_stack = set()
-        cycles = []
-        
-        def dfs(node: str, path: List[str]):
-            if node in rec_stack:
-                # Cycle détecté
-                cycle_start = path.index(node)
-                cycle = path[cycle_start:] + [node]
-                cycles.append(cycle)
-                return
-            
-            if node in visited:
-                return
-            
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-            
-            # Parcourir les dépendances
-            if node in self.nodes:
-                for import_path in self.nodes[node].local_imports:
-                    if import_path in self.nodes:
-                        dfs(import_path, path.copy())
-            
-            rec_stack.remove(node)
-            path.pop()
-        
-        # DFS sur tous les nœuds
-        for node in self.nodes:
-            if node not in visited:
-                dfs(node, [])
+        """
+        Détecte les cycles dans le graphe de dépendances.
         
-        self.cycles = cycles
-        return cycles
+        Un cycle fermé ([a, b, ..., a]) est rapporté par composante fortement
+        connexe (Tarjan itératif, sans limite de récursion).
+        """
+        self.cycles = self._index.cycles()
+        return self.cycles
+    
+    def strongly_connected_components(self) -> List[List[str]]:
+        """Groupes de fichiers mutuellement dépendants (cycles d'imports)"""
+        return self._index.strongly_connected_components()
+    
+    def shortest_path(self, source: str, target: str) -> List[str]:
+        """Plus courte chaîne d'imports de source vers target ([] si aucune)"""
+        return self._index.shortest_path(source, target)
+    
+    def dependencies_of(self, file_path: str) -> Set[str]:
+        """Fichiers importés directement ou transitivement par file_path"""
+        return self._index.reachable(file_path)
+    
+    def dependents_of(self, file_path: str) -> Set[str]:
+        """Fichiers qui importent file_path directement ou transitivement"""
+        return self._index.reachable(file_path, reverse=True)
+    
+    def topological_layers(self) -> List[List[str]]:
+        """Couches d'analyse, dépendances d'abord (un cycle forme une seule unité)"""
+        return self._index.topological_layers()
 
 
 class SimpleImportAnalyzerLogger:
@@ -338,23 +356,120 @@ class SimpleImportAnalyzerLogger:
         return report
 
 
+class ResolverWorker:
+    """
+    Thread démon unique et durable qui exécute les résolutions une à une.
+    
+    Contrairement à SIGALRM, l'attente d'un résultat borné par un délai
+    fonctionne depuis n'importe quel thread. Une résolution qui dépasse le
+    délai continue en arrière-plan (les threads Python ne sont pas
+    interruptibles) : c'est à l'appelant de ne plus lui confier de travail.
+    """
+    
+    def __init__(self, name: str = "import-resolve"):
+        self.name = name
+        self._tasks = queue.SimpleQueue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+    
+    def submit(self, func, *args, **kwargs) -> Future:
+        """Planifie func sur le worker (démarré au premier appel)."""
+        future = Future()
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+        self._tasks.put((future, func, args, kwargs))
+        return future
+    
+    def _run(self):
+        while True:
+            future, func, args, kwargs = self._tasks.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(func(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+
+# L'ImportResolver modifie sys.path, global au processus : tous les analyseurs
+# partagent le même verrou et le même worker (thread démarré au premier usage)
+_resolver_lock = threading.Lock()
+_resolver_worker = ResolverWorker()
+
+
+# Analyseur propre à chaque processus du pool (créé par l'initializer)
+_worker_analyzer = None
+
+
+def _init_analysis_worker(project_root: str):
+    """Initializer du pool : un analyseur (et son partitioner) par processus."""
+    global _worker_analyzer
+    _worker_analyzer = ImportAnalyzer(project_root=project_root, workers=1)
+
+
+def _analyze_file_in_worker(file_path: str) -> Tuple[str, Optional[float], ImportAnalysisResult]:
+    """Parse et classifie un fichier dans un processus du pool."""
+    try:
+        mtime = os.path.getmtime(file_path)
+    except OSError:
+        mtime = None
+    return file_path, mtime, _worker_analyzer._analyze_single_file(file_path)
+
+
 class ImportAnalyzer:
     """Analyseur d'imports de production - Version redesignée"""
     
-    def __init__(self, project_root: str = None):
+    def __init__(self, project_root: str = None, workers: Optional[int] = 1,
+                 resolve_timeout: float = 10.0, persistent_cache=None):
+        """
+        Args:
+            project_root: Racine du projet (défaut: répertoire courant)
+            workers: Processus de parsing (1 = série, None = un par cœur)
+            resolve_timeout: Délai max (s) d'une résolution par l'ImportResolver
+            persistent_cache: PersistentImportCache partagé entre invocations (optionnel)
+        """
         self.project_root = project_root or os.getcwd()
         self.dependency_graph = DependencyGraph()
         self.import_resolver = None
         self.max_depth = 10
         self.analyzed_files = set()
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        # En dessous de ce nombre de fichiers à parser, un niveau reste en série
+        self.parallel_min_batch = 4
+        
+        # Délais : par résolution, et budget global optionnel par analyse
+        self.resolve_timeout = resolve_timeout
+        self._deadline = None
+        self.pending_files = []  # fichiers non développés faute de budget
+        self.timed_out_imports = []
+        # L'ImportResolver n'est pas thread-safe (il modifie sys.path) : le worker
+        # durable du module l'exécute pour tous les analyseurs, le verrou partagé
+        # reste pris tant qu'il travaille
+        self._resolver_lock = _resolver_lock
+        self._resolver_worker = _resolver_worker
+        # Disjoncteur : après un timeout, l'ImportResolver est ignoré jusqu'à la fin de l'analyse
+        self._resolver_tripped = False
+        self.use_import_resolver = True
         
         # Cache pour les modules locaux détectés automatiquement
         self._local_modules_cache = {}
         
+        # Mémoïsation : analyse par fichier (invalidée par mtime) et résolutions d'imports
+        self._file_analysis_cache = {}  # file_path → (mtime, ImportAnalysisResult)
+        self._resolution_cache = {}  # (import_name, dossier courant) → chemin résolu
+        self.parse_count = 0
+        
+        # Cache disque : empreintes prises avant parsing, en attente d'écriture
+        self.persistent_cache = persistent_cache
+        self._pending_persist = {}  # file_path → empreinte
+        self._loaded_from_disk = set()
+        
         # Initialiser l'import resolver si disponible
         try:
-            from .import_resolver import ImportResolver
-            self.import_resolver = ImportResolver()
+            from ..resolvers.import_resolver import ImportResolver
+            self.import_resolver = ImportResolver(project_root=self.project_root)
             logger.info("✅ ImportResolver initialisé")
         except ImportError:
             logger.warning("⚠️ ImportResolver non disponible, utilisation du résolveur simple")
@@ -381,6 +496,7 @@ class ImportAnalyzer:
             'unresolved_imports': 0,
             'cycles_detected': 0,
             'max_depth': 0,
+            'resolve_timeouts': 0,
             'duration': 0
         }
     
@@ -590,47 +706,81 @@ class ImportAnalyzer:
             self.logger.log_error(f"Erreur résolution import {import_name}: {e}")
             return None
     
+    def _remaining_budget(self) -> Optional[float]:
+        """Secondes restantes avant la deadline de l'analyse (None = illimité)."""
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - time.monotonic())
+    
+    def _deadline_expired(self) -> bool:
+        return self._deadline is not None and time.monotonic() >= self._deadline
+    
     def _resolve_import_with_resolver(self, import_name: str, current_file: str) -> Optional[str]:
-        """Résout un import avec l'ImportResolver avec timeout."""
-        if not self.import_resolver:
+        """
+        Résout un import avec l'ImportResolver avec timeout (utilisable depuis tout thread).
+        
+        L'attente du verrou et celle du résultat partagent le même délai. Un
+        timeout ouvre le disjoncteur : les résolutions suivantes de l'analyse
+        passent directement au résolveur simple au lieu d'attendre derrière
+        une résolution bloquée.
+        """
+        if not self.import_resolver or not self.use_import_resolver or self._resolver_tripped:
             return None
         
+        # Le délai d'une résolution est borné par le budget restant de l'analyse
+        timeout = self.resolve_timeout
+        remaining = self._remaining_budget()
+        if remaining is not None:
+            timeout = min(timeout, remaining) if timeout is not None else remaining
+        expires_at = time.monotonic() + timeout if timeout is not None else None
+        
+        if not self._resolver_lock.acquire(timeout=-1 if timeout is None else timeout):
+            self._record_resolve_timeout(import_name)
+            return None
         try:
-            import signal
-            
-            def timeout_handler(signum, frame):
-                raise TimeoutError("Timeout lors de la résolution d'import")
-            
-            # Définir un timeout de 10 secondes
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(10)
-            
-            try:
-                resolved_path = self.import_resolver.resolve_import(import_name, current_file)
-                signal.alarm(0)  # Annuler le timeout
-                return resolved_path
-            except TimeoutError:
-                self.logger.log_debug(f"Timeout résolution import: {import_name}")
-                return None
-            finally:
-                signal.alarm(0)
-                
+            future = self._resolver_worker.submit(self.import_resolver.resolve_import, import_name, current_file)
+        except BaseException:
+            self._resolver_lock.release()
+            raise
+        # Libéré quand le worker a fini, même si l'appelant a abandonné l'attente
+        future.add_done_callback(lambda _: self._resolver_lock.release())
+        
+        try:
+            wait = max(0.0, expires_at - time.monotonic()) if expires_at is not None else None
+            return future.result(timeout=wait)
+        except FuturesTimeoutError:
+            self._record_resolve_timeout(import_name)
+            return None
         except Exception as e:
             self.logger.log_debug(f"Erreur ImportResolver {import_name}: {e}")
             return None
     
+    def _record_resolve_timeout(self, import_name: str):
+        """Compte un timeout de résolution et ouvre le disjoncteur."""
+        self._resolver_tripped = True
+        self.stats['resolve_timeouts'] += 1
+        self.timed_out_imports.append(import_name)
+        self.logger.log_debug(f"Timeout résolution import: {import_name} (ImportResolver ignoré pour cette analyse)")
+    
     def find_file_for_import(self, import_name: str, current_file: str) -> Optional[str]:
-        """Trouve le fichier correspondant à un import (stratégie hybride)."""
+        """Trouve le fichier correspondant à un import (stratégie hybride, mémoïsée)."""
+        # La résolution ne dépend que du nom et du dossier du fichier courant
+        cache_key = (import_name, os.path.dirname(os.path.abspath(current_file)))
+        if cache_key in self._resolution_cache:
+            return self._resolution_cache[cache_key]
+        
         # Essayer d'abord avec l'ImportResolver
         resolved_path = self._resolve_import_with_resolver(import_name, current_file)
-        if resolved_path:
-            return resolved_path
+        if not resolved_path:
+            # Fallback vers la résolution simple
+            resolved_path = self._resolve_import_simple(import_name, current_file)
         
-        # Fallback vers la résolution simple
-        return self._resolve_import_simple(import_name, current_file)
+        self._resolution_cache[cache_key] = resolved_path
+        return resolved_path
     
     def analyze_files(self, file_paths: List[str], max_depth: int = None, 
-                     use_import_resolver: bool = True, debug: bool = False) -> Dict[str, Any]:
+                     use_import_resolver: bool = True, debug: bool = False,
+                     workers: Optional[int] = None, deadline: Optional[float] = None) -> Dict[str, Any]:
         """
         Analyse les dépendances d'une liste de fichiers
         
@@ -639,25 +789,51 @@ class ImportAnalyzer:
             max_depth: Profondeur maximale d'analyse (optionnel)
             use_import_resolver: Utiliser l'ImportResolver (défaut: True)
             debug: Mode debug avec logs détaillés
+            workers: Processus de parsing pour cette analyse (défaut: self.workers)
+            deadline: Budget global en secondes ; une fois dépassé, l'analyse
+                s'arrête et le rapport est partiel (voir 'pending_files')
         
         Returns:
             Dict contenant les résultats d'analyse
         """
         if max_depth:
             self.max_depth = max_depth
+        if workers is not None:
+            self.workers = max(1, workers)
+        self._deadline = time.monotonic() + deadline if deadline is not None else None
+        self.pending_files = []
+        self.timed_out_imports = []
+        self.use_import_resolver = use_import_resolver
+        # Les résolutions dépendent de l'arborescence, qui a pu changer depuis l'analyse précédente
+        self._resolution_cache.clear()
+        self._local_modules_cache.clear()
+        # Nouveau parcours : les fichiers déjà vus sont redéveloppés (leurs analyses restent mémoïsées)
+        self.dependency_graph.file_depths.clear()
+        # Le disjoncteur reste ouvert tant qu'une résolution précédente bloque le worker
+        self._resolver_tripped = self._resolver_lock.locked()
         
         self.logger.log_info(f"🔍 Début de l'analyse de {len(file_paths)} fichiers")
         self.logger.log_info(f"   Project root: {self.project_root}")
         self.logger.log_info(f"   Max depth: {self.max_depth}")
         self.logger.log_info(f"   Import resolver: {'✅' if use_import_resolver and self.import_resolver else '❌'}")
         self.logger.log_info(f"   Partitioner: {'✅' if self.partitioner else '❌'}")
+        self.logger.log_info(f"   Workers: {self.workers}")
         
-        # Analyser chaque fichier
+        # Analyser tous les fichiers en un seul parcours (chaque fichier est parsé une fois)
+        existing_paths = []
         for file_path in file_paths:
             if os.path.exists(file_path):
-                self._analyze_file_recursive(file_path, depth=0, visited=set(), debug=debug)
+                existing_paths.append(file_path)
             else:
                 self.logger.log_error(f"⚠️ Fichier non trouvé: {file_path}")
+        try:
+            self._build_dependency_graph(existing_paths, depth=0, debug=debug)
+        finally:
+            self._deadline = None
+        if self.persistent_cache:
+            self._restore_invalidated_entries()
+        if self.pending_files:
+            self.logger.log_info(f"⏱️ Budget épuisé: {len(self.pending_files)} fichiers non analysés (résultat partiel)")
         
         # Détecter les cycles
         cycles = self.dependency_graph.detect_cycles()
@@ -693,49 +869,233 @@ class ImportAnalyzer:
     
     def _analyze_file_recursive(self, file_path: str, depth: int = 0, visited: Set[str] = None, debug: bool = False):
         """Analyse récursive d'un fichier et de ses dépendances"""
-        if visited is None:
-            visited = set()
-        
-        # Éviter les cycles et respecter la profondeur maximale
-        if depth > self.max_depth or file_path in visited:
+        if visited and file_path in visited:
             return
+        self._build_dependency_graph([file_path], depth=depth, debug=debug)
+    
+    def _build_dependency_graph(self, file_paths: List[str], depth: int = 0, debug: bool = False):
+        """
+        Construit le graphe de dépendances par un parcours en largeur multi-sources.
         
-        visited.add(file_path)
-        
-        if debug:
-            self.logger.log_debug(f"🔍 Analyse récursive: {file_path} (depth: {depth})")
+        Chaque fichier est analysé une seule fois et développé à sa profondeur
+        minimale : le coût est linéaire en fichiers + imports, même quand un
+        fichier est atteint par de nombreux chemins (dépendances en diamant).
+        Le parcours avance niveau par niveau ; avec plusieurs workers, les
+        fichiers d'un niveau sont parsés en parallèle puis fusionnés dans
+        l'ordre du parcours, le résultat ne dépend donc pas du nombre de workers.
+        """
+        frontier = [file_path for file_path in file_paths if self._record_depth(file_path, depth)]
+        executor = None
+        try:
+            while frontier:
+                if self.workers > 1:
+                    executor = self._prefetch_analyses(frontier, executor, debug)
+                frontier = self._expand_level(frontier, debug)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=not self._deadline_expired(), cancel_futures=True)
+    
+    def _defer_files(self, file_paths: List[str]):
+        """Met de côté des fichiers non développés (deadline) pour une analyse ultérieure."""
+        for file_path in file_paths:
+            if file_path not in self.dependency_graph.nodes:
+                # Profondeur oubliée : un prochain appel pourra les développer
+                self.dependency_graph.file_depths.pop(file_path, None)
+                self.pending_files.append(file_path)
+    
+    def _prefetch_analyses(self, file_paths: List[str], executor, debug: bool = False):
+        """Parse en parallèle les fichiers d'un niveau absents du cache ; retourne le pool."""
+        pending = sorted({file_path for file_path in file_paths
+                          if not self._is_analysis_cached(file_path)
+                          and not self._load_persisted_analysis(file_path)})
+        if len(pending) < self.parallel_min_batch:
+            return executor
+        if self.persistent_cache:
+            for file_path in pending:
+                self._pending_persist[file_path] = self.persistent_cache.fingerprint(file_path)
         
         try:
-            # Analyser le fichier
-            analysis_result = self._analyze_single_file(file_path, debug)
-            self.dependency_graph.add_node(file_path, analysis_result)
-            self.dependency_graph.file_depths[file_path] = depth
+            if executor is None:
+                executor = ProcessPoolExecutor(max_workers=self.workers,
+                                               initializer=_init_analysis_worker,
+                                               initargs=(self.project_root,))
+            chunksize = max(1, len(pending) // (self.workers * 4))
+            for file_path, mtime, analysis_result in executor.map(_analyze_file_in_worker, pending,
+                                                                  timeout=self._remaining_budget(),
+                                                                  chunksize=chunksize):
+                self._store_analysis(file_path, mtime, analysis_result)
+        except FuturesTimeoutError:
+            # Budget épuisé : les analyses reçues sont gardées, le niveau s'arrêtera
+            executor.shutdown(wait=False, cancel_futures=True)
+            return None
+        except (BrokenProcessPool, OSError, RuntimeError) as e:
+            # Pool indisponible (sandbox, limites système...) : retour au mode série
+            self.logger.log_error(f"⚠️ Pool de parsing indisponible, analyse en série: {e}")
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+            self.workers = 1
+            return None
+        
+        if debug:
+            self.logger.log_debug(f"   ⚡ {len(pending)} fichiers parsés en parallèle")
+        return executor
+    
+    def _expand_level(self, frontier: List[str], debug: bool = False) -> List[str]:
+        """Analyse les fichiers d'un niveau et retourne le niveau suivant."""
+        next_frontier = []
+        for position, file_path in enumerate(frontier):
+            if self._deadline_expired():
+                self._defer_files(frontier[position:] + next_frontier)
+                return []
+            file_depth = self.dependency_graph.file_depths[file_path]
             
-            # Ajouter au rapport Markdown
-            self.logger._add_file_to_md_report(file_path, analysis_result.local_imports, depth)
+            if debug:
+                self.logger.log_debug(f"🔍 Analyse récursive: {file_path} (depth: {file_depth})")
             
-            # Analyser récursivement les imports locaux
-            for import_name in analysis_result.local_imports:
-                if debug:
-                    self.logger.log_debug(f"   📦 Import local: {import_name}")
+            try:
+                # Analyser le fichier (mémoïsé)
+                first_visit = file_path not in self.dependency_graph.nodes
+                analysis_result = self._get_file_analysis(file_path, debug)
+                self.dependency_graph.add_node(file_path, analysis_result)
                 
-                # Trouver le fichier correspondant
-                resolved_path = self.find_file_for_import(import_name, file_path)
-                if resolved_path and resolved_path not in visited:
+                # Ajouter au rapport Markdown
+                if first_visit:
+                    self.logger._add_file_to_md_report(file_path, analysis_result.local_imports, file_depth)
+                
+                # Développer les imports locaux
+                known_resolutions = dict(analysis_result.resolved_paths)
+                # Seules les résolutions venues du cache disque sont reprises telles quelles ;
+                # les autres sont refaites à chaque analyse (mémoïsées le temps de celle-ci)
+                reusable = known_resolutions if file_path in self._loaded_from_disk else {}
+                for import_name in analysis_result.local_imports:
+                    if debug:
+                        self.logger.log_debug(f"   📦 Import local: {import_name}")
+                    
+                    # Trouver le fichier correspondant (résolution du cache si toujours présente)
+                    resolved_path = reusable.get(import_name)
+                    if not resolved_path or not os.path.exists(resolved_path):
+                        resolved_path = self.find_file_for_import(import_name, file_path)
+                        if resolved_path:
+                            analysis_result.resolved_paths[import_name] = resolved_path
+                        else:
+                            analysis_result.resolved_paths.pop(import_name, None)
+                    if not resolved_path:
+                        if debug:
+                            self.logger.log_debug(f"   ❌ Non résolu: {import_name}")
+                        continue
+                    
                     if debug:
                         self.logger.log_debug(f"   ✅ Résolu vers: {resolved_path}")
-                    self._analyze_file_recursive(resolved_path, depth + 1, visited.copy(), debug)
                     self.dependency_graph.add_edge(file_path, resolved_path)
-                elif debug and not resolved_path:
-                    self.logger.log_debug(f"   ❌ Non résolu: {import_name}")
+                    if self._record_depth(resolved_path, file_depth + 1):
+                        next_frontier.append(resolved_path)
+                
+                self._persist_analysis(file_path, analysis_result, known_resolutions)
+            
+            except Exception as e:
+                self.logger.log_error(f"❌ Erreur lors de l'analyse de {file_path}: {e}")
+                error_result = ImportAnalysisResult(
+                    file_path=file_path,
+                    error_messages=[str(e)]
+                )
+                self.dependency_graph.add_node(file_path, error_result)
+        return next_frontier
+    
+    def _record_depth(self, file_path: str, depth: int) -> bool:
+        """Enregistre la profondeur d'un fichier ; vrai s'il doit être (re)développé."""
+        if depth > self.max_depth:
+            return False
+        known_depth = self.dependency_graph.file_depths.get(file_path)
+        if known_depth is not None and known_depth <= depth:
+            return False
+        self.dependency_graph.file_depths[file_path] = depth
+        return True
+    
+    @staticmethod
+    def _get_mtime(file_path: str) -> Optional[float]:
+        try:
+            return os.path.getmtime(file_path)
+        except OSError:
+            return None
+    
+    def _is_analysis_cached(self, file_path: str) -> bool:
+        cached = self._file_analysis_cache.get(file_path)
+        return bool(cached) and cached[0] == self._get_mtime(file_path)
+    
+    def _store_analysis(self, file_path: str, mtime: Optional[float], analysis_result: ImportAnalysisResult):
+        """Mémorise une analyse faite dans un worker et reporte ses effets locaux."""
+        self.parse_count += 1
+        self._adopt_analysis(file_path, mtime, analysis_result)
+    
+    def _adopt_analysis(self, file_path: str, mtime: Optional[float], analysis_result: ImportAnalysisResult):
+        """Mémorise une analyse produite hors de ce processus (worker ou cache disque)."""
+        self._file_analysis_cache[file_path] = (mtime, analysis_result)
+        self._record_result_stats(analysis_result)
+        # Le cache des modules locaux de l'autre processus est perdu : on le reconstruit ici
+        for import_stmt in analysis_result.imports:
+            if not import_stmt.startswith('.'):
+                self._is_local_module(import_stmt)
+    
+    def _load_persisted_analysis(self, file_path: str) -> Optional[ImportAnalysisResult]:
+        """Charge l'analyse d'un fichier depuis le cache disque si son contenu n'a pas changé."""
+        if not self.persistent_cache:
+            return None
+        mtime = self._get_mtime(file_path)
+        entry = self.persistent_cache.get_file(file_path)
+        if entry is None:
+            return None
+        try:
+            analysis_result = ImportAnalysisResult.from_dict(entry['analysis'])
+        except (KeyError, TypeError, ValueError):
+            return None
+        analysis_result.resolved_paths = {name: path for name, path in (entry.get('resolved') or {}).items() if path}
+        self._adopt_analysis(file_path, mtime, analysis_result)
+        self._loaded_from_disk.add(file_path)
+        return analysis_result
+    
+    def _restore_invalidated_entries(self):
+        """
+        Réécrit les entrées chargées du disque puis invalidées en cascade pendant
+        l'analyse (une de leurs dépendances a changé) : leur propre contenu, lui,
+        n'a pas changé, inutile de les reparser à la prochaine invocation.
+        """
+        for file_path in self._loaded_from_disk:
+            cached = self._file_analysis_cache.get(file_path)
+            if cached and not self.persistent_cache.has_file(file_path):
+                self.persistent_cache.put_file(file_path, cached[1].to_dict(),
+                                               resolved=cached[1].resolved_paths)
+        self._loaded_from_disk = set()
+    
+    def _persist_analysis(self, file_path: str, analysis_result: ImportAnalysisResult,
+                          previous_resolutions: Dict[str, str]):
+        """Écrit l'analyse d'un fichier nouvellement parsé, ou dont les résolutions ont changé."""
+        if not self.persistent_cache:
+            return
+        newly_parsed = file_path in self._pending_persist
+        if not newly_parsed and analysis_result.resolved_paths == previous_resolutions:
+            return
+        self.persistent_cache.put_file(file_path, analysis_result.to_dict(),
+                                       resolved=analysis_result.resolved_paths,
+                                       fingerprint=self._pending_persist.pop(file_path, None))
+    
+    def _get_file_analysis(self, file_path: str, debug: bool = False) -> ImportAnalysisResult:
+        """Analyse d'un fichier, parsée une seule fois tant qu'il n'est pas modifié."""
+        mtime = self._get_mtime(file_path)
+        cached = self._file_analysis_cache.get(file_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
         
-        except Exception as e:
-            self.logger.log_error(f"❌ Erreur lors de l'analyse de {file_path}: {e}")
-            error_result = ImportAnalysisResult(
-                file_path=file_path,
-                error_messages=[str(e)]
-            )
-            self.dependency_graph.add_node(file_path, error_result)
+        persisted = self._load_persisted_analysis(file_path)
+        if persisted is not None:
+            return persisted
+        
+        if self.persistent_cache:
+            # Empreinte prise avant la lecture : une modification pendant le parsing invalidera l'entrée
+            self._pending_persist[file_path] = self.persistent_cache.fingerprint(file_path)
+        self.parse_count += 1
+        analysis_result = self._analyze_single_file(file_path, debug)
+        self._file_analysis_cache[file_path] = (mtime, analysis_result)
+        return analysis_result
     
     def _analyze_single_file(self, file_path: str, debug: bool = False) -> ImportAnalysisResult:
         """Analyse un seul fichier"""
@@ -788,10 +1148,7 @@ class ImportAnalyzer:
                             self.logger.log_debug(f"   ❓ Inconnu: {import_stmt}")
             
             # Mettre à jour les statistiques
-            self.stats['local_imports'] += len(result.local_imports)
-            self.stats['external_imports'] += len(result.external_imports)
-            self.stats['standard_imports'] += len(result.standard_imports)
-            self.stats['unresolved_imports'] += len(result.unresolved_imports)
+            self._record_result_stats(result)
             
         except Exception as e:
             result.error_messages.append(str(e))
@@ -799,6 +1156,13 @@ class ImportAnalyzer:
         
         return result
     
+    def _record_result_stats(self, result: ImportAnalysisResult):
+        """Ajoute les imports classifiés d'un fichier aux statistiques."""
+        self.stats['local_imports'] += len(result.local_imports)
+        self.stats['external_imports'] += len(result.external_imports)
+        self.stats['standard_imports'] += len(result.standard_imports)
+        self.stats['unresolved_imports'] += len(result.unresolved_imports)
+    
     def _generate_analysis_report(self, target_files: List[str], cycles: List[List[str]]) -> Dict[str, Any]:
         """Génère un rapport d'analyse complet"""
         
@@ -829,7 +1193,9 @@ class ImportAnalyzer:
                 'target_files': target_files,
                 'total_files_analyzed': total_files,
                 'max_depth': self.max_depth,
-                'project_root': self.project_root
+                'project_root': self.project_root,
+                'partial': bool(self.pending_files),
+                'pending_files': list(self.pending_files)
             },
             'statistics': {
                 'files_analyzed': total_files,
@@ -840,6 +1206,8 @@ class ImportAnalyzer:
                 'unresolved_imports': total_unresolved,
                 'cycles_detected': len(cycles),
                 'files_with_errors': len(files_with_errors),
+                'resolve_timeouts': self.stats['resolve_timeouts'],
+                'timed_out_imports': list(self.timed_out_imports),
                 'duration': self.stats['duration']
             },
             'files_analysis': {
@@ -919,6 +1287,14 @@ Exemples d'utilisation:
                        help='Afficher les modules détectés automatiquement')
     parser.add_argument('--verbose', action='store_true',
                        help='Mode verbeux (alias pour --debug)')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Processus de parsing en parallèle (défaut: 1, série)')
+    parser.add_argument('--deadline', type=float, default=None,
+                       help='Budget global en secondes (rapport partiel si dépassé)')
+    parser.add_argument('--persistent-cache', action='store_true',
+                       help='Réutiliser les analyses des invocations précédentes (cache disque)')
+    parser.add_argument('--cache-dir', type=str, default=None,
+                       help='Répertoire du cache disque (défaut: <project-root>/.shadeos/import_cache)')
     
     args = parser.parse_args()
     
@@ -927,7 +1303,14 @@ Exemples d'utilisation:
         args.debug = True
     
     # Créer l'analyseur
-    analyzer = ImportAnalyzer(project_root=args.project_root)
+    analyzer = ImportAnalyzer(project_root=args.project_root, workers=args.workers)
+    if args.persistent_cache or args.cache_dir:
+        from .import_analysis_cache import PersistentImportCache
+        analyzer.persistent_cache = PersistentImportCache(
+            cache_dir=args.cache_dir,
+            project_root=args.project_root,
+            config={'import_resolver': bool(analyzer.import_resolver) and not args.no_import_resolver}
+        )
     
     # Analyser les fichiers
     print("🚀 Début de l'analyse d'imports...")
@@ -935,7 +1318,8 @@ Exemples d'utilisation:
         args.files, 
         max_depth=args.max_depth,
         use_import_resolver=not args.no_import_resolver,
-        debug=args.debug
+        debug=args.debug,
+        deadline=args.deadline
     )
     
     # Afficher les résultats
@@ -8,11 +8,14 @@ Créé par Alma, Architecte Démoniaque du Nexus Luciforme.
 """
 
 from .base_ast_partitioner import BaseASTPartitioner
+from .token_counter import TokenCounter, LineTokenIndex
 from .python_ast_partitioner import PythonASTPartitioner
 from .tree_sitter_partitioner import TreeSitterPartitioner, TREE_SITTER_AVAILABLE
 
 __all__ = [
     'BaseASTPartitioner',
+    'TokenCounter',
+    'LineTokenIndex',
     'PythonASTPartitioner',
     'TreeSitterPartitioner',
     'TREE_SITTER_AVAILABLE'
@@ -15,6 +15,7 @@ from ..schemas.partition_schemas import (
 )
 from ..trackers.location_tracker import LocationTracker
 from ..handlers.error_logger import log_partitioning_error, log_partitioning_warning
+from .token_counter import TokenCounter
 
 
 class BaseASTPartitioner(ABC):
@@ -24,6 +25,7 @@ class BaseASTPartitioner(ABC):
         self.max_tokens = max_tokens
         self.overlap_lines = overlap_lines
         self.location_tracker = LocationTracker()
+        self.token_service = TokenCounter.shared()
         self.token_counter = self._init_token_counter()
     
     @abstractmethod
@@ -85,7 +87,8 @@ class BaseASTPartitioner(ABC):
             # Extraction des nœuds top-level
             top_level_nodes = self.extract_top_level_nodes(tree)
             
-            # Partitionnement de chaque nœud
+            # Partitionnement de chaque nœud (tokens encodés en un lot)
+            self._prefetch_token_counts(content, top_level_nodes)
             for node in top_level_nodes:
                 try:
                     blocks = self._partition_node(content, node, file_path)
@@ -181,6 +184,7 @@ class BaseASTPartitioner(ABC):
         """Subdivise un nœud par son body."""
         
         blocks = []
+        self._prefetch_token_counts(content, node.body)
         
         # Traite chaque élément du body
         for child_node in node.body:
@@ -205,54 +209,29 @@ class BaseASTPartitioner(ABC):
         location = self.location_tracker.create_location_from_ast_node(content, node)
         node_content = location.extract_content(content)
         
-        # Division en chunks de lignes
+        # Division en chunks de lignes (sommes préfixes : un bisect par chunk)
         lines = node_content.split('\n')
+        line_tokens = self.token_service.line_index(node_content)
         chunks = []
-        current_chunk = []
-        current_tokens = 0
+        start_line = 1
         
-        for line in lines:
-            line_tokens = self._count_tokens(line)
-            
-            if current_tokens + line_tokens > self.max_tokens and current_chunk:
-                # Finalise le chunk actuel
-                chunk_content = '\n'.join(current_chunk)
-                chunk_location = self._create_chunk_location(
-                    content, location, current_chunk, lines
-                )
-                
-                chunk_block = PartitionBlock(
-                    content=chunk_content,
-                    block_type=BlockType.CHUNK,
-                    location=chunk_location,
-                    partition_method=PartitionMethod.AST,
-                    block_name=f"{self.get_node_name(node)}_chunk_{len(chunks)}",
-                    token_count=current_tokens
-                )
-                chunks.append(chunk_block)
-                
-                current_chunk = []
-                current_tokens = 0
-            
-            current_chunk.append(line)
-            current_tokens += line_tokens
-        
-        # Dernier chunk
-        if current_chunk:
-            chunk_content = '\n'.join(current_chunk)
+        while start_line <= len(lines):
+            end_line = line_tokens.fit(start_line, self.max_tokens)
+            chunk_lines = lines[start_line - 1:end_line]
             chunk_location = self._create_chunk_location(
-                content, location, current_chunk, lines
+                content, location, chunk_lines, lines
             )
             
             chunk_block = PartitionBlock(
-                content=chunk_content,
+                content='\n'.join(chunk_lines),
                 block_type=BlockType.CHUNK,
                 location=chunk_location,
                 partition_method=PartitionMethod.AST,
                 block_name=f"{self.get_node_name(node)}_chunk_{len(chunks)}",
-                token_count=current_tokens
+                token_count=line_tokens.count(start_line, end_line)
             )
             chunks.append(chunk_block)
+            start_line = end_line + 1
         
         return chunks
     
@@ -345,21 +324,28 @@ class BaseASTPartitioner(ABC):
         return blocks
     
     def _init_token_counter(self):
-        """Initialise le compteur de tokens."""
-        try:
-            import tiktoken
-            return tiktoken.get_encoding("cl100k_base")
-        except ImportError:
-            # Fallback simple
-            return None
+        """Encodeur tiktoken partagé (None si tiktoken est absent)."""
+        return self.token_service.encoder
     
     def _count_tokens(self, text: str) -> int:
-        """Compte les tokens dans un texte."""
-        if self.token_counter:
-            return len(self.token_counter.encode(text))
-        else:
-            # Estimation approximative
-            return len(text.split()) * 1.3
+        """Compte les tokens dans un texte (mémoïsé par le service partagé)."""
+        return self.token_service.count(text)
+    
+    def _count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Compte les tokens de plusieurs textes en un seul lot d'encodage."""
+        return self.token_service.count_many(texts)
+    
+    def _prefetch_token_counts(self, content: str, nodes: List[ast.AST]):
+        """Encode en un lot le contenu de plusieurs nœuds ; _count_tokens les retrouvera mémoïsés."""
+        texts = []
+        for node in nodes:
+            try:
+                location = self.location_tracker.create_location_from_ast_node(content, node)
+                texts.append(location.extract_content(content))
+            except Exception:
+                continue  # Le nœud sera signalé par _partition_node
+        if len(texts) > 1:
+            self.token_service.count_many(texts)
     
     def _calculate_complexity(self, node: ast.AST) -> float:
         """Calcule un score de complexité pour un nœud."""
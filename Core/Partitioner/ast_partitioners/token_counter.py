@@ -0,0 +1,170 @@
+"""
+🔢 Service de Comptage de Tokens Partagé
+
+Un seul encodeur tiktoken par encodage pour tous les partitionneurs, une
+mémoïsation LRU par contenu (le même texte n'est encodé qu'une fois), un
+encodage par lots des textes manquants, et des sommes préfixes de tokens par
+ligne : le nombre de tokens de n'importe quelle plage de lignes s'obtient en
+O(1) une fois l'index de lignes construit.
+
+Créé par Alma, Architecte Démoniaque du Nexus Luciforme.
+"""
+
+import bisect
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Union
+
+TokenCount = Union[int, float]
+
+
+class LineTokenIndex:
+    """Sommes préfixes des tokens par ligne d'un contenu."""
+
+    def __init__(self, line_counts: Sequence[TokenCount]):
+        self.prefix: List[TokenCount] = [0]
+        total = 0
+        for count in line_counts:
+            total += count
+            self.prefix.append(total)
+
+    def __len__(self) -> int:
+        return len(self.prefix) - 1
+
+    def line(self, line_number: int) -> TokenCount:
+        """Tokens d'une ligne (1-based)."""
+        return self.prefix[line_number] - self.prefix[line_number - 1]
+
+    def count(self, start_line: int, end_line: int) -> TokenCount:
+        """Tokens des lignes [start_line, end_line] (1-based, incluses), en O(1)."""
+        start_line = max(1, start_line)
+        end_line = min(len(self), end_line)
+        if end_line < start_line:
+            return 0
+        return self.prefix[end_line] - self.prefix[start_line - 1]
+
+    def fit(self, start_line: int, budget: TokenCount) -> int:
+        """
+        Dernière ligne telle que [start_line, fin] tienne dans le budget.
+
+        Retourne au moins start_line (une ligne trop grosse forme son propre
+        morceau), en O(log n).
+        """
+        limit = self.prefix[start_line - 1] + budget
+        end_line = bisect.bisect_right(self.prefix, limit) - 1
+        return min(len(self), max(start_line, end_line))
+
+
+class TokenCounter:
+    """Compteur de tokens mémoïsé, partagé par encodage."""
+
+    _shared: Dict[str, 'TokenCounter'] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, encoding_name: str = "cl100k_base", encoder=None,
+                 memo_size: int = 8192, line_index_size: int = 32):
+        """
+        Args:
+            encoding_name: Encodage tiktoken
+            encoder: Encodeur déjà construit (sinon chargé depuis tiktoken)
+            memo_size: Nombre de textes gardés dans la mémoïsation
+            line_index_size: Nombre de contenus dont l'index de lignes est gardé
+        """
+        self.encoding_name = encoding_name
+        self.encoder = encoder if encoder is not None else self._load_encoder(encoding_name)
+        self.memo_size = memo_size
+        self.line_index_size = line_index_size
+        self.lock = threading.Lock()
+        self._memo: 'OrderedDict[str, TokenCount]' = OrderedDict()
+        self._line_indexes: 'OrderedDict[str, LineTokenIndex]' = OrderedDict()
+        self.stats = {'hits': 0, 'misses': 0, 'encoded_batches': 0}
+
+    @classmethod
+    def shared(cls, encoding_name: str = "cl100k_base") -> 'TokenCounter':
+        """Instance partagée par tous les partitionneurs d'un processus."""
+        with cls._shared_lock:
+            if encoding_name not in cls._shared:
+                cls._shared[encoding_name] = cls(encoding_name)
+            return cls._shared[encoding_name]
+
+    @staticmethod
+    def _load_encoder(encoding_name: str):
+        try:
+            import tiktoken
+            return tiktoken.get_encoding(encoding_name)
+        except ImportError:
+            # Fallback simple : estimation par mots
+            return None
+
+    def _encode_lengths(self, texts: List[str]) -> List[TokenCount]:
+        if self.encoder is None:
+            # Estimation approximative
+            return [len(text.split()) * 1.3 for text in texts]
+        if len(texts) == 1:
+            return [len(self.encoder.encode_ordinary(texts[0]))]
+        self.stats['encoded_batches'] += 1
+        return [len(tokens) for tokens in self.encoder.encode_ordinary_batch(texts)]
+
+    def _remember(self, text: str, count: TokenCount):
+        self._memo[text] = count
+        if len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
+
+    def count(self, text: str) -> TokenCount:
+        """Nombre de tokens d'un texte (mémoïsé)."""
+        with self.lock:
+            cached = self._memo.get(text)
+            if cached is not None:
+                self._memo.move_to_end(text)
+                self.stats['hits'] += 1
+                return cached
+        count = self._encode_lengths([text])[0]
+        with self.lock:
+            self.stats['misses'] += 1
+            self._remember(text, count)
+        return count
+
+    def count_many(self, texts: Sequence[str]) -> List[TokenCount]:
+        """Nombres de tokens d'une liste de textes ; les absents sont encodés en un lot."""
+        counts: List[Optional[TokenCount]] = [None] * len(texts)
+        missing: Dict[str, List[int]] = {}
+        with self.lock:
+            for position, text in enumerate(texts):
+                cached = self._memo.get(text)
+                if cached is not None:
+                    self._memo.move_to_end(text)
+                    counts[position] = cached
+                else:
+                    missing.setdefault(text, []).append(position)
+            self.stats['hits'] += len(texts) - sum(len(p) for p in missing.values())
+
+        if missing:
+            missing_texts = list(missing)
+            encoded = self._encode_lengths(missing_texts)
+            with self.lock:
+                self.stats['misses'] += len(missing_texts)
+                for text, count in zip(missing_texts, encoded):
+                    self._remember(text, count)
+                    for position in missing[text]:
+                        counts[position] = count
+        return counts
+
+    def line_index(self, content: str) -> LineTokenIndex:
+        """Index des tokens par ligne d'un contenu (mémoïsé par contenu)."""
+        with self.lock:
+            index = self._line_indexes.get(content)
+            if index is not None:
+                self._line_indexes.move_to_end(content)
+                return index
+        index = LineTokenIndex(self.count_many(content.split('\n')))
+        with self.lock:
+            self._line_indexes[content] = index
+            if len(self._line_indexes) > self.line_index_size:
+                self._line_indexes.popitem(last=False)
+        return index
+
+    def clear(self):
+        """Vide les mémoïsations."""
+        with self.lock:
+            self._memo.clear()
+            self._line_indexes.clear()
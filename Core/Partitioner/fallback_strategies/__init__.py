@@ -10,11 +10,13 @@ Créé par Alma, Architecte Démoniaque du Nexus Luciforme.
 from .regex_partitioner import RegexPartitioner
 from .textual_partitioner import TextualPartitioner
 from .emergency_partitioner import EmergencyPartitioner
+from .streaming_partitioner import StreamingPartitioner
 
 __all__ = [
     'RegexPartitioner',
     'TextualPartitioner',
-    'EmergencyPartitioner'
+    'EmergencyPartitioner',
+    'StreamingPartitioner'
 ]
 
 __version__ = "1.0.0"
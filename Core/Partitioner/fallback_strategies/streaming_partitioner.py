@@ -0,0 +1,479 @@
+"""
+🌊 Partitionneur en Flux - Très gros fichiers
+
+Partitionne un fichier sans jamais le charger en entier : le fichier est lu
+par morceaux, les frontières de portée de premier niveau sont détectées
+ligne à ligne (indentation pour Python, profondeur d'accolades pour les
+langages à accolades) et les PartitionBlock sont produits au fil de l'eau.
+La mémoire reste bornée par la taille maximale d'un bloc : une portée plus
+grosse que la limite est découpée en chunks, de préférence entre deux
+membres (méthodes, champs).
+
+Seul iter_blocks() borne la mémoire ; collect() rassemble tous les blocs
+dans un PartitionResult, dont la taille suit donc celle du fichier.
+
+Créé par Alma, Architecte Démoniaque du Nexus Luciforme.
+"""
+
+import re
+import time
+from abc import ABC, abstractmethod
+from typing import Iterator, List, Optional, Tuple
+from ..schemas.partition_schemas import (
+    PartitionBlock, PartitionLocation, PartitionResult,
+    PartitionMethod, BlockType
+)
+
+DEFINITION_TYPES = (BlockType.CLASS, BlockType.FUNCTION)
+
+NAME_PATTERN = re.compile(
+    r'\b(?:class|def|function|fn|func|struct|interface|enum|trait|impl|type)\s+([A-Za-z_$][\w$]*)'
+)
+
+
+class _ScopeTracker(ABC):
+    """Suit chaînes, commentaires et crochets d'une ligne à l'autre."""
+
+    # Jetons spéciaux et délimiteurs de chaîne, surchargés par langage
+    special = re.compile(r'["\'()\[\]{}]')
+    line_comment = None
+    prefixes: Tuple[str, ...] = ()
+
+    def __init__(self):
+        self.depth = 0
+        self.closing: Optional[str] = None  # fin de la chaîne/du commentaire en cours
+        self.multiline = False  # la chaîne en cours peut traverser les lignes
+
+    def idle(self) -> bool:
+        return self.closing is None
+
+    def _open(self, token: str) -> bool:
+        """Ouvre une chaîne/un commentaire ; False si le jeton n'en ouvre pas."""
+        if token in ('"', "'"):
+            self.closing, self.multiline = token, False
+            return True
+        return False
+
+    def scan(self, text: str):
+        """Met à jour l'état après un morceau de ligne."""
+        position, length = 0, len(text)
+        while position < length:
+            if self.closing is not None:
+                end = self._find_closing(text, position)
+                if end == -1:
+                    if not self.multiline and text.endswith('\n'):
+                        self.closing = None  # chaîne simple non fermée : on tolère
+                    return
+                self.closing = None
+                position = end
+                continue
+            match = self.special.search(text, position)
+            if not match:
+                return
+            token = match.group()
+            position = match.end()
+            if token == self.line_comment:
+                return
+            if self._open(token):
+                continue
+            if token in '([{':
+                self.depth += 1
+            elif token in ')]}':
+                self.depth = max(0, self.depth - 1)
+
+    def _find_closing(self, text: str, position: int) -> int:
+        """Position juste après la fin de la chaîne en cours, -1 si absente."""
+        closing = self.closing
+        while True:
+            found = text.find(closing, position)
+            if found == -1:
+                return -1
+            backslashes = 0
+            while found - backslashes - 1 >= position and text[found - backslashes - 1] == '\\':
+                backslashes += 1
+            if backslashes % 2 == 0:
+                return found + len(closing)
+            position = found + 1
+
+    def is_prefix(self, stripped: str) -> bool:
+        """Ligne rattachée à la portée suivante (décorateur, commentaire)."""
+        return stripped.startswith(self.prefixes)
+
+    def starts_unit(self, line: str, stripped: str) -> bool:
+        """Vrai si la ligne ouvre une nouvelle portée de premier niveau."""
+        return self.depth == 0 and self.idle() and not line[0].isspace()
+
+    def split_indent(self, line: str, stripped: str) -> bool:
+        """Vrai si l'on peut couper une portée trop grosse avant cette ligne."""
+        return self.depth <= 1 and self.idle()
+
+    @abstractmethod
+    def block_type(self, stripped: str) -> BlockType:
+        """Type du bloc ouvert par une ligne significative de premier niveau."""
+
+
+class _PythonScopeTracker(_ScopeTracker):
+    special = re.compile(r'"""|\'\'\'|["\'#()\[\]{}]')
+    line_comment = '#'
+    prefixes = ('@', '#')
+    continuations = re.compile(r'(?:else|elif|except|finally)\b')
+
+    def __init__(self):
+        super().__init__()
+        self.continued = False  # ligne terminée par un backslash
+
+    def _open(self, token: str) -> bool:
+        if token in ('"""', "'''"):
+            self.closing, self.multiline = token, True
+            return True
+        return super()._open(token)
+
+    def scan(self, text: str):
+        super().scan(text)
+        if text.endswith('\n'):
+            self.continued = self.idle() and text.rstrip('\r\n').endswith('\\')
+
+    def idle(self) -> bool:
+        return self.closing is None and not self.continued
+
+    def starts_unit(self, line: str, stripped: str) -> bool:
+        return (super().starts_unit(line, stripped)
+                and not self.continuations.match(stripped))
+
+    def split_indent(self, line: str, stripped: str) -> bool:
+        return self.depth == 0 and self.idle()
+
+    def block_type(self, stripped: str) -> BlockType:
+        if stripped.startswith('class '):
+            return BlockType.CLASS
+        if stripped.startswith(('def ', 'async def ')):
+            return BlockType.FUNCTION
+        if stripped.startswith(('import ', 'from ')):
+            return BlockType.IMPORT
+        if re.match(r'[A-Za-z_][\w.]*\s*(?::[^=]*)?=', stripped):
+            return BlockType.VARIABLE
+        return BlockType.MIXED
+
+
+class _BraceScopeTracker(_ScopeTracker):
+    special = re.compile(r'/\*|//|["\'`()\[\]{}]')
+    line_comment = '//'
+    prefixes = ('//', '/*', '*', '@', '#[')
+    definition = re.compile(
+        r'(?:(?:export|default|public|private|protected|internal|static|abstract|final|'
+        r'async|pub(?:\([^)]*\))?|unsafe|extern|inline|virtual|override|sealed|open|data)\s+)*'
+        r'(class|struct|interface|enum|trait|impl|union|object|record|function|fn|func|def|fun)\b'
+    )
+    imports = re.compile(r'(?:import|use|package|#include|require|using|extern crate)\b')
+
+    def __init__(self, char_literals: bool = True):
+        super().__init__()
+        self.char_literals = char_literals
+
+    def _open(self, token: str) -> bool:
+        if token == '/*':
+            self.closing, self.multiline = '*/', True
+            return True
+        if token == '`':
+            self.closing, self.multiline = '`', True
+            return True
+        if token == "'" and not self.char_literals:
+            return False  # lifetimes Rust ('a)
+        return super()._open(token)
+
+    def starts_unit(self, line: str, stripped: str) -> bool:
+        # "{" seul en colonne 0 : corps d'une déclaration style C
+        return super().starts_unit(line, stripped) and not stripped.startswith('{')
+
+    def block_type(self, stripped: str) -> BlockType:
+        match = self.definition.match(stripped)
+        if match:
+            keyword = match.group(1)
+            if keyword in ('function', 'fn', 'func', 'def', 'fun'):
+                return BlockType.FUNCTION
+            return BlockType.CLASS
+        if self.imports.match(stripped):
+            return BlockType.IMPORT
+        if re.match(r'[\w:<>\[\]*&\s]+\([^;]*\)\s*(?:->\s*[\w:<>&*]+\s*)?(?:const\s*)?\{?$', stripped):
+            return BlockType.FUNCTION  # signature C/C++/Java sans mot-clé
+        return BlockType.MIXED
+
+
+class _Span:
+    """Morceaux de lignes consécutifs avec leurs coordonnées."""
+
+    __slots__ = ('pieces', 'chars', 'start', 'end', 'block_type', 'name',
+                 'significant', 'split_points', 'chunks', 'body_indent')
+
+    def __init__(self):
+        self.pieces: List[str] = []
+        self.chars = 0
+        self.start = None  # (ligne, caractère, offset)
+        self.end = None
+        self.block_type: Optional[BlockType] = None
+        self.name: Optional[str] = None
+        self.significant = False
+        self.split_points: List[int] = []
+        self.chunks = 0
+        self.body_indent: Optional[int] = None
+
+    def add(self, piece: str, line: int, char: int, offset: int):
+        if self.start is None:
+            self.start = (line, char, offset)
+        self.pieces.append(piece)
+        self.chars += len(piece)
+        last = len(piece) - 1 if piece.endswith('\n') else len(piece)
+        self.end = (line, char + last, offset + len(piece))
+
+    def extend(self, other: '_Span'):
+        if other.start is None:
+            return
+        if self.start is None:
+            self.start = other.start
+        self.pieces.extend(other.pieces)
+        self.chars += other.chars
+        self.end = other.end
+
+
+class StreamingPartitioner:
+    """Partitionneur par flux à mémoire bornée pour les très gros fichiers."""
+
+    INDENT_LANGUAGES = {'python'}
+    BRACE_LANGUAGES = {
+        'javascript', 'typescript', 'rust', 'go', 'c', 'cpp', 'java', 'csharp',
+        'kotlin', 'swift', 'php', 'scala', 'fsharp'
+    }
+
+    def __init__(self, max_tokens: int = 3500, chars_per_token: int = 4,
+                 read_size: int = 1024 * 1024):
+        """
+        Args:
+            max_tokens: Taille cible maximale d'un bloc
+            chars_per_token: Ratio caractères/token pour borner les blocs sans encoder
+            read_size: Taille des lectures sur disque
+        """
+        self.max_tokens = max_tokens
+        self.chars_per_token = chars_per_token
+        self.max_chars = max_tokens * chars_per_token
+        self.read_size = read_size
+
+    def _tracker_for(self, language: str) -> Optional[_ScopeTracker]:
+        if language in self.INDENT_LANGUAGES:
+            return _PythonScopeTracker()
+        if language in self.BRACE_LANGUAGES:
+            return _BraceScopeTracker(char_literals=language != 'rust')
+        return None
+
+    def _open(self, file_path: str):
+        # Même décodage pour le comptage et le découpage : offsets et total en caractères
+        return open(file_path, 'r', encoding='utf-8', errors='replace', newline='')
+
+    def count_chars(self, file_path: str) -> int:
+        """Nombre de caractères (et non d'octets) du fichier, lu par morceaux."""
+        total = 0
+        with self._open(file_path) as f:
+            for data in iter(lambda: f.read(self.read_size), ''):
+                total += len(data)
+        return total
+
+    def _iter_pieces(self, file_path: str) -> Iterator[Tuple[str, int, int, int]]:
+        """(morceau, ligne, caractère, offset) ; une ligne trop longue est coupée."""
+        line, char, offset = 1, 0, 0
+        carry = ''
+        with self._open(file_path) as f:
+            while True:
+                data = f.read(self.read_size)
+                carry += data
+                position = 0
+                while True:
+                    newline = carry.find('\n', position)
+                    if newline == -1:
+                        if len(carry) - position < self.max_chars and data:
+                            break
+                        piece = carry[position:position + self.max_chars]
+                        if not piece:
+                            break
+                    else:
+                        piece = carry[position:min(newline + 1, position + self.max_chars)]
+                    yield piece, line, char, offset
+                    position += len(piece)
+                    offset += len(piece)
+                    if piece.endswith('\n'):
+                        line, char = line + 1, 0
+                    else:
+                        char += len(piece)
+                carry = carry[position:]
+                if not data:
+                    return
+
+    def iter_blocks(self, file_path: str, language: str = 'unknown') -> Iterator[PartitionBlock]:
+        """
+        Produit les blocs du fichier dans l'ordre, sans le charger en entier.
+
+        Le fichier est lu deux fois : un premier passage compte ses
+        caractères (total_chars des blocs), le second le découpe.
+        """
+        tracker = self._tracker_for(language)
+        total_chars = self.count_chars(file_path)
+        unit, group = _Span(), _Span()
+
+        for piece, line, char, offset in self._iter_pieces(file_path):
+            at_line_start = char == 0
+            stripped = piece.strip()
+
+            if tracker is not None and at_line_start and stripped:
+                if unit.significant and tracker.starts_unit(piece, stripped):
+                    group, blocks = self._close_unit(unit, group, total_chars)
+                    yield from blocks
+                    unit = _Span()
+                elif unit.significant and tracker.split_indent(piece, stripped):
+                    indent = len(piece) - len(piece.lstrip())
+                    if unit.body_indent is None and indent > 0:
+                        unit.body_indent = indent
+                    if unit.body_indent is not None and 0 < indent <= unit.body_indent:
+                        unit.split_points.append(len(unit.pieces))
+                if not unit.significant and not tracker.is_prefix(stripped):
+                    unit.significant = True
+                    unit.block_type = tracker.block_type(stripped)
+                    match = NAME_PATTERN.search(stripped)
+                    unit.name = match.group(1) if match else None
+            elif tracker is None and stripped:
+                unit.significant = True
+                unit.block_type = BlockType.CHUNK
+
+            unit.add(piece, line, char, offset)
+            if tracker is not None:
+                tracker.scan(piece)
+
+            if unit.chars > self.max_chars:
+                # Portée trop grosse : le groupe en attente d'abord, puis des chunks
+                if group.pieces:
+                    yield self._make_block(group, total_chars)
+                    group = _Span()
+                while unit.chars > self.max_chars:
+                    yield self._split_unit(unit, total_chars)
+
+        group, blocks = self._close_unit(unit, group, total_chars)
+        yield from blocks
+        if group.pieces:
+            yield self._make_block(group, total_chars)
+
+    def _close_unit(self, unit: _Span, group: _Span, total_chars: int):
+        """Termine une portée ; retourne (groupe en attente, blocs à produire)."""
+        blocks = []
+        if not unit.pieces:
+            return group, blocks
+        if unit.block_type in DEFINITION_TYPES or unit.chunks:
+            if group.pieces:
+                blocks.append(self._make_block(group, total_chars))
+                group = _Span()
+            blocks.append(self._make_block(unit, total_chars))
+            return group, blocks
+
+        # Instructions de premier niveau regroupées jusqu'à la taille max
+        if group.pieces and group.chars + unit.chars > self.max_chars:
+            blocks.append(self._make_block(group, total_chars))
+            group = _Span()
+        if group.start is None:
+            group.block_type, group.name = unit.block_type, unit.name
+        else:
+            group.name = None
+            if group.block_type != unit.block_type:
+                group.block_type = BlockType.MIXED
+        group.extend(unit)
+        return group, blocks
+
+    def _split_unit(self, unit: _Span, total_chars: int) -> PartitionBlock:
+        """Détache le début d'une portée trop grosse en chunk et garde le reste."""
+        points = [point for point in unit.split_points if 0 < point < len(unit.pieces)]
+        # Sans frontière de membre, on coupe avant le dernier morceau (chunk <= max_chars)
+        cut = points[-1] if points else max(1, len(unit.pieces) - 1)
+        head, tail = unit.pieces[:cut], unit.pieces[cut:]
+
+        chunk = _Span()
+        chunk.block_type = BlockType.CHUNK
+        chunk.name = f"{unit.name or 'scope'}_chunk_{unit.chunks}"
+        chunk.start = unit.start
+        chunk.pieces = head
+        chunk.chars = sum(len(piece) for piece in head)
+        end_offset = unit.start[2] + chunk.chars
+        chunk.end = self._end_of(head, unit.start, end_offset)
+        unit.chunks += 1
+        block = self._make_block(chunk, total_chars, parent=unit.name)
+
+        unit.pieces = tail
+        unit.chars -= chunk.chars
+        unit.split_points = [point - cut for point in unit.split_points if point > cut]
+        if tail:
+            line, char, _ = chunk.end
+            if head[-1].endswith('\n'):
+                unit.start = (line + 1, 0, end_offset)
+            else:
+                unit.start = (line, char, end_offset)
+        else:
+            unit.start = None
+        return block
+
+    @staticmethod
+    def _end_of(pieces: List[str], start, end_offset: int):
+        """Coordonnées du dernier caractère d'une suite de morceaux."""
+        line, char = start[0], start[1]
+        for piece in pieces[:-1]:
+            if piece.endswith('\n'):
+                line, char = line + 1, 0
+            else:
+                char += len(piece)
+        last = pieces[-1]
+        return (line, char + (len(last) - 1 if last.endswith('\n') else len(last)), end_offset)
+
+    def _make_block(self, span: _Span, total_chars: int, parent: Optional[str] = None) -> PartitionBlock:
+        block_type = BlockType.CHUNK if span.chunks else (span.block_type or BlockType.CHUNK)
+        name = f"{span.name}_chunk_{span.chunks}" if span.chunks and span.name else span.name
+        content = ''.join(span.pieces)
+        location = PartitionLocation(
+            start_line=span.start[0], start_char=span.start[1],
+            end_line=span.end[0], end_char=span.end[1],
+            start_offset=span.start[2], end_offset=span.end[2],
+            total_chars=total_chars
+        )
+        return PartitionBlock(
+            block_type=block_type,
+            content=content,
+            location=location,
+            method=PartitionMethod.STREAMING,
+            parent_block=parent or (span.name if span.chunks else None),
+            metadata={
+                'block_name': name,
+                'estimated_tokens': len(content) // self.chars_per_token,
+                'streamed': True
+            }
+        )
+
+    def collect(self, file_path: str, language: str = 'unknown') -> PartitionResult:
+        """
+        Partitionne tout le fichier en flux et rassemble les blocs dans un PartitionResult.
+
+        Le fichier n'est jamais chargé d'un seul tenant ni parsé en AST, mais le
+        résultat contient tous les blocs : sa mémoire suit la taille du
+        fichier. Utiliser iter_blocks() pour une mémoire bornée.
+        """
+        start_time = time.time()
+        result = PartitionResult(
+            file_path=file_path,
+            file_type=language,
+            total_lines=0,
+            total_chars=0,
+            partitions=[],
+            strategy_used=PartitionMethod.STREAMING,
+            success=False
+        )
+        try:
+            for block in self.iter_blocks(file_path, language):
+                result.partitions.append(block)
+                result.total_lines = block.location.end_line
+                result.total_chars = block.location.total_chars
+            result.success = True
+        except (OSError, UnicodeError) as e:
+            result.add_error("streaming_error", str(e))
+        result.processing_time = time.time() - start_time
+        return result
@@ -5,7 +5,9 @@ Ce module contient les résolveurs d'imports pour localiser les fichiers corresp
 """
 
 from .import_resolver import ImportResolver
+from .module_index import ModuleIndex
 
 __all__ = [
-    'ImportResolver'
+    'ImportResolver',
+    'ModuleIndex'
 ] 
\ No newline at end of file
@@ -12,12 +12,16 @@ import sys
 import ast
 import logging
 import importlib.util
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple, Union
 from dataclasses import dataclass
 from collections import defaultdict
 from enum import Enum
 
+from .module_index import ModuleIndex
+
 # Configuration du logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
@@ -250,64 +254,124 @@ class PackageAnalyzer:
         
         return None
 
+# Résolveur propre à chaque processus du pool (créé par l'initializer)
+_worker_resolver = None
+
+
+def _init_resolver_worker(project_root: str):
+    """Initializer du pool : un résolveur (et ses caches) par processus."""
+    global _worker_resolver
+    _worker_resolver = ImportResolver(project_root)
+
+
+def _analyze_dependencies_in_worker(file_path: str) -> DependencyNode:
+    """Analyse les dépendances d'un fichier dans un processus du pool."""
+    return _worker_resolver.analyze_file_dependencies(file_path)
+
+
 class ImportResolver:
     """Résolveur d'imports locaux amélioré avec approche générique."""
     
-    def __init__(self, project_root: str = '.'):
+    def __init__(self, project_root: str = '.', module_index: ModuleIndex = None):
+        """
+        Args:
+            project_root: Racine du projet
+            module_index: Index des modules (défaut: instance partagée du projet)
+        """
         self.project_root = Path(project_root)
-        self.import_cache: Dict[str, Optional[str]] = {}
+        # Clés normalisées : (nom de module absolu, chemins de recherche)
+        self.import_cache: Dict[Tuple[str, Tuple[str, ...]], Optional[str]] = {}
         self.dependency_graph: Dict[str, Set[str]] = defaultdict(set)
         self.file_structure_cache: Dict[str, List[str]] = {}
         self.unresolved_imports: List[str] = []
         self.error_classifier = ImportErrorClassifier()
         self.package_analyzer = PackageAnalyzer(self.project_root)
+        self._module_index = module_index
+        self._search_paths_cache: Dict[str, Tuple[float, List[Path]]] = {}
+    
+    @property
+    def module_index(self) -> ModuleIndex:
+        """Index des modules, chargé (ou construit) au premier usage."""
+        if self._module_index is None:
+            self._module_index = ModuleIndex.shared(str(self.project_root))
+        return self._module_index
         
     def _build_file_structure_cache(self):
-        """Construit un cache de la structure des fichiers."""
+        """Construit un cache de la structure des fichiers (depuis l'index des modules)."""
         if self.file_structure_cache:
             return
-            
-        logger.info("🔧 Construction du cache de structure des fichiers...")
-        
-        for root, dirs, files in os.walk(self.project_root):
-            dirs[:] = [d for d in dirs if d not in ['.git', '__pycache__', '.pytest_cache']]
-            
-            for file in files:
-                if file.endswith('.py'):
-                    file_path = Path(root) / file
-                    path_str = str(file_path)
-                    
-                    # Indexer par nom de fichier
-                    if file not in self.file_structure_cache:
-                        self.file_structure_cache[file] = []
-                    self.file_structure_cache[file].append(path_str)
-                    
-                    # Indexer par chemin complet
-                    path_parts = list(file_path.parts)
-                    path_key = '/'.join(path_parts)
-                    self.file_structure_cache[path_key] = [path_str]
-        
-        logger.info(f"✅ Cache construit: {len(self.file_structure_cache)} entrées")
+        self.file_structure_cache = self.module_index.files_by_name()
+    
+    def _normalize_import(self, import_name: str, current_file: str,
+                          search_paths: List[Path]) -> Optional[Tuple[str, Tuple[str, ...]]]:
+        """
+        Clé de cache normalisée d'un import.
+        
+        Un import relatif est converti en nom absolu : deux fichiers frères qui
+        importent le même module partagent ainsi la même entrée de cache.
+        """
+        if import_name.startswith('.'):
+            absolute_name = self._absolute_name_for_relative(import_name, Path(current_file))
+            return (absolute_name, ()) if absolute_name is not None else None
+        return import_name, tuple(str(path) for path in search_paths)
+    
+    def _absolute_name_for_relative(self, import_name: str, current_path: Path) -> Optional[str]:
+        """Nom de module absolu d'un import relatif, ou None s'il sort du projet."""
+        dots = len(import_name) - len(import_name.lstrip('.'))
+        module_name = import_name[dots:]
+        target_dir = Path(os.path.abspath(current_path)).parent
+        for _ in range(dots - 1):
+            target_dir = target_dir.parent
+        try:
+            relative_path = target_dir.relative_to(self.module_index.project_root)
+        except ValueError:
+            return None
+        parts = list(relative_path.parts) + (module_name.split('.') if module_name else [])
+        return '.'.join(parts)
+    
+    def _lookup_in_index(self, module_name: str, search_paths: List[Path]) -> Optional[str]:
+        """Cherche un module local dans l'index, relativement à chaque chemin de recherche."""
+        index = self.module_index
+        for search_path in search_paths:
+            try:
+                prefix = Path(os.path.abspath(search_path)).relative_to(index.project_root)
+            except ValueError:
+                continue
+            qualified = '.'.join(list(prefix.parts) + [module_name])
+            resolved = index.lookup(qualified)
+            if resolved:
+                return resolved
+        return None
     
     def resolve_import(self, import_name: str, current_file: str) -> Optional[str]:
         """Résout un import vers un fichier Python."""
-        cache_key = f"{import_name}:{current_file}"
-        if cache_key in self.import_cache:
+        # Simuler les modifications de sys.path pour ce fichier
+        search_paths = self._get_search_paths_for_file(current_file)
+        
+        cache_key = self._normalize_import(import_name, current_file, search_paths)
+        if cache_key is not None and cache_key in self.import_cache:
             return self.import_cache[cache_key]
         
         logger.debug(f"🔍 Résolution: {import_name} depuis {current_file}")
-        
-        self._build_file_structure_cache()
         current_path = Path(current_file)
         
-        # Simuler les modifications de sys.path pour ce fichier
-        search_paths = self._get_search_paths_for_file(current_file)
-        
         # Import relatif
         if import_name.startswith('.'):
-            result = self._resolve_relative_import(import_name, current_path)
+            result = None
+            if cache_key is not None:
+                # Module lui-même, ou module parent si le dernier élément est un nom importé
+                absolute_name = cache_key[0]
+                result = (self.module_index.lookup(absolute_name)
+                          or self.module_index.lookup(absolute_name.rsplit('.', 1)[0]))
+            if not result:
+                result = self._resolve_relative_import(import_name, current_path)
         else:
-            result = self._resolve_absolute_import_with_paths(import_name, search_paths)
+            # Modules locaux depuis l'index, sinon importlib (stdlib, tiers)
+            parts = import_name.split('.')
+            module_name = '.'.join(parts[:-1]) if len(parts) > 1 else import_name
+            result = self._lookup_in_index(module_name, search_paths)
+            if not result:
+                result = self._resolve_absolute_import_with_paths(import_name, search_paths)
         
         if result:
             logger.debug(f"✅ Résolu: {import_name} -> {result}")
@@ -315,7 +379,8 @@ class ImportResolver:
             logger.warning(f"❌ Non résolu: {import_name} depuis {current_file}")
             self.unresolved_imports.append(f"{import_name} (depuis {current_file})")
         
-        self.import_cache[cache_key] = result
+        if cache_key is not None:
+            self.import_cache[cache_key] = result
         return result
     
     def _resolve_relative_import(self, import_name: str, current_path: Path) -> Optional[str]:
@@ -427,7 +492,20 @@ class ImportResolver:
         return None
     
     def _get_search_paths_for_file(self, file_path: str) -> List[Path]:
-        """Détermine les chemins de recherche pour un fichier donné."""
+        """Détermine les chemins de recherche pour un fichier donné (mémoïsé par mtime)."""
+        try:
+            mtime = os.path.getmtime(file_path)
+        except OSError:
+            mtime = None
+        cached = self._search_paths_cache.get(file_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        search_paths = self._scan_search_paths(file_path)
+        self._search_paths_cache[file_path] = (mtime, search_paths)
+        return search_paths
+    
+    def _scan_search_paths(self, file_path: str) -> List[Path]:
+        """Analyse les modifications de sys.path faites par un fichier."""
         search_paths = [self.project_root]  # Chemin par défaut
         
         # Analyser les modifications de sys.path dans le fichier
@@ -602,39 +680,90 @@ class ImportResolver:
         
         return patterns
     
-    def analyze_recursive_dependencies(self, start_files: List[str], max_depth: int = 50) -> Dict[str, DependencyNode]:
-        """Analyse récursive des dépendances."""
+    def analyze_recursive_dependencies(self, start_files: List[str], max_depth: int = 50,
+                                       workers: int = 1) -> Dict[str, DependencyNode]:
+        """
+        Analyse récursive des dépendances.
+        
+        Le parcours se fait niveau par niveau, en largeur ; avec workers > 1 les
+        fichiers d'un niveau sont analysés dans un pool de processus puis
+        fusionnés dans l'ordre du parcours, si bien que le résultat est
+        identique quel que soit le nombre de workers.
+        
+        Args:
+            start_files: Fichiers de départ
+            max_depth: Profondeur maximale
+            workers: Processus d'analyse (1 = série, None = un par cœur)
+        """
         logger.info(f"🔄 Analyse récursive: {len(start_files)} fichiers de départ")
+        workers = workers if workers is not None else (os.cpu_count() or 1)
         
         visited = set()
         all_dependencies: Dict[str, DependencyNode] = {}
         
-        def analyze_recursively(file_path: str, depth: int = 0):
-            if depth > max_depth or file_path in visited:
-                return
-            
-            visited.add(file_path)
-            logger.debug(f"  {'  ' * depth}📁 {file_path}")
-            
-            # Analyser le fichier
-            dependency_node = self.analyze_file_dependencies(file_path)
-            all_dependencies[file_path] = dependency_node
-            
-            # Analyser récursivement les dépendances
-            for dep_file in dependency_node.dependencies:
-                if dep_file not in visited:
-                    analyze_recursively(dep_file, depth + 1)
-        
-        # Analyser tous les fichiers de départ
+        frontier = []
         for file_path in start_files:
-            if os.path.exists(file_path):
-                analyze_recursively(file_path)
-            else:
+            if not os.path.exists(file_path):
                 logger.warning(f"⚠️ Fichier non trouvé: {file_path}")
+            elif file_path not in visited:
+                visited.add(file_path)
+                frontier.append(file_path)
+        
+        executor = None
+        try:
+            depth = 0
+            while frontier and depth <= max_depth:
+                nodes = None
+                if workers > 1 and len(frontier) > 1:
+                    nodes, executor = self._analyze_level_parallel(frontier, workers, executor)
+                if nodes is None:
+                    workers = 1
+                    nodes = [self.analyze_file_dependencies(file_path) for file_path in frontier]
+                
+                next_frontier = []
+                for dependency_node in nodes:
+                    logger.debug(f"  {'  ' * depth}📁 {dependency_node.file_path}")
+                    all_dependencies[dependency_node.file_path] = dependency_node
+                    
+                    # Ordre trié : les ensembles de dépendances n'ont pas d'ordre stable
+                    for dep_file in sorted(dependency_node.dependencies):
+                        if dep_file not in visited:
+                            visited.add(dep_file)
+                            next_frontier.append(dep_file)
+                
+                frontier = next_frontier
+                depth += 1
+        finally:
+            if executor is not None:
+                executor.shutdown()
         
         logger.info(f"✅ Analyse terminée: {len(all_dependencies)} fichiers analysés")
         return all_dependencies
     
+    def _analyze_level_parallel(self, file_paths: List[str], workers: int, executor):
+        """Analyse un niveau dans le pool ; retourne (nœuds ou None si indisponible, pool)."""
+        try:
+            if executor is None:
+                executor = ProcessPoolExecutor(max_workers=workers,
+                                               initializer=_init_resolver_worker,
+                                               initargs=(str(self.project_root),))
+            chunksize = max(1, len(file_paths) // (workers * 4))
+            nodes = list(executor.map(_analyze_dependencies_in_worker, file_paths, chunksize=chunksize))
+        except (BrokenProcessPool, OSError, RuntimeError) as e:
+            logger.warning(f"⚠️ Pool d'analyse indisponible, retour au mode série: {e}")
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+            return None, None
+        
+        # Reporter dans ce résolveur l'état accumulé par les workers
+        for dependency_node in nodes:
+            self.dependency_graph[dependency_node.file_path].update(dependency_node.dependencies)
+            self.unresolved_imports.extend(
+                f"{import_name} (depuis {dependency_node.file_path})"
+                for import_name in dependency_node.unresolved_imports
+            )
+        return nodes, executor
+    
     def get_dependency_stats(self, dependencies: Dict[str, DependencyNode]) -> Dict[str, any]:
         """Calcule les statistiques des dépendances."""
         total_files = len(dependencies)
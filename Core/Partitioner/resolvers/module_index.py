@@ -0,0 +1,222 @@
+"""
+🗂️ Index incrémental des modules du projet pour l'ImportResolver
+
+Associe chaque nom de module local (``Core.Partitioner.resolvers``) au fichier
+qui le définit. L'index est construit une seule fois, persisté dans
+``.shadeos/module_index.json``, puis tenu à jour par sondage des mtimes de
+dossiers : seuls les dossiers modifiés (fichier ajouté, supprimé ou renommé)
+sont relus. Une même instance est partagée par tous les résolveurs d'un projet.
+
+Créé par Alma, Architecte Démoniaque du Nexus Luciforme.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+INDEX_FORMAT_VERSION = 1
+IGNORED_DIRS = {'.git', '__pycache__', '.pytest_cache', '.shadeos', 'node_modules', '.venv', 'venv'}
+
+
+class ModuleIndex:
+    """Index nom de module → fichier, persistant et mis à jour par deltas."""
+
+    _shared: Dict[str, 'ModuleIndex'] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, project_root: str = '.', index_file: str = None,
+                 refresh_interval: float = 2.0):
+        """
+        Args:
+            project_root: Racine du projet indexé
+            index_file: Fichier de persistance (défaut: <project_root>/.shadeos/module_index.json)
+            refresh_interval: Délai min (s) entre deux sondages des dossiers
+        """
+        self.project_root = Path(os.path.abspath(project_root))
+        self.index_file = Path(index_file) if index_file else self.project_root / '.shadeos' / 'module_index.json'
+        self.refresh_interval = refresh_interval
+        self.lock = threading.RLock()
+
+        self.modules: Dict[str, str] = {}  # nom de module → chemin relatif du fichier
+        self.dir_mtimes: Dict[str, int] = {}  # dossier relatif → mtime_ns au dernier scan
+        self.dir_modules: Dict[str, List[str]] = {}  # dossier relatif → modules qu'il définit
+        self._last_refresh = 0.0
+        self._loaded = False
+
+    @classmethod
+    def shared(cls, project_root: str = '.') -> 'ModuleIndex':
+        """Instance partagée par tous les résolveurs d'un même projet."""
+        key = os.path.abspath(project_root)
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(key)
+            return cls._shared[key]
+
+    # ----- Construction et persistance -----
+
+    def ensure_loaded(self):
+        """Charge l'index persisté (ou le construit) puis applique les deltas."""
+        with self.lock:
+            if self._loaded:
+                self.refresh()
+                return
+            self._loaded = True
+            if self._load():
+                self.refresh(force=True)
+            else:
+                self.rebuild()
+
+    def _load(self) -> bool:
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"⚠️ Index des modules illisible, reconstruction: {e}")
+            return False
+        if data.get('version') != INDEX_FORMAT_VERSION:
+            return False
+        self.dir_mtimes = data.get('dir_mtimes', {})
+        self.dir_modules = data.get('dir_modules', {})
+        self.modules = data.get('modules', {})
+        return True
+
+    def save(self):
+        """Écrit l'index de façon atomique."""
+        with self.lock:
+            data = {
+                'version': INDEX_FORMAT_VERSION,
+                'dir_mtimes': self.dir_mtimes,
+                'dir_modules': self.dir_modules,
+                'modules': self.modules
+            }
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.index_file.with_name(f"{self.index_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_file, self.index_file)
+        except OSError as e:
+            logger.warning(f"⚠️ Impossible de sauvegarder l'index des modules: {e}")
+
+    def rebuild(self):
+        """Reconstruit tout l'index (un seul parcours du projet)."""
+        with self.lock:
+            logger.info("🔧 Construction de l'index des modules...")
+            self.modules, self.dir_mtimes, self.dir_modules = {}, {}, {}
+            # Créé avant le scan : sinon le mtime de son dossier parent change juste après
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            self._scan_tree('')
+            self._last_refresh = time.monotonic()
+            self.save()
+            logger.info(f"✅ Index des modules construit: {len(self.modules)} modules")
+
+    # ----- Scan -----
+
+    @staticmethod
+    def _module_name(rel_dir: str, file_name: str) -> str:
+        parts = [part for part in rel_dir.split('/') if part] if rel_dir else []
+        stem = file_name[:-3]
+        if stem != '__init__':
+            parts.append(stem)
+        return '.'.join(parts)
+
+    def _scan_dir(self, rel_dir: str) -> List[str]:
+        """Relit un dossier ; retourne ses sous-dossiers (relatifs)."""
+        abs_dir = self.project_root / rel_dir if rel_dir else self.project_root
+        try:
+            mtime_ns = os.stat(abs_dir).st_mtime_ns
+            entries = list(os.scandir(abs_dir))
+        except OSError:
+            self._forget_dir(rel_dir)
+            return []
+
+        for module_name in self.dir_modules.pop(rel_dir, []):
+            self.modules.pop(module_name, None)
+
+        subdirs, module_names = [], []
+        for entry in sorted(entries, key=lambda e: e.name):
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in IGNORED_DIRS and not entry.name.startswith('.'):
+                    subdirs.append(rel_path)
+            elif entry.name.endswith('.py'):
+                module_name = self._module_name(rel_dir, entry.name)
+                if module_name:
+                    self.modules[module_name] = rel_path
+                    module_names.append(module_name)
+
+        self.dir_modules[rel_dir] = module_names
+        self.dir_mtimes[rel_dir] = mtime_ns
+        return subdirs
+
+    def _scan_tree(self, rel_dir: str):
+        stack = [rel_dir]
+        while stack:
+            stack.extend(self._scan_dir(stack.pop()))
+
+    def _forget_dir(self, rel_dir: str):
+        """Retire un dossier supprimé et tous ses sous-dossiers de l'index."""
+        prefix = rel_dir + '/'
+        for known_dir in [d for d in self.dir_mtimes if d == rel_dir or d.startswith(prefix)]:
+            for module_name in self.dir_modules.pop(known_dir, []):
+                self.modules.pop(module_name, None)
+            self.dir_mtimes.pop(known_dir, None)
+
+    def refresh(self, force: bool = False) -> int:
+        """
+        Sonde les mtimes des dossiers connus et relit ceux qui ont changé.
+
+        Returns:
+            Nombre de dossiers relus
+        """
+        with self.lock:
+            if not force and time.monotonic() - self._last_refresh < self.refresh_interval:
+                return 0
+            self._last_refresh = time.monotonic()
+
+            changed = []
+            for rel_dir, known_mtime in list(self.dir_mtimes.items()):
+                abs_dir = self.project_root / rel_dir if rel_dir else self.project_root
+                try:
+                    if os.stat(abs_dir).st_mtime_ns != known_mtime:
+                        changed.append(rel_dir)
+                except OSError:
+                    self._forget_dir(rel_dir)
+
+            for rel_dir in changed:
+                if rel_dir not in self.dir_mtimes:
+                    continue  # retiré avec un parent supprimé
+                for subdir in self._scan_dir(rel_dir):
+                    # Les nouveaux sous-dossiers sont parcourus entièrement
+                    if subdir not in self.dir_mtimes:
+                        self._scan_tree(subdir)
+
+            if changed:
+                logger.debug(f"🔄 Index des modules: {len(changed)} dossiers relus")
+                self.save()
+            return len(changed)
+
+    # ----- Requêtes -----
+
+    def lookup(self, module_name: str) -> Optional[str]:
+        """Chemin absolu du fichier définissant un module local, ou None."""
+        self.ensure_loaded()
+        rel_path = self.modules.get(module_name)
+        return str(self.project_root / rel_path) if rel_path else None
+
+    def files_by_name(self) -> Dict[str, List[str]]:
+        """Fichiers indexés regroupés par nom de fichier."""
+        self.ensure_loaded()
+        by_name: Dict[str, List[str]] = {}
+        with self.lock:
+            for rel_path in self.modules.values():
+                by_name.setdefault(os.path.basename(rel_path), []).append(str(self.project_root / rel_path))
+        return by_name
@@ -6,27 +6,37 @@ Créé par Alma, Architecte Démoniaque du Nexus Luciforme.
 """
 
 import os
-from typing import Dict, List, Optional, Type, Any
-from .partition_schemas import PartitionResult, PartitioningError
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterable, Iterator, List, Optional, Type, Any
+from .partition_schemas import PartitionBlock, PartitionResult, PartitioningError
 from ..ast_partitioners.base_ast_partitioner import BaseASTPartitioner
 from ..ast_partitioners.python_ast_partitioner import PythonASTPartitioner
 from ..ast_partitioners.tree_sitter_partitioner import TreeSitterPartitioner, TREE_SITTER_AVAILABLE
 from ..fallback_strategies import (
     RegexPartitioner,
     TextualPartitioner,
-    EmergencyPartitioner
+    EmergencyPartitioner,
+    StreamingPartitioner
 )
 from ..handlers.error_logger import log_partitioning_error, log_partitioning_warning
 
 
+# Au-delà de cette taille, les fichiers lus depuis le disque sont partitionnés en flux
+STREAMING_THRESHOLD = 8 * 1024 * 1024
+
+
 class LanguageRegistry:
     """Registre central des partitionneurs par langage."""
     
-    def __init__(self):
+    def __init__(self, streaming_threshold: int = STREAMING_THRESHOLD):
         self.partitioners: Dict[str, BaseASTPartitioner] = {}
         self.language_mappings: Dict[str, str] = {}
         self.extension_mappings: Dict[str, str] = {}
         self.languages: Dict[str, Dict[str, Any]] = {}  # Attribut pour les tests
+        self.streaming_threshold = streaming_threshold
+        self.streaming_partitioner = StreamingPartitioner()
         self._init_default_mappings()
         self._init_default_partitioners()
     
@@ -263,6 +273,132 @@ class LanguageRegistry:
             )
             raise
 
+    def should_stream(self, file_path: str) -> bool:
+        """Vrai si le fichier dépasse le seuil du partitionnement en flux."""
+        try:
+            return os.path.getsize(file_path) > self.streaming_threshold
+        except OSError:
+            return False
+
+    def iter_partition_blocks(self, file_path: str,
+                              language: Optional[str] = None) -> Iterator[PartitionBlock]:
+        """
+        Blocs d'un fichier lu depuis le disque, produits au fil de l'eau.
+
+        Au-delà de streaming_threshold, le fichier n'est jamais chargé en
+        entier (StreamingPartitioner) et la mémoire reste bornée par un bloc ;
+        en dessous, il passe par le partitionneur habituel de son langage.
+        C'est le seul point d'entrée à mémoire bornée pour les gros fichiers.
+        """
+        language = language or self.detect_language(file_path)
+        if self.should_stream(file_path):
+            yield from self.streaming_partitioner.iter_blocks(file_path, language)
+            return
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        yield from self.partition_file(file_path, content, language).partitions
+
+    def collect_large_file(self, file_path: str, language: Optional[str] = None) -> PartitionResult:
+        """
+        Partitionne un très gros fichier en flux et rassemble tous ses blocs.
+
+        Évite le contenu d'un seul tenant et l'AST complet, mais le
+        PartitionResult garde chaque bloc : sa mémoire suit la taille du
+        fichier. Pour une mémoire bornée, itérer iter_partition_blocks().
+        """
+        language = language or self.detect_language(file_path)
+        result = self.streaming_partitioner.collect(file_path, language)
+        result.metadata['detected_language'] = language
+        result.metadata['partitioner_type'] = type(self.streaming_partitioner).__name__
+        return result
+
+    def partition_path(self, file_path: str, language: Optional[str] = None) -> PartitionResult:
+        """
+        Lit puis partitionne un fichier sans jamais lever d'exception.
+
+        Un échec (lecture ou partitionnement) donne un PartitionResult avec
+        success=False et l'erreur dans ``errors``. La durée est enregistrée
+        dans ``metadata['partition_time']``.
+
+        Au-delà de streaming_threshold, le fichier est découpé en flux
+        (collect_large_file) mais le résultat contient tous les blocs ; pour
+        une mémoire bornée, utiliser iter_partition_blocks().
+        """
+        start = time.perf_counter()
+        try:
+            if self.should_stream(file_path):
+                result = self.collect_large_file(file_path, language)
+            else:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                result = self.partition_file(file_path, content, language)
+        except Exception as e:
+            result = PartitionResult(
+                file_path=file_path,
+                file_type=language or self.detect_language(file_path),
+                total_lines=0,
+                total_chars=0,
+                partitions=[],
+                success=False
+            )
+            result.add_error("partitioning_failed", str(e), {'exception': type(e).__name__})
+        result.metadata['partition_time'] = time.perf_counter() - start
+        result.metadata['worker_pid'] = os.getpid()
+        return result
+
+    def partition_files(self, file_paths: Iterable[str], workers: int = 1,
+                        language: Optional[str] = None) -> Iterator[PartitionResult]:
+        """
+        Partitionne un lot de fichiers, en parallèle si workers > 1.
+
+        Les résultats sont produits au fil de l'eau, dans l'ordre de fin de
+        traitement (et non dans l'ordre des chemins). Chaque processus du
+        pool garde son propre registre, donc ses parsers Tree-sitter et ses
+        tokenizers, pour toute la durée du lot. Les partitionneurs enregistrés
+        à la main sur cette instance ne sont utilisés qu'en mode série.
+
+        Args:
+            file_paths: Chemins des fichiers à partitionner
+            workers: Nombre de processus (1 = série dans ce processus)
+            language: Langage imposé (sinon détecté par fichier)
+
+        Yields:
+            Un PartitionResult par fichier, avec metadata['partition_time']
+        """
+        file_paths = list(file_paths)
+        if workers <= 1 or len(file_paths) < 2:
+            for file_path in file_paths:
+                yield self.partition_path(file_path, language)
+            return
+
+        done = set()
+        executor = None
+        try:
+            executor = ProcessPoolExecutor(max_workers=min(workers, len(file_paths)),
+                                           initializer=_init_partition_worker,
+                                           initargs=(self.streaming_threshold,))
+            # Suivi par chemin soumis : un partitionneur peut renseigner file_path autrement
+            futures = {executor.submit(_partition_path_in_worker, file_path, language): file_path
+                       for file_path in file_paths}
+            for future in as_completed(futures):
+                result = future.result()
+                done.add(futures[future])
+                yield result
+        except (BrokenProcessPool, OSError, RuntimeError) as e:
+            # Pool indisponible (sandbox, limites système...) : on termine en série
+            log_partitioning_warning(
+                "partition_pool_unavailable",
+                f"Process pool unavailable, partitioning serially: {e}",
+                "language_registry"
+            )
+            for file_path in file_paths:
+                if file_path not in done:
+                    yield self.partition_path(file_path, language)
+        finally:
+            # Consommateur arrêté en route : on n'attend pas les fichiers restants
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
     def _get_fallback_partitioner(self, language: str, file_path: str) -> BaseASTPartitioner:
         """Obtient un partitionneur de fallback selon la cascade intelligente."""
 
@@ -436,9 +572,33 @@ class LanguageRegistry:
 # Instance globale du registre
 global_language_registry = LanguageRegistry()
 
+# Registre propre à chaque processus du pool de partition_files
+_worker_registry: Optional[LanguageRegistry] = None
+
+
+def _init_partition_worker(streaming_threshold: int = STREAMING_THRESHOLD):
+    """Initializer du pool : un registre (parsers, tokenizers) par processus."""
+    global _worker_registry
+    _worker_registry = global_language_registry
+    # Même seuil de flux que le registre appelant : résultats identiques en série
+    _worker_registry.streaming_threshold = streaming_threshold
+
+
+def _partition_path_in_worker(file_path: str, language: Optional[str]) -> PartitionResult:
+    """Partitionne un fichier dans un processus du pool."""
+    return _worker_registry.partition_path(file_path, language)
+
 
 def partition_file(file_path: str, content: str = None, language: Optional[str] = None) -> PartitionResult:
-    """Partitionne un fichier en utilisant le registre global."""
+    """
+    Partitionne un fichier en utilisant le registre global.
+
+    Sans content, un fichier au-delà du seuil est découpé en flux mais tous
+    ses blocs sont rassemblés dans le résultat (mémoire O(fichier)) ; pour
+    une mémoire bornée, itérer global_language_registry.iter_partition_blocks().
+    """
+    if content is None and global_language_registry.should_stream(file_path):
+        return global_language_registry.collect_large_file(file_path, language)
     if content is None:
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
@@ -449,6 +609,12 @@ def partition_file(file_path: str, content: str = None, language: Optional[str]
     return global_language_registry.partition_file(file_path, content, language)
 
 
+def partition_files(file_paths: Iterable[str], workers: int = 1,
+                    language: Optional[str] = None) -> Iterator[PartitionResult]:
+    """Partitionne un lot de fichiers (au fil de l'eau) avec le registre global."""
+    return global_language_registry.partition_files(file_paths, workers=workers, language=language)
+
+
 def detect_language(file_path: str, content: Optional[str] = None) -> str:
     """Fonction utilitaire pour détecter un langage."""
     return global_language_registry.detect_language(file_path, content)
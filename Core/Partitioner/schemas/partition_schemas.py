@@ -17,6 +17,7 @@ class PartitionMethod(Enum):
     REGEX = "regex"
     TEXTUAL = "textual"
     EMERGENCY = "emergency"
+    STREAMING = "streaming"
     CUSTOM = "custom"
 
 
@@ -142,6 +143,82 @@ class PartitionBlock:
     parent_block: Optional[str] = None
 
 
+class PartitionList(list):
+    """Liste de blocs qui compte ses mutations (invalide l'index de localisation)."""
+    
+    version = 0
+    
+    def _touch(self):
+        self.version += 1
+
+
+def _mutating(name):
+    method = getattr(list, name)
+    
+    def wrapper(self, *args, **kwargs):
+        self._touch()
+        return method(self, *args, **kwargs)
+    
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in ('append', 'extend', 'insert', 'remove', 'pop', 'clear', 'sort', 'reverse',
+              '__setitem__', '__delitem__', '__iadd__', '__imul__'):
+    setattr(PartitionList, _name, _mutating(_name))
+del _name
+
+
+class PartitionIntervalIndex:
+    """
+    Arbre d'intervalles statique sur les lignes des blocs.
+    
+    Les blocs sont triés par ligne de début ; un arbre binaire implicite sur
+    ce tableau garde, pour chaque sous-arbre, la plus grande ligne de fin.
+    Une requête ne descend que dans les sous-arbres qui peuvent chevaucher la
+    plage : O(log n + k) pour k résultats.
+    """
+    
+    def __init__(self, partitions: List['PartitionBlock']):
+        order = sorted(range(len(partitions)), key=lambda i: partitions[i].location.start_line)
+        self.positions = order  # index d'origine dans la liste des blocs
+        self.starts = [partitions[i].location.start_line for i in order]
+        self.ends = [partitions[i].location.end_line for i in order]
+        self.max_ends = list(self.ends)
+        self._build(0, len(order))
+    
+    def _build(self, low: int, high: int) -> int:
+        """Calcule max_ends du sous-arbre [low, high) (profondeur log n)."""
+        if low >= high:
+            return -1
+        middle = (low + high) // 2
+        self.max_ends[middle] = max(self.ends[middle],
+                                    self._build(low, middle),
+                                    self._build(middle + 1, high))
+        return self.max_ends[middle]
+    
+    def overlapping(self, start_line: int, end_line: int) -> List[int]:
+        """Index d'origine (triés) des blocs qui chevauchent [start_line, end_line]."""
+        starts, ends, max_ends = self.starts, self.ends, self.max_ends
+        hits = []
+        stack = [(0, len(starts))]
+        while stack:
+            low, high = stack.pop()
+            if low >= high:
+                continue
+            middle = (low + high) // 2
+            if max_ends[middle] < start_line:
+                continue  # tout le sous-arbre finit avant la plage
+            stack.append((low, middle))
+            if starts[middle] <= end_line:
+                if ends[middle] >= start_line:
+                    hits.append(self.positions[middle])
+                stack.append((middle + 1, high))
+        hits.sort()
+        return hits
+
+
 @dataclass
 class PartitionResult:
     """Résultat complet d'un partitionnement."""
@@ -174,21 +251,47 @@ class PartitionResult:
         data['partitions'] = [p.to_dict() for p in self.partitions]
         return data
     
+    def __post_init__(self):
+        self._location_index = None
+        self._indexed_version = None
+    
+    def __setattr__(self, name, value):
+        if name == 'partitions' and not isinstance(value, PartitionList):
+            value = PartitionList(value)
+        super().__setattr__(name, value)
+        if name == 'partitions':
+            self.invalidate_location_index()
+    
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state['_location_index'] = None  # reconstruit à la demande
+        state['_indexed_version'] = None
+        return state
+    
+    def invalidate_location_index(self):
+        """Oublie l'index de localisation (à appeler après édition d'une location en place)."""
+        self.__dict__['_location_index'] = None
+    
+    def _get_location_index(self) -> PartitionIntervalIndex:
+        """Index d'intervalles construit à la première requête, invalidé par mutation."""
+        version = self.partitions.version
+        if self._location_index is None or self._indexed_version != version:
+            self._location_index = PartitionIntervalIndex(self.partitions)
+            self._indexed_version = version
+        return self._location_index
+    
     def get_partition_by_location(self, line: int, char: int = 0) -> Optional[PartitionBlock]:
         """Trouve la partition contenant une position donnée."""
-        for partition in self.partitions:
+        for position in self._get_location_index().overlapping(line, line):
+            partition = self.partitions[position]
             if partition.location.contains_position(line, char):
                 return partition
         return None
     
     def get_overlapping_partitions(self, start_line: int, end_line: int) -> List[PartitionBlock]:
         """Trouve toutes les partitions qui chevauchent une plage."""
-        overlapping = []
-        for partition in self.partitions:
-            loc = partition.location
-            if not (end_line < loc.start_line or start_line > loc.end_line):
-                overlapping.append(partition)
-        return overlapping
+        return [self.partitions[position]
+                for position in self._get_location_index().overlapping(start_line, end_line)]
     
     def get_partitions_by_type(self, block_type: BlockType) -> List[PartitionBlock]:
         """Récupère toutes les partitions d'un type donné."""
@@ -17,9 +17,17 @@ __version__ = "1.0.0"
 __author__ = "Alma, Architecte Démoniaque du Nexus Luciforme"
 
 # Import des providers
-from .llm_provider import LLMProvider, ProviderStatus, LLMResponse, ValidationResult, ProviderType, ErrorType
+from .llm_provider import (
+    LLMProvider, ProviderStatus, LLMResponse, ValidationResult, ProviderType, ErrorType,
+    StreamChunk, StreamingResponseBuilder
+)
+from .cached_provider import (
+    LLMResponseCache, CachedLLMProvider, with_response_cache, with_response_cache_if_enabled
+)
+from .scheduled_provider import Priority, LLMScheduler, ScheduledLLMProvider, with_scheduler
 from .provider_factory import ProviderFactory
 from .openai_provider import OpenAIProvider
+from .local_worker import LocalModelWorkerManager, LocalWorkerUnavailable, WorkerResult
 from .local_provider import LocalProvider
 try:
     from .providers_optional.gemini_provider import GeminiProvider
@@ -33,8 +41,21 @@ __all__ = [
     'ValidationResult',
     'ProviderType',
     'ErrorType',
+    'StreamChunk',
+    'StreamingResponseBuilder',
+    'LLMResponseCache',
+    'CachedLLMProvider',
+    'with_response_cache',
+    'with_response_cache_if_enabled',
+    'Priority',
+    'LLMScheduler',
+    'ScheduledLLMProvider',
+    'with_scheduler',
     'ProviderFactory',
     'OpenAIProvider',
+    'LocalModelWorkerManager',
+    'LocalWorkerUnavailable',
+    'WorkerResult',
     'LocalProvider',
     'GeminiProvider',
 ] 
\ No newline at end of file
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+⛧ Cached Provider - Cache de Réponses LLM Adressé par Contenu ⛧
+
+Décorateur optionnel pour n'importe quel LLMProvider : une réponse est
+identifiée par le hash de (provider, modèle, prompt normalisé, paramètres
+d'échantillonnage). Deux niveaux :
+
+- mémoire : LRU borné, dans le processus,
+- disque : un fichier JSON par clé, avec TTL, partagé entre processus
+  (écritures atomiques fichier temporaire + os.replace).
+
+Seules les générations déterministes sont mises en cache : au-delà de
+max_temperature (0 par défaut, LLM_CACHE_MAX_TEMPERATURE via la factory),
+l'appel passe directement au provider. Les réponses d'erreur ne sont
+jamais stockées. Les appels internes de classification et d'extraction
+(enrichissement de requêtes, détection du type de recherche, parser
+introspectif, réflexion de l'Archiviste) sont faits à température 0 et
+passent par with_response_cache_if_enabled() quand LLM_CACHE est actif.
+
+Créé par Alma, Architecte Démoniaque du Nexus Luciforme.
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+import unicodedata
+from collections import OrderedDict
+from contextlib import aclosing
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple, AsyncIterator
+
+from .llm_provider import LLMProvider, ProviderStatus, LLMResponse, ProviderType, StreamChunk
+
+try:
+    from Core.Config.feature_flags import is_llm_cache_enabled, get_llm_cache_max_temperature
+except Exception:
+    def is_llm_cache_enabled() -> bool:
+        return False
+
+    def get_llm_cache_max_temperature() -> float:
+        return 0.0
+
+CACHE_FORMAT_VERSION = 1
+
+# Paramètres qui ne changent pas le texte généré
+NON_SAMPLING_PARAMS = {'timeout', 'on_chunk'}
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Forme canonique d'un prompt : NFC, fins de ligne Unix, sans espaces de bord de ligne."""
+    prompt = unicodedata.normalize('NFC', prompt).replace('\r\n', '\n').replace('\r', '\n')
+    return '\n'.join(line.rstrip() for line in prompt.split('\n')).strip()
+
+
+class LLMResponseCache:
+    """Cache de réponses LLM à deux niveaux (LRU mémoire + disque avec TTL)"""
+
+    _shared: Dict[str, 'LLMResponseCache'] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_entries: int = 512, cache_dir: Optional[str] = None,
+                 ttl: Optional[float] = 7 * 24 * 3600, persist: bool = True):
+        """
+        Args:
+            max_entries: Taille du LRU mémoire
+            cache_dir: Répertoire du niveau disque (défaut: ./.shadeos/llm_cache)
+            ttl: Durée de vie d'une entrée en secondes (None : illimitée)
+            persist: Activer le niveau disque
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.cache_dir = None
+        if persist:
+            self.cache_dir = Path(cache_dir) if cache_dir else Path.cwd() / '.shadeos' / 'llm_cache'
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self.lock = threading.Lock()
+        self._memory: 'OrderedDict[str, Tuple[Optional[float], Dict[str, Any]]]' = OrderedDict()
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'bypassed': 0,
+                      'stores': 0, 'expired': 0}
+
+    @classmethod
+    def shared(cls, cache_dir: Optional[str] = None, **options) -> 'LLMResponseCache':
+        """Cache partagé par répertoire disque dans le processus (un seul LRU mémoire)."""
+        name = os.path.abspath(cache_dir) if cache_dir else str(Path.cwd() / '.shadeos' / 'llm_cache')
+        with cls._shared_lock:
+            cache = cls._shared.get(name)
+            if cache is None:
+                cache = cls(cache_dir=name, **options)
+                cls._shared[name] = cache
+            return cache
+
+    @staticmethod
+    def make_key(provider: str, model: Optional[str], prompt: str, params: Dict[str, Any]) -> str:
+        """Clé de contenu : sha256 de (provider, modèle, prompt normalisé, paramètres)."""
+        payload = json.dumps({
+            'version': CACHE_FORMAT_VERSION,
+            'provider': provider,
+            'model': model,
+            'prompt': normalize_prompt(prompt),
+            'params': params
+        }, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    # ----- Niveau disque -----
+
+    def _entry_file(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._entry_file(key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+            return None
+
+    def _write_disk(self, key: str, entry: Dict[str, Any]):
+        """Écriture atomique : un lecteur concurrent ne voit jamais de fichier partiel."""
+        entry_file = self._entry_file(key)
+        entry_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = entry_file.with_name(f"{entry_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False, default=str)
+        os.replace(tmp_file, entry_file)
+
+    def _remove_disk(self, key: str):
+        try:
+            self._entry_file(key).unlink()
+        except OSError:
+            pass
+
+    # ----- Accès -----
+
+    @staticmethod
+    def _expired(expires_at: Optional[float]) -> bool:
+        return expires_at is not None and expires_at <= time.time()
+
+    def _remember(self, key: str, expires_at: Optional[float], response: Dict[str, Any]):
+        self._memory[key] = (expires_at, response)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Tuple[Dict[str, Any], str]]:
+        """(réponse sérialisée, niveau 'memory' ou 'disk') ou None."""
+        expired = False
+        with self.lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._expired(entry[0]):
+                    self._memory.move_to_end(key)
+                    self.stats['memory_hits'] += 1
+                    return entry[1], 'memory'
+                del self._memory[key]
+                expired = True
+
+        if self.cache_dir is not None:
+            stored = self._read_disk(key)
+            if stored is not None:
+                if not self._expired(stored.get('expires_at')):
+                    with self.lock:
+                        self._remember(key, stored.get('expires_at'), stored['response'])
+                        self.stats['disk_hits'] += 1
+                    return stored['response'], 'disk'
+                self._remove_disk(key)
+                expired = True
+
+        with self.lock:
+            self.stats['misses'] += 1
+            if expired:
+                self.stats['expired'] += 1
+        return None
+
+    def put(self, key: str, response: Dict[str, Any]):
+        """Stocke une réponse sérialisée dans les deux niveaux."""
+        expires_at = time.time() + self.ttl if self.ttl is not None else None
+        with self.lock:
+            self._remember(key, expires_at, response)
+            self.stats['stores'] += 1
+        if self.cache_dir is not None:
+            try:
+                self._write_disk(key, {'expires_at': expires_at, 'response': response})
+            except OSError as e:
+                print(f"⚠️ Écriture du cache LLM impossible: {e}")
+
+    def record_bypass(self):
+        with self.lock:
+            self.stats['bypassed'] += 1
+
+    def purge_expired(self) -> int:
+        """Supprime les entrées expirées des deux niveaux ; retourne le nombre supprimé."""
+        removed = 0
+        with self.lock:
+            for key in [k for k, (expires_at, _) in self._memory.items() if self._expired(expires_at)]:
+                del self._memory[key]
+                removed += 1
+        if self.cache_dir is not None:
+            for entry_file in self.cache_dir.glob('*/*.json'):
+                try:
+                    with open(entry_file, 'r', encoding='utf-8') as f:
+                        expires_at = json.load(f).get('expires_at')
+                except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+                    expires_at = 0
+                if self._expired(expires_at):
+                    try:
+                        entry_file.unlink()
+                        removed += 1
+                    except OSError:
+                        pass
+        return removed
+
+    def clear(self):
+        """Vide les deux niveaux."""
+        with self.lock:
+            self._memory.clear()
+        if self.cache_dir is not None:
+            for entry_file in self.cache_dir.glob('*/*.json'):
+                try:
+                    entry_file.unlink()
+                except OSError:
+                    pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Compteurs et taux de succès (hors appels non déterministes contournés)."""
+        with self.lock:
+            stats = dict(self.stats)
+            stats['memory_entries'] = len(self._memory)
+        lookups = stats['memory_hits'] + stats['disk_hits'] + stats['misses']
+        stats['hit_rate'] = (stats['memory_hits'] + stats['disk_hits']) / lookups if lookups else 0.0
+        return stats
+
+
+class CachedLLMProvider(LLMProvider):
+    """LLMProvider décoré par un LLMResponseCache ; le reste est délégué au provider enveloppé."""
+
+    def __init__(self, provider: LLMProvider, cache: Optional[LLMResponseCache] = None,
+                 max_temperature: float = 0.0, **cache_options):
+        """
+        Args:
+            provider: Provider enveloppé
+            cache: Cache partagé (sinon créé avec cache_options)
+            max_temperature: Au-delà, la génération est jugée non déterministe et non cachée
+            **cache_options: max_entries, cache_dir, ttl, persist pour LLMResponseCache
+        """
+        super().__init__(provider.provider_type, provider.config)
+        self.provider = provider
+        self.cache = cache if cache is not None else LLMResponseCache(**cache_options)
+        self.max_temperature = max_temperature
+
+    def __getattr__(self, name: str) -> Any:
+        # Attributs propres au provider enveloppé (model, ollama_host...)
+        provider = self.__dict__.get('provider')
+        if provider is None:
+            raise AttributeError(name)
+        return getattr(provider, name)
+
+    def _cache_key(self, prompt: str, kwargs: Dict[str, Any]) -> Optional[str]:
+        """Clé de la requête, ou None si la génération n'est pas déterministe."""
+        temperature = kwargs.get('temperature', self.provider.temperature)
+        if temperature is None or temperature > self.max_temperature:
+            return None
+        params = {k: v for k, v in kwargs.items() if k not in NON_SAMPLING_PARAMS and k != 'model'}
+        params['temperature'] = temperature
+        params.setdefault('max_tokens', self.provider.max_tokens)
+        model = kwargs.get('model', getattr(self.provider, 'model', None))
+        return self.cache.make_key(type(self.provider).__name__, model, prompt, params)
+
+    def _lookup(self, key: Optional[str], start_time: float) -> Optional[LLMResponse]:
+        if key is None:
+            self.cache.record_bypass()
+            return None
+        cached = self.cache.get(key)
+        if cached is None:
+            return None
+        stored, tier = cached
+        response = LLMResponse(**{**stored, 'provider_type': ProviderType(stored['provider_type'])})
+        response.metadata = {
+            **(response.metadata or {}),
+            'cache_hit': True,
+            'cache_tier': tier,
+            'original_response_time': response.response_time
+        }
+        response.response_time = time.time() - start_time
+        return response
+
+    def _store(self, key: Optional[str], response: LLMResponse):
+        if key is None or (response.metadata and 'error_type' in response.metadata):
+            return
+        stored = asdict(response)
+        stored['provider_type'] = response.provider_type.value
+        self.cache.put(key, stored)
+
+    async def test_connection(self) -> ProviderStatus:
+        return await self.provider.test_connection()
+
+    async def generate_response(self, prompt: str, **kwargs) -> LLMResponse:
+        """Réponse en cache si disponible, sinon génération puis mise en cache"""
+        start_time = time.time()
+        key = self._cache_key(prompt, kwargs)
+        cached = self._lookup(key, start_time)
+        if cached is not None:
+            return cached
+
+        response = await self.provider.generate_response(prompt, **kwargs)
+        self._store(key, response)
+        return response
+
+    async def stream_response(self, prompt: str, **kwargs) -> AsyncIterator[StreamChunk]:
+        """Flux du provider, ou la réponse en cache en un seul fragment"""
+        start_time = time.time()
+        key = self._cache_key(prompt, kwargs)
+        cached = self._lookup(key, start_time)
+        if cached is not None:
+            cached.metadata['first_token_latency'] = cached.response_time
+            if cached.content:
+                yield StreamChunk(content=cached.content, index=0, elapsed=cached.response_time)
+            yield StreamChunk(content="", index=1 if cached.content else 0,
+                              elapsed=cached.response_time, done=True, response=cached)
+            return
+
+        async with aclosing(self.provider.stream_response(prompt, **kwargs)) as stream:
+            async for chunk in stream:
+                if chunk.done and chunk.response is not None:
+                    self._store(key, chunk.response)
+                yield chunk
+
+    async def aclose(self):
+        await self.provider.aclose()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Statistiques du cache (succès mémoire/disque, contournements, taux de succès)"""
+        return self.cache.get_stats()
+
+    def get_provider_info(self) -> Dict[str, Any]:
+        """Informations du provider enveloppé, plus l'état du cache"""
+        info = self.provider.get_provider_info()
+        info['response_cache'] = {
+            'max_temperature': self.max_temperature,
+            'cache_dir': str(self.cache.cache_dir) if self.cache.cache_dir else None,
+            'ttl': self.cache.ttl,
+            **self.get_cache_stats()
+        }
+        return info
+
+
+def with_response_cache(provider: LLMProvider, **options) -> CachedLLMProvider:
+    """Enveloppe un provider dans le cache de réponses (options de CachedLLMProvider)."""
+    if isinstance(provider, CachedLLMProvider):
+        return provider
+    return CachedLLMProvider(provider, **options)
+
+
+def with_response_cache_if_enabled(provider: Optional[LLMProvider]) -> Optional[LLMProvider]:
+    """
+    Enveloppe provider dans le cache partagé si LLM_CACHE est actif.
+
+    Pour les sites d'appel internes : sans le flag (ou sans provider), le
+    provider est retourné tel quel. Le seuil de température vient de
+    LLM_CACHE_MAX_TEMPERATURE.
+    """
+    if provider is None or not is_llm_cache_enabled():
+        return provider
+    return with_response_cache(provider, cache=LLMResponseCache.shared(),
+                               max_temperature=get_llm_cache_max_temperature())
@@ -4,13 +4,19 @@
 
 Provider abstrait avec validation, gestion d'erreurs, estimation de taille
 et configuration flexible pour l'Archiviste Daemon.
+
+stream_response() produit la réponse par fragments (StreamChunk) au fil de la
+génération ; le dernier fragment porte la LLMResponse assemblée, avec la
+latence du premier token dans ses métadonnées.
 """
 
 import asyncio
+import inspect
 import time
 from abc import ABC, abstractmethod
+from contextlib import aclosing
 from dataclasses import dataclass
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, AsyncIterator, Callable
 from enum import Enum
 
 
@@ -58,6 +64,83 @@ class LLMResponse:
     metadata: Optional[Dict[str, Any]] = None
 
 
+@dataclass
+class StreamChunk:
+    """Fragment d'une réponse streamée"""
+    content: str
+    index: int
+    elapsed: float
+    done: bool = False
+    response: Optional[LLMResponse] = None
+
+
+class StreamingResponseBuilder:
+    """Assemble une LLMResponse au fil des fragments reçus"""
+    
+    def __init__(self, provider_type: ProviderType, model_used: str,
+                 prompt_size: Optional[int] = None, start_time: Optional[float] = None):
+        self.provider_type = provider_type
+        self.model_used = model_used
+        self.prompt_size = prompt_size
+        self.start_time = start_time or time.time()
+        self.parts: List[str] = []
+        self.first_token_latency: Optional[float] = None
+    
+    @property
+    def content(self) -> str:
+        return "".join(self.parts)
+    
+    def add(self, text: str) -> Optional[StreamChunk]:
+        """Ajoute un fragment ; None si le fragment est vide"""
+        if not text:
+            return None
+        elapsed = time.time() - self.start_time
+        if self.first_token_latency is None:
+            self.first_token_latency = elapsed
+        self.parts.append(text)
+        return StreamChunk(content=text, index=len(self.parts) - 1, elapsed=elapsed)
+    
+    def _metadata(self) -> Dict[str, Any]:
+        return {
+            "streamed": True,
+            "first_token_latency": self.first_token_latency,
+            "chunks": len(self.parts)
+        }
+    
+    def finish(self, tokens_used: Optional[int] = None, content: Optional[str] = None,
+               metadata: Optional[Dict[str, Any]] = None) -> StreamChunk:
+        """Fragment final portant la réponse complète"""
+        elapsed = time.time() - self.start_time
+        response = LLMResponse(
+            content=self.content if content is None else content,
+            provider_type=self.provider_type,
+            model_used=self.model_used,
+            response_time=elapsed,
+            tokens_used=tokens_used,
+            prompt_size=self.prompt_size,
+            metadata={**self._metadata(), **(metadata or {})}
+        )
+        return StreamChunk(content="", index=len(self.parts), elapsed=elapsed, done=True, response=response)
+    
+    def fail(self, error: str, error_type: ErrorType) -> StreamChunk:
+        """Fragment final d'erreur ; le contenu déjà reçu reste dans les métadonnées"""
+        elapsed = time.time() - self.start_time
+        response = LLMResponse(
+            content=f"ERREUR: {error}",
+            provider_type=self.provider_type,
+            model_used="error",
+            response_time=elapsed,
+            prompt_size=self.prompt_size,
+            metadata={
+                **self._metadata(),
+                "error_type": error_type.value,
+                "error": error,
+                "partial_content": self.content
+            }
+        )
+        return StreamChunk(content="", index=len(self.parts), elapsed=elapsed, done=True, response=response)
+
+
 @dataclass
 class ValidationResult:
     """Résultat de validation d'un provider"""
@@ -103,6 +186,95 @@ class LLMProvider(ABC):
         """Génération de réponse avec gestion d'erreurs"""
         pass
     
+    async def stream_response(self, prompt: str, **kwargs) -> AsyncIterator[StreamChunk]:
+        """
+        Génération streamée : fragments au fil de l'eau, puis un fragment final
+        (done=True) portant la LLMResponse complète ou d'erreur.
+        
+        Implémentation par défaut pour les providers sans streaming natif :
+        toute la réponse arrive en un seul fragment.
+        """
+        start_time = time.time()
+        response = await self.generate_response(prompt, **kwargs)
+        builder = StreamingResponseBuilder(
+            self.provider_type, response.model_used, response.prompt_size, start_time
+        )
+        is_error = bool(response.metadata and "error_type" in response.metadata)
+        if not is_error:
+            chunk = builder.add(response.content)
+            if chunk is not None:
+                yield chunk
+        response.metadata = {**(response.metadata or {}), "streamed": False,
+                             "first_token_latency": response.response_time, "chunks": len(builder.parts)}
+        yield StreamChunk(content="", index=len(builder.parts), elapsed=time.time() - start_time,
+                          done=True, response=response)
+    
+    async def generate_streaming(self, prompt: str, on_chunk: Optional[Callable] = None,
+                                 **kwargs) -> LLMResponse:
+        """
+        Consomme stream_response() et retourne la réponse finale.
+        
+        Le flux est fermé dès le fragment final (ou une erreur) : ses blocs
+        finally (place de l'ordonnanceur, processus ollama...) s'exécutent
+        avant le retour, sans attendre le ramasse-miettes.
+        
+        Args:
+            on_chunk: Appelé (sync ou async) avec chaque StreamChunk de contenu
+        """
+        final = None
+        async with aclosing(self.stream_response(prompt, **kwargs)) as stream:
+            async for chunk in stream:
+                if chunk.done:
+                    final = chunk.response
+                    break
+                if on_chunk is not None:
+                    result = on_chunk(chunk)
+                    if inspect.isawaitable(result):
+                        await result
+        if final is None:
+            final = self._create_error_response("Flux terminé sans réponse finale", ErrorType.UNKNOWN_ERROR)
+        return final
+    
+    async def _iterate_with_timeout(self, iterator, timeout: Optional[float]):
+        """
+        Itère un flux asynchrone sous un délai total (TimeoutError à l'échéance).
+        
+        Le flux source est fermé (aclose) quand l'itération s'arrête, y compris
+        sur timeout ou abandon par le consommateur.
+        """
+        iterator = iterator.__aiter__()
+        try:
+            if timeout is None:
+                async for item in iterator:
+                    yield item
+                return
+            
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError()
+                try:
+                    item = await asyncio.wait_for(iterator.__anext__(), timeout=remaining)
+                except StopAsyncIteration:
+                    return
+                yield item
+        finally:
+            close = getattr(iterator, 'aclose', None)
+            if close is not None:
+                await close()
+    
+    async def aclose(self):
+        """Libère les ressources du provider (sessions, processus...)"""
+        pass
+    
+    async def __aenter__(self) -> 'LLMProvider':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
     def estimate_prompt_size(self, prompt: str) -> int:
         """Estimation de la taille du prompt en tokens"""
         if not self.estimate_prompt_size:
@@ -4,14 +4,28 @@
 
 Provider Ollama local avec gestion d'erreurs, timeout configurable
 et test de connexion robuste.
+
+Par défaut les générations passent par un worker persistant par modèle
+(LocalModelWorkerManager : modèle gardé chaud sur le serveur Ollama déjà
+lancé, file d'attente, déchargement après inactivité). Le provider ne lance
+lui-même ``ollama serve`` qu'avec ``spawn_ollama_server: True`` ; aclose()
+libère alors le gestionnaire et arrête ce serveur. Sans serveur joignable, ou
+avec ``persistent_worker: False``, chaque prompt lance ``ollama run`` ;
+stream_response() lit alors sa sortie standard au fil de l'eau.
 """
 
 import asyncio
 import time
 import subprocess
 import json
-from typing import Dict, Any, Optional
-from .llm_provider import LLMProvider, ProviderStatus, LLMResponse, ProviderType, ErrorType
+import codecs
+from contextlib import aclosing
+from typing import Dict, Any, Optional, AsyncIterator
+from .llm_provider import (
+    LLMProvider, ProviderStatus, LLMResponse, ProviderType, ErrorType,
+    StreamChunk, StreamingResponseBuilder
+)
+from .local_worker import LocalModelWorkerManager, LocalWorkerUnavailable, WorkerResult
 
 
 class LocalProvider(LLMProvider):
@@ -32,6 +46,13 @@ class LocalProvider(LLMProvider):
         else:
             self.ollama_binary = config.get('ollama_binary', '/usr/local/bin/ollama')
         
+        # Worker persistant (désactivé après un échec de démarrage du serveur)
+        self.persistent_worker = config.get('persistent_worker', True)
+        self.worker_idle_timeout = config.get('worker_idle_timeout', 300)
+        # Lancer ``ollama serve`` si aucun serveur ne répond (sinon seul un serveur existant est réutilisé)
+        self.spawn_ollama_server = config.get('spawn_ollama_server', False)
+        self._worker_manager: Optional[LocalModelWorkerManager] = None
+        
         # Validation du modèle
         if not self.model:
             raise ValueError("Modèle Ollama non spécifié")
@@ -127,8 +148,80 @@ class LocalProvider(LLMProvider):
                 response_time=time.time() - start_time
             )
     
+    def _get_worker_manager(self) -> Optional[LocalModelWorkerManager]:
+        """Gestionnaire de workers partagé (retenu jusqu'à aclose), ou None en mode subprocess"""
+        if not self.persistent_worker:
+            return None
+        if self._worker_manager is None:
+            self._worker_manager = LocalModelWorkerManager.shared(
+                self.ollama_host,
+                ollama_binary=self.ollama_binary,
+                idle_timeout=self.worker_idle_timeout,
+                spawn_server=self.spawn_ollama_server
+            ).retain()
+        return self._worker_manager
+    
+    async def aclose(self):
+        """Libère le gestionnaire de workers ; le dernier utilisateur l'arrête avec son serveur."""
+        manager, self._worker_manager = self._worker_manager, None
+        if manager is not None:
+            await asyncio.to_thread(manager.release)
+    
+    def _disable_worker(self, error: Exception):
+        print(f"⚠️ Worker Ollama indisponible ({error}) - repli sur ollama run par appel")
+        self.persistent_worker = False
+    
+    @staticmethod
+    def _worker_options(temperature: float) -> Dict[str, Any]:
+        if temperature != 0.7:  # Valeur par défaut
+            return {"temperature": temperature}
+        return {}
+    
     async def generate_response(self, prompt: str, **kwargs) -> LLMResponse:
         """Génération de réponse avec gestion d'erreurs Ollama"""
+        manager = self._get_worker_manager()
+        if manager is not None:
+            start_time = time.time()
+            model = kwargs.get('model', self.model)
+            try:
+                result = await manager.generate(
+                    model, prompt,
+                    options=self._worker_options(kwargs.get('temperature', self.temperature)),
+                    timeout=self._handle_timeout(kwargs.get('timeout'))
+                )
+                response = self._create_success_response(
+                    content=result.content.strip(),
+                    model_used=model,
+                    response_time=time.time() - start_time,
+                    tokens_used=result.tokens_used,
+                    prompt_size=len(prompt) if self.estimate_prompt_size else None
+                )
+                response.metadata = {
+                    "worker": True,
+                    "queue_wait": result.queue_wait,
+                    "first_token_latency": result.first_token_latency,
+                    "cold_start": result.cold_start
+                }
+                return response
+            except LocalWorkerUnavailable as e:
+                self._disable_worker(e)
+            except asyncio.TimeoutError:
+                return self._create_error_response(
+                    f"Timeout Ollama après {self.timeout} secondes",
+                    ErrorType.TIMEOUT,
+                    time.time() - start_time
+                )
+            except Exception as e:
+                return self._create_error_response(
+                    f"Erreur Ollama inconnue: {str(e)}",
+                    ErrorType.UNKNOWN_ERROR,
+                    time.time() - start_time
+                )
+        
+        return await self._generate_subprocess(prompt, **kwargs)
+    
+    async def _generate_subprocess(self, prompt: str, **kwargs) -> LLMResponse:
+        """Génération par un processus ``ollama run`` dédié"""
         start_time = time.time()
         
         try:
@@ -137,11 +230,7 @@ class LocalProvider(LLMProvider):
             temperature = kwargs.get('temperature', self.temperature)
             
             # Construction de la commande
-            command = [self.ollama_binary, 'run', model]
-            
-            # Ajout des paramètres si supportés
-            if temperature != 0.7:  # Valeur par défaut
-                command.extend(['--temperature', str(temperature)])
+            command = self._build_run_command(model, temperature)
             
             # Estimation de la taille du prompt
             prompt_size = len(prompt) if self.estimate_prompt_size else None
@@ -182,6 +271,126 @@ class LocalProvider(LLMProvider):
                 time.time() - start_time
             )
     
+    async def stream_response(self, prompt: str, **kwargs) -> AsyncIterator[StreamChunk]:
+        """Génération streamée par le worker du modèle, sinon par ``ollama run``"""
+        manager = self._get_worker_manager()
+        if manager is not None:
+            model = kwargs.get('model', self.model)
+            prompt_size = len(prompt) if self.estimate_prompt_size else None
+            builder = StreamingResponseBuilder(self.provider_type, model, prompt_size)
+            timeout = self._handle_timeout(kwargs.get('timeout'))
+            stream = manager.stream(
+                model, prompt,
+                options=self._worker_options(kwargs.get('temperature', self.temperature)),
+                timeout=timeout
+            )
+            try:
+                async with aclosing(stream):
+                    async for item in stream:
+                        if isinstance(item, WorkerResult):
+                            yield builder.finish(
+                                tokens_used=item.tokens_used,
+                                content=builder.content.strip(),
+                                metadata={"worker": True, "queue_wait": item.queue_wait,
+                                          "cold_start": item.cold_start}
+                            )
+                            return
+                        # Comme generate_response : pas d'espaces en tête de réponse
+                        chunk = builder.add(item if builder.parts else item.lstrip())
+                        if chunk is not None:
+                            yield chunk
+            except LocalWorkerUnavailable as e:
+                self._disable_worker(e)
+                if builder.parts:
+                    yield builder.fail(str(e), ErrorType.NETWORK_ERROR)
+                    return
+            except asyncio.TimeoutError:
+                yield builder.fail(f"Timeout Ollama après {timeout} secondes", ErrorType.TIMEOUT)
+                return
+            except Exception as e:
+                yield builder.fail(f"Erreur Ollama inconnue: {str(e)}", ErrorType.UNKNOWN_ERROR)
+                return
+        
+        async with aclosing(self._stream_subprocess(prompt, **kwargs)) as stream:
+            async for chunk in stream:
+                yield chunk
+    
+    async def _stream_subprocess(self, prompt: str, **kwargs) -> AsyncIterator[StreamChunk]:
+        """Génération streamée : stdout de ``ollama run`` lu par blocs"""
+        start_time = time.time()
+        model = kwargs.get('model', self.model)
+        temperature = kwargs.get('temperature', self.temperature)
+        prompt_size = len(prompt) if self.estimate_prompt_size else None
+        builder = StreamingResponseBuilder(self.provider_type, model, prompt_size, start_time)
+        timeout = self._handle_timeout(kwargs.get('timeout'))
+        process = None
+        
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *self._build_run_command(model, temperature),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            process.stdin.write(prompt.encode())
+            await process.stdin.drain()
+            process.stdin.close()
+            
+            async for text in self._iterate_with_timeout(self._read_stdout(process), timeout):
+                # Comme generate_response : pas d'espaces en tête de réponse
+                if not builder.parts:
+                    text = text.lstrip()
+                chunk = builder.add(text)
+                if chunk is not None:
+                    yield chunk
+            
+            stderr = await process.stderr.read()
+            await process.wait()
+            if process.returncode != 0:
+                yield builder.fail(f"Erreur Ollama: {stderr.decode(errors='replace') or process.returncode}",
+                                   ErrorType.UNKNOWN_ERROR)
+                return
+            
+            yield builder.finish(content=builder.content.rstrip())
+        
+        except asyncio.TimeoutError:
+            yield builder.fail(f"Timeout Ollama après {timeout} secondes", ErrorType.TIMEOUT)
+        
+        except FileNotFoundError:
+            yield builder.fail(f"Binaire Ollama non trouvé: {self.ollama_binary}", ErrorType.UNKNOWN_ERROR)
+        
+        except Exception as e:
+            yield builder.fail(f"Erreur Ollama inconnue: {str(e)}", ErrorType.UNKNOWN_ERROR)
+        
+        finally:
+            # Consommateur interrompu ou timeout : ne pas laisser le modèle tourner
+            if process is not None and process.returncode is None:
+                process.kill()
+                await process.wait()
+    
+    async def _read_stdout(self, process) -> AsyncIterator[str]:
+        """Texte de la sortie standard au fil de l'eau (UTF-8 incrémental)"""
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        while True:
+            data = await process.stdout.read(4096)
+            if not data:
+                break
+            text = decoder.decode(data)
+            if text:
+                yield text
+        tail = decoder.decode(b'', final=True)
+        if tail:
+            yield tail
+    
+    def _build_run_command(self, model: str, temperature: float) -> list:
+        """Commande ``ollama run`` pour un modèle"""
+        command = [self.ollama_binary, 'run', model]
+        
+        # Ajout des paramètres si supportés
+        if temperature != 0.7:  # Valeur par défaut
+            command.extend(['--temperature', str(temperature)])
+        return command
+    
     async def _run_ollama_command(self, command: list, input_text: str = None) -> str:
         """Exécution d'une commande Ollama"""
         process = await asyncio.create_subprocess_exec(
@@ -217,6 +426,9 @@ class LocalProvider(LLMProvider):
         base_info.update({
             "model": self.model,
             "ollama_host": self.ollama_host,
-            "ollama_binary": self.ollama_binary
+            "ollama_binary": self.ollama_binary,
+            "persistent_worker": self.persistent_worker
         })
+        if self.persistent_worker and self.ollama_host in LocalModelWorkerManager._shared:
+            base_info["worker_stats"] = LocalModelWorkerManager._shared[self.ollama_host].get_stats()
         return base_info 
\ No newline at end of file
@@ -4,14 +4,23 @@
 
 Provider Ollama local utilisant l'API HTTP avec gestion d'erreurs, timeout configurable
 et test de connexion robuste.
+
+La session HTTP appartient au provider : créée à la première requête, elle
+garde ses connexions keep-alive dans un pool borné (limite globale et par
+hôte) et se ferme via aclose() ou ``async with provider:``.
+
+stream_response() lit le flux NDJSON de /api/generate ligne par ligne.
 """
 
 import asyncio
 import time
 import json
 import aiohttp
-from typing import Dict, Any, Optional
-from .llm_provider import LLMProvider, ProviderStatus, LLMResponse, ProviderType, ErrorType
+from typing import Dict, Any, Optional, AsyncIterator
+from .llm_provider import (
+    LLMProvider, ProviderStatus, LLMResponse, ProviderType, ErrorType,
+    StreamChunk, StreamingResponseBuilder
+)
 
 
 class LocalProviderHTTP(LLMProvider):
@@ -25,76 +34,118 @@ class LocalProviderHTTP(LLMProvider):
         self.ollama_host = config.get('ollama_host', 'http://localhost:11434')
         self.api_base_url = f"{self.ollama_host}/api"
         
+        # Pool de connexions keep-alive
+        self.pool_size = config.get('pool_size', 32)
+        self.per_host_limit = config.get('per_host_limit', 8)
+        self.keepalive_timeout = config.get('keepalive_timeout', 30)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        
         # Validation du modèle
         if not self.model:
             raise ValueError("Modèle Ollama non spécifié")
     
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Session partagée du provider, créée à la demande dans la boucle courante"""
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed:
+            if self._session_loop is loop:
+                return self._session
+            if not self._session_loop.is_closed():
+                # Session d'une autre boucle encore vivante : fermée dans sa boucle
+                self._session_loop.call_soon_threadsafe(
+                    lambda session=self._session: asyncio.ensure_future(session.close())
+                )
+        
+        connector = aiohttp.TCPConnector(
+            limit=self.pool_size,
+            limit_per_host=self.per_host_limit,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=300
+        )
+        self._session = aiohttp.ClientSession(connector=connector)
+        self._session_loop = loop
+        return self._session
+    
+    async def aclose(self):
+        """Ferme la session et libère les connexions du pool"""
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            if self._session_loop is asyncio.get_running_loop():
+                await session.close()
+            elif not self._session_loop.is_closed():
+                self._session_loop.call_soon_threadsafe(
+                    lambda: asyncio.ensure_future(session.close())
+                )
+        self._session_loop = None
+    
     async def test_connection(self) -> ProviderStatus:
         """Test de connexion et validation du provider Ollama via API HTTP"""
         start_time = time.time()
         
         try:
-            async with aiohttp.ClientSession() as session:
-                # Test de santé
-                async with session.get(f"{self.api_base_url}/version", timeout=aiohttp.ClientTimeout(total=5)) as response:
-                    if response.status != 200:
-                        return ProviderStatus(
-                            valid=False,
-                            provider_type=self.provider_type,
-                            capabilities=[],
-                            error=f"Ollama non accessible: HTTP {response.status}",
-                            error_type=ErrorType.UNKNOWN_ERROR,
-                            response_time=time.time() - start_time
-                        )
-                
-                # Vérification que le modèle est disponible
-                async with session.get(f"{self.api_base_url}/tags", timeout=aiohttp.ClientTimeout(total=10)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        models = data.get('models', [])
-                        model_found = any(model['name'] == self.model for model in models)
-                        
-                        if not model_found:
-                            return ProviderStatus(
-                                valid=False,
-                                provider_type=self.provider_type,
-                                capabilities=[],
-                                error=f"Modèle Ollama '{self.model}' non trouvé. Modèles disponibles: {[m['name'] for m in models]}",
-                                error_type=ErrorType.MODEL_UNAVAILABLE,
-                                response_time=time.time() - start_time
-                            )
-                    else:
+            session = self._get_session()
+            
+            # Test de santé
+            async with session.get(f"{self.api_base_url}/version", timeout=aiohttp.ClientTimeout(total=5)) as response:
+                if response.status != 200:
+                    return ProviderStatus(
+                        valid=False,
+                        provider_type=self.provider_type,
+                        capabilities=[],
+                        error=f"Ollama non accessible: HTTP {response.status}",
+                        error_type=ErrorType.UNKNOWN_ERROR,
+                        response_time=time.time() - start_time
+                    )
+            
+            # Vérification que le modèle est disponible
+            async with session.get(f"{self.api_base_url}/tags", timeout=aiohttp.ClientTimeout(total=10)) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    models = data.get('models', [])
+                    model_found = any(model['name'] == self.model for model in models)
+                    
+                    if not model_found:
                         return ProviderStatus(
                             valid=False,
                             provider_type=self.provider_type,
                             capabilities=[],
-                            error=f"Impossible de récupérer la liste des modèles: HTTP {response.status}",
-                            error_type=ErrorType.UNKNOWN_ERROR,
+                            error=f"Modèle Ollama '{self.model}' non trouvé. Modèles disponibles: {[m['name'] for m in models]}",
+                            error_type=ErrorType.MODEL_UNAVAILABLE,
                             response_time=time.time() - start_time
                         )
-                
-                # Test simple avec le modèle
-                test_prompt = "Test de connexion Ollama - Réponds simplement 'OK'"
-                test_response = await self._call_api_generate(session, test_prompt)
-                
-                response_time = time.time() - start_time
-                
-                return ProviderStatus(
-                    valid=True,
-                    provider_type=self.provider_type,
-                    capabilities=[
-                        "text_generation",
-                        "chat_completion",
-                        "local_inference"
-                    ],
-                    response_time=response_time,
-                    model_info={
-                        "model": self.model,
-                        "ollama_host": self.ollama_host,
-                        "test_response": test_response
-                    }
-                )
-                
+                else:
+                    return ProviderStatus(
+                        valid=False,
+                        provider_type=self.provider_type,
+                        capabilities=[],
+                        error=f"Impossible de récupérer la liste des modèles: HTTP {response.status}",
+                        error_type=ErrorType.UNKNOWN_ERROR,
+                        response_time=time.time() - start_time
+                    )
+            
+            # Test simple avec le modèle
+            test_prompt = "Test de connexion Ollama - Réponds simplement 'OK'"
+            test_response = await self._call_api_generate(session, test_prompt)
+            
+            response_time = time.time() - start_time
+            
+            return ProviderStatus(
+                valid=True,
+                provider_type=self.provider_type,
+                capabilities=[
+                    "text_generation",
+                    "chat_completion",
+                    "local_inference"
+                ],
+                response_time=response_time,
+                model_info={
+                    "model": self.model,
+                    "ollama_host": self.ollama_host,
+                    "test_response": test_response
+                }
+            )
+            
         except aiohttp.ClientConnectorError:
             return ProviderStatus(
                 valid=False,
@@ -137,14 +188,13 @@ class LocalProviderHTTP(LLMProvider):
             # Estimation de la taille du prompt
             prompt_size = len(prompt) if self.estimate_prompt_size else None
             
-            async with aiohttp.ClientSession() as session:
-                # Appel à l'API
-                response_text = await self._call_api_generate(
-                    session, 
-                    prompt, 
-                    model=model, 
-                    temperature=temperature
-                )
+            # Appel à l'API (connexion réutilisée depuis le pool)
+            response_text = await self._call_api_generate(
+                self._get_session(),
+                prompt,
+                model=model,
+                temperature=temperature
+            )
             
             response_time = time.time() - start_time
             
@@ -169,21 +219,70 @@ class LocalProviderHTTP(LLMProvider):
                 time.time() - start_time
             )
     
-    async def _call_api_generate(self, session: aiohttp.ClientSession, prompt: str, 
-                                model: str = None, temperature: float = None) -> str:
-        """Appel à l'API generate d'Ollama"""
+    async def stream_response(self, prompt: str, **kwargs) -> AsyncIterator[StreamChunk]:
+        """Génération streamée via le flux NDJSON de l'API generate"""
+        start_time = time.time()
+        model = kwargs.get('model', self.model)
+        prompt_size = len(prompt) if self.estimate_prompt_size else None
+        builder = StreamingResponseBuilder(self.provider_type, model, prompt_size, start_time)
+        timeout = self._handle_timeout(kwargs.get('timeout'))
+        payload = self._generate_payload(prompt, model, kwargs.get('temperature'), stream=True)
+        
+        try:
+            async with self._get_session().post(f"{self.api_base_url}/generate", json=payload) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    yield builder.fail(f"Erreur API Ollama: HTTP {response.status} - {error_text}",
+                                       ErrorType.UNKNOWN_ERROR)
+                    return
+                
+                tokens_used = None
+                async for line in self._iterate_with_timeout(response.content, timeout):
+                    if not line.strip():
+                        continue
+                    data = json.loads(line)
+                    if data.get('error'):
+                        yield builder.fail(f"Erreur Ollama: {data['error']}", ErrorType.UNKNOWN_ERROR)
+                        return
+                    chunk = builder.add(data.get('response', ''))
+                    if chunk is not None:
+                        yield chunk
+                    if data.get('done'):
+                        tokens_used = data.get('eval_count')
+                        break
+                
+                yield builder.finish(tokens_used=tokens_used)
+        
+        except asyncio.TimeoutError:
+            yield builder.fail(f"Timeout Ollama après {timeout} secondes", ErrorType.TIMEOUT)
+        
+        except aiohttp.ClientConnectorError:
+            yield builder.fail(f"Impossible de se connecter à Ollama: {self.ollama_host}", ErrorType.NETWORK_ERROR)
+        
+        except Exception as e:
+            yield builder.fail(f"Erreur Ollama inconnue: {str(e)}", ErrorType.UNKNOWN_ERROR)
+    
+    def _generate_payload(self, prompt: str, model: str = None, temperature: float = None,
+                          stream: bool = False) -> Dict[str, Any]:
+        """Corps de requête pour l'API generate d'Ollama"""
         model = model or self.model
-        temperature = temperature or self.temperature
+        temperature = self.temperature if temperature is None else temperature
         
         payload = {
             "model": model,
             "prompt": prompt,
-            "stream": False
+            "stream": stream
         }
         
         # Ajouter les paramètres optionnels
         if temperature != 0.7:  # Valeur par défaut
             payload["options"] = {"temperature": temperature}
+        return payload
+    
+    async def _call_api_generate(self, session: aiohttp.ClientSession, prompt: str, 
+                                model: str = None, temperature: float = None) -> str:
+        """Appel à l'API generate d'Ollama"""
+        payload = self._generate_payload(prompt, model, temperature, stream=False)
         
         async with session.post(
             f"{self.api_base_url}/generate",
@@ -205,6 +304,8 @@ class LocalProviderHTTP(LLMProvider):
             "model": self.model,
             "ollama_host": self.ollama_host,
             "api_base_url": self.api_base_url,
-            "provider_type": "http_api"
+            "provider_type": "http_api",
+            "pool_size": self.pool_size,
+            "per_host_limit": self.per_host_limit
         })
         return base_info 
\ No newline at end of file
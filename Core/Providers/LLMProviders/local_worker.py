@@ -0,0 +1,518 @@
+#!/usr/bin/env python3
+"""
+⛧ Local Worker - Workers Ollama Persistants ⛧
+
+Remplace le ``ollama run <modèle>`` lancé à chaque prompt par des workers
+longue durée adossés au serveur HTTP d'Ollama :
+
+- un serveur ``ollama serve`` réutilisé s'il tourne déjà ; sur demande
+  explicite (spawn_server=True), lancé et surveillé par le gestionnaire
+  (relancé s'il meurt), puis arrêté avec lui,
+- un worker par modèle : file d'attente des requêtes, modèle gardé chargé
+  entre deux appels (keep_alive), déchargé après une période d'inactivité,
+- une boucle asyncio dédiée dans un thread : utilisable depuis du code
+  synchrone (generate_sync) comme depuis n'importe quelle boucle (generate,
+  stream).
+
+La boucle dédiée et le serveur possédé sont arrêtés par shutdown(), par le
+dernier release() des utilisateurs enregistrés (retain()), ou à la sortie de
+l'interpréteur (atexit).
+
+Créé par Alma, Architecte Démoniaque du Nexus Luciforme.
+"""
+
+import os
+import time
+import atexit
+import json
+import shutil
+import asyncio
+import threading
+import subprocess
+import concurrent.futures
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, Callable, AsyncIterator
+from urllib.parse import urlparse
+
+import aiohttp
+
+
+class LocalWorkerUnavailable(RuntimeError):
+    """Aucun serveur Ollama joignable ni lançable"""
+
+
+@dataclass
+class WorkerResult:
+    """Résultat d'une génération par un worker"""
+    content: str
+    model: str
+    tokens_used: Optional[int] = None
+    queue_wait: float = 0.0
+    first_token_latency: Optional[float] = None
+    total_time: float = 0.0
+    cold_start: bool = False
+
+
+@dataclass
+class _WorkerRequest:
+    prompt: str
+    options: Dict[str, Any]
+    future: asyncio.Future
+    on_token: Optional[Callable[[str], None]] = None
+    enqueued_at: float = field(default_factory=time.time)
+    emitted: int = 0
+
+
+class _ModelWorker:
+    """File d'attente et consommateurs d'un modèle"""
+
+    def __init__(self, model: str, concurrency: int):
+        self.model = model
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.tasks = []
+        self.concurrency = concurrency
+        self.loaded = False
+        self.last_used = time.time()
+        self.active = 0
+        self.served = 0
+
+
+class LocalModelWorkerManager:
+    """Gestionnaire des workers de modèles locaux (un par modèle, serveur Ollama partagé)"""
+
+    _shared: Dict[str, 'LocalModelWorkerManager'] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, ollama_host: str = 'http://localhost:11434', ollama_binary: Optional[str] = None,
+                 idle_timeout: float = 300.0, concurrency: int = 1, max_restarts: int = 3,
+                 startup_timeout: float = 30.0, spawn_server: bool = False):
+        """
+        Args:
+            ollama_host: URL du serveur Ollama
+            ollama_binary: Binaire pour lancer ``ollama serve`` si le serveur est absent
+            spawn_server: Lancer ``ollama serve`` si aucun serveur ne répond
+                (sinon LocalWorkerUnavailable : seul un serveur existant est réutilisé)
+            idle_timeout: Secondes d'inactivité avant de décharger un modèle
+            concurrency: Requêtes simultanées par modèle
+            max_restarts: Relances maximales du serveur possédé par le gestionnaire
+            startup_timeout: Attente maximale du démarrage du serveur
+        """
+        self.ollama_host = ollama_host.rstrip('/')
+        self.api_base_url = f"{self.ollama_host}/api"
+        self.ollama_binary = ollama_binary or shutil.which('ollama') or '/usr/local/bin/ollama'
+        self.idle_timeout = idle_timeout
+        self.concurrency = max(1, concurrency)
+        self.max_restarts = max_restarts
+        self.startup_timeout = startup_timeout
+        self.spawn_server = spawn_server
+
+        self.workers: Dict[str, _ModelWorker] = {}
+        self.server_process: Optional[subprocess.Popen] = None
+        self.restarts = 0
+        self.stats = {'requests': 0, 'cold_starts': 0, 'unloads': 0, 'server_starts': 0, 'errors': 0}
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._server_lock: Optional[asyncio.Lock] = None
+        self._server_ready = False
+        self._start_lock = threading.Lock()
+        self._users = 0
+        self._cleanup_registered = False
+
+    @classmethod
+    def shared(cls, ollama_host: str = 'http://localhost:11434', **options) -> 'LocalModelWorkerManager':
+        """
+        Gestionnaire partagé par hôte Ollama dans le processus.
+
+        Les options ne s'appliquent qu'à la création, sauf spawn_server=True
+        qui autorise aussi le gestionnaire existant à lancer le serveur.
+        """
+        with cls._shared_lock:
+            manager = cls._shared.get(ollama_host)
+            if manager is None:
+                manager = cls(ollama_host, **options)
+                cls._shared[ollama_host] = manager
+            elif options.get('spawn_server'):
+                manager.spawn_server = True
+            return manager
+
+    # ----- Cycle de vie -----
+
+    def retain(self) -> 'LocalModelWorkerManager':
+        """Enregistre un utilisateur ; le dernier release() arrête le gestionnaire."""
+        with self._start_lock:
+            self._users += 1
+        return self
+
+    def release(self, stop_server: bool = True):
+        """Retire un utilisateur ; arrête boucle, workers et serveur possédé s'il n'en reste aucun."""
+        with self._start_lock:
+            self._users = max(0, self._users - 1)
+            last = self._users == 0
+        if last:
+            self.shutdown(stop_server=stop_server)
+
+    def _register_cleanup(self):
+        """Arrêt à la sortie de l'interpréteur dès qu'une boucle ou un serveur est possédé."""
+        if not self._cleanup_registered:
+            self._cleanup_registered = True
+            atexit.register(self.shutdown)
+
+    # ----- Boucle dédiée -----
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run():
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=run, name="ollama-workers", daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+                self._register_cleanup()
+            return self._loop
+
+    def _submit(self, coro) -> 'asyncio.Future':
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    # ----- Serveur Ollama -----
+
+    async def _server_alive(self) -> bool:
+        try:
+            async with self._session.get(f"{self.api_base_url}/version",
+                                         timeout=aiohttp.ClientTimeout(total=2)) as response:
+                return response.status == 200
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return False
+
+    async def _ensure_server(self, check: bool = False):
+        """
+        Serveur joignable ; lancé (ou relancé) par le gestionnaire si nécessaire.
+
+        Args:
+            check: Revérifier le serveur même s'il a déjà répondu (après une erreur de connexion)
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit_per_host=8))
+            self._server_lock = asyncio.Lock()
+        owned_alive = self.server_process is None or self.server_process.poll() is None
+        if self._server_ready and owned_alive and not check:
+            return
+
+        async with self._server_lock:
+            if await self._server_alive():
+                self._server_ready = True
+                return
+            self._server_ready = False
+            if self.server_process is None or self.server_process.poll() is not None:
+                if self.server_process is not None:
+                    if self.restarts >= self.max_restarts:
+                        raise LocalWorkerUnavailable(
+                            f"Serveur Ollama relancé {self.restarts} fois, abandon")
+                    self.restarts += 1
+                    print(f"🔁 Serveur Ollama arrêté (code {self.server_process.returncode}), relance {self.restarts}")
+                elif not self.spawn_server:
+                    raise LocalWorkerUnavailable(
+                        f"Serveur Ollama injoignable: {self.ollama_host} (lancement non autorisé, spawn_server=False)")
+                self._spawn_server()
+
+            deadline = time.time() + self.startup_timeout
+            while time.time() < deadline:
+                if await self._server_alive():
+                    # Les modèles du serveur précédent ne sont plus chargés
+                    for worker in self.workers.values():
+                        worker.loaded = False
+                    self._server_ready = True
+                    return
+                if self.server_process.poll() is not None:
+                    break
+                await asyncio.sleep(0.1)
+            raise LocalWorkerUnavailable(f"Serveur Ollama injoignable: {self.ollama_host}")
+
+    def _spawn_server(self):
+        if not os.path.exists(self.ollama_binary) and shutil.which(self.ollama_binary) is None:
+            raise LocalWorkerUnavailable(f"Binaire Ollama non trouvé: {self.ollama_binary}")
+        parsed = urlparse(self.ollama_host)
+        env = dict(os.environ, OLLAMA_HOST=parsed.netloc or parsed.path)
+        self.server_process = subprocess.Popen(
+            [self.ollama_binary, 'serve'],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            env=env
+        )
+        self._register_cleanup()
+        self.stats['server_starts'] += 1
+        print(f"🚀 Serveur Ollama lancé (pid {self.server_process.pid}) sur {self.ollama_host}")
+
+    # ----- Workers -----
+
+    def _get_worker(self, model: str) -> _ModelWorker:
+        worker = self.workers.get(model)
+        if worker is None:
+            worker = _ModelWorker(model, self.concurrency)
+            self.workers[model] = worker
+            worker.tasks = [asyncio.ensure_future(self._consume(worker)) for _ in range(worker.concurrency)]
+        return worker
+
+    async def _consume(self, worker: _ModelWorker):
+        """Consommateur d'un modèle ; décharge le modèle après idle_timeout sans requête."""
+        while True:
+            try:
+                request = await asyncio.wait_for(worker.queue.get(), timeout=self.idle_timeout)
+            except asyncio.TimeoutError:
+                if (worker.queue.empty() and worker.active == 0
+                        and time.time() - worker.last_used >= self.idle_timeout):
+                    await self._retire(worker)
+                    return
+                continue
+
+            if request.future.done():
+                # Appelant parti (timeout, annulation) avant son tour
+                continue
+            worker.active += 1
+            try:
+                result = await self._run_request(worker, request)
+                if not request.future.done():
+                    request.future.set_result(result)
+            except Exception as e:
+                self.stats['errors'] += 1
+                if not request.future.done():
+                    request.future.set_exception(e)
+            finally:
+                worker.active -= 1
+                worker.last_used = time.time()
+
+    async def _retire(self, worker: _ModelWorker):
+        """Retire un worker inactif et décharge son modèle du serveur."""
+        if self.workers.get(worker.model) is not worker:
+            return
+        del self.workers[worker.model]
+        for task in worker.tasks:
+            if task is not asyncio.current_task():
+                task.cancel()
+        if worker.loaded:
+            try:
+                await self._post_generate({"model": worker.model, "keep_alive": 0})
+                self.stats['unloads'] += 1
+                print(f"💤 Modèle {worker.model} déchargé après {self.idle_timeout:g}s d'inactivité")
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass
+
+    async def _post_generate(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        async with self._session.post(f"{self.api_base_url}/generate", json=payload) as response:
+            if response.status != 200:
+                raise RuntimeError(f"Erreur API Ollama: HTTP {response.status} - {await response.text()}")
+            return await response.json()
+
+    async def _run_request(self, worker: _ModelWorker, request: _WorkerRequest) -> WorkerResult:
+        started = time.time()
+        cold_start = not worker.loaded
+        payload = {
+            "model": worker.model,
+            "prompt": request.prompt,
+            "stream": True,
+            # Ollama garde le modèle un peu plus longtemps que nous : c'est le worker qui décharge
+            "keep_alive": f"{int(self.idle_timeout) + 60}s"
+        }
+        if request.options:
+            payload["options"] = request.options
+
+        for attempt in range(2):
+            await self._ensure_server(check=attempt > 0)
+            try:
+                return await self._stream_generate(worker, request, payload, started, cold_start)
+            except aiohttp.ClientConnectionError:
+                self._server_ready = False
+                # Serveur tombé pendant la requête : relance puis une seule nouvelle
+                # tentative, tant qu'aucun fragment n'a été transmis à l'appelant
+                if attempt == 1 or request.future.done() or request.emitted:
+                    raise
+                worker.loaded = False
+                cold_start = True
+        raise LocalWorkerUnavailable(f"Serveur Ollama injoignable: {self.ollama_host}")
+
+    async def _stream_generate(self, worker: _ModelWorker, request: _WorkerRequest, payload: Dict[str, Any],
+                               started: float, cold_start: bool) -> WorkerResult:
+        parts = []
+        first_token_latency = None
+        tokens_used = None
+        async with self._session.post(f"{self.api_base_url}/generate", json=payload) as response:
+            if response.status != 200:
+                raise RuntimeError(f"Erreur API Ollama: HTTP {response.status} - {await response.text()}")
+            async for line in response.content:
+                if request.future.done():
+                    break
+                if not line.strip():
+                    continue
+                data = json.loads(line)
+                if data.get('error'):
+                    raise RuntimeError(f"Erreur Ollama: {data['error']}")
+                text = data.get('response', '')
+                if text:
+                    if first_token_latency is None:
+                        first_token_latency = time.time() - request.enqueued_at
+                    parts.append(text)
+                    request.emitted += 1
+                    if request.on_token is not None:
+                        request.on_token(text)
+                if data.get('done'):
+                    tokens_used = data.get('eval_count')
+                    break
+
+        worker.loaded = True
+        worker.served += 1
+        self.stats['requests'] += 1
+        if cold_start:
+            self.stats['cold_starts'] += 1
+        return WorkerResult(
+            content="".join(parts),
+            model=worker.model,
+            tokens_used=tokens_used,
+            queue_wait=started - request.enqueued_at,
+            first_token_latency=first_token_latency,
+            total_time=time.time() - request.enqueued_at,
+            cold_start=cold_start
+        )
+
+    async def _enqueue(self, model: str, prompt: str, options: Optional[Dict[str, Any]],
+                       on_token: Optional[Callable[[str], None]]) -> WorkerResult:
+        """Exécuté dans la boucle dédiée : met la requête en file et attend son résultat."""
+        await self._ensure_server()
+        worker = self._get_worker(model)
+        worker.last_used = time.time()
+        request = _WorkerRequest(prompt, dict(options or {}), asyncio.get_running_loop().create_future(), on_token)
+        await worker.queue.put(request)
+        try:
+            return await request.future
+        finally:
+            if not request.future.done():
+                request.future.cancel()
+
+    async def _warm(self, model: str):
+        await self._ensure_server()
+        worker = self._get_worker(model)
+        if not worker.loaded:
+            # Un prompt vide charge le modèle sans rien générer
+            await self._post_generate({"model": model, "keep_alive": f"{int(self.idle_timeout) + 60}s"})
+            worker.loaded = True
+            worker.last_used = time.time()
+            self.stats['cold_starts'] += 1
+
+    # ----- API publique -----
+
+    async def generate(self, model: str, prompt: str, options: Optional[Dict[str, Any]] = None,
+                       timeout: Optional[float] = None,
+                       on_token: Optional[Callable[[str], None]] = None) -> WorkerResult:
+        """
+        Génération par le worker du modèle, depuis n'importe quelle boucle asyncio.
+
+        Args:
+            on_token: Appelé dans le thread des workers pour chaque fragment
+        """
+        future = asyncio.wrap_future(self._submit(self._enqueue(model, prompt, options, on_token)))
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            raise asyncio.TimeoutError(f"Timeout du worker {model} après {timeout} secondes")
+
+    def generate_sync(self, model: str, prompt: str, options: Optional[Dict[str, Any]] = None,
+                      timeout: Optional[float] = None) -> WorkerResult:
+        """Génération bloquante, pour le code synchrone."""
+        future = self._submit(self._enqueue(model, prompt, options, None))
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    async def stream(self, model: str, prompt: str, options: Optional[Dict[str, Any]] = None,
+                     timeout: Optional[float] = None) -> AsyncIterator[Any]:
+        """
+        Fragments de texte au fil de la génération, puis le WorkerResult final.
+        """
+        loop = asyncio.get_running_loop()
+        tokens: asyncio.Queue = asyncio.Queue()
+        on_token = lambda text: loop.call_soon_threadsafe(tokens.put_nowait, text)
+        future = asyncio.wrap_future(self._submit(self._enqueue(model, prompt, options, on_token)))
+        deadline = loop.time() + timeout if timeout is not None else None
+        try:
+            while True:
+                getter = asyncio.ensure_future(tokens.get())
+                remaining = deadline - loop.time() if deadline is not None else None
+                done, _ = await asyncio.wait({getter, future}, timeout=remaining,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                if getter in done:
+                    yield getter.result()
+                    continue
+                getter.cancel()
+                if future in done:
+                    # Fragments arrivés avant le résultat final
+                    while not tokens.empty():
+                        yield tokens.get_nowait()
+                    yield future.result()
+                    return
+                raise asyncio.TimeoutError(f"Timeout du worker {model} après {timeout} secondes")
+        finally:
+            if not future.done():
+                future.cancel()
+
+    def warm(self, model: str, timeout: Optional[float] = None):
+        """Charge un modèle à l'avance (bloquant)."""
+        self._submit(self._warm(model)).result(timeout=timeout)
+
+    def unload(self, model: str):
+        """Décharge immédiatement un modèle et retire son worker (bloquant)."""
+        async def unload():
+            worker = self.workers.get(model)
+            if worker is not None:
+                await self._retire(worker)
+        if self._loop is not None:
+            self._submit(unload()).result()
+
+    def shutdown(self, stop_server: bool = True):
+        """Arrête les workers, la boucle dédiée et le serveur possédé (idempotent)."""
+        if self._cleanup_registered:
+            self._cleanup_registered = False
+            atexit.unregister(self.shutdown)
+        if self._loop is not None and self._thread.is_alive():
+            async def close():
+                tasks = [task for worker in self.workers.values() for task in worker.tasks]
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                self.workers.clear()
+                if self._session is not None:
+                    await self._session.close()
+            self._submit(close()).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+            self._loop.close()
+            self._loop = None
+        if stop_server and self.server_process is not None and self.server_process.poll() is None:
+            self.server_process.terminate()
+            try:
+                self.server_process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.server_process.kill()
+        with self._shared_lock:
+            if self._shared.get(self.ollama_host) is self:
+                del self._shared[self.ollama_host]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Statistiques : requêtes, démarrages à froid, déchargements, workers actifs."""
+        return {
+            **self.stats,
+            'server_owned': self.server_process is not None,
+            'server_restarts': self.restarts,
+            'workers': {
+                model: {'loaded': worker.loaded, 'queued': worker.queue.qsize(), 'served': worker.served}
+                for model, worker in list(self.workers.items())
+            }
+        }
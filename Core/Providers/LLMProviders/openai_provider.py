@@ -4,13 +4,18 @@
 
 Provider OpenAI avec validation complète, gestion d'erreurs détaillée
 et test de connexion robuste.
+
+stream_response() utilise le streaming natif de chat.completions.
 """
 
 import os
 import time
 import asyncio
-from typing import Dict, Any, Optional
-from .llm_provider import LLMProvider, ProviderStatus, LLMResponse, ProviderType, ErrorType
+from typing import Dict, Any, Optional, AsyncIterator, Tuple
+from .llm_provider import (
+    LLMProvider, ProviderStatus, LLMResponse, ProviderType, ErrorType,
+    StreamChunk, StreamingResponseBuilder
+)
 
 
 class OpenAIProvider(LLMProvider):
@@ -240,6 +245,77 @@ class OpenAIProvider(LLMProvider):
                 time.time() - start_time
             )
     
+    async def stream_response(self, prompt: str, **kwargs) -> AsyncIterator[StreamChunk]:
+        """Génération streamée via chat.completions (stream=True)"""
+        start_time = time.time()
+        model = kwargs.get('model', self.model)
+        # L'attribut de config estimate_prompt_size masque la méthode du même nom
+        prompt_size = LLMProvider.estimate_prompt_size(self, prompt) if self.estimate_prompt_size else None
+        builder = StreamingResponseBuilder(self.provider_type, model, prompt_size, start_time)
+        timeout = self._handle_timeout(kwargs.get('timeout'))
+        
+        try:
+            import openai
+            
+            # Configuration du client
+            client_config = {"api_key": self.api_key}
+            if self.organization:
+                client_config["organization"] = self.organization
+            
+            client = openai.AsyncOpenAI(**client_config)
+            
+            generation_params = {
+                "model": model,
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": kwargs.get('temperature', self.temperature),
+                "max_tokens": kwargs.get('max_tokens', self.max_tokens),
+                "stream": True,
+                # Dernier événement : usage des tokens
+                "stream_options": {"include_usage": True},
+            }
+            generation_params = {k: v for k, v in generation_params.items() if v is not None}
+            
+            stream = await self._execute_with_timeout(
+                client.chat.completions.create(**generation_params),
+                timeout
+            )
+            tokens_used = None
+            async for event in self._iterate_with_timeout(stream, timeout):
+                if event.choices:
+                    chunk = builder.add(event.choices[0].delta.content or "")
+                    if chunk is not None:
+                        yield chunk
+                if getattr(event, 'usage', None):
+                    tokens_used = event.usage.total_tokens
+            
+            yield builder.finish(tokens_used=tokens_used)
+        
+        except ImportError:
+            yield builder.fail("Module OpenAI non installé. Installez avec: pip install openai",
+                               ErrorType.UNKNOWN_ERROR)
+        
+        except (asyncio.TimeoutError, TimeoutError):
+            yield builder.fail(f"Timeout OpenAI après {timeout} secondes", ErrorType.TIMEOUT)
+        
+        except Exception as e:
+            yield builder.fail(*self._classify_error(e))
+    
+    def _classify_error(self, error: Exception) -> Tuple[str, ErrorType]:
+        """Message et type d'erreur pour une exception du client OpenAI"""
+        import openai
+        
+        known_errors = [
+            ("AuthenticationError", "Clé API OpenAI invalide ou expirée", ErrorType.API_KEY_INVALID),
+            ("RateLimitError", "Limite de taux OpenAI dépassée", ErrorType.RATE_LIMIT),
+            ("NotFoundError", f"Modèle OpenAI '{self.model}' non disponible", ErrorType.MODEL_UNAVAILABLE),
+            ("APIConnectionError", "Connexion à l'API OpenAI impossible", ErrorType.NETWORK_ERROR),
+        ]
+        for class_name, message, error_type in known_errors:
+            error_class = getattr(openai, class_name, None)
+            if error_class is not None and isinstance(error, error_class):
+                return message, error_type
+        return f"Erreur OpenAI inconnue: {str(error)}", ErrorType.UNKNOWN_ERROR
+    
     def get_provider_info(self) -> Dict[str, Any]:
         """Informations spécifiques au provider OpenAI"""
         base_info = super().get_provider_info()
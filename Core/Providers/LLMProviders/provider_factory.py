@@ -12,6 +12,26 @@ from .llm_provider import LLMProvider, ProviderType, ValidationResult, ErrorType
 from .openai_provider import OpenAIProvider
 from .local_provider import LocalProvider
 from .local_provider_http import LocalProviderHTTP
+from .cached_provider import with_response_cache
+from .scheduled_provider import with_scheduler
+
+try:
+    from Core.Config.feature_flags import (
+        is_llm_cache_enabled, get_llm_cache_max_temperature,
+        is_llm_scheduler_enabled, get_llm_max_in_flight
+    )
+except Exception:
+    def is_llm_cache_enabled() -> bool:
+        return False
+
+    def get_llm_cache_max_temperature() -> float:
+        return 0.0
+
+    def is_llm_scheduler_enabled() -> bool:
+        return False
+
+    def get_llm_max_in_flight() -> int:
+        return 2
 
 
 class ProviderFactory:
@@ -19,7 +39,42 @@ class ProviderFactory:
     
     @staticmethod
     def create_provider(provider_type: str, **kwargs) -> LLMProvider:
-        """Création d'un provider selon le type spécifié"""
+        """
+        Création d'un provider selon le type spécifié
+        
+        ``response_cache=True`` (ou un dict d'options de CachedLLMProvider, ou
+        LLM_CACHE=1) enveloppe le provider dans le cache de réponses ; le seuil
+        max_temperature vient par défaut de LLM_CACHE_MAX_TEMPERATURE.
+        
+        ``scheduler=True`` (ou un dict d'options de ScheduledLLMProvider, ou
+        LLM_SCHEDULER=1) fait passer les appels par l'ordonnanceur partagé ;
+        ``priority`` ("interactive", "normal", "background") est la priorité
+        par défaut des appels. Le cache enveloppe l'ordonnanceur : un succès
+        du cache n'attend pas de place.
+        """
+        cache_options = kwargs.pop('response_cache', None)
+        scheduler_options = kwargs.pop('scheduler', None)
+        priority = kwargs.pop('priority', None)
+        if cache_options is None:
+            cache_options = is_llm_cache_enabled()
+        if scheduler_options is None:
+            scheduler_options = is_llm_scheduler_enabled()
+        provider = ProviderFactory._create_base_provider(provider_type, **kwargs)
+        if scheduler_options:
+            scheduler_options = dict(scheduler_options) if isinstance(scheduler_options, dict) else {}
+            if priority is not None:
+                scheduler_options.setdefault('priority', priority)
+            scheduler_options.setdefault('max_in_flight', get_llm_max_in_flight())
+            provider = with_scheduler(provider, **scheduler_options)
+        if cache_options:
+            cache_options = dict(cache_options) if isinstance(cache_options, dict) else {}
+            cache_options.setdefault('max_temperature', get_llm_cache_max_temperature())
+            return with_response_cache(provider, **cache_options)
+        return provider
+    
+    @staticmethod
+    def _create_base_provider(provider_type: str, **kwargs) -> LLMProvider:
+        """Création du provider brut, sans cache"""
         
         # Normalisation du type
         provider_type = provider_type.lower().strip()
@@ -89,19 +144,22 @@ class ProviderFactory:
             "openai": {
                 "description": "Provider OpenAI GPT-4",
                 "required_config": ["api_key"],
-                "optional_config": ["model", "organization", "timeout", "max_tokens"],
+                "optional_config": ["model", "organization", "timeout", "max_tokens", "response_cache",
+                                    "scheduler", "priority"],
                 "capabilities": ["chat_completion", "text_generation", "streaming", "function_calling"]
             },
             "local": {
                 "description": "Provider Ollama Local (API HTTP)",
                 "required_config": ["model"],
-                "optional_config": ["ollama_host", "timeout", "temperature"],
+                "optional_config": ["ollama_host", "timeout", "temperature", "response_cache", "scheduler", "priority"],
                 "capabilities": ["text_generation", "chat_completion", "local_inference"]
             },
             "local_subprocess": {
                 "description": "Provider Ollama Local (Subprocess)",
                 "required_config": ["model"],
-                "optional_config": ["ollama_host", "ollama_binary", "timeout", "temperature"],
+                "optional_config": ["ollama_host", "ollama_binary", "timeout", "temperature", "response_cache",
+                                    "scheduler", "priority", "persistent_worker", "worker_idle_timeout",
+                                    "spawn_ollama_server"],
                 "capabilities": ["text_generation", "chat_completion", "local_inference"]
             },
             "gemini": {
@@ -0,0 +1,520 @@
+#!/usr/bin/env python3
+"""
+⛧ Scheduled Provider - Admission et Fusion des Appels LLM ⛧
+
+Ordonnanceur partagé entre tous les clients d'un même modèle (Alma,
+Archiviste, Légion, agents) :
+
+- max_in_flight : nombre d'appels simultanés admis vers le serveur,
+- classes de priorité : un appel interactif passe devant la réflexion
+  de fond dans la file d'attente,
+- fusion : un prompt identique (même clé que le cache de réponses) déjà en
+  cours n'est pas relancé, les appelants suivants reçoivent sa réponse ; en
+  streaming, ils reçoivent les fragments du flux en cours (rejoués depuis le
+  début) tant qu'ils partagent sa boucle asyncio,
+- métriques : profondeur de file, attente par classe de priorité, fusions.
+
+L'ordonnanceur ne dépend d'aucune boucle asyncio : un même LLMScheduler.shared()
+sert plusieurs boucles et le code synchrone (slot_sync).
+
+Créé par Alma, Architecte Démoniaque du Nexus Luciforme.
+"""
+
+import time
+import heapq
+import asyncio
+import itertools
+import threading
+import concurrent.futures
+from collections import deque
+from contextlib import aclosing, asynccontextmanager, contextmanager
+from dataclasses import replace
+from enum import IntEnum
+from typing import Dict, Any, Optional, Callable, Awaitable, AsyncIterator, Tuple, Union
+
+from .llm_provider import LLMProvider, ProviderStatus, LLMResponse, StreamChunk
+from .cached_provider import LLMResponseCache, NON_SAMPLING_PARAMS
+
+
+class Priority(IntEnum):
+    """Classes de priorité (la plus petite valeur passe en premier)"""
+    INTERACTIVE = 0
+    NORMAL = 1
+    BACKGROUND = 2
+
+    @classmethod
+    def coerce(cls, value: Union['Priority', str, int, None], default: 'Priority' = None) -> 'Priority':
+        """Priority depuis une valeur de configuration ('interactive', 2, Priority.NORMAL...)"""
+        if value is None:
+            return default if default is not None else cls.NORMAL
+        if isinstance(value, str):
+            return cls[value.strip().upper()]
+        return cls(value)
+
+
+class _LeaderCancelled(Exception):
+    """L'appel fusionné a été annulé par son initiateur : les suivants relancent le leur"""
+
+
+class _Waiter:
+    """Demande d'admission en attente d'une place"""
+
+    __slots__ = ('priority', 'enqueued_at', 'wake', 'granted', 'abandoned', 'wait_time')
+
+    def __init__(self, priority: Priority, wake: Optional[Callable[[], None]] = None):
+        self.priority = priority
+        self.enqueued_at = time.time()
+        self.wake = wake
+        self.granted = False
+        self.abandoned = False
+        self.wait_time = 0.0
+
+
+class _InFlight:
+    """Appel en cours partagé par les requêtes identiques"""
+
+    __slots__ = ('future', 'waiter', 'followers')
+
+    def __init__(self):
+        self.future: concurrent.futures.Future = concurrent.futures.Future()
+        self.waiter: Optional[_Waiter] = None
+        self.followers = 0
+
+
+class _SharedStream:
+    """Flux en cours partagé par les requêtes identiques d'une même boucle"""
+
+    __slots__ = ('chunks', 'finished', 'error', 'changed', 'consumers', 'pump', 'waiter', 'wait_time')
+
+    def __init__(self):
+        self.chunks = []
+        self.finished = False
+        self.error: Optional[BaseException] = None
+        self.changed = asyncio.Condition()
+        self.consumers = 0
+        self.pump: Optional[asyncio.Task] = None
+        self.waiter: Optional[_Waiter] = None
+        self.wait_time = 0.0
+
+
+class LLMScheduler:
+    """Ordonnanceur d'appels LLM : limite d'appels simultanés, priorités, fusion"""
+
+    _shared: Dict[str, 'LLMScheduler'] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_in_flight: int = 2, name: str = 'default', wait_samples: int = 256):
+        """
+        Args:
+            max_in_flight: Appels simultanés admis
+            name: Nom de l'ordonnanceur (hôte ou type de provider)
+            wait_samples: Attentes récentes conservées par classe pour le p95
+        """
+        self.max_in_flight = max(1, max_in_flight)
+        self.name = name
+        self.lock = threading.Lock()
+        self._heap = []
+        self._sequence = itertools.count()
+        self._inflight: Dict[str, _InFlight] = {}
+        self._streams: Dict[Tuple[asyncio.AbstractEventLoop, str], _SharedStream] = {}
+        self.in_flight = 0
+        self.queued = 0
+        self.stats = {'admitted': 0, 'completed': 0, 'coalesced': 0, 'abandoned': 0, 'max_queue_depth': 0}
+        self._waits = {priority: deque(maxlen=wait_samples) for priority in Priority}
+        self._wait_totals = {priority: [0, 0.0, 0.0] for priority in Priority}  # nombre, somme, max
+
+    @classmethod
+    def shared(cls, name: str = 'default', **options) -> 'LLMScheduler':
+        """Ordonnanceur partagé par nom (hôte du modèle) dans le processus."""
+        with cls._shared_lock:
+            scheduler = cls._shared.get(name)
+            if scheduler is None:
+                scheduler = cls(name=name, **options)
+                cls._shared[name] = scheduler
+            return scheduler
+
+    # ----- Admission -----
+
+    def _grant(self, waiter: _Waiter):
+        """Sous self.lock : attribue une place et enregistre l'attente."""
+        waiter.granted = True
+        waiter.wait_time = time.time() - waiter.enqueued_at
+        self.in_flight += 1
+        self.stats['admitted'] += 1
+        self._waits[waiter.priority].append(waiter.wait_time)
+        totals = self._wait_totals[waiter.priority]
+        totals[0] += 1
+        totals[1] += waiter.wait_time
+        totals[2] = max(totals[2], waiter.wait_time)
+
+    def _try_admit(self, waiter: _Waiter, inflight: Optional[_InFlight] = None) -> bool:
+        """Admission immédiate si une place est libre et personne n'attend, sinon mise en file."""
+        with self.lock:
+            if inflight is not None:
+                inflight.waiter = waiter
+            if self.in_flight < self.max_in_flight and not self.queued:
+                self._grant(waiter)
+                return True
+            heapq.heappush(self._heap, (waiter.priority, next(self._sequence), waiter))
+            self.queued += 1
+            self.stats['max_queue_depth'] = max(self.stats['max_queue_depth'], self.queued)
+            return False
+
+    def _abandon(self, waiter: _Waiter) -> bool:
+        """Retire une attente annulée ; True si la place avait déjà été attribuée."""
+        with self.lock:
+            if waiter.granted:
+                return True
+            waiter.abandoned = True
+            self.queued -= 1
+            self.stats['abandoned'] += 1
+            return False
+
+    def _release(self):
+        """Libère une place et la donne à l'attente la plus prioritaire."""
+        to_wake = None
+        with self.lock:
+            self.in_flight -= 1
+            self.stats['completed'] += 1
+            while self._heap and self.in_flight < self.max_in_flight:
+                _, _, waiter = heapq.heappop(self._heap)
+                if waiter.granted or waiter.abandoned:
+                    continue  # Entrée périmée (promotion) ou attente annulée
+                self.queued -= 1
+                self._grant(waiter)
+                to_wake = waiter
+                break
+        if to_wake is not None:
+            to_wake.wake()
+
+    def _promote(self, waiter: Optional[_Waiter], priority: Priority):
+        """Remonte une attente en file (appel fusionné rejoint par un appelant plus prioritaire)."""
+        with self.lock:
+            if waiter is None or waiter.granted or waiter.abandoned or priority >= waiter.priority:
+                return
+            waiter.priority = priority
+            heapq.heappush(self._heap, (priority, next(self._sequence), waiter))
+
+    async def _acquire(self, priority: Priority, inflight: Optional[_InFlight] = None) -> _Waiter:
+        loop = asyncio.get_running_loop()
+        granted = loop.create_future()
+
+        def resolve():
+            if not granted.done():
+                granted.set_result(None)
+
+        waiter = _Waiter(priority, lambda: loop.call_soon_threadsafe(resolve))
+        if self._try_admit(waiter, inflight):
+            return waiter
+        try:
+            await granted
+        except asyncio.CancelledError:
+            if self._abandon(waiter):
+                self._release()
+            raise
+        return waiter
+
+    @asynccontextmanager
+    async def slot(self, priority: Union[Priority, str, None] = None) -> AsyncIterator[_Waiter]:
+        """Place d'exécution (async) ; l'objet retourné expose wait_time."""
+        waiter = await self._acquire(Priority.coerce(priority))
+        try:
+            yield waiter
+        finally:
+            self._release()
+
+    @contextmanager
+    def slot_sync(self, priority: Union[Priority, str, None] = None, timeout: Optional[float] = None):
+        """Place d'exécution pour le code synchrone (TimeoutError si l'attente dépasse timeout)."""
+        event = threading.Event()
+        waiter = _Waiter(Priority.coerce(priority), event.set)
+        if not self._try_admit(waiter) and not event.wait(timeout):
+            if not self._abandon(waiter):
+                raise TimeoutError(f"Aucune place LLM ({self.name}) après {timeout} secondes")
+        try:
+            yield waiter
+        finally:
+            self._release()
+
+    # ----- Fusion -----
+
+    async def run(self, key: Optional[str], call: Callable[[], Awaitable[Any]],
+                  priority: Union[Priority, str, None] = None) -> Any:
+        """
+        Exécute call() dans une place ; un appel de même clé déjà en cours est partagé.
+
+        Returns:
+            (résultat, True si le résultat vient d'un appel fusionné)
+        """
+        priority = Priority.coerce(priority)
+        if key is None:
+            async with self.slot(priority):
+                return await call(), False
+
+        with self.lock:
+            inflight = self._inflight.get(key)
+            leader = inflight is None
+            if leader:
+                inflight = _InFlight()
+                self._inflight[key] = inflight
+            else:
+                inflight.followers += 1
+                self.stats['coalesced'] += 1
+        if not leader:
+            self._promote(inflight.waiter, priority)
+            try:
+                # shield : l'annulation d'un suivant ne touche pas l'appel partagé
+                return await asyncio.shield(asyncio.wrap_future(inflight.future)), True
+            except _LeaderCancelled:
+                return await self.run(key, call, priority)
+
+        try:
+            await self._acquire(priority, inflight)
+            try:
+                result = await call()
+            finally:
+                self._release()
+        except BaseException as e:
+            with self.lock:
+                self._inflight.pop(key, None)
+            inflight.future.set_exception(e if isinstance(e, Exception) else _LeaderCancelled())
+            raise
+        with self.lock:
+            self._inflight.pop(key, None)
+        inflight.future.set_result(result)
+        return result, False
+
+    async def stream(self, key: Optional[str], open_stream: Callable[[], AsyncIterator[StreamChunk]],
+                     priority: Union[Priority, str, None] = None
+                     ) -> AsyncIterator[Tuple[StreamChunk, bool, float]]:
+        """
+        Flux de open_stream() dans une place ; un flux de même clé en cours dans
+        la même boucle est partagé (ses fragments déjà produits sont rejoués).
+
+        Le flux amont est lu par une tâche de la boucle : un consommateur qui
+        s'arrête tôt ne coupe pas les autres, le dernier à partir ferme l'amont
+        et libère la place avant de rendre la main.
+
+        Yields:
+            (fragment, True si le flux vient d'un appel fusionné, attente d'admission)
+        """
+        priority = Priority.coerce(priority)
+        if key is None:
+            async with self.slot(priority) as waiter, aclosing(open_stream()) as stream:
+                async for chunk in stream:
+                    yield chunk, False, waiter.wait_time
+            return
+
+        stream_key = (asyncio.get_running_loop(), key)
+        with self.lock:
+            shared = self._streams.get(stream_key)
+            leader = shared is None
+            if leader:
+                shared = _SharedStream()
+                self._streams[stream_key] = shared
+            else:
+                self.stats['coalesced'] += 1
+            shared.consumers += 1
+        if leader:
+            shared.pump = asyncio.ensure_future(self._pump(stream_key, shared, open_stream, priority))
+        else:
+            self._promote(shared.waiter, priority)
+
+        index = 0
+        try:
+            while True:
+                async with shared.changed:
+                    await shared.changed.wait_for(lambda: index < len(shared.chunks) or shared.finished)
+                while index < len(shared.chunks):
+                    chunk = shared.chunks[index]
+                    index += 1
+                    yield chunk, not leader, shared.wait_time
+                if shared.finished and index >= len(shared.chunks):
+                    if shared.error is not None:
+                        raise shared.error
+                    return
+        finally:
+            with self.lock:
+                shared.consumers -= 1
+                last = shared.consumers == 0
+                if last and self._streams.get(stream_key) is shared:
+                    del self._streams[stream_key]
+            if last and not shared.pump.done():
+                # Plus personne ne lit : l'amont est fermé et la place rendue avant de continuer
+                shared.pump.cancel()
+                await asyncio.wait([shared.pump])
+
+    async def _pump(self, stream_key: Tuple[asyncio.AbstractEventLoop, str], shared: _SharedStream,
+                    open_stream: Callable[[], AsyncIterator[StreamChunk]], priority: Priority):
+        """Lit le flux amont dans une place et publie ses fragments aux consommateurs."""
+        try:
+            waiter = await self._acquire(priority, shared)
+            shared.wait_time = waiter.wait_time
+            try:
+                async with aclosing(open_stream()) as stream:
+                    async for chunk in stream:
+                        async with shared.changed:
+                            shared.chunks.append(chunk)
+                            shared.changed.notify_all()
+            finally:
+                self._release()
+        except asyncio.CancelledError:
+            shared.error = asyncio.CancelledError()
+        except Exception as e:
+            shared.error = e
+        finally:
+            with self.lock:
+                if self._streams.get(stream_key) is shared:
+                    del self._streams[stream_key]
+            async with shared.changed:
+                shared.finished = True
+                shared.changed.notify_all()
+
+    # ----- Métriques -----
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Places occupées, profondeur de file, attente par priorité (moyenne, max, p95), fusions."""
+        with self.lock:
+            stats = dict(self.stats)
+            stats.update({
+                'name': self.name,
+                'max_in_flight': self.max_in_flight,
+                'in_flight': self.in_flight,
+                'queue_depth': self.queued,
+                'coalescing_keys': len(self._inflight) + len(self._streams)
+            })
+            wait_time = {}
+            for priority in Priority:
+                count, total, longest = self._wait_totals[priority]
+                recent = sorted(self._waits[priority])
+                wait_time[priority.name.lower()] = {
+                    'count': count,
+                    'mean': total / count if count else 0.0,
+                    'max': longest,
+                    'p95': recent[min(len(recent) - 1, int(len(recent) * 0.95))] if recent else 0.0
+                }
+        stats['wait_time'] = wait_time
+        return stats
+
+
+class ScheduledLLMProvider(LLMProvider):
+    """LLMProvider dont les appels passent par un LLMScheduler partagé ; le reste est délégué."""
+
+    def __init__(self, provider: LLMProvider, scheduler: Optional[LLMScheduler] = None,
+                 priority: Union[Priority, str, None] = None, coalesce: bool = True, **scheduler_options):
+        """
+        Args:
+            provider: Provider enveloppé
+            scheduler: Ordonnanceur (sinon LLMScheduler.shared(scheduler_name_for(provider)))
+            priority: Priorité par défaut des appels (surchargeable par appel : priority=...)
+            coalesce: Fusionner les prompts identiques en cours
+            **scheduler_options: max_in_flight, wait_samples pour l'ordonnanceur partagé
+        """
+        super().__init__(provider.provider_type, provider.config)
+        self.provider = provider
+        self.scheduler = scheduler if scheduler is not None else LLMScheduler.shared(
+            scheduler_name_for(provider), **scheduler_options)
+        self.priority = Priority.coerce(priority)
+        self.coalesce = coalesce
+
+    def __getattr__(self, name: str) -> Any:
+        # Attributs propres au provider enveloppé (model, ollama_host...)
+        provider = self.__dict__.get('provider')
+        if provider is None:
+            raise AttributeError(name)
+        return getattr(provider, name)
+
+    def _request_key(self, prompt: str, kwargs: Dict[str, Any]) -> Optional[str]:
+        """Clé de fusion : mêmes composantes que la clé du cache de réponses."""
+        if not self.coalesce:
+            return None
+        params = {k: v for k, v in kwargs.items() if k not in NON_SAMPLING_PARAMS and k != 'model'}
+        params.setdefault('temperature', self.provider.temperature)
+        params.setdefault('max_tokens', self.provider.max_tokens)
+        model = kwargs.get('model', getattr(self.provider, 'model', None))
+        return LLMResponseCache.make_key(type(self.provider).__name__, model, prompt, params)
+
+    async def test_connection(self) -> ProviderStatus:
+        return await self.provider.test_connection()
+
+    async def generate_response(self, prompt: str, **kwargs) -> LLMResponse:
+        """Génération admise par l'ordonnanceur, fusionnée avec un prompt identique en cours"""
+        priority = Priority.coerce(kwargs.pop('priority', None), self.priority)
+        enqueued_at = time.time()
+        response, coalesced = await self.scheduler.run(
+            self._request_key(prompt, kwargs),
+            lambda: self.provider.generate_response(prompt, **kwargs),
+            priority
+        )
+        if coalesced:
+            # Copie : les suivants ne partagent pas les métadonnées du leader
+            response = replace(response, metadata=dict(response.metadata or {}))
+        metadata = response.metadata if response.metadata is not None else {}
+        metadata.update({
+            'priority': priority.name.lower(),
+            'coalesced': coalesced,
+            'scheduled_time': time.time() - enqueued_at
+        })
+        response.metadata = metadata
+        return response
+
+    async def stream_response(self, prompt: str, **kwargs) -> AsyncIterator[StreamChunk]:
+        """
+        Flux du provider ; la place est occupée jusqu'à la fin du flux.
+
+        Un flux identique déjà en cours dans la même boucle est partagé : les
+        suivants reçoivent ses fragments au lieu de relancer la génération.
+        """
+        priority = Priority.coerce(kwargs.pop('priority', None), self.priority)
+        enqueued_at = time.time()
+        shared_stream = self.scheduler.stream(
+            self._request_key(prompt, kwargs),
+            lambda: self.provider.stream_response(prompt, **kwargs),
+            priority
+        )
+        async with aclosing(shared_stream) as stream:
+            async for chunk, coalesced, queue_wait in stream:
+                if chunk.done and chunk.response is not None:
+                    # Copies : le fragment final est partagé par les flux fusionnés
+                    response = replace(chunk.response, metadata={
+                        **(chunk.response.metadata or {}),
+                        'priority': priority.name.lower(),
+                        'queue_wait': queue_wait,
+                        'coalesced': coalesced,
+                        'scheduled_time': time.time() - enqueued_at
+                    })
+                    chunk = replace(chunk, response=response)
+                yield chunk
+
+    async def aclose(self):
+        await self.provider.aclose()
+
+    def get_scheduler_stats(self) -> Dict[str, Any]:
+        """Statistiques de l'ordonnanceur (file, attentes par priorité, fusions)"""
+        return self.scheduler.get_stats()
+
+    def get_provider_info(self) -> Dict[str, Any]:
+        """Informations du provider enveloppé, plus l'état de l'ordonnanceur"""
+        info = self.provider.get_provider_info()
+        info['scheduler'] = {
+            'priority': self.priority.name.lower(),
+            'coalesce': self.coalesce,
+            **self.get_scheduler_stats()
+        }
+        return info
+
+
+def scheduler_name_for(provider: LLMProvider) -> str:
+    """Nom d'ordonnanceur partagé : l'hôte Ollama pour les modèles locaux, sinon le type de provider."""
+    return getattr(provider, 'ollama_host', None) or provider.provider_type.value
+
+
+def with_scheduler(provider: LLMProvider, **options) -> ScheduledLLMProvider:
+    """Enveloppe un provider dans l'ordonnanceur partagé (options de ScheduledLLMProvider)."""
+    if isinstance(provider, ScheduledLLMProvider):
+        if 'priority' in options:
+            return ScheduledLLMProvider(provider.provider, scheduler=provider.scheduler,
+                                        priority=options['priority'],
+                                        coalesce=options.get('coalesce', provider.coalesce))
+        return provider
+    return ScheduledLLMProvider(provider, **options)
@@ -231,13 +231,7 @@ class BaseAutoFeedingThread(ABC):
             await self._initialize_provider()
             
             if hasattr(self, 'provider') and self.provider:
-                response = await self.provider.generate_response(prompt)
-                daemon_response = response.content if hasattr(response, 'content') else str(response)
-                self.log_debug_action("llm_call_success", {
-                    "prompt_length": len(prompt),
-                    "response_length": len(daemon_response)
-                })
-                return daemon_response
+                return await self._generate_with_provider(prompt)
             else:
                 # Mode mock par défaut
                 mock_response = self._generate_mock_response(prompt)
@@ -247,6 +241,26 @@ class BaseAutoFeedingThread(ABC):
             self.log_debug_action("llm_call_error", {"error": str(e)})
             return self._generate_mock_response("error_fallback")
     
+    async def _generate_with_provider(self, prompt: str) -> str:
+        """Appelle le provider, en streaming s'il le permet, et journalise la latence du premier token."""
+        if hasattr(self.provider, 'generate_streaming'):
+            response = await self.provider.generate_streaming(prompt, on_chunk=self._on_llm_chunk)
+        else:
+            response = await self.provider.generate_response(prompt)
+        daemon_response = response.content if hasattr(response, 'content') else str(response)
+        metadata = getattr(response, 'metadata', None) or {}
+        self.log_debug_action("llm_call_success", {
+            "prompt_length": len(prompt),
+            "response_length": len(daemon_response),
+            "streamed": metadata.get("streamed", False),
+            "first_token_latency": metadata.get("first_token_latency")
+        })
+        return daemon_response
+    
+    def _on_llm_chunk(self, chunk):
+        """Fragment reçu pendant la génération. Les sous-classes peuvent surcharger pour parser au fil de l'eau."""
+        pass
+    
     def _get_prompt(self, user_input: str) -> str:
         """Génère le prompt pour le LLM. Implémentation commune."""
         # Template de base que les sous-classes peuvent surcharger
@@ -13,6 +13,23 @@ from dataclasses import dataclass, field
 
 from .memory_registry import MemoryRegistry, initialize_memory_registry
 
+try:
+    from Core.Providers.LLMProviders.local_worker import LocalModelWorkerManager, LocalWorkerUnavailable
+except Exception:
+    LocalModelWorkerManager = None  # Repli sur ollama run par appel
+
+try:
+    from Core.Providers.LLMProviders.scheduled_provider import LLMScheduler, Priority
+    from Core.Config.feature_flags import is_llm_scheduler_enabled, get_llm_max_in_flight
+except Exception:
+    LLMScheduler = None  # Pas d'ordonnancement : appels directs
+
+try:
+    from Core.Providers.LLMProviders.cached_provider import LLMResponseCache
+    from Core.Config.feature_flags import is_llm_cache_enabled, get_llm_cache_max_temperature
+except Exception:
+    LLMResponseCache = None  # Pas de cache de réponses
+
 
 @dataclass
 class ReflectionCycle:
@@ -31,13 +48,37 @@ class ReflectionCycle:
 class ReflectionEngine:
     """Moteur de réflexion autonome pour l'Archiviste"""
     
-    def __init__(self, memory_engine, model: str = "qwen2.5:7b-instruct", max_cycles: int = 5, debug: bool = True):
+    def __init__(self, memory_engine, model: str = "qwen2.5:7b-instruct", max_cycles: int = 5, debug: bool = True,
+                 ollama_host: str = "http://localhost:11434", persistent_worker: bool = True,
+                 temperature: Optional[float] = None, spawn_ollama_server: bool = False):
         self.memory_engine = memory_engine
         self.model = model
+        # Température d'échantillonnage du worker (None = défaut du modèle)
+        self.temperature = temperature
         self.max_cycles = max_cycles
         self.timeout = 30
         self.debug = debug
         
+        # Worker Ollama persistant : modèle gardé chaud entre les cycles, sur le
+        # serveur déjà lancé (``ollama serve`` lancé ici seulement sur demande)
+        self.worker_manager = None
+        if persistent_worker and LocalModelWorkerManager is not None:
+            self.worker_manager = LocalModelWorkerManager.shared(
+                ollama_host, spawn_server=spawn_ollama_server).retain()
+        
+        # Ordonnanceur partagé avec les providers du même hôte (LLM_SCHEDULER) : priorité de fond
+        self.scheduler = None
+        if LLMScheduler is not None and is_llm_scheduler_enabled():
+            self.scheduler = LLMScheduler.shared(ollama_host, max_in_flight=get_llm_max_in_flight())
+        
+        # Cache de réponses (LLM_CACHE) : servi sans place d'ordonnanceur, pour un
+        # échantillonnage déjà déterministe (température ≤ LLM_CACHE_MAX_TEMPERATURE)
+        self.response_cache = None
+        self.cache_max_temperature = 0.0
+        if LLMResponseCache is not None and is_llm_cache_enabled():
+            self.response_cache = LLMResponseCache.shared()
+            self.cache_max_temperature = get_llm_cache_max_temperature()
+        
         # Initialiser le MemoryRegistry
         self.memory_registry = initialize_memory_registry(memory_engine)
         
@@ -387,8 +428,57 @@ class ReflectionEngine:
         
         return response
     
+    def _cache_key(self, prompt: str) -> Optional[str]:
+        """
+        Clé de cache, ou None si l'appel n'est pas cachable : seul le worker
+        reçoit la température configurée (ollama run garde celle du modèle).
+        """
+        if self.response_cache is None or self.worker_manager is None:
+            return None
+        if self.temperature is None or self.temperature > self.cache_max_temperature:
+            return None
+        return LLMResponseCache.make_key('ReflectionEngine', self.model, prompt,
+                                         {'temperature': self.temperature})
+    
     def _call_ai(self, prompt: str) -> str:
-        """Appel à l'IA avec gestion d'erreur"""
+        """Appel à l'IA avec gestion d'erreur, admis par l'ordonnanceur s'il est actif"""
+        if self.response_cache is not None:
+            key = self._cache_key(prompt)
+            if key is None:
+                self.response_cache.record_bypass()
+            else:
+                cached = self.response_cache.get(key)
+                if cached is not None:
+                    return cached[0]['content']
+        
+        if self.scheduler is None:
+            return self._call_model(prompt)
+        try:
+            with self.scheduler.slot_sync(Priority.BACKGROUND, timeout=self.timeout):
+                return self._call_model(prompt)
+        except TimeoutError as e:
+            print(f"⏳ Réflexion reportée: {e}")
+            return ""
+    
+    def _call_model(self, prompt: str) -> str:
+        """Appel au modèle : worker persistant, sinon ollama run"""
+        if self.worker_manager is not None:
+            try:
+                key = self._cache_key(prompt)
+                options = {'temperature': self.temperature} if self.temperature is not None else None
+                text = self.worker_manager.generate_sync(self.model, prompt, options=options,
+                                                         timeout=self.timeout).content.strip()
+                if key is not None and text:
+                    self.response_cache.put(key, {'content': text, 'model': self.model})
+                return text
+            except LocalWorkerUnavailable as e:
+                print(f"⚠️ Worker Ollama indisponible ({e}) - repli sur ollama run")
+                self.worker_manager.release()
+                self.worker_manager = None
+            except Exception as e:
+                print(f"❌ Erreur lors de l'appel IA: {e}")
+                return ""
+        
         try:
             cmd = ["ollama", "run", self.model, prompt]
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=self.timeout)
@@ -300,7 +300,8 @@ class LegionAutoFeedingThread:
                     "model": "qwen2.5:7b-instruct",
                     "ollama_host": "http://localhost:11434",
                     "timeout": 60,
-                    "temperature": 0.666  # Rituel démoniaque
+                    "temperature": 0.666,  # Rituel démoniaque
+                    "priority": "background"  # Cède la place aux appels interactifs (LLM_SCHEDULER)
                 }
                 self.provider = ProviderFactory.create_provider("local", **config)
                 print("✅ Provider local initialisé avec température rituelle 0.666")
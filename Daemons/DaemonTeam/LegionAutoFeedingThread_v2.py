@@ -294,7 +294,8 @@ class LegionAutoFeedingThread(BaseAutoFeedingThread):
                     "model": "qwen2.5:7b-instruct",
                     "ollama_host": "http://localhost:11434",
                     "timeout": 60,
-                    "temperature": 0.666  # Rituel démoniaque
+                    "temperature": 0.666,  # Rituel démoniaque
+                    "priority": "background"  # Cède la place aux appels interactifs (LLM_SCHEDULER)
                 }
                 self.provider = ProviderFactory.create_provider("local", **config)
                 self.log_debug_action("provider_initialized", {
@@ -324,7 +325,8 @@ class LegionAutoFeedingThread(BaseAutoFeedingThread):
                     "model": "qwen2.5:7b-instruct",
                     "ollama_host": "http://localhost:11434",
                     "timeout": 60,
-                    "temperature": 0.666
+                    "temperature": 0.666,
+                    "priority": "background"
                 }
                 self.provider = ProviderFactory.create_provider("local", **config)
                 self.log_debug_action("provider_async_initialized", {"status": "success"})
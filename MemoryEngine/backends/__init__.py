@@ -1,4 +1,5 @@
 from .storage_backends import FileSystemBackend
+from .sqlite_backend import SQLiteBackend, migrate_filesystem_store
 
 try:
     from .neo4j_backend import Neo4jBackend
@@ -6,4 +7,4 @@ try:
 except ImportError:
     NEO4J_AVAILABLE = False
 
-__all__ = ['FileSystemBackend', 'Neo4jBackend', 'NEO4J_AVAILABLE'] 
\ No newline at end of file
+__all__ = ['FileSystemBackend', 'SQLiteBackend', 'migrate_filesystem_store', 'Neo4jBackend', 'NEO4J_AVAILABLE'] 
\ No newline at end of file
@@ -0,0 +1,204 @@
+"""
+⛧ Index inversé sur disque pour le FileSystemBackend ⛧
+
+Chaque clé (mot-clé, id, cible de lien...) possède son propre journal de
+postings, nommé par le hash de la clé. Une recherche ne lit donc qu'un seul
+fichier (coût O(résultats)). Une mise à jour n'ajoute que quelques lignes en
+fin de journal des clés touchées : son coût ne dépend ni de la taille du
+store ni du nombre de valeurs déjà associées à la clé.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+ADD, REMOVE = "+", "-"
+
+
+class DiskInvertedIndex:
+    """
+    Index clé → ensemble ordonné de valeurs, persisté en un journal par clé.
+
+    Le journal commence par une ligne d'en-tête ``{"key": ...}`` suivie
+    d'opérations ``["+", valeur]`` / ``["-", valeur]``. La lecture rejoue le
+    journal avec une sémantique d'ensemble ; quand les lignes mortes
+    (doublons, retraits) dominent, la clé est compactée.
+    """
+
+    BUILT_MARKER = ".built_v2"
+    COMPACTION_SLACK = 64
+
+    def __init__(self, index_dir):
+        self.index_dir = Path(index_dir)
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.RLock()
+
+    def _key_file(self, key: str) -> Path:
+        """Chemin du journal d'une clé (répartition sur 256 sous-dossiers)."""
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return self.index_dir / digest[:2] / f"{digest}.jsonl"
+
+    @staticmethod
+    def _read_header(f) -> str:
+        try:
+            return json.loads(f.readline()).get('key')
+        except (json.JSONDecodeError, AttributeError):
+            return None
+
+    def _load(self, key: str) -> Tuple[Dict[str, None], int]:
+        """Rejoue le journal d'une clé : (valeurs vivantes, nombre d'opérations)."""
+        values = {}
+        try:
+            with open(self._key_file(key), 'r', encoding='utf-8') as f:
+                if self._read_header(f) != key:
+                    # En-tête illisible ou collision de hash : on ne renvoie rien de faux
+                    return {}, 0
+                entries = self._parse_entries(key, f.read())
+        except FileNotFoundError:
+            return {}, 0
+        except IOError as e:
+            print(f"⚠️ Index corrompu pour '{key}': {e}")
+            return {}, 0
+        for op, value in entries:
+            if op == ADD:
+                values[value] = None
+            else:
+                values.pop(value, None)
+        return values, len(entries)
+
+    @staticmethod
+    def _parse_entries(key: str, body: str) -> list:
+        """Décode les opérations d'un journal (une seule passe JSON si possible)."""
+        lines = body.splitlines()
+        try:
+            return json.loads("[" + ",".join(lines) + "]")
+        except json.JSONDecodeError:
+            pass
+        entries = []
+        for line in lines:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                # Ligne tronquée (écriture interrompue) : ignorée
+                print(f"⚠️ Entrée d'index illisible pour '{key}'")
+        return entries
+
+    def _append(self, key: str, operations: List[Tuple[str, str]]):
+        """Ajoute des opérations en fin de journal (crée le journal si besoin)."""
+        key_file = self._key_file(key)
+        if not key_file.exists():
+            operations = [(op, value) for op, value in operations if op == ADD]
+            if not operations:
+                return
+            key_file.parent.mkdir(exist_ok=True)
+            header = json.dumps({'key': key}, ensure_ascii=False) + "\n"
+        else:
+            # Une ligne tronquée par une écriture interrompue ne doit pas avaler la suivante
+            header = "" if self._ends_with_newline(key_file) else "\n"
+        lines = "".join(json.dumps([op, value], ensure_ascii=False) + "\n" for op, value in operations)
+        with open(key_file, 'a', encoding='utf-8') as f:
+            f.write(header + lines)
+
+    @staticmethod
+    def _ends_with_newline(key_file: Path) -> bool:
+        with open(key_file, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def _store(self, key: str, values: Iterable[str]):
+        """Réécrit le journal compacté d'une clé (supprimé s'il est vide)."""
+        key_file = self._key_file(key)
+        values = list(values)
+        if not values:
+            try:
+                key_file.unlink()
+            except FileNotFoundError:
+                pass
+            return
+        key_file.parent.mkdir(exist_ok=True)
+        tmp_file = key_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'key': key}, ensure_ascii=False) + "\n")
+            f.writelines(json.dumps([ADD, value], ensure_ascii=False) + "\n" for value in values)
+        os.replace(tmp_file, key_file)
+
+    def get(self, key: str) -> List[str]:
+        """Retourne les valeurs associées à une clé."""
+        with self.lock:
+            values, operations = self._load(key)
+            if operations > 2 * len(values) + self.COMPACTION_SLACK:
+                self._store(key, values)
+            return list(values)
+
+    def keys(self) -> List[str]:
+        """Liste les clés présentes dans l'index (lit l'en-tête de chaque journal)."""
+        keys = []
+        with self.lock:
+            for key_file in sorted(self.index_dir.glob('*/*.jsonl')):
+                try:
+                    with open(key_file, 'r', encoding='utf-8') as f:
+                        key = self._read_header(f)
+                except IOError:
+                    continue
+                if key is not None:
+                    keys.append(key)
+        return keys
+
+    def add(self, key: str, value: str):
+        """Associe une valeur à une clé (sans doublon à la lecture)."""
+        with self.lock:
+            self._append(key, [(ADD, value)])
+
+    def remove(self, key: str, value: str):
+        """Retire une valeur d'une clé."""
+        with self.lock:
+            self._append(key, [(REMOVE, value)])
+
+    def update(self, value: str, old_keys: Iterable[str], new_keys: Iterable[str]):
+        """Déplace une valeur des anciennes clés vers les nouvelles (diff minimal)."""
+        self.update_many([(value, old_keys, new_keys)])
+
+    def update_many(self, changes: Iterable[Tuple[str, Iterable[str], Iterable[str]]]):
+        """
+        Applique plusieurs update() en n'ouvrant chaque journal qu'une fois.
+
+        Args:
+            changes: Triplets (valeur, anciennes clés, nouvelles clés)
+        """
+        operations = {}
+        for value, old_keys, new_keys in changes:
+            old_keys, new_keys = set(old_keys or []), set(new_keys or [])
+            for key in old_keys - new_keys:
+                operations.setdefault(key, []).append((REMOVE, value))
+            for key in new_keys - old_keys:
+                operations.setdefault(key, []).append((ADD, value))
+
+        with self.lock:
+            for key, key_operations in operations.items():
+                self._append(key, key_operations)
+
+    def is_built(self) -> bool:
+        """Indique si l'index a déjà été construit (au format courant) pour ce store."""
+        return (self.index_dir / self.BUILT_MARKER).exists()
+
+    def rebuild(self, postings: Dict[str, List[str]]):
+        """Remplace entièrement l'index par les postings fournis."""
+        with self.lock:
+            self.clear()
+            for key, values in postings.items():
+                self._store(key, dict.fromkeys(values))
+            (self.index_dir / self.BUILT_MARKER).touch()
+
+    def clear(self):
+        """Supprime toutes les entrées de l'index."""
+        with self.lock:
+            if self.index_dir.exists():
+                shutil.rmtree(self.index_dir)
+            self.index_dir.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,470 @@
+"""
+⛧ SQLite Backend for Fractal Memory ⛧
+
+Stocke toute la mémoire fractale dans un seul fichier SQLite : nœuds,
+mots-clés, strates et liens, avec des index dédiés. Évite l'explosion
+d'inodes et les parcours de répertoires du FileSystemBackend, et permet
+des écritures groupées dans une seule transaction.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..core.memory_node import FractalMemoryNode
+from .store_statistics import LINK_TYPES, STRATA, extract_links
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS nodes (
+    path TEXT PRIMARY KEY,
+    id TEXT NOT NULL,
+    parent TEXT,
+    strata TEXT NOT NULL,
+    summary TEXT,
+    data TEXT NOT NULL,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS nodes_id ON nodes(id);
+CREATE INDEX IF NOT EXISTS nodes_parent ON nodes(parent);
+CREATE INDEX IF NOT EXISTS nodes_strata ON nodes(strata, updated_at);
+
+CREATE TABLE IF NOT EXISTS keywords (
+    keyword TEXT NOT NULL,
+    path TEXT NOT NULL REFERENCES nodes(path) ON DELETE CASCADE,
+    PRIMARY KEY (keyword, path)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS keywords_path ON keywords(path);
+
+CREATE TABLE IF NOT EXISTS links (
+    source TEXT NOT NULL REFERENCES nodes(path) ON DELETE CASCADE,
+    target TEXT NOT NULL,
+    link_type TEXT NOT NULL,
+    PRIMARY KEY (source, link_type, target)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS links_target ON links(target, link_type);
+"""
+
+
+class SQLiteBackend:
+    """
+    Backend mono-fichier pour la mémoire fractale (même surface que FileSystemBackend).
+    """
+
+    def __init__(self, db_path: str = None, base_path: str = '.'):
+        """
+        Args:
+            db_path: Fichier SQLite (par défaut <base_path>/.shadeos/memory.sqlite3)
+            base_path: Base utilisée pour le chemin par défaut
+        """
+        self.db_path = Path(db_path) if db_path else Path(base_path) / '.shadeos' / 'memory.sqlite3'
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.lock = threading.RLock()
+        self.connection = sqlite3.connect(str(self.db_path), check_same_thread=False,
+                                          isolation_level=None)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(SCHEMA)
+        self._transaction_depth = 0
+
+    def close(self):
+        """Ferme la connexion SQLite."""
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+    @contextmanager
+    def transaction(self):
+        """Regroupe plusieurs écritures dans une seule transaction (réentrant)."""
+        with self.lock:
+            if self._transaction_depth == 0:
+                self.connection.execute("BEGIN IMMEDIATE")
+            self._transaction_depth += 1
+            try:
+                yield self.connection
+            except BaseException:
+                self._transaction_depth -= 1
+                if self._transaction_depth == 0:
+                    self.connection.execute("ROLLBACK")
+                raise
+            else:
+                self._transaction_depth -= 1
+                if self._transaction_depth == 0:
+                    self.connection.execute("COMMIT")
+
+    @staticmethod
+    def _relative_path(path: str) -> str:
+        """Normalise un chemin de nœud (même forme que le FileSystemBackend)."""
+        return os.path.normpath(path).lstrip('./')
+
+    @staticmethod
+    def _parent_of(relative_path: str) -> Optional[str]:
+        parent = os.path.dirname(relative_path)
+        return parent or None
+
+    # ------------------------------------------------------------------
+    # Lecture
+    # ------------------------------------------------------------------
+
+    def _load_data(self, row) -> Dict[str, Any]:
+        """Données brutes d'un nœud, avec ses enfants calculés depuis la table."""
+        data = json.loads(row["data"])
+        children = self.connection.execute(
+            "SELECT path, summary FROM nodes WHERE parent = ? ORDER BY rowid", (row["path"],)
+        ).fetchall()
+        data['children'] = [{"name": os.path.basename(child["path"]), "summary": child["summary"]}
+                            for child in children]
+        return data
+
+    def _read_raw(self, path: str) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT path, data FROM nodes WHERE path = ?", (self._relative_path(path),)
+            ).fetchone()
+            return self._load_data(row) if row else None
+
+    def read(self, path: str) -> FractalMemoryNode:
+        """Lit un nœud mémoire."""
+        data = self._read_raw(path)
+        if data is None:
+            raise FileNotFoundError(f"Le nœud mémoire à '{path}' n'existe pas.")
+        return FractalMemoryNode.from_dict(data)
+
+    # ------------------------------------------------------------------
+    # Écriture
+    # ------------------------------------------------------------------
+
+    def _put(self, path: str, data: Dict[str, Any]):
+        """Insère/remplace un nœud brut et ses lignes d'index (dans une transaction)."""
+        relative_path = self._relative_path(path)
+        stored = {key: value for key, value in data.items() if key != 'children'}
+        self.connection.execute(
+            """
+            INSERT INTO nodes (path, id, parent, strata, summary, data, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, strftime('%Y-%m-%dT%H:%M:%f', 'now'))
+            ON CONFLICT(path) DO UPDATE SET
+                id = excluded.id, parent = excluded.parent, strata = excluded.strata,
+                summary = excluded.summary, data = excluded.data, updated_at = excluded.updated_at
+            """,
+            (relative_path, stored.get('id'), self._parent_of(relative_path),
+             stored.get('strata', 'somatic'), stored.get('metadata', {}).get('summary'),
+             json.dumps(stored, ensure_ascii=False)))
+
+        self.connection.execute("DELETE FROM keywords WHERE path = ?", (relative_path,))
+        self.connection.executemany(
+            "INSERT OR IGNORE INTO keywords (keyword, path) VALUES (?, ?)",
+            [(keyword, relative_path) for keyword in stored.get('keywords', [])])
+
+        self.connection.execute("DELETE FROM links WHERE source = ?", (relative_path,))
+        self.connection.executemany(
+            "INSERT OR IGNORE INTO links (source, target, link_type) VALUES (?, ?, ?)",
+            [(relative_path, self._relative_path(target), link_type)
+             for link_type, targets in extract_links(stored).items()
+             for target in targets])
+
+    def _summaries(self, paths: List[str]) -> Dict[str, str]:
+        """Résumés des nœuds existants parmi paths (requêtes IN groupées)."""
+        if not paths:
+            return {}
+        by_relative = {self._relative_path(path): path for path in paths}
+        keys = list(by_relative)
+        summaries = {}
+        # Découpage pour rester sous la limite de variables SQLite
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            rows = self.connection.execute(
+                f"SELECT path, summary FROM nodes WHERE path IN ({placeholders})", chunk
+            ).fetchall()
+            summaries.update({by_relative[row["path"]]: row["summary"] for row in rows})
+        return summaries
+
+    @staticmethod
+    def _build_data(path: str, content: str, summary: str, keywords: list, linked_memories: list,
+                    strata: str, transcendence_links: list, immanence_links: list) -> Dict[str, Any]:
+        return FractalMemoryNode(
+            content=content,
+            metadata={
+                'path': path,
+                'summary': summary,
+                'keywords': keywords,
+                'strata': strata,
+                'transcendence_links': transcendence_links or [],
+                'immanence_links': immanence_links or []
+            },
+            strata=strata,
+            keywords=keywords,
+            linked_memories=linked_memories
+        ).to_dict()
+
+    def write(self, path: str, content: str, summary: str, keywords: list, links: list = None,
+              strata: str = "somatic", transcendence_links: list = None, immanence_links: list = None):
+        """Crée ou remplace un nœud mémoire (les enfants sont dérivés de la table)."""
+        self.write_bulk([{
+            'path': path, 'content': content, 'summary': summary, 'keywords': keywords,
+            'links': links, 'strata': strata,
+            'transcendence_links': transcendence_links, 'immanence_links': immanence_links
+        }])
+
+    def write_bulk(self, nodes: list) -> dict:
+        """
+        Écrit un lot de nœuds dans une seule transaction.
+
+        Args:
+            nodes: Liste de dicts avec les arguments de write()
+
+        Returns:
+            Compteurs du lot (même forme que FileSystemBackend.write_bulk)
+        """
+        stats = {"nodes_written": 0, "parents_updated": 0, "links_resolved": 0, "link_reads": 0}
+        summaries = {node['path']: node['summary'] for node in nodes}
+
+        with self.transaction():
+            external = [link for node in nodes for link in node.get('links') or []
+                        if link not in summaries]
+            if external:
+                stats["link_reads"] += 1
+                summaries.update(self._summaries(list(dict.fromkeys(external))))
+
+            for node in nodes:
+                linked_memories = [{"path": link, "summary": summaries[link]}
+                                   for link in node.get('links') or [] if link in summaries]
+                stats["links_resolved"] += len(linked_memories)
+                self._put(node['path'], self._build_data(
+                    node['path'], node['content'], node['summary'], node['keywords'],
+                    linked_memories, node.get('strata', 'somatic'),
+                    node.get('transcendence_links'), node.get('immanence_links')))
+                stats["nodes_written"] += 1
+        return stats
+
+    def import_raw(self, records) -> int:
+        """
+        Importe des nœuds bruts (dicts FractalMemoryNode) tels quels, en une transaction.
+
+        Args:
+            records: Itérable de (chemin, données)
+        """
+        count = 0
+        with self.transaction():
+            for path, data in records:
+                self._put(path, data)
+                count += 1
+        return count
+
+    def update_node(self, path: str, node: FractalMemoryNode):
+        """Réécrit un nœud existant tel quel."""
+        with self.transaction():
+            self._put(path, node.to_dict())
+
+    def store(self, node: FractalMemoryNode) -> str:
+        """Stocke un nœud mémoire (interface pour compatibilité avec les tests)."""
+        import hashlib
+        content_hash = hashlib.md5(node.content.encode()).hexdigest()[:8]
+        self.write(
+            path=f"/memories/{node.strata}/{content_hash}",
+            content=node.content,
+            summary=node.metadata.get('summary', node.content[:100] + '...' if len(node.content) > 100 else node.content),
+            keywords=node.keywords,
+            links=node.metadata.get('links', []),
+            strata=node.strata,
+            transcendence_links=node.metadata.get('transcendence_links', []),
+            immanence_links=node.metadata.get('immanence_links', [])
+        )
+        return content_hash
+
+    def delete(self, path: str) -> bool:
+        """Supprime un nœud (ses mots-clés et liens sortants suivent par cascade)."""
+        with self.transaction():
+            cursor = self.connection.execute(
+                "DELETE FROM nodes WHERE path = ?", (self._relative_path(path),))
+            return cursor.rowcount > 0
+
+    # ------------------------------------------------------------------
+    # Recherche
+    # ------------------------------------------------------------------
+
+    def find_by_keyword(self, keyword: str) -> List[str]:
+        """Trouve les nœuds portant un mot-clé."""
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT path FROM keywords WHERE keyword = ?", (keyword,)).fetchall()
+            return [row["path"] for row in rows]
+
+    def find_by_strata(self, strata: str) -> List[Dict[str, str]]:
+        """Trouve tous les nœuds d'une strate (les plus récents d'abord)."""
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT path, summary FROM nodes WHERE strata = ? ORDER BY updated_at DESC",
+                (strata,)).fetchall()
+            return [{"path": row["path"], "summary": row["summary"]} for row in rows]
+
+    def find_nodes_linking_to(self, target_path: str) -> List[str]:
+        """Nœuds ayant un lien (de tout type) vers target_path."""
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT DISTINCT source FROM links WHERE target = ?",
+                (self._relative_path(target_path),)).fetchall()
+            return [row["source"] for row in rows]
+
+    def search(self, strata: str = None, metadata_filter: dict = None) -> list:
+        """Recherche des nœuds par strate et filtre exact sur les métadonnées."""
+        clauses, params = [], []
+        if strata:
+            clauses.append("strata = ?")
+            params.append(strata)
+        python_filter = {}
+        for key, value in (metadata_filter or {}).items():
+            if isinstance(value, (str, int, float)) and not isinstance(value, bool):
+                clauses.append("json_extract(data, ?) = ?")
+                params.extend([f'$.metadata."{key}"', value])
+            else:
+                python_filter[key] = value
+
+        query = "SELECT path, data FROM nodes"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+
+        results = []
+        with self.lock:
+            for row in self.connection.execute(query, params).fetchall():
+                data = self._load_data(row)
+                metadata = data.get('metadata', {})
+                if all(metadata.get(k) == v for k, v in python_filter.items()):
+                    results.append(data)
+        return results
+
+    def retrieve(self, node_id: str) -> Optional[FractalMemoryNode]:
+        """Récupère un nœud par son ID."""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT path, data FROM nodes WHERE id = ?", (node_id,)).fetchone()
+            return FractalMemoryNode.from_dict(self._load_data(row)) if row else None
+
+    def _traverse_links(self, start_path: str, link_type: str, max_depth: int) -> List[Dict]:
+        """Plus long chemin (sans cycle, max_depth sauts) en suivant un type de lien."""
+        def describe(relative_path):
+            row = self.connection.execute(
+                "SELECT path, summary, strata FROM nodes WHERE path = ?", (relative_path,)).fetchone()
+            return dict(row) if row else None
+
+        with self.lock:
+            start = describe(self._relative_path(start_path))
+            if start is None:
+                return []
+            best = [start]
+            stack = [[start]]
+            while stack:
+                chain = stack.pop()
+                if len(chain) > len(best):
+                    best = chain
+                if len(chain) > max_depth:
+                    continue
+                seen = {entry["path"] for entry in chain}
+                targets = self.connection.execute(
+                    "SELECT target FROM links WHERE source = ? AND link_type = ?",
+                    (chain[-1]["path"], link_type)).fetchall()
+                for row in targets:
+                    if row["target"] not in seen:
+                        target = describe(row["target"])
+                        if target is not None:
+                            stack.append(chain + [target])
+            return best if len(best) > 1 else []
+
+    def traverse_transcendence_path(self, start_path: str, max_depth: int = 5) -> List[Dict]:
+        """Suit les liens de transcendance vers l'abstraction depuis un nœud."""
+        return self._traverse_links(start_path, "transcendence_links", max_depth)
+
+    def traverse_immanence_path(self, start_path: str, max_depth: int = 5) -> List[Dict]:
+        """Suit les liens d'immanence vers la concrétisation depuis un nœud."""
+        return self._traverse_links(start_path, "immanence_links", max_depth)
+
+    def get_memory_statistics(self, verify: bool = False) -> Dict[str, Any]:
+        """
+        Statistiques du store, calculées par agrégats indexés.
+
+        Args:
+            verify: Accepté pour compatibilité ; les agrégats SQL sont toujours exacts
+        """
+        with self.lock:
+            nodes_by_strata = {strata: 0 for strata in STRATA}
+            total_nodes, total_bytes = 0, 0
+            for row in self.connection.execute(
+                    "SELECT strata, count(*) AS n, coalesce(sum(length(data)), 0) AS size "
+                    "FROM nodes GROUP BY strata"):
+                nodes_by_strata[row["strata"]] = row["n"]
+                total_nodes += row["n"]
+                total_bytes += row["size"]
+
+            links_by_type = {link_type: 0 for link_type in LINK_TYPES}
+            for row in self.connection.execute(
+                    "SELECT link_type, count(*) AS n FROM links GROUP BY link_type"):
+                links_by_type[row["link_type"]] = row["n"]
+
+        return {
+            "total_nodes": total_nodes,
+            "total_bytes": total_bytes,
+            "nodes_by_strata": nodes_by_strata,
+            "links_by_type": links_by_type,
+            "total_links": sum(links_by_type.values()),
+        }
+
+
+def migrate_filesystem_store(base_path: str = '.', db_path: str = None, batch_size: int = 1000) -> Dict[str, Any]:
+    """
+    Copie un store FileSystemBackend (.shadeos/memory) dans un fichier SQLite.
+
+    Les nœuds sont importés tels quels (id, horodatage, liens résolus) par
+    transactions de batch_size nœuds. Le store d'origine n'est pas modifié.
+
+    Returns:
+        Nombre de nœuds migrés, fichiers illisibles ignorés et chemin de la base
+    """
+    memory_root = Path(base_path) / '.shadeos' / 'memory'
+    backend = SQLiteBackend(db_path=db_path, base_path=base_path)
+    migrated, skipped = 0, 0
+
+    def flush(batch):
+        return backend.import_raw(batch) if batch else 0
+
+    try:
+        batch = []
+        for root, _, files in os.walk(memory_root):
+            if '.fractal_memory' not in files:
+                continue
+            try:
+                with open(os.path.join(root, '.fractal_memory'), 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"⚠️ Nœud ignoré ({root}): {e}")
+                skipped += 1
+                continue
+            batch.append((os.path.relpath(root, memory_root), data))
+            if len(batch) >= batch_size:
+                migrated += flush(batch)
+                batch = []
+        migrated += flush(batch)
+    finally:
+        backend.close()
+
+    return {"migrated": migrated, "skipped": skipped, "db_path": str(backend.db_path)}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Migre un store .shadeos/memory vers SQLite")
+    parser.add_argument("base_path", nargs="?", default=".", help="Dossier contenant .shadeos/memory")
+    parser.add_argument("--db", dest="db_path", help="Fichier SQLite cible")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    result = migrate_filesystem_store(args.base_path, args.db_path, args.batch_size)
+    print(f"✅ {result['migrated']} nœuds migrés vers {result['db_path']} ({result['skipped']} ignorés)")
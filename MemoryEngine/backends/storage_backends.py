@@ -1,21 +1,140 @@
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from ..core.memory_node import FractalMemoryNode
+from .disk_index import DiskInvertedIndex
+from .store_statistics import LINK_TYPES, StoreStatistics, extract_links
 
 class FileSystemBackend:
     """Gère le stockage de la mémoire fractale sur le système de fichiers."""
 
+    # Champs de métadonnées absents de l'index champ=valeur : 'strata' double
+    # l'index des strates, 'path' désigne directement le fichier du nœud et
+    # 'summary' est propre à chaque nœud (une clé par nœud, jamais partagée).
+    UNINDEXED_METADATA = frozenset({'path', 'summary', 'strata'})
+
     def __init__(self, base_path: str = '.'):
         self.base_path = Path(base_path)
         self.memory_root = self.base_path / '.shadeos' / 'memory'
         self.memory_root.mkdir(parents=True, exist_ok=True)
 
+        # Index persistants, stockés à côté de la racine mémoire
+        self.index_root = self.base_path / '.shadeos' / 'memory_index'
+        self.keyword_index = DiskInvertedIndex(self.index_root / 'keywords')
+        # Liens entrants : cible → sources, un index par type de lien
+        self.backlink_indexes = {
+            link_type: DiskInvertedIndex(self.index_root / 'backlinks' / link_type)
+            for link_type in LINK_TYPES
+        }
+        # Index secondaires : id → chemin, strate → chemins, champ=valeur → chemins
+        self.id_index = DiskInvertedIndex(self.index_root / 'ids')
+        self.strata_index = DiskInvertedIndex(self.index_root / 'strata')
+        self.metadata_index = DiskInvertedIndex(self.index_root / 'metadata')
+        self.indexes = {
+            "keywords": self.keyword_index,
+            "ids": self.id_index,
+            "strata": self.strata_index,
+            "metadata": self.metadata_index,
+            **self.backlink_indexes
+        }
+        self.statistics = StoreStatistics(self.index_root / 'stats.json')
+        if not all(index.is_built() for index in self.indexes.values()) or not self.statistics.loaded:
+            self.rebuild_indexes()
+
+    def _relative_path(self, path: str) -> str:
+        """Normalise un chemin de nœud relativement à la racine mémoire."""
+        # Sécurise le chemin pour éviter les traversées de répertoire
+        return os.path.normpath(path).lstrip('./')
+
     def _get_node_path(self, path: str) -> str:
         """Construit le chemin absolu vers un fichier .fractal_memory."""
-        # Sécurise le chemin pour éviter les traversées de répertoire
-        safe_path = os.path.normpath(path).lstrip('./')
-        return os.path.join(self.memory_root, safe_path, '.fractal_memory')
+        return os.path.join(self.memory_root, self._relative_path(path), '.fractal_memory')
+
+    def _read_raw(self, path: str) -> dict:
+        """Lit le JSON brut d'un nœud, ou None s'il n'existe pas."""
+        try:
+            with open(self._get_node_path(path), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _iter_node_files(self):
+        """Parcourt le store et produit les chemins des fichiers .fractal_memory."""
+        for root, _, files in os.walk(self.memory_root):
+            if '.fractal_memory' in files:
+                yield os.path.join(root, '.fractal_memory')
+
+    def _load_node_file(self, node_file: str):
+        """Charge un fichier nœud : (chemin relatif, données JSON, taille) ou None."""
+        try:
+            with open(node_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            size = os.path.getsize(node_file)
+        except (json.JSONDecodeError, IOError):
+            return None
+        return os.path.relpath(os.path.dirname(node_file), self.memory_root), data, size
+
+    def _iter_nodes(self):
+        """Parcourt tout le store et produit (chemin relatif, données JSON, taille)."""
+        for node_file in self._iter_node_files():
+            loaded = self._load_node_file(node_file)
+            if loaded is not None:
+                yield loaded
+
+    def _index_keys(self, data: dict) -> dict:
+        """Clés sous lesquelles un nœud brut apparaît dans chaque index."""
+        if not data:
+            return {}
+        keys = {
+            "keywords": data.get('keywords', []),
+            "ids": [data['id']] if data.get('id') else [],
+            "strata": [data.get('strata', 'somatic')],
+            "metadata": [self._metadata_key(field, value)
+                         for field, value in (data.get('metadata') or {}).items()
+                         if field not in self.UNINDEXED_METADATA and self._is_indexable(value)],
+        }
+        for link_type, targets in extract_links(data).items():
+            keys[link_type] = [self._relative_path(target) for target in targets]
+        return keys
+
+    @staticmethod
+    def _is_indexable(value) -> bool:
+        """Seules les valeurs scalaires des métadonnées sont indexées."""
+        return value is None or isinstance(value, (str, int, float, bool))
+
+    @staticmethod
+    def _metadata_key(field: str, value) -> str:
+        return f"{field}={json.dumps(value, ensure_ascii=False)}"
+
+    def _update_indexes(self, changes):
+        """
+        Met à jour tous les index persistants.
+
+        Args:
+            changes: Itérable de (chemin relatif, données précédentes, nouvelles données),
+                     None représentant un nœud absent
+        """
+        per_index = {name: [] for name in self.indexes}
+        for relative_path, previous, new in changes:
+            old_keys, new_keys = self._index_keys(previous), self._index_keys(new)
+            for name, index_changes in per_index.items():
+                index_changes.append((relative_path, old_keys.get(name, []), new_keys.get(name, [])))
+        for name, index_changes in per_index.items():
+            self.indexes[name].update_many(index_changes)
+
+    def rebuild_indexes(self):
+        """Reconstruit les index persistants à partir d'un scan complet du store."""
+        postings = {name: {} for name in self.indexes}
+        counters = StoreStatistics.empty_counters()
+        for relative_path, data, size in self._iter_nodes():
+            for name, keys in self._index_keys(data).items():
+                for key in keys:
+                    postings[name].setdefault(key, []).append(relative_path)
+            StoreStatistics.merge(counters, StoreStatistics.node_counters(data, size))
+        for name, index in self.indexes.items():
+            index.rebuild(postings[name])
+        self.statistics.replace(counters)
 
     def read(self, path: str) -> FractalMemoryNode:
         """Lit un nœud mémoire depuis le système de fichiers."""
@@ -26,12 +145,47 @@ class FileSystemBackend:
         with open(node_file_path, 'r', encoding='utf-8') as f:
             return FractalMemoryNode.from_json(f.read())
 
+    def _build_node(self, path: str, content: str, summary: str, keywords: list,
+                    linked_memories: list, strata: str, transcendence_links: list,
+                    immanence_links: list, previous: dict = None) -> FractalMemoryNode:
+        """Construit le nœud à écrire en conservant les enfants déjà connus."""
+        return FractalMemoryNode(
+            content=content,
+            metadata={
+                'path': path,  # Ajout du chemin dans les métadonnées
+                'summary': summary,
+                'keywords': keywords,
+                'strata': strata,
+                'transcendence_links': transcendence_links or [],
+                'immanence_links': immanence_links or []
+            },
+            strata=strata,
+            keywords=keywords,
+            children=list(previous.get('children', [])) if previous else [],
+            linked_memories=linked_memories
+        )
+
+    def _write_node_file(self, path: str, node: FractalMemoryNode) -> tuple:
+        """Écrit le fichier d'un nœud ; retourne (ancienne taille, nouvelle taille)."""
+        node_path = self._get_node_path(path)
+        os.makedirs(os.path.dirname(node_path), exist_ok=True)
+        old_size = os.path.getsize(node_path) if os.path.exists(node_path) else 0
+        with open(node_path, 'w', encoding='utf-8') as f:
+            f.write(node.to_json())
+        return old_size, os.path.getsize(node_path)
+
+    def _record_replacement(self, previous: dict, new_node: FractalMemoryNode, sizes: tuple):
+        """Met à jour les compteurs après l'écriture d'un nœud (création ou remplacement)."""
+        old_size, new_size = sizes
+        if previous:
+            self.statistics.record_node(previous, old_size, -1)
+        self.statistics.record_node(new_node.to_dict(), new_size, +1)
+
     def write(self, path: str, content: str, summary: str, keywords: list, links: list, 
               strata: str = "somatic", transcendence_links: list = None, immanence_links: list = None):
         """Écrit un nœud mémoire et met à jour son parent."""
-        # 1. Crée le nœud cible
-        node_path = self._get_node_path(path)
-        os.makedirs(os.path.dirname(node_path), exist_ok=True)
+        # 1. Lit l'éventuelle version précédente (diff des index, enfants)
+        previous = self._read_raw(path)
 
         # 2. Gère les liens interdimensionnels
         linked_memories = []
@@ -45,23 +199,10 @@ class FileSystemBackend:
                     pass
         
         # 3. Crée le nœud avec la nouvelle interface
-        new_node = FractalMemoryNode(
-            content=content,
-            metadata={
-                'path': path,  # Ajout du chemin dans les métadonnées
-                'summary': summary,
-                'keywords': keywords,
-                'strata': strata,
-                'transcendence_links': transcendence_links or [],
-                'immanence_links': immanence_links or []
-            },
-            strata=strata,
-            keywords=keywords,
-            linked_memories=linked_memories
-        )
-
-        with open(node_path, 'w', encoding='utf-8') as f:
-            f.write(new_node.to_json())
+        new_node = self._build_node(path, content, summary, keywords, linked_memories,
+                                    strata, transcendence_links, immanence_links, previous)
+        self._record_replacement(previous, new_node, self._write_node_file(path, new_node))
+        self._update_indexes([(self._relative_path(path), previous, new_node.to_dict())])
 
         # 4. Met à jour le nœud parent
         parent_path, child_name = os.path.split(path.strip('/'))
@@ -69,12 +210,100 @@ class FileSystemBackend:
             try:
                 parent_node = self.read(parent_path)
                 parent_node.add_child(child_name, summary)
-                with open(self._get_node_path(parent_path), 'w', encoding='utf-8') as f:
-                    f.write(parent_node.to_json())
+                old_size, new_size = self._write_node_file(parent_path, parent_node)
+                self.statistics.adjust_bytes(new_size - old_size)
             except FileNotFoundError:
                 # Le parent n'existe pas, on ne peut pas le mettre à jour. C'est normal pour un nœud racine.
                 pass
 
+        self.statistics.save()
+
+    def write_bulk(self, nodes: list) -> dict:
+        """
+        Écrit un lot de nœuds en minimisant les entrées/sorties.
+
+        Les enfants sont regroupés par parent (chaque parent est écrit une seule
+        fois), les résumés des liens internes au lot sont résolus en mémoire et
+        chaque clé des index persistants n'est réécrite qu'une seule fois.
+
+        Args:
+            nodes: Liste de dicts avec les arguments de write()
+
+        Returns:
+            Compteurs d'entrées/sorties du lot
+        """
+        stats = {"nodes_written": 0, "parents_updated": 0, "links_resolved": 0, "link_reads": 0}
+
+        # 1. Résumés disponibles sans lecture disque
+        summaries = {node['path']: node['summary'] for node in nodes}
+        external_summaries = {}
+
+        def resolve_summary(link_path):
+            if link_path in summaries:
+                return summaries[link_path]
+            if link_path not in external_summaries:
+                stats["link_reads"] += 1
+                raw = self._read_raw(link_path)
+                external_summaries[link_path] = FractalMemoryNode.from_dict(raw).summary if raw else None
+            return external_summaries[link_path]
+
+        # 2. Construction en mémoire (la dernière occurrence d'un chemin l'emporte)
+        built = {}
+        previous_by_path = {}
+        index_changes = {}
+        for node in nodes:
+            path = node['path']
+            relative_path = self._relative_path(path)
+            previous = self._read_raw(path)
+            previous_by_path.setdefault(path, previous)
+            linked_memories = []
+            for link_path in node.get('links') or []:
+                link_summary = resolve_summary(link_path)
+                if link_summary is not None:
+                    linked_memories.append({"path": link_path, "summary": link_summary})
+                    stats["links_resolved"] += 1
+            built[path] = self._build_node(
+                path, node['content'], node['summary'], node['keywords'], linked_memories,
+                node.get('strata', 'somatic'), node.get('transcendence_links'),
+                node.get('immanence_links'), previous)
+            index_changes[relative_path] = (previous_by_path[path], built[path].to_dict())
+
+        # 3. Regroupement des enfants par parent
+        children_by_parent = {}
+        for path, node in built.items():
+            parent_path, child_name = os.path.split(path.strip('/'))
+            if parent_path:
+                children_by_parent.setdefault(parent_path, []).append((child_name, node.summary))
+
+        # Les parents présents dans le lot reçoivent leurs enfants avant écriture
+        batch_parents = {path.strip('/'): node for path, node in built.items()}
+        for parent_path in list(children_by_parent):
+            if parent_path in batch_parents:
+                for child_name, child_summary in children_by_parent.pop(parent_path):
+                    batch_parents[parent_path].add_child(child_name, child_summary)
+
+        # 4. Écriture de chaque nœud une seule fois
+        for path, node in built.items():
+            self._record_replacement(previous_by_path[path], node, self._write_node_file(path, node))
+            stats["nodes_written"] += 1
+
+        # 5. Parents hors lot : une lecture et une écriture chacun
+        for parent_path, children in children_by_parent.items():
+            try:
+                parent_node = self.read(parent_path)
+            except FileNotFoundError:
+                continue
+            for child_name, child_summary in children:
+                parent_node.add_child(child_name, child_summary)
+            old_size, new_size = self._write_node_file(parent_path, parent_node)
+            self.statistics.adjust_bytes(new_size - old_size)
+            stats["parents_updated"] += 1
+
+        self._update_indexes(
+            (relative_path, previous, new) for relative_path, (previous, new) in index_changes.items())
+        self.statistics.save()
+        return stats
+
     def store(self, node: FractalMemoryNode) -> str:
         """Stocke un nœud mémoire (interface pour compatibilité avec les tests)."""
         # Génère un chemin unique basé sur le contenu
@@ -97,73 +326,182 @@ class FileSystemBackend:
         return content_hash
 
     def find_by_keyword(self, keyword: str) -> list:
-        """Trouve des nœuds mémoire par mot-clé."""
-        matches = []
-        for root, _, files in os.walk(self.memory_root):
-            if '.fractal_memory' in files:
-                try:
-                    node_path = os.path.join(root, '.fractal_memory')
-                    with open(node_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    if keyword in data.get('keywords', []):
-                        relative_path = os.path.relpath(root, self.memory_root)
-                        matches.append(relative_path)
-                except (json.JSONDecodeError, KeyError):
+        """Trouve des nœuds mémoire par mot-clé (via l'index inversé)."""
+        return self.keyword_index.get(keyword)
+
+    def delete(self, path: str) -> bool:
+        """Supprime un nœud mémoire et le retire des index."""
+        node_path = self._get_node_path(path)
+        if not os.path.exists(node_path):
+            return False
+        previous = self._read_raw(path)
+        size = os.path.getsize(node_path)
+
+        os.remove(node_path)
+        try:
+            # Supprime le dossier s'il ne contient plus d'enfants
+            os.rmdir(os.path.dirname(node_path))
+        except OSError:
+            pass
+
+        self._update_indexes([(self._relative_path(path), previous, None)])
+        if previous:
+            self.statistics.record_node(previous, size, -1)
+            self.statistics.save()
+
+        # Retire l'enfant de la liste du parent (inverse de la mise à jour de write)
+        parent_path, child_name = os.path.split(path.strip('/'))
+        if parent_path:
+            try:
+                parent_node = self.read(parent_path)
+            except FileNotFoundError:
+                return True
+            if parent_node.remove_child(child_name):
+                self.update_node(parent_path, parent_node)
+        return True
+
+    def update_node(self, path: str, node: FractalMemoryNode):
+        """Réécrit un nœud existant tel quel (ex. après nettoyage de ses liens)."""
+        previous = self._read_raw(path)
+        self._record_replacement(previous, node, self._write_node_file(path, node))
+        self._update_indexes([(self._relative_path(path), previous, node.to_dict())])
+        self.statistics.save()
+
+    def find_nodes_linking_to(self, target_path: str) -> list:
+        """Retourne les nœuds ayant un lien (de tout type) vers target_path, en O(degré entrant)."""
+        target = self._relative_path(target_path)
+        sources = []
+        for index in self.backlink_indexes.values():
+            for source in index.get(target):
+                if source not in sources:
+                    sources.append(source)
+        return sources
+
+    def _traverse_links(self, start_path: str, link_type: str, max_depth: int) -> list:
+        """
+        Plus long chemin (sans cycle, max_depth sauts) en suivant un type de lien.
+
+        Les chemins retournés sont normalisés (forme relative, comme les index
+        et le SQLiteBackend), quelle que soit la forme des liens stockés.
+        """
+        def describe(relative_path, data):
+            return {"path": relative_path, "summary": data.get('metadata', {}).get('summary', ''),
+                    "strata": data.get('strata', 'somatic')}
+
+        start_key = self._relative_path(start_path)
+        start = self._read_raw(start_key)
+        if start is None:
+            return []
+
+        best = [describe(start_key, start)]
+        stack = [(start, best, {start_key})]
+        while stack:
+            data, chain, seen = stack.pop()
+            if len(chain) > len(best):
+                best = chain
+            if len(chain) > max_depth:
+                continue
+            for target in extract_links(data)[link_type]:
+                key = self._relative_path(target)
+                if key in seen:
                     continue
-        return matches 
+                target_data = self._read_raw(key)
+                if target_data is not None:
+                    stack.append((target_data, chain + [describe(key, target_data)], seen | {key}))
+        return best if len(best) > 1 else []
+
+    def traverse_transcendence_path(self, start_path: str, max_depth: int = 5) -> list:
+        """Suit les liens de transcendance vers l'abstraction depuis un nœud."""
+        return self._traverse_links(start_path, "transcendence_links", max_depth)
+
+    def traverse_immanence_path(self, start_path: str, max_depth: int = 5) -> list:
+        """Suit les liens d'immanence vers la concrétisation depuis un nœud."""
+        return self._traverse_links(start_path, "immanence_links", max_depth)
+
+    def get_memory_statistics(self, verify: bool = False, workers: int = 8) -> dict:
+        """
+        Statistiques du store issues des compteurs maintenus à l'écriture.
+
+        Args:
+            verify: Si True, rescanne le store en parallèle et corrige les compteurs
+            workers: Nombre de threads de lecture pour la vérification
+
+        Returns:
+            Compteurs (nœuds par strate, octets, liens par type)
+        """
+        if not verify:
+            return self.statistics.snapshot()
+
+        counters = StoreStatistics.empty_counters()
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            for loaded in executor.map(self._load_node_file, self._iter_node_files()):
+                if loaded is not None:
+                    _, data, size = loaded
+                    StoreStatistics.merge(counters, StoreStatistics.node_counters(data, size))
+
+        maintained = self.statistics.snapshot()
+        maintained.pop("total_links")
+        reconciled = maintained != counters
+        if reconciled:
+            print("⚠️ Statistiques du store désynchronisées, compteurs corrigés")
+            self.statistics.replace(counters)
+
+        snapshot = self.statistics.snapshot()
+        snapshot["reconciled"] = reconciled
+        return snapshot
 
     def close(self):
         """Ferme la connexion au backend (pas d'action nécessaire pour FileSystem)."""
         pass
 
     def search(self, strata: str = None, metadata_filter: dict = None) -> list:
-        """Recherche des nœuds de mémoire."""
+        """
+        Recherche des nœuds de mémoire.
+
+        Les candidats sont l'intersection des index de strate et de métadonnées
+        (``path`` désigne directement son nœud) ; seuls leurs fichiers sont lus
+        pour appliquer le filtre complet.
+        """
+        metadata_filter = metadata_filter or {}
+        candidates = None
+
+        def narrow(paths):
+            nonlocal candidates
+            paths = set(paths)
+            candidates = paths if candidates is None else candidates & paths
+
+        if strata:
+            narrow(self.strata_index.get(strata))
+        for field, value in metadata_filter.items():
+            if field == 'path' and isinstance(value, str):
+                narrow([self._relative_path(value)])
+            elif field == 'strata' and isinstance(value, str):
+                # _build_node écrit la même strate dans le nœud et ses métadonnées
+                narrow(self.strata_index.get(value))
+            elif field not in self.UNINDEXED_METADATA and self._is_indexable(value):
+                narrow(self.metadata_index.get(self._metadata_key(field, value)))
+            if candidates is not None and not candidates:
+                return []
+        if candidates is None:
+            # Aucun critère indexable : tous les nœuds, via toutes les strates connues
+            candidates = set()
+            for known_strata in self.strata_index.keys():
+                candidates.update(self.strata_index.get(known_strata))
+
         results = []
-        try:
-            for strata_dir in self.memory_root.iterdir():
-                if not strata_dir.is_dir():
-                    continue
-                if strata and strata_dir.name != strata:
-                    continue
-                    
-                for node_file in strata_dir.rglob("*.json"):
-                    try:
-                        with open(node_file, 'r', encoding='utf-8') as f:
-                            node_data = json.load(f)
-                            
-                        # Filtrer par métadonnées si spécifié
-                        if metadata_filter:
-                            node_metadata = node_data.get('metadata', {})
-                            if not all(node_metadata.get(k) == v for k, v in metadata_filter.items()):
-                                continue
-                                
-                        results.append(node_data)
-                    except Exception as e:
-                        print(f"Erreur lecture {node_file}: {e}")
-                        
-        except Exception as e:
-            print(f"Erreur recherche: {e}")
-            
+        for relative_path in sorted(candidates):
+            node_data = self._read_raw(relative_path)
+            if node_data is None:
+                continue
+            node_metadata = node_data.get('metadata', {})
+            if all(node_metadata.get(k) == v for k, v in metadata_filter.items()):
+                results.append(node_data)
         return results
     
     def retrieve(self, node_id: str) -> FractalMemoryNode:
-        """Récupère un nœud de mémoire par son ID."""
-        try:
-            for strata_dir in self.memory_root.iterdir():
-                if not strata_dir.is_dir():
-                    continue
-                    
-                for node_file in strata_dir.rglob("*.json"):
-                    try:
-                        with open(node_file, 'r', encoding='utf-8') as f:
-                            node_data = json.load(f)
-                            
-                        if node_data.get('id') == node_id:
-                            return FractalMemoryNode.from_dict(node_data)
-                    except Exception as e:
-                        print(f"Erreur lecture {node_file}: {e}")
-                        
-        except Exception as e:
-            print(f"Erreur récupération: {e}")
-            
-        return None 
\ No newline at end of file
+        """Récupère un nœud de mémoire par son ID (via l'index des ids)."""
+        for relative_path in self.id_index.get(node_id):
+            node_data = self._read_raw(relative_path)
+            if node_data is not None and node_data.get('id') == node_id:
+                return FractalMemoryNode.from_dict(node_data)
+        return None
@@ -0,0 +1,119 @@
+"""
+Compteurs persistants du store fractal (nœuds par strate, octets, liens).
+
+Ils sont tenus à jour à chaque écriture/suppression par le FileSystemBackend
+et sauvegardés avec ses index, afin que les statistiques soient disponibles
+au démarrage sans scanner le store.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List
+
+STRATA = ("somatic", "cognitive", "metaphysical")
+LINK_TYPES = ("linked_memories", "transcendence_links", "immanence_links")
+
+
+def extract_links(data: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Retourne les chemins cibles d'un nœud brut, par type de lien."""
+    metadata = data.get('metadata', {}) or {}
+    raw_links = {
+        "linked_memories": data.get('linked_memories', []),
+        # Les liens verticaux écrits par write() sont conservés dans les métadonnées
+        "transcendence_links": data.get('transcendence_links') or metadata.get('transcendence_links', []),
+        "immanence_links": data.get('immanence_links') or metadata.get('immanence_links', []),
+    }
+    links = {}
+    for link_type, entries in raw_links.items():
+        links[link_type] = [
+            entry.get('path') if isinstance(entry, dict) else entry
+            for entry in entries or []
+            if (entry.get('path') if isinstance(entry, dict) else entry)
+        ]
+    return links
+
+
+class StoreStatistics:
+    """Compteurs agrégés du store, persistés dans un petit fichier JSON."""
+
+    def __init__(self, stats_file):
+        self.stats_file = Path(stats_file)
+        self.lock = threading.Lock()
+        self.counters = self.empty_counters()
+        self.loaded = self._load()
+
+    @staticmethod
+    def empty_counters() -> Dict[str, Any]:
+        return {
+            "total_nodes": 0,
+            "total_bytes": 0,
+            "nodes_by_strata": {strata: 0 for strata in STRATA},
+            "links_by_type": {link_type: 0 for link_type in LINK_TYPES},
+        }
+
+    @staticmethod
+    def node_counters(data: Dict[str, Any], size: int) -> Dict[str, Any]:
+        """Contribution d'un seul nœud aux compteurs."""
+        counters = StoreStatistics.empty_counters()
+        counters["total_nodes"] = 1
+        counters["total_bytes"] = size
+        strata = data.get('strata', 'somatic')
+        counters["nodes_by_strata"][strata] = 1
+        for link_type, targets in extract_links(data).items():
+            counters["links_by_type"][link_type] = len(targets)
+        return counters
+
+    @staticmethod
+    def merge(target: Dict[str, Any], delta: Dict[str, Any], sign: int = 1):
+        """Ajoute (ou retranche) des compteurs à d'autres."""
+        target["total_nodes"] += sign * delta["total_nodes"]
+        target["total_bytes"] += sign * delta["total_bytes"]
+        for group in ("nodes_by_strata", "links_by_type"):
+            for key, value in delta[group].items():
+                target[group][key] = target[group].get(key, 0) + sign * value
+
+    def _load(self) -> bool:
+        try:
+            with open(self.stats_file, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"⚠️ Statistiques du store illisibles: {e}")
+            return False
+        self.merge(self.counters, stored)
+        return True
+
+    def save(self):
+        """Écrit les compteurs de façon atomique."""
+        with self.lock:
+            self.stats_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.stats_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.counters, f)
+            os.replace(tmp_file, self.stats_file)
+
+    def record_node(self, data: Dict[str, Any], size: int, sign: int = 1):
+        """Compte (sign=1) ou décompte (sign=-1) un nœud."""
+        with self.lock:
+            self.merge(self.counters, self.node_counters(data, size), sign)
+
+    def adjust_bytes(self, delta: int):
+        """Corrige la taille totale (réécriture d'un nœud existant)."""
+        with self.lock:
+            self.counters["total_bytes"] += delta
+
+    def replace(self, counters: Dict[str, Any]):
+        """Remplace les compteurs (reconstruction ou réconciliation)."""
+        with self.lock:
+            self.counters = counters
+        self.save()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Copie des compteurs courants, avec les totaux dérivés."""
+        with self.lock:
+            snapshot = json.loads(json.dumps(self.counters))
+        snapshot["total_links"] = sum(snapshot["links_by_type"].values())
+        return snapshot
@@ -1,7 +1,9 @@
 import os
 from ..backends.storage_backends import FileSystemBackend
+from ..backends.sqlite_backend import SQLiteBackend
 from .memory_node import FractalMemoryNode
 from .temporal_index import TemporalIndex
+from .node_cache import NodeCache
 
 # Import Neo4j backend if available
 try:
@@ -15,14 +17,18 @@ class MemoryEngine:
     Point d'entrée principal et API publique du moteur de mémoire fractale.
     Supporte les backends FileSystem et Neo4j avec Strates et Respiration.
     """
-    def __init__(self, backend_type: str = "auto", base_path: str = '.', backend=None, **backend_kwargs):
+    def __init__(self, backend_type: str = "auto", base_path: str = '.', backend=None,
+                 cache_max_entries: int = 1024, cache_max_bytes: int = 64 * 1024 * 1024,
+                 **backend_kwargs):
         """
         Initialize the Memory Engine with the specified backend.
 
         Args:
-            backend_type: "filesystem", "neo4j", or "auto" (tries Neo4j first, falls back to filesystem)
-            base_path: Base path for filesystem backend
+            backend_type: "filesystem", "sqlite", "neo4j", or "auto" (tries Neo4j first, falls back to filesystem)
+            base_path: Base path for filesystem and sqlite backends
             backend: Custom backend instance (overrides backend_type)
+            cache_max_entries: Max nodes kept in the read cache (0 disables it)
+            cache_max_bytes: Max serialized size of the read cache in bytes
             **backend_kwargs: Additional arguments for backend initialization
         """
         if backend:
@@ -33,6 +39,8 @@ class MemoryEngine:
             self.backend = Neo4jBackend(**backend_kwargs)
         elif backend_type == "filesystem":
             self.backend = FileSystemBackend(base_path=base_path)
+        elif backend_type == "sqlite":
+            self.backend = SQLiteBackend(base_path=base_path, **backend_kwargs)
         elif backend_type == "auto":
             # Try Neo4j first, fall back to filesystem
             if NEO4J_AVAILABLE:
@@ -53,6 +61,9 @@ class MemoryEngine:
         # Initialisation de l'index temporel
         from .temporal_index import TemporalIndex
         self.temporal_index = TemporalIndex(backend_type, base_path)
+        
+        # Cache LRU des nœuds lus (invalidé à chaque écriture/suppression)
+        self.node_cache = NodeCache(cache_max_entries, cache_max_bytes)
 
     def create_memory(self, path: str, content: str, summary: str, keywords: list,
                      links: list = None, strata: str = "somatic",
@@ -78,6 +89,7 @@ class MemoryEngine:
         else:
             # Old FileSystem backend
             self.backend.write(path, content, summary, keywords, links or [])
+        self._invalidate_cached(path)
         
         # Indexation temporelle automatique
         metadata = {
@@ -91,9 +103,88 @@ class MemoryEngine:
         
         return True
 
+    def create_memories_bulk(self, nodes, batch_size: int = 1000) -> dict:
+        """
+        Crée un grand nombre de souvenirs par lots.
+
+        Les parents ne sont réécrits qu'une fois par lot, les liens internes au
+        lot sont résolus en mémoire et l'index temporel est mis à jour une seule
+        fois par lot.
+
+        Args:
+            nodes: Itérable de dicts avec les arguments de create_memory()
+                   (path, content, summary, keywords, links, strata, ...)
+            batch_size: Nombre de nœuds traités par lot
+
+        Returns:
+            Statistiques d'ingestion (nœuds, parents, liens, débit)
+        """
+        import time
+
+        stats = {
+            "nodes_written": 0,
+            "parents_updated": 0,
+            "links_resolved": 0,
+            "link_reads": 0,
+            "batches": 0,
+        }
+        start = time.perf_counter()
+
+        batch = []
+        for node in nodes:
+            batch.append(node)
+            if len(batch) >= batch_size:
+                self._create_memory_batch(batch, stats)
+                batch = []
+        if batch:
+            self._create_memory_batch(batch, stats)
+
+        elapsed = time.perf_counter() - start
+        stats["elapsed_seconds"] = elapsed
+        stats["nodes_per_second"] = stats["nodes_written"] / elapsed if elapsed > 0 else 0.0
+        return stats
+
+    def _create_memory_batch(self, batch: list, stats: dict):
+        """Écrit un lot de nœuds puis l'enregistre dans l'index temporel."""
+        if hasattr(self.backend, 'write_bulk'):
+            batch_stats = self.backend.write_bulk(batch)
+            for key, value in batch_stats.items():
+                stats[key] = stats.get(key, 0) + value
+        else:
+            # Backends sans écriture groupée : nœud par nœud
+            for node in batch:
+                self.backend.write(node['path'], node['content'], node['summary'], node['keywords'],
+                                   node.get('links') or [], node.get('strata', 'somatic'),
+                                   node.get('transcendence_links') or [], node.get('immanence_links') or [])
+                stats["nodes_written"] += 1
+        for node in batch:
+            self._invalidate_cached(node['path'])
+
+        self.temporal_index.auto_record_many([
+            (node['path'], {
+                "path": node['path'],
+                "strata": node.get('strata', 'somatic'),
+                "keywords": node['keywords'],
+                "summary": node['summary'],
+                "content": node['content']
+            })
+            for node in batch
+        ])
+        stats["batches"] += 1
+
+    def _invalidate_cached(self, path: str):
+        """Invalide un nœud et son parent (dont la liste d'enfants change)."""
+        self.node_cache.invalidate(path)
+        parent_path = os.path.dirname(path.strip('/'))
+        if parent_path:
+            self.node_cache.invalidate(parent_path)
+
     def get_memory_node(self, path: str):
         """Récupère le contenu complet d'un nœud mémoire avec injection des liens temporels."""
-        node = self.backend.read(path)
+        node = self.node_cache.get(path)
+        if node is None:
+            node = self.backend.read(path)
+            self.node_cache.put(path, node)
         if node:
             # Injection des liens temporels virtuels
             self.temporal_index.inject_temporal_links(node)
@@ -124,6 +215,7 @@ class MemoryEngine:
             # Étape 2: Supprimer le nœud lui-même
             if hasattr(self.backend, 'delete'):
                 success = self.backend.delete(path)
+                self._invalidate_cached(path)
                 if success:
                     print(f"✅ Mémoire {path} supprimée avec nettoyage des liens")
                 return success
@@ -177,31 +269,33 @@ class MemoryEngine:
             # Vérification et nettoyage des différents types de liens
             modified = False
 
-            # Links classiques
-            if hasattr(node, 'links') and node.links:
-                original_count = len(node.links)
-                node.links = [link for link in node.links if link != target_path]
-                if len(node.links) != original_count:
-                    modified = True
-
-            # Transcendence links
-            if hasattr(node, 'transcendence_links') and node.transcendence_links:
-                original_count = len(node.transcendence_links)
-                node.transcendence_links = [link for link in node.transcendence_links if link != target_path]
-                if len(node.transcendence_links) != original_count:
-                    modified = True
-
-            # Immanence links
-            if hasattr(node, 'immanence_links') and node.immanence_links:
-                original_count = len(node.immanence_links)
-                node.immanence_links = [link for link in node.immanence_links if link != target_path]
-                if len(node.immanence_links) != original_count:
-                    modified = True
+            def without_target(entries):
+                kept = [link for link in entries
+                        if (link.get('path') if isinstance(link, dict) else link).strip('/') != target_path.strip('/')]
+                return kept, len(kept) != len(entries)
+
+            # Liens associatifs, transcendance et immanence (champs du nœud)
+            for attribute in ('links', 'linked_memories', 'transcendence_links', 'immanence_links'):
+                if getattr(node, attribute, None):
+                    kept, changed = without_target(getattr(node, attribute))
+                    if changed:
+                        setattr(node, attribute, kept)
+                        modified = True
+
+            # Liens verticaux conservés dans les métadonnées (FileSystemBackend)
+            metadata = getattr(node, 'metadata', None) or {}
+            for key in ('transcendence_links', 'immanence_links'):
+                if metadata.get(key):
+                    kept, changed = without_target(metadata[key])
+                    if changed:
+                        metadata[key] = kept
+                        modified = True
 
             # Sauvegarder si modifié
             if modified:
                 if hasattr(self.backend, 'update_node'):
                     self.backend.update_node(node_path, node)
+                    self.node_cache.invalidate(node_path)
                     print(f"  🔗 Liens nettoyés dans {node_path}")
                 else:
                     # Fallback : recréer le nœud
@@ -353,8 +447,13 @@ class MemoryEngine:
         """Récupère un nœud de mémoire par son ID."""
         return self.backend.retrieve(node_id)
 
-    def get_statistics(self) -> dict:
-        """Récupère les statistiques du MemoryEngine."""
+    def get_statistics(self, verify: bool = False) -> dict:
+        """
+        Récupère les statistiques du MemoryEngine.
+
+        Args:
+            verify: Si True, le backend rescanne son store pour réconcilier ses compteurs
+        """
         stats = {
             "backend_type": self.backend_type,
             "total": 0,
@@ -369,9 +468,34 @@ class MemoryEngine:
                 "cognitive": 0,
                 "metaphysical": 0
             },
-            "advanced_stats": False
+            "advanced_stats": False,
+            "node_cache": self.node_cache.get_statistics()
         }
         
+        # Compteurs maintenus par le backend (pas de scan sauf verify=True)
+        if hasattr(self.backend, 'get_memory_statistics'):
+            try:
+                if isinstance(self.backend, (FileSystemBackend, SQLiteBackend)):
+                    backend_stats = self.backend.get_memory_statistics(verify=verify)
+                else:
+                    backend_stats = self.backend.get_memory_statistics()
+            except Exception as e:
+                print(f"⚠️ Statistiques backend indisponibles: {e}")
+                backend_stats = {}
+            
+            if "nodes_by_strata" in backend_stats:
+                stats["nodes_by_strata"].update(backend_stats["nodes_by_strata"])
+            else:
+                # Format Neo4j : <strata>_nodes
+                for strata in stats["nodes_by_strata"]:
+                    stats["nodes_by_strata"][strata] = backend_stats.get(f"{strata}_nodes", 0)
+            stats["strata"] = dict(stats["nodes_by_strata"])
+            
+            for key in ("total_bytes", "links_by_type", "total_links", "total_relationships", "reconciled"):
+                if key in backend_stats:
+                    stats[key] = backend_stats[key]
+            stats["advanced_stats"] = bool(backend_stats)
+        
         # Calculer les totaux
         total_nodes = sum(stats["nodes_by_strata"].values())
         stats["total_nodes"] = total_nodes
@@ -379,11 +503,12 @@ class MemoryEngine:
         
         return stats
 
-    def get_memory_statistics(self) -> dict:
+    def get_memory_statistics(self, verify: bool = False) -> dict:
         """Alias pour get_statistics() pour compatibilité."""
-        return self.get_statistics()
+        return self.get_statistics(verify=verify)
 
     def close(self):
         """Ferme la connexion au backend (important pour Neo4j)."""
+        self.temporal_index.close()
         if hasattr(self.backend, 'close'):
             self.backend.close() 
\ No newline at end of file
@@ -24,6 +24,9 @@ class FractalMemoryNode:
     summary: str = field(init=False)
     keywords: List[str] = field(default_factory=list)
 
+    # Enfants directs dans l'arborescence fractale
+    children: List[Dict[str, str]] = field(default_factory=list)
+
     # Relations associatives fractales
     linked_memories: List[Dict[str, str]] = field(default_factory=list)
 
@@ -60,6 +63,7 @@ class FractalMemoryNode:
             'metadata': self.metadata,
             'strata': self.strata,
             'keywords': self.keywords,
+            'children': self.children,
             'linked_memories': self.linked_memories,
             'transcendence_links': self.transcendence_links,
             'immanence_links': self.immanence_links,
@@ -84,11 +88,27 @@ class FractalMemoryNode:
             id=data.get('id', str(uuid.uuid4())),
             timestamp=data.get('timestamp', datetime.now().isoformat()),
             keywords=data.get('keywords', []),
+            children=data.get('children', []),
             linked_memories=data.get('linked_memories', []),
             transcendence_links=data.get('transcendence_links', []),
             immanence_links=data.get('immanence_links', [])
         )
 
+    def add_child(self, name: str, summary: str):
+        """Ajoute (ou met à jour) un enfant direct du nœud."""
+        for child in self.children:
+            if child['name'] == name:
+                child['summary'] = summary
+                return
+        self.children.append({"name": name, "summary": summary})
+
+    def remove_child(self, name: str) -> bool:
+        """Retire un enfant direct du nœud ; False s'il n'était pas listé."""
+        remaining = [child for child in self.children if child['name'] != name]
+        removed = len(remaining) != len(self.children)
+        self.children = remaining
+        return removed
+
     def add_link(self, path: str, summary: str):
         """Ajoute un lien interdimensionnel à la liste."""
         # Évite les doublons
@@ -0,0 +1,110 @@
+"""
+Cache LRU borné pour les nœuds mémoire lus depuis le backend.
+
+Le cache est en lecture traversante : MemoryEngine le consulte avant le
+backend et l'invalide à chaque écriture ou suppression.
+
+Chaque nœud est conservé sous forme d'instantané pickle, pris une seule fois
+à l'insertion : sa longueur donne la taille exacte de l'entrée et chaque
+lecture en reconstruit un nœud indépendant (plus rapide qu'un deepcopy),
+que l'appelant peut modifier sans altérer le cache.
+"""
+
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class NodeCache:
+    """Cache LRU de FractalMemoryNode, borné en nombre d'entrées et en octets sérialisés."""
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Args:
+            max_entries: Nombre maximal de nœuds en cache (0 désactive le cache)
+            max_bytes: Taille maximale des instantanés en cache, en octets
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+
+        self._entries = OrderedDict()  # clé → instantané pickle du nœud
+        self.current_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return path.strip('/')
+
+    def get(self, path: str) -> Optional[Any]:
+        """Retourne un nœud reconstruit depuis l'instantané en cache, ou None (miss)."""
+        key = self._key(path)
+        with self.lock:
+            snapshot = self._entries.get(key)
+            if snapshot is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        # Nouvel objet à chaque lecture : les appelants le modifient librement
+        return pickle.loads(snapshot)
+
+    def put(self, path: str, node):
+        """Insère l'instantané d'un nœud et évince les moins récemment utilisés si besoin."""
+        if self.max_entries <= 0 or node is None:
+            return
+        try:
+            snapshot = pickle.dumps(node, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return  # Nœud non sérialisable : lu directement depuis le backend
+        if len(snapshot) > self.max_bytes:
+            return
+        key = self._key(path)
+        with self.lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= len(previous)
+            self._entries[key] = snapshot
+            self.current_bytes += len(snapshot)
+
+            while (len(self._entries) > self.max_entries
+                   or self.current_bytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= len(evicted)
+                self.evictions += 1
+
+    def invalidate(self, path: str):
+        """Retire un nœud du cache."""
+        with self.lock:
+            snapshot = self._entries.pop(self._key(path), None)
+            if snapshot is not None:
+                self.current_bytes -= len(snapshot)
+                self.invalidations += 1
+
+    def clear(self):
+        """Vide le cache (les compteurs sont conservés)."""
+        with self.lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Compteurs du cache pour MemoryEngine.get_statistics()."""
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
@@ -12,7 +12,7 @@ from typing import Dict, List, Any, Optional, Union
 from enum import Enum
 from dataclasses import dataclass
 
-from Core.LLMProviders import LLMProvider
+from Core.Providers.LLMProviders import LLMProvider, with_response_cache_if_enabled
 
 
 class EnrichmentPower(Enum):
@@ -41,7 +41,8 @@ class QueryEnrichmentSystem:
     """Système d'enrichissement universel des requêtes"""
     
     def __init__(self, llm_provider: LLMProvider = None):
-        self.llm_provider = llm_provider
+        # Cache de réponses si LLM_CACHE est actif (températures ≤ LLM_CACHE_MAX_TEMPERATURE)
+        self.llm_provider = with_response_cache_if_enabled(llm_provider)
         
         # Fragments modulaires hardcodés
         self.enrichment_fragments = {
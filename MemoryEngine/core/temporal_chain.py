@@ -0,0 +1,335 @@
+"""
+Compact on-disk chain of the compacted temporal timeline.
+
+Each timeline entry gets one fixed-size record in ``chain.idx`` (uuid key,
+offset and length of its payload in ``chain.blob``), in sequence order, so
+the previous/next links of an entry are simply its neighbouring records.
+Both files are memory-mapped for reading.
+
+Lookups by uuid and by fractal path binary-search two sorted key files
+(``chain.uuid``, ``chain.path``: fixed-size records of a 16-byte key and a
+position), also memory-mapped, so nothing proportional to the chain stays
+in memory. Records appended since the key files were last merged form a
+small in-memory tail; past TAIL_LIMIT records the tail is merged into the
+key files in one streaming pass.
+"""
+
+import hashlib
+import heapq
+import json
+import mmap
+import os
+import struct
+import threading
+import uuid as uuid_module
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# clé uuid (16 octets), offset et longueur du payload dans chain.blob
+RECORD = struct.Struct('<16sQI4x')
+# Fichiers de clés triés : clé (16 octets), position dans la chaîne
+KEY_RECORD = struct.Struct('<16sI')
+# Records ajoutés gardés en mémoire avant fusion dans les fichiers de clés
+TAIL_LIMIT = 4096
+
+
+def uuid_key(value: str) -> bytes:
+    """Clé binaire de 16 octets d'un uuid (haché s'il n'est pas canonique)."""
+    try:
+        return uuid_module.UUID(value).bytes
+    except (ValueError, AttributeError, TypeError):
+        return hashlib.md5(str(value).encode('utf-8')).digest()
+
+
+def path_key(fractal_path: str) -> bytes:
+    """Clé binaire de 16 octets d'un chemin fractal."""
+    return hashlib.md5(fractal_path.encode('utf-8')).digest()
+
+
+class SortedKeyFile:
+    """Records (clé, position) triés par clé puis position, recherchés par dichotomie sur un mmap."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._map = None
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def _mapped(self):
+        if self._map is None:
+            try:
+                with open(self.path, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size:
+                        self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except FileNotFoundError:
+                pass
+        return self._map
+
+    def __len__(self) -> int:
+        mapped = self._mapped()
+        return len(mapped) // KEY_RECORD.size if mapped is not None else 0
+
+    def _key_at(self, index: int) -> bytes:
+        return self._map[index * KEY_RECORD.size:index * KEY_RECORD.size + 16]
+
+    def positions(self, key: bytes) -> Iterator[int]:
+        """Positions associées à une clé, de la plus récente à la plus ancienne."""
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if self._key_at(middle) <= key:
+                low = middle + 1
+            else:
+                high = middle
+        index = low - 1
+        while index >= 0 and self._key_at(index) == key:
+            yield KEY_RECORD.unpack_from(self._map, index * KEY_RECORD.size)[1]
+            index -= 1
+
+    def __iter__(self) -> Iterator[Tuple[bytes, int]]:
+        mapped = self._mapped()
+        for index in range(len(self)):
+            yield KEY_RECORD.unpack_from(mapped, index * KEY_RECORD.size)
+
+    def write(self, records: Iterable[Tuple[bytes, int]]):
+        """Remplace le fichier par des records déjà triés (écriture atomique, en flux)."""
+        tmp_file = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_file, 'wb') as f:
+            for key, position in records:
+                f.write(KEY_RECORD.pack(key, position))
+            f.flush()
+            os.fsync(f.fileno())
+        self.close()
+        os.replace(tmp_file, self.path)
+
+
+class TemporalChain:
+    """Tableau de records (uuid, payload) mappé en mémoire, dans l'ordre de la timeline."""
+
+    def __init__(self, chain_dir):
+        self.chain_dir = Path(chain_dir)
+        self.chain_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.chain_dir / "chain.idx"
+        self.blob_file = self.chain_dir / "chain.blob"
+        self.meta_file = self.chain_dir / "chain.json"
+        self.lock = threading.RLock()
+
+        self.meta = self._load_meta()
+        self._index_map = None
+        self._blob_map = None
+        # Fichiers de clés triés, couvrant les positions [0, meta["sorted"])
+        self.uuid_keys = SortedKeyFile(self.chain_dir / "chain.uuid")
+        self.path_keys = SortedKeyFile(self.chain_dir / "chain.path")
+        # Queue non fusionnée, chargée à la première requête
+        self._tail_uuid = None  # clé uuid → position
+        self._tail_path = None  # fractal_path → dernière position
+
+    def _load_meta(self) -> Dict[str, Any]:
+        try:
+            with open(self.meta_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"count": 0, "last_seq": 0, "sorted": 0}
+
+    def _save_meta(self):
+        tmp_file = self.meta_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.meta, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.meta_file)
+
+    @property
+    def count(self) -> int:
+        return self.meta["count"]
+
+    @property
+    def last_seq(self) -> int:
+        return self.meta["last_seq"]
+
+    @property
+    def sorted_count(self) -> int:
+        """Positions couvertes par les fichiers de clés (absent des anciennes chaînes : 0)."""
+        return self.meta.get("sorted", 0)
+
+    def is_consistent(self, count: int, last_seq: int) -> bool:
+        """Vrai si la chaîne reflète exactement une timeline de cette taille."""
+        try:
+            index_size = self.index_file.stat().st_size
+        except FileNotFoundError:
+            index_size = 0
+        key_sizes = []
+        for keys in (self.uuid_keys, self.path_keys):
+            try:
+                key_sizes.append(keys.path.stat().st_size)
+            except FileNotFoundError:
+                key_sizes.append(0)
+        return (self.count == count and self.last_seq == last_seq
+                and index_size == count * RECORD.size
+                and self.sorted_count <= count
+                and key_sizes == [self.sorted_count * KEY_RECORD.size] * 2)
+
+    @staticmethod
+    def _payload(entry: Dict[str, Any]) -> bytes:
+        return json.dumps([entry["uuid"], entry["timestamp"], entry["fractal_path"],
+                           entry.get("strata"), entry.get("intent")],
+                          ensure_ascii=False).encode('utf-8')
+
+    def _close_maps(self):
+        for mapped in (self._index_map, self._blob_map):
+            if mapped is not None:
+                mapped.close()
+        self._index_map = self._blob_map = None
+        self.uuid_keys.close()
+        self.path_keys.close()
+
+    def _write_records(self, entries: Iterable[Dict[str, Any]], index_file: Path,
+                       blob_file: Path, mode: str):
+        """Écrit les records ; retourne (nombre, dernière seq, positions ajoutées)."""
+        written = 0
+        last_seq = None
+        added = []
+        with open(index_file, mode) as index_out, open(blob_file, mode) as blob_out:
+            offset = blob_out.seek(0, os.SEEK_END)
+            for entry in entries:
+                payload = self._payload(entry)
+                index_out.write(RECORD.pack(uuid_key(entry["uuid"]), offset, len(payload)))
+                blob_out.write(payload)
+                offset += len(payload)
+                added.append((entry["uuid"], entry["fractal_path"]))
+                written += 1
+                last_seq = entry["seq"]
+            for out in (blob_out, index_out):
+                out.flush()
+                os.fsync(out.fileno())
+        return written, last_seq, added
+
+    def append(self, entries: Iterable[Dict[str, Any]]):
+        """Ajoute des entrées compactées (ordonnées par seq, idempotent)."""
+        entries = [entry for entry in entries if entry["seq"] > self.last_seq]
+        if not entries:
+            return
+        with self.lock:
+            self._close_maps()
+            start = self.count
+            written, last_seq, added = self._write_records(
+                entries, self.index_file, self.blob_file, 'ab')
+            self.meta = {**self.meta, "count": start + written, "last_seq": last_seq}
+            self._save_meta()
+            if self._tail_uuid is not None:
+                for position, (entry_uuid, path) in enumerate(added, start=start):
+                    self._tail_uuid[uuid_key(entry_uuid)] = position
+                    self._tail_path[path] = position
+                if len(self._tail_uuid) > TAIL_LIMIT:
+                    self._merge_tail()
+
+    def rebuild(self, entries: Iterable[Dict[str, Any]], last_seq: int):
+        """Réécrit toute la chaîne depuis les entrées de la timeline."""
+        with self.lock:
+            self._close_maps()
+            tmp_index = self.index_file.with_suffix('.idx.tmp')
+            tmp_blob = self.blob_file.with_suffix('.blob.tmp')
+            written, _, added = self._write_records(entries, tmp_index, tmp_blob, 'wb')
+            os.replace(tmp_blob, self.blob_file)
+            os.replace(tmp_index, self.index_file)
+            # Tri transitoire des clés de la chaîne réécrite ; rien n'est gardé en mémoire
+            self.uuid_keys.write(sorted((uuid_key(entry_uuid), position)
+                                        for position, (entry_uuid, _) in enumerate(added)))
+            self.path_keys.write(sorted((path_key(path), position)
+                                        for position, (_, path) in enumerate(added)))
+            self.meta = {"count": written, "last_seq": last_seq, "sorted": written}
+            self._save_meta()
+            self._tail_uuid = self._tail_path = None
+
+    def _maps(self):
+        if self._index_map is None and self.count:
+            with open(self.index_file, 'rb') as f:
+                self._index_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            with open(self.blob_file, 'rb') as f:
+                self._blob_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._index_map, self._blob_map
+
+    def get(self, position: int) -> Optional[Dict[str, Any]]:
+        """Entrée compacte (uuid, timestamp, chemin, strate, intent) à une position."""
+        if not 0 <= position < self.count:
+            return None
+        with self.lock:
+            index_map, blob_map = self._maps()
+            _, offset, length = RECORD.unpack_from(index_map, position * RECORD.size)
+            entry_uuid, timestamp, path, strata, intent = json.loads(blob_map[offset:offset + length])
+        return {"uuid": entry_uuid, "timestamp": timestamp, "fractal_path": path,
+                "strata": strata, "intent": intent}
+
+    def _read_tail(self) -> List[Tuple[bytes, str, int]]:
+        """(clé uuid, chemin, position) des records non couverts par les fichiers de clés."""
+        index_map, blob_map = self._maps()
+        tail = []
+        for position in range(self.sorted_count, self.count):
+            key, offset, length = RECORD.unpack_from(index_map, position * RECORD.size)
+            tail.append((key, json.loads(blob_map[offset:offset + length])[2], position))
+        return tail
+
+    def _merge_tail(self):
+        """Fusionne la queue dans les fichiers de clés (un passage en flux sur chacun)."""
+        tail = self._read_tail()
+        for keys, new_records in (
+                (self.uuid_keys, sorted((key, position) for key, _, position in tail)),
+                (self.path_keys, sorted((path_key(path), position) for _, path, position in tail))):
+            keys.write(heapq.merge(iter(keys), new_records))
+        self.meta = {**self.meta, "sorted": self.count}
+        self._save_meta()
+        self._tail_uuid, self._tail_path = {}, {}
+
+    def _ensure_lookup(self):
+        """Charge la queue non fusionnée (fusionnée d'abord si elle dépasse TAIL_LIMIT)."""
+        if self._tail_uuid is not None:
+            return
+        if self.count - self.sorted_count > TAIL_LIMIT:
+            self._merge_tail()
+            return
+        self._tail_uuid, self._tail_path = {}, {}
+        for key, path, position in self._read_tail():
+            self._tail_uuid[key] = position
+            self._tail_path[path] = position
+
+    def find_uuid(self, entry_uuid: str) -> Optional[int]:
+        """Position d'un uuid dans la chaîne, ou None."""
+        key = uuid_key(entry_uuid)
+        with self.lock:
+            self._ensure_lookup()
+            if key in self._tail_uuid:
+                return self._tail_uuid[key]
+            return next(self.uuid_keys.positions(key), None)
+
+    def _path_positions(self, fractal_path: str) -> Iterator[int]:
+        """Positions des entrées d'un chemin fractal, de la plus récente à la plus ancienne."""
+        self._ensure_lookup()
+        if fractal_path in self._tail_path:
+            for _, path, position in reversed(self._read_tail()):
+                if path == fractal_path:
+                    yield position
+        # Une clé md5 partagée par deux chemins se départage sur le payload
+        for position in self.path_keys.positions(path_key(fractal_path)):
+            entry = self.get(position)
+            if entry is not None and entry["fractal_path"] == fractal_path:
+                yield position
+
+    def find_path(self, fractal_path: str) -> Optional[int]:
+        """Position de la dernière entrée d'un chemin fractal, ou None."""
+        with self.lock:
+            self._ensure_lookup()
+            if fractal_path in self._tail_path:
+                return self._tail_path[fractal_path]
+            return next(self._path_positions(fractal_path), None)
+
+    def count_path(self, fractal_path: str) -> int:
+        """Nombre d'entrées d'un chemin fractal dans la chaîne."""
+        with self.lock:
+            return sum(1 for _ in self._path_positions(fractal_path))
+
+    def close(self):
+        with self.lock:
+            self._close_maps()
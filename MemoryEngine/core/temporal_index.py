@@ -6,9 +6,14 @@ Provides fast temporal search capabilities with fallback to fractal memory
 import json
 import os
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from itertools import islice
+from typing import Dict, Iterator, List, Any, Optional
 from pathlib import Path
 
+from .temporal_chain import TemporalChain
+from .temporal_journal import TemporalJournal
+from .temporal_timeline import TimelineStore, to_timestamp
+
 
 class SearchProvider:
     """Interface abstraite pour les providers de recherche."""
@@ -198,67 +203,213 @@ class TemporalIndex:
     Stocke seulement les chemins et métadonnées, récupération dynamique.
     """
     
-    def __init__(self, backend_type: str, base_path: str):
+    def __init__(self, backend_type: str, base_path: str, fsync_interval: float = 1.0,
+                 batch_size: int = 64, compact_threshold: int = 5000):
         """
         Initialize the temporal index.
         
         Args:
             backend_type: Type of backend ("filesystem", "neo4j")
             base_path: Base path for storage
+            fsync_interval: Max seconds between two journal fsyncs (group commit)
+            batch_size: Max journal records written before a forced fsync
+            compact_threshold: Journal size (records) triggering a snapshot compaction
         """
         self.backend_type = backend_type
         self.base_path = Path(base_path)
         self.temporal_dir = self.base_path / "memory" / "temporal"
         self.temporal_dir.mkdir(parents=True, exist_ok=True)
         
-        # Index files
-        self.index_files = {
+        # Snapshot des index secondaires (intent, strata, keywords)
+        self.snapshot_file = self.temporal_dir / "indexes.json"
+        # Anciens fichiers d'index (migrés au premier chargement)
+        self.legacy_index_files = {
             "timeline": self.temporal_dir / "timeline.json",
             "intent_index": self.temporal_dir / "intent_index.json",
             "strata_index": self.temporal_dir / "strata_index.json",
             "keyword_index": self.temporal_dir / "keywords_index.json"
         }
         
-        # Load existing indexes
-        self.temporal_index = self._load_indexes()
+        # Timeline sur disque, découpée par jour (jamais chargée entièrement)
+        self.timeline = TimelineStore(self.temporal_dir / "timeline")
+        
+        # Journal append-only des mutations depuis le dernier snapshot
+        self.compact_threshold = compact_threshold
+        self.journal = TemporalJournal(self.temporal_dir / "journal.log",
+                                       fsync_interval=fsync_interval, batch_size=batch_size)
+        
+        # Chaîne compacte de la timeline (vérifiée/reconstruite au premier accès)
+        self.chain = TemporalChain(self.temporal_dir / "chain")
+        self._chain_checked = False
         
-        # Temporal nodes storage
-        self.temporal_nodes = {}  # uuid → TemporalNode
-        self.fractal_to_temporal = {}  # fractal_path → uuid
+        # Entrées pas encore compactées dans la timeline (bornées par compact_threshold)
+        self.recent_entries = []
+        self._recent_by_uuid = {}  # uuid → position dans recent_entries
+        self._recent_by_path = {}  # fractal_path → dernière position dans recent_entries
+        # Chemins supprimés pas encore retirés des fichiers de la timeline
+        self.removed_paths = set()
+        
+        # Load existing indexes (snapshots + journal replay)
+        self.temporal_index = self._load_indexes()
     
     def _load_indexes(self) -> Dict[str, Any]:
-        """Load existing temporal indexes from files."""
+        """Load the index snapshot, then replay the journal written since."""
         indexes = {
-            "timeline": [],
             "intent_index": {},
             "strata_index": {},
             "keyword_index": {}
         }
+        self.snapshot_seq = 0
         
-        for index_name, file_path in self.index_files.items():
-            if file_path.exists():
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        if index_name == "timeline":
-                            indexes["timeline"] = json.load(f)
-                        else:
-                            indexes[index_name] = json.load(f)
-                except (json.JSONDecodeError, IOError) as e:
-                    print(f"⚠️ Warning: Could not load {index_name} index: {e}")
+        if self.snapshot_file.exists():
+            try:
+                with open(self.snapshot_file, 'r', encoding='utf-8') as f:
+                    snapshot = json.load(f)
+                self.snapshot_seq = snapshot.pop("last_seq", 0)
+                indexes.update(snapshot)
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"⚠️ Warning: Could not load temporal index snapshot: {e}")
+        else:
+            self._migrate_legacy_indexes(indexes)
+        
+        # Récupération après crash : rejoue les mutations non compactées
+        for record in self.journal.replay():
+            if record.get("op") == "record":
+                entry = record["entry"]
+                if "seq" not in entry:
+                    # Journal écrit avant l'introduction des numéros de séquence
+                    latest = self._latest_entry()
+                    entry["seq"] = max(latest["seq"] if latest else 0, self.snapshot_seq) + 1
+                self._apply_entry(indexes, entry)
+            elif record.get("op") == "remove":
+                self._remove_from_all_indexes(record["path"], indexes)
         
         return indexes
     
-    def _save_indexes(self):
-        """Save temporal indexes to files."""
-        for index_name, file_path in self.index_files.items():
+    def _migrate_legacy_indexes(self, indexes: Dict[str, Any]):
+        """Convertit les anciens fichiers JSON (timeline complète en mémoire) au nouveau format."""
+        legacy_timeline = []
+        for index_name, file_path in self.legacy_index_files.items():
+            if not file_path.exists():
+                continue
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
+                with open(file_path, 'r', encoding='utf-8') as f:
                     if index_name == "timeline":
-                        json.dump(self.temporal_index["timeline"], f, indent=2, ensure_ascii=False)
+                        legacy_timeline = json.load(f)
                     else:
-                        json.dump(self.temporal_index[index_name], f, indent=2, ensure_ascii=False)
-            except IOError as e:
-                print(f"⚠️ Warning: Could not save {index_name} index: {e}")
+                        indexes[index_name] = json.load(f)
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"⚠️ Warning: Could not load {index_name} index: {e}")
+        
+        if not any(path.exists() for path in self.legacy_index_files.values()):
+            return
+        
+        for seq, entry in enumerate(legacy_timeline, start=self.timeline.last_seq + 1):
+            entry["seq"] = seq
+        self.timeline.append(legacy_timeline)
+        self.snapshot_seq = self.timeline.last_seq
+        if self._save_indexes(indexes):
+            for file_path in self.legacy_index_files.values():
+                file_path.unlink(missing_ok=True)
+            print(f"🔄 Index temporel migré ({len(legacy_timeline)} entrées)")
+    
+    def _save_indexes(self, indexes: Dict[str, Any] = None) -> bool:
+        """Write the index snapshot atomically (compact JSON, no indentation)."""
+        indexes = indexes if indexes is not None else self.temporal_index
+        snapshot = dict(indexes, last_seq=self.snapshot_seq)
+        try:
+            tmp_path = self.snapshot_file.with_suffix('.json.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_file)
+        except IOError as e:
+            print(f"⚠️ Warning: Could not save temporal index snapshot: {e}")
+            return False
+        return True
+    
+    def compact(self):
+        """Fold the journal into the day files and the snapshot, then truncate it."""
+        self.journal.flush()
+        chain = self._get_chain()
+        self.timeline.remove_paths(self.removed_paths)
+        self.timeline.append(self.recent_entries)
+        if self.removed_paths:
+            # Des positions ont disparu : la chaîne est réécrite
+            chain.rebuild(self.timeline.iter_entries(), self.timeline.last_seq)
+        else:
+            chain.append(self.recent_entries)
+        if self.recent_entries:
+            self.snapshot_seq = self.recent_entries[-1]["seq"]
+        if self._save_indexes():
+            self.journal.reset()
+            self.recent_entries = []
+            self._index_recent()
+            self.removed_paths = set()
+    
+    def _get_chain(self) -> TemporalChain:
+        """Chaîne compacte, reconstruite depuis les fichiers journaliers si elle est absente ou périmée."""
+        if not self._chain_checked:
+            if not self.chain.is_consistent(self.timeline.count, self.timeline.last_seq):
+                self.chain.rebuild(self.timeline.iter_entries(), self.timeline.last_seq)
+            self._chain_checked = True
+        return self.chain
+    
+    def _index_recent(self):
+        """Recalcule les tables uuid/chemin des entrées récentes."""
+        self._recent_by_uuid = {}
+        self._recent_by_path = {}
+        for position, entry in enumerate(self.recent_entries):
+            self._recent_by_uuid[entry["uuid"]] = position
+            self._recent_by_path[entry["fractal_path"]] = position
+    
+    def _maybe_compact(self):
+        if self.journal.record_count >= self.compact_threshold:
+            self.compact()
+    
+    def flush(self):
+        """Force l'écriture sur disque des enregistrements en attente."""
+        self.journal.flush()
+    
+    def close(self):
+        """Synchronise et ferme le journal."""
+        self.journal.close()
+        self.chain.close()
+    
+    def _latest_entry(self) -> Optional[Dict[str, Any]]:
+        """Dernière entrée de la timeline (compactée ou non)."""
+        if self.recent_entries:
+            return self.recent_entries[-1]
+        return self.timeline.last_entry
+    
+    def _apply_entry(self, indexes: Dict[str, Any], temporal_entry: Dict[str, Any]):
+        """Ajoute une entrée temporelle à la timeline et aux index secondaires."""
+        fractal_path = temporal_entry["fractal_path"]
+        seq = temporal_entry.get("seq", 0)
+        
+        # Déjà présente dans les fichiers de la timeline (compaction interrompue)
+        if seq > self.timeline.last_seq:
+            if self.recent_entries:
+                self.recent_entries[-1]["next_uuid"] = temporal_entry["uuid"]
+            self._recent_by_uuid[temporal_entry["uuid"]] = len(self.recent_entries)
+            self._recent_by_path[fractal_path] = len(self.recent_entries)
+            self.recent_entries.append(temporal_entry)
+        
+        # Déjà présente dans le snapshot des index secondaires
+        if seq <= self.snapshot_seq:
+            return
+        
+        # Indexation par intent
+        if temporal_entry["intent"]:
+            indexes["intent_index"].setdefault(temporal_entry["intent"], []).append(fractal_path)
+        
+        # Indexation par strata
+        indexes["strata_index"].setdefault(temporal_entry["strata"], []).append(fractal_path)
+        
+        # Indexation par keywords
+        for keyword in temporal_entry["keywords"]:
+            indexes["keyword_index"].setdefault(keyword, []).append(fractal_path)
     
     def auto_record(self, fractal_path: str, metadata: Dict[str, Any]):
         """
@@ -268,69 +419,108 @@ class TemporalIndex:
             fractal_path: Chemin du nœud fractal
             metadata: Métadonnées du nœud (intent, strata, keywords, etc.)
         """
-        import uuid
-        
-        # Créer UUID temporel
-        temporal_uuid = str(uuid.uuid4())
-        
-        # Créer nœud temporel
-        temporal_node = TemporalNode(fractal_path, temporal_uuid, metadata)
-        
-        # Liens bidirectionnels
-        if self.temporal_index["timeline"]:
-            previous_uuid = self.temporal_index["timeline"][-1]["uuid"]
-            temporal_node.previous_temporal_uuid = previous_uuid
-            # Vérifier que le nœud précédent existe avant de le modifier
-            if previous_uuid in self.temporal_nodes:
-                self.temporal_nodes[previous_uuid].next_temporal_uuid = temporal_uuid
-        
-        # Stockage
-        self.temporal_nodes[temporal_uuid] = temporal_node
-        self.fractal_to_temporal[fractal_path] = temporal_uuid
-        
-        # Indexation temporelle
-        temporal_entry = {
-            "uuid": temporal_uuid,
-            "fractal_path": fractal_path,
-            "timestamp": temporal_node.timestamp,
-            "intent": metadata.get("intent"),
-            "strata": metadata.get("strata", "somatic"),
-            "keywords": metadata.get("keywords", []),
-            "previous_uuid": temporal_node.previous_temporal_uuid,
-            "next_uuid": temporal_node.next_temporal_uuid
-        }
-        
-        self.temporal_index["timeline"].append(temporal_entry)
-        
-        # Indexation par intent
-        if temporal_entry["intent"]:
-            if temporal_entry["intent"] not in self.temporal_index["intent_index"]:
-                self.temporal_index["intent_index"][temporal_entry["intent"]] = []
-            self.temporal_index["intent_index"][temporal_entry["intent"]].append(fractal_path)
-        
-        # Indexation par strata
-        strata = temporal_entry["strata"]
-        if strata not in self.temporal_index["strata_index"]:
-            self.temporal_index["strata_index"][strata] = []
-        self.temporal_index["strata_index"][strata].append(fractal_path)
+        self.auto_record_many([(fractal_path, metadata)])
+    
+    def auto_record_many(self, records: List[tuple]):
+        """
+        Enregistre un lot de nœuds fractals avec une seule écriture du journal.
         
-        # Indexation par keywords
-        for keyword in temporal_entry["keywords"]:
-            if keyword not in self.temporal_index["keyword_index"]:
-                self.temporal_index["keyword_index"][keyword] = []
-            self.temporal_index["keyword_index"][keyword].append(fractal_path)
+        Args:
+            records: Liste de tuples (fractal_path, metadata)
+        """
+        import uuid
         
-        # Sauvegarde des index
-        self._save_indexes()
+        journal_records = []
+        latest = self._latest_entry()
+        next_seq = latest["seq"] + 1 if latest else self.timeline.last_seq + 1
+        for fractal_path, metadata in records:
+            # Créer UUID temporel ; les TemporalNode sont reconstruits à la demande
+            temporal_uuid = str(uuid.uuid4())
+            
+            # Lien vers le nœud précédent (le suivant est déduit de l'ordre de la timeline)
+            latest = self._latest_entry()
+            
+            # Indexation temporelle
+            temporal_entry = {
+                "seq": next_seq,
+                "uuid": temporal_uuid,
+                "fractal_path": fractal_path,
+                "timestamp": datetime.now().isoformat(),
+                "intent": metadata.get("intent"),
+                "strata": metadata.get("strata", "somatic"),
+                "keywords": metadata.get("keywords", []),
+                "previous_uuid": latest["uuid"] if latest else None,
+                "next_uuid": None
+            }
+            
+            journal_records.append({"op": "record", "entry": dict(temporal_entry)})
+            self._apply_entry(self.temporal_index, temporal_entry)
+            next_seq += 1
+        
+        # Journalisation (append-only) au lieu de réécrire les index
+        self.journal.append_many(journal_records)
+        self._maybe_compact()
+    
+    def _entry_at(self, position: int) -> Optional[Dict[str, Any]]:
+        """Entrée à une position globale (chaîne compactée puis entrées récentes)."""
+        chain = self._get_chain()
+        if position < chain.count:
+            entry = chain.get(position)
+            # Suppression pas encore compactée : l'entrée est sautée
+            if entry and entry["fractal_path"] in self.removed_paths:
+                return None
+            return entry
+        return self.recent_entries[position - chain.count]
+    
+    def _neighbour(self, position: int, step: int):
+        """Position et entrée voisines (step = -1 ou 1), ou (None, None)."""
+        total = self._get_chain().count + len(self.recent_entries)
+        position += step
+        while 0 <= position < total:
+            entry = self._entry_at(position)
+            if entry is not None:
+                return position, entry
+            position += step
+        return None, None
+    
+    def _position_of_uuid(self, uuid: str) -> Optional[int]:
+        if uuid in self._recent_by_uuid:
+            return self._get_chain().count + self._recent_by_uuid[uuid]
+        position = self._get_chain().find_uuid(uuid)
+        if position is not None and self._entry_at(position) is not None:
+            return position
+        return None
+    
+    def _position_of_path(self, fractal_path: str) -> Optional[int]:
+        if fractal_path in self._recent_by_path:
+            return self._get_chain().count + self._recent_by_path[fractal_path]
+        if fractal_path in self.removed_paths:
+            return None
+        return self._get_chain().find_path(fractal_path)
+    
+    def _node_at(self, position: Optional[int]) -> Optional['TemporalNode']:
+        """Matérialise un TemporalNode léger avec ses liens déduits des voisins."""
+        if position is None:
+            return None
+        entry = self._entry_at(position)
+        if entry is None:
+            return None
+        temporal_node = TemporalNode(entry["fractal_path"], entry["uuid"],
+                                     {"strata": entry.get("strata"), "intent": entry.get("intent")})
+        temporal_node.timestamp = entry["timestamp"]
+        _, previous_entry = self._neighbour(position, -1)
+        _, next_entry = self._neighbour(position, 1)
+        temporal_node.previous_temporal_uuid = previous_entry["uuid"] if previous_entry else None
+        temporal_node.next_temporal_uuid = next_entry["uuid"] if next_entry else None
+        return temporal_node
     
     def get_temporal_node(self, uuid: str) -> Optional['TemporalNode']:
         """Récupère un nœud temporel par UUID."""
-        return self.temporal_nodes.get(uuid)
+        return self._node_at(self._position_of_uuid(uuid))
     
     def get_temporal_by_fractal(self, fractal_path: str) -> Optional['TemporalNode']:
-        """Récupère un nœud temporel par chemin fractal."""
-        uuid = self.fractal_to_temporal.get(fractal_path)
-        return self.temporal_nodes.get(uuid) if uuid else None
+        """Récupère le dernier nœud temporel d'un chemin fractal."""
+        return self._node_at(self._position_of_path(fractal_path))
     
     def inject_temporal_links(self, fractal_node):
         """Injecte les liens temporels virtuels dans un nœud fractal."""
@@ -348,22 +538,13 @@ class TemporalIndex:
     def traverse_temporal_chain(self, start_uuid: str, direction: str = "next", max_steps: int = 10):
         """Traverse la chaîne temporelle."""
         chain = []
-        current_uuid = start_uuid
-        steps = 0
+        position = self._position_of_uuid(start_uuid)
+        step = 1 if direction == "next" else -1
         
-        while current_uuid and steps < max_steps:
-            temporal_node = self.get_temporal_node(current_uuid)
-            if not temporal_node:
-                break
-                
-            chain.append(temporal_node)
-            
-            if direction == "next":
-                current_uuid = temporal_node.next_temporal_uuid
-            else:
-                current_uuid = temporal_node.previous_temporal_uuid
-            
-            steps += 1
+        # Parcours par positions voisines, sans recherche d'uuid à chaque pas
+        while position is not None and len(chain) < max_steps:
+            chain.append(self._node_at(position))
+            position, _ = self._neighbour(position, step)
         
         return chain
     
@@ -418,58 +599,134 @@ class TemporalIndex:
         
         return list(paths)
     
+    def iter_timeline(self, start=None, end=None, reverse: bool = False,
+                      strata: str = None) -> Iterator[Dict[str, Any]]:
+        """
+        Itère sur les entrées de la timeline dans l'intervalle [start, end).
+        
+        Les fichiers journaliers sont lus un par un, puis les entrées récentes
+        non compactées ; rien n'est chargé entièrement en mémoire.
+        
+        Args:
+            start: Borne inclusive (datetime ou chaîne ISO), None = début
+            end: Borne exclusive (datetime ou chaîne ISO), None = fin
+            reverse: Du plus récent au plus ancien
+            strata: Ne garder que les entrées de cette strate
+        """
+        start, end = to_timestamp(start), to_timestamp(end)
+        recent = [entry for entry in self.recent_entries
+                  if (not start or entry["timestamp"] >= start)
+                  and (not end or entry["timestamp"] < end)]
+        # Les suppressions en attente ne concernent que les entrées déjà compactées
+        stored = (entry for entry in self.timeline.iter_entries(start, end, reverse)
+                  if entry["fractal_path"] not in self.removed_paths)
+        
+        if reverse:
+            sources = (reversed(recent), stored)
+        else:
+            sources = (stored, iter(recent))
+        
+        for source in sources:
+            for entry in source:
+                if strata and entry.get("strata") != strata:
+                    continue
+                yield entry
+    
+    def search_by_time_range(self, start=None, end=None, strata: str = None,
+                             limit: int = None) -> List[Dict[str, Any]]:
+        """Entrées de la timeline dans [start, end), dans l'ordre chronologique."""
+        return list(islice(self.iter_timeline(start, end, strata=strata), limit))
+    
+    def last_entries(self, n: int = 10, strata: str = None) -> List[Dict[str, Any]]:
+        """Les n dernières entrées (les plus récentes d'abord), éventuellement d'une strate."""
+        return list(islice(self.iter_timeline(reverse=True, strata=strata), n))
+    
     def search_by_timeline(self, time_period: str) -> List[str]:
-        """Recherche par période temporelle."""
-        # TODO: Implémenter la recherche par période
-        # Pour l'instant, retourne les 10 derniers
-        return [entry["fractal_path"] for entry in self.temporal_index["timeline"][-10:]]
+        """
+        Recherche par période temporelle.
+        
+        Args:
+            time_period: "ascending" / "descending" (10 dernières entrées, du plus
+                         ancien ou du plus récent), intervalle ISO "début/fin",
+                         ou préfixe de date ("2025", "2025-08", "2025-08-12")
+        """
+        if time_period in (None, "", "ascending", "descending"):
+            entries = self.last_entries(10)
+            if time_period != "descending":
+                entries.reverse()
+        elif "/" in time_period:
+            start, end = time_period.split("/", 1)
+            entries = self.search_by_time_range(start or None, end or None)
+        else:
+            # Préfixe de date : toutes les horodatations qui commencent par lui
+            entries = self.search_by_time_range(time_period, time_period + "~")
+        return [entry["fractal_path"] for entry in entries]
     
     def get_statistics(self) -> Dict[str, Any]:
         """Retourne les statistiques de l'index temporel."""
+        # Entrées compactées dont la suppression attend encore la compaction
+        pending_removals = 0
+        if self.removed_paths:
+            chain = self._get_chain()
+            pending_removals = sum(chain.count_path(path) for path in self.removed_paths)
         return {
-            "total_entries": len(self.temporal_index["timeline"]),
+            "total_entries": self.timeline.count - pending_removals + len(self.recent_entries),
             "intent_count": len(self.temporal_index["intent_index"]),
             "strata_count": len(self.temporal_index["strata_index"]),
             "keyword_count": len(self.temporal_index["keyword_index"]),
-            "latest_entry": self.temporal_index["timeline"][-1] if self.temporal_index["timeline"] else None
+            "latest_entry": self._latest_entry()
         }
     
     def cleanup_orphaned_entries(self, memory_engine):
         """Nettoie les entrées orphelines (nœuds fractals supprimés)."""
         orphaned_paths = []
+        checked = set()
         
-        for entry in self.temporal_index["timeline"]:
+        for entry in self.iter_timeline():
             path = entry["fractal_path"]
-            if not memory_engine.get_memory_node(path):
+            if path in checked:
+                continue
+            checked.add(path)
+            try:
+                exists = bool(memory_engine.get_memory_node(path))
+            except FileNotFoundError:
+                exists = False
+            if not exists:
                 orphaned_paths.append(path)
         
         # Suppression des entrées orphelines
         for path in orphaned_paths:
             self._remove_from_all_indexes(path)
+            self.journal.append({"op": "remove", "path": path})
         
         if orphaned_paths:
-            self._save_indexes()
+            self.compact()
             print(f"🧹 Nettoyé {len(orphaned_paths)} entrées orphelines")
     
-    def _remove_from_all_indexes(self, path: str):
+    def _remove_from_all_indexes(self, path: str, indexes: Dict[str, Any] = None):
         """Supprime un chemin de tous les index."""
-        # Timeline
-        self.temporal_index["timeline"] = [
-            entry for entry in self.temporal_index["timeline"] 
+        if indexes is None:
+            indexes = self.temporal_index
+        
+        # Timeline : entrées récentes tout de suite, fichiers journaliers à la compaction
+        self.recent_entries = [
+            entry for entry in self.recent_entries
             if entry["fractal_path"] != path
         ]
+        self._index_recent()
+        self.removed_paths.add(path)
         
         # Intent index
-        for intent, paths in self.temporal_index["intent_index"].items():
-            self.temporal_index["intent_index"][intent] = [p for p in paths if p != path]
+        for intent, paths in indexes["intent_index"].items():
+            indexes["intent_index"][intent] = [p for p in paths if p != path]
         
         # Strata index
-        for strata, paths in self.temporal_index["strata_index"].items():
-            self.temporal_index["strata_index"][strata] = [p for p in paths if p != path]
+        for strata, paths in indexes["strata_index"].items():
+            indexes["strata_index"][strata] = [p for p in paths if p != path]
         
         # Keyword index
-        for keyword, paths in self.temporal_index["keyword_index"].items():
-            self.temporal_index["keyword_index"][keyword] = [p for p in paths if p != path]
+        for keyword, paths in indexes["keyword_index"].items():
+            indexes["keyword_index"][keyword] = [p for p in paths if p != path]
 
 
 class TemporalNode:
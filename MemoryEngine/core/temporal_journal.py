@@ -0,0 +1,118 @@
+"""
+Write-ahead journal for the TemporalIndex.
+
+Each mutation is appended as one JSON line instead of re-serialising every
+index file. Appends are group-committed (fsync every ``batch_size`` records
+or every ``fsync_interval`` seconds) and the journal is folded into snapshot
+files by the owning index once it grows past its compaction threshold.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+
+class TemporalJournal:
+    """Journal append-only avec commit groupé et relecture après crash."""
+
+    def __init__(self, journal_path, fsync_interval: float = 1.0, batch_size: int = 64):
+        """
+        Args:
+            journal_path: Fichier journal (JSON lines)
+            fsync_interval: Délai max (s) entre deux fsync ; 0 force un fsync par écriture
+            batch_size: Nombre max d'enregistrements non synchronisés
+        """
+        self.journal_path = Path(journal_path)
+        self.fsync_interval = fsync_interval
+        self.batch_size = max(1, batch_size)
+        self.lock = threading.Lock()
+
+        self._file = None
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        self.record_count = 0
+
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        """
+        Relit les enregistrements du journal dans l'ordre.
+
+        Une dernière ligne tronquée (crash pendant l'écriture) est ignorée puis
+        coupée du fichier pour que les appends suivants restent valides.
+        """
+        self.record_count = 0
+        if not self.journal_path.exists():
+            return
+
+        valid_bytes = 0
+        with open(self.journal_path, 'rb') as f:
+            for raw_line in f:
+                if not raw_line.endswith(b'\n'):
+                    break
+                try:
+                    record = json.loads(raw_line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    break
+                valid_bytes += len(raw_line)
+                self.record_count += 1
+                yield record
+
+        if valid_bytes < self.journal_path.stat().st_size:
+            print(f"⚠️ Journal temporel tronqué à {valid_bytes} octets (écriture interrompue)")
+            with open(self.journal_path, 'r+b') as f:
+                f.truncate(valid_bytes)
+
+    def append(self, record: Dict[str, Any]):
+        """Ajoute un enregistrement, synchronisé sur disque par lots."""
+        self.append_many([record])
+
+    def append_many(self, records: List[Dict[str, Any]]):
+        """Ajoute plusieurs enregistrements en une seule écriture."""
+        if not records:
+            return
+        payload = ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records)
+        with self.lock:
+            if self._file is None:
+                self._file = open(self.journal_path, 'a', encoding='utf-8')
+            self._file.write(payload)
+            # Visible par l'OS immédiatement : survit à un crash du processus
+            self._file.flush()
+            self._pending += len(records)
+            self.record_count += len(records)
+
+            if (self._pending >= self.batch_size
+                    or time.monotonic() - self._last_sync >= self.fsync_interval):
+                self._sync()
+
+    def _sync(self):
+        if self._file is not None and self._pending:
+            os.fsync(self._file.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def flush(self):
+        """Force la synchronisation des enregistrements en attente."""
+        with self.lock:
+            self._sync()
+
+    def reset(self):
+        """Vide le journal (appelé après l'écriture d'un snapshot)."""
+        with self.lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            with open(self.journal_path, 'w', encoding='utf-8') as f:
+                f.flush()
+                os.fsync(f.fileno())
+            self._pending = 0
+            self.record_count = 0
+
+    def close(self):
+        """Synchronise et ferme le journal."""
+        with self.lock:
+            self._sync()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
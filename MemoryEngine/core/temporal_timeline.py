@@ -0,0 +1,190 @@
+"""
+Timeline on disk for the TemporalIndex, chunked by day.
+
+Entries are stored in ``timeline/YYYY-MM-DD.jsonl`` files, one JSON line per
+entry, in timestamp order. Range queries bisect the sorted list of day files
+and only stream the days they cover; reverse iteration loads one day at a
+time. The whole timeline is never held in memory.
+"""
+
+import bisect
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+
+def to_timestamp(value) -> Optional[str]:
+    """Normalise une borne (datetime ou chaîne ISO) en chaîne ISO comparable."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+class TimelineStore:
+    """Timeline append-only découpée en fichiers journaliers."""
+
+    def __init__(self, timeline_dir):
+        self.timeline_dir = Path(timeline_dir)
+        self.timeline_dir.mkdir(parents=True, exist_ok=True)
+        self.meta_file = self.timeline_dir / "meta.json"
+        self.meta = self._load_meta()
+        self._days = sorted(path.stem for path in self.timeline_dir.glob("*.jsonl"))
+
+    def _load_meta(self) -> Dict[str, Any]:
+        try:
+            with open(self.meta_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"count": 0, "last_seq": 0, "last_entry": None}
+
+    def _save_meta(self):
+        tmp_file = self.meta_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.meta, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.meta_file)
+
+    def _day_file(self, day: str) -> Path:
+        return self.timeline_dir / f"{day}.jsonl"
+
+    @staticmethod
+    def _day_of(timestamp: str) -> str:
+        return timestamp[:10]
+
+    @property
+    def count(self) -> int:
+        return self.meta["count"]
+
+    @property
+    def last_seq(self) -> int:
+        return self.meta["last_seq"]
+
+    @property
+    def last_entry(self) -> Optional[Dict[str, Any]]:
+        return self.meta["last_entry"]
+
+    def _last_seq_in(self, day_file: Path) -> int:
+        """Séquence de la dernière ligne complète d'un fichier (tronque une ligne cassée)."""
+        if not day_file.exists():
+            return 0
+        with open(day_file, 'rb+') as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            block = min(size, 64 * 1024)
+            f.seek(size - block)
+            tail = f.read(block)
+            if tail and not tail.endswith(b'\n'):
+                # Append interrompu : on coupe la ligne incomplète
+                cut = tail.rfind(b'\n') + 1
+                f.truncate(size - block + cut)
+                tail = tail[:cut]
+            lines = tail.splitlines()
+        for line in reversed(lines):
+            try:
+                return json.loads(line).get("seq", 0)
+            except json.JSONDecodeError:
+                continue
+        return 0
+
+    def append(self, entries: List[Dict[str, Any]]):
+        """
+        Ajoute des entrées (déjà ordonnées par seq) aux fichiers journaliers.
+
+        Idempotent : les entrées déjà présentes après un crash de compaction sont
+        ignorées grâce à leur numéro de séquence.
+        """
+        entries = [entry for entry in entries if entry["seq"] > self.last_seq]
+        by_day = {}
+        for entry in entries:
+            by_day.setdefault(self._day_of(entry["timestamp"]), []).append(entry)
+
+        for day, day_entries in by_day.items():
+            day_file = self._day_file(day)
+            already = self._last_seq_in(day_file)
+            lines = [json.dumps(entry, ensure_ascii=False) + '\n'
+                     for entry in day_entries if entry["seq"] > already]
+            if lines:
+                with open(day_file, 'a', encoding='utf-8') as f:
+                    f.writelines(lines)
+                    f.flush()
+                    os.fsync(f.fileno())
+            if day not in self._days:
+                bisect.insort(self._days, day)
+
+        if entries:
+            self.meta["count"] += len(entries)
+            self.meta["last_seq"] = entries[-1]["seq"]
+            self.meta["last_entry"] = entries[-1]
+            self._save_meta()
+
+    def remove_paths(self, paths: Set[str]):
+        """Réécrit les fichiers journaliers sans les entrées des chemins donnés."""
+        if not paths:
+            return
+        removed = 0
+        last_entry = None
+        for day in list(self._days):
+            day_file = self._day_file(day)
+            kept = []
+            for entry in self._read_day(day):
+                if entry["fractal_path"] in paths:
+                    removed += 1
+                else:
+                    kept.append(entry)
+            if not kept:
+                day_file.unlink(missing_ok=True)
+                self._days.remove(day)
+                continue
+            last_entry = kept[-1]
+            tmp_file = day_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.writelines(json.dumps(entry, ensure_ascii=False) + '\n' for entry in kept)
+            os.replace(tmp_file, day_file)
+
+        self.meta["count"] -= removed
+        self.meta["last_entry"] = last_entry
+        self._save_meta()
+
+    def _read_day(self, day: str) -> List[Dict[str, Any]]:
+        entries = []
+        try:
+            with open(self._day_file(day), 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entries.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def iter_days(self, start: str = None, end: str = None, reverse: bool = False) -> Iterator[str]:
+        """Jours couvrant l'intervalle [start, end), trouvés par bisection."""
+        low = bisect.bisect_left(self._days, self._day_of(start)) if start else 0
+        high = bisect.bisect_right(self._days, self._day_of(end)) if end else len(self._days)
+        days = self._days[low:high]
+        return iter(reversed(days) if reverse else days)
+
+    def iter_entries(self, start=None, end=None, reverse: bool = False) -> Iterator[Dict[str, Any]]:
+        """Entrées de l'intervalle [start, end), un fichier journalier à la fois."""
+        start, end = to_timestamp(start), to_timestamp(end)
+        for day in self.iter_days(start, end, reverse):
+            day_entries = self._read_day(day)
+            if reverse:
+                day_entries.reverse()
+            for entry in day_entries:
+                timestamp = entry["timestamp"]
+                if start and timestamp < start:
+                    if reverse:
+                        return
+                    continue
+                if end and timestamp >= end:
+                    if reverse:
+                        continue
+                    return
+                yield entry
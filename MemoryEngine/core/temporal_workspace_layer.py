@@ -14,7 +14,7 @@ from typing import Dict, List, Any, Optional, Union
 from pathlib import Path
 from datetime import datetime
 
-from Core.LLMProviders import LLMProvider
+from Core.Providers.LLMProviders import LLMProvider
 from .temporal_components import WorkspaceTemporalLayer as BaseWorkspaceTemporalLayer
 from .engine import MemoryEngine
 from .fractal_search_engine import FractalSearchEngine
@@ -12,7 +12,7 @@ from typing import Dict, List, Any, Optional, Union
 from dataclasses import dataclass
 from enum import Enum
 
-from Core.Providers.LLMProviders import LLMProvider
+from Core.Providers.LLMProviders import LLMProvider, with_response_cache_if_enabled
 from .meta_path_adapter import MetaPathAdapter, UnifiedResultFormatter
 
 
@@ -49,7 +49,8 @@ class FractalSearchEngine:
     
     def __init__(self, memory_engine, llm_provider: LLMProvider):
         self.memory_engine = memory_engine
-        self.llm_provider = llm_provider
+        # Cache de réponses si LLM_CACHE est actif (températures ≤ LLM_CACHE_MAX_TEMPERATURE)
+        self.llm_provider = with_response_cache_if_enabled(llm_provider)
         
     async def search(self, query: str, **kwargs) -> SearchResult:
         """
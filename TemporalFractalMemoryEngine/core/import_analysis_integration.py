@@ -21,10 +21,12 @@ import uuid
 # Import de l'analyseur d'imports
 try:
     from Core.Partitioner.analyzers.import_analyzer import ImportAnalyzer, ImportAnalysisResult
+    from Core.Partitioner.analyzers.graph_index import IndexedGraph
 except ImportError:
     logger.warning("ImportAnalyzer non disponible")
     ImportAnalyzer = None
     ImportAnalysisResult = None
+    IndexedGraph = None
 
 # Import du TemporalFractalMemoryEngine
 try:
@@ -389,20 +391,42 @@ class TemporalDependencyGraph:
         self.nodes = {}
         self.edges = []
         self.cycles = []
+        self.index = IndexedGraph() if IndexedGraph else None
     
     def add_link(self, temporal_link: TemporalLink):
         """Ajoute un lien temporel au graphe"""
         self.edges.append(temporal_link)
+        source = temporal_link.source_node.file_path
+        target = temporal_link.target_node.file_path
+        self.nodes[source] = temporal_link.source_node
+        self.nodes[target] = temporal_link.target_node
+        if self.index is not None:
+            self.index.add_edge(source, target)
     
     def find_path(self, source: str, target: str) -> List[str]:
-        """Trouve un chemin entre deux fichiers"""
-        # Implémentation simplifiée - à étendre
-        return []
+        """Trouve le plus court chemin de dépendance entre deux fichiers"""
+        if self.index is None:
+            return []
+        return self.index.shortest_path(source, target)
     
     def detect_cycles(self) -> List[List[str]]:
-        """Détecte les cycles dans le graphe"""
-        # Implémentation simplifiée - à étendre
-        return []
+        """Détecte les cycles dans le graphe (un cycle fermé par composante)"""
+        if self.index is None:
+            return []
+        self.cycles = self.index.cycles()
+        return self.cycles
+    
+    def get_dependencies(self, file_path: str) -> Set[str]:
+        """Fichiers dont file_path dépend, transitivement"""
+        return self.index.reachable(file_path) if self.index is not None else set()
+    
+    def get_dependents(self, file_path: str) -> Set[str]:
+        """Fichiers qui dépendent de file_path, transitivement"""
+        return self.index.reachable(file_path, reverse=True) if self.index is not None else set()
+    
+    def get_layers(self) -> List[List[str]]:
+        """Couches topologiques, dépendances d'abord"""
+        return self.index.topological_layers() if self.index is not None else []
 
 
 # Fonctions utilitaires pour l'intégration
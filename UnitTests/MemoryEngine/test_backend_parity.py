@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+🧪 Parité FileSystemBackend / SQLiteBackend
+
+Un même scénario MemoryEngine doit produire les mêmes chemins et résultats
+quel que soit le backend (chemins normalisés sous forme relative).
+"""
+
+import pytest
+
+from MemoryEngine.core.engine import MemoryEngine
+
+BACKENDS = ["filesystem", "sqlite"]
+
+
+def populate(engine):
+    engine.create_memory("/c", "concept", "sc", ["k"], strata="metaphysical")
+    engine.create_memory("/b", "idée", "sb", ["k"], strata="cognitive", transcendence_links=["/c"])
+    engine.create_memory("/a", "fait", "sa", ["k", "x"], links=["/b"], transcendence_links=["b"])
+    engine.create_memory("/a/d", "détail", "sd", ["x"], immanence_links=["/a"])
+    # Cycle : c → a en transcendance
+    engine.create_memory("/c", "concept", "sc", ["k"], strata="metaphysical", transcendence_links=["a/"])
+
+
+@pytest.fixture(params=BACKENDS)
+def engine(request, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    engine = MemoryEngine(backend_type=request.param, base_path=str(tmp_path / "memory"))
+    populate(engine)
+    yield engine
+    engine.backend.close()
+
+
+def scenario(engine):
+    """Résultats comparables de toutes les requêtes du scénario."""
+    return {
+        "transcendence_from_slash": engine.traverse_transcendence_path("/a"),
+        "transcendence_from_relative": engine.traverse_transcendence_path("a"),
+        "immanence": engine.traverse_immanence_path("/a/d/"),
+        "missing_start": engine.traverse_transcendence_path("/absent"),
+        "keyword_k": sorted(engine.find_memories_by_keyword("k")),
+        "keyword_x": sorted(engine.find_memories_by_keyword("x")),
+        "linking_to_b": sorted(engine.backend.find_nodes_linking_to("/b")),
+        "search_all": sorted(node["metadata"]["path"] for node in engine.search()),
+        "search_cognitive": sorted(node["metadata"]["path"] for node in engine.search(strata="cognitive")),
+        "children_of_a": [child["name"] for child in engine.get_memory_node("/a").children],
+    }
+
+
+def test_traversal_paths_are_normalized(engine):
+    chain = engine.traverse_transcendence_path("/a")
+    assert [entry["path"] for entry in chain] == ["a", "b", "c"]
+    assert [entry["strata"] for entry in chain] == ["somatic", "cognitive", "metaphysical"]
+    assert engine.traverse_transcendence_path("a") == chain
+    assert [entry["path"] for entry in engine.traverse_immanence_path("/a/d")] == ["a/d", "a"]
+
+
+def test_retrieve_by_id(engine):
+    node = engine.get_memory_node("/b")
+    assert engine.retrieve(node.id).content == "idée"
+    assert engine.retrieve("id-inconnu") is None
+
+
+def test_backends_return_identical_results(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    results = {}
+    for backend_type in BACKENDS:
+        engine = MemoryEngine(backend_type=backend_type, base_path=str(tmp_path / backend_type))
+        populate(engine)
+        results[backend_type] = scenario(engine)
+        engine.backend.close()
+    assert results["filesystem"] == results["sqlite"]
+
+
+def test_forget_removes_child_from_parent(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    results = {}
+    for backend_type in BACKENDS:
+        engine = MemoryEngine(backend_type=backend_type, base_path=str(tmp_path / backend_type))
+        populate(engine)
+        engine.create_memory("/a/e", "autre", "se", ["x"])
+        assert engine.forget_memory("/a/d")
+        results[backend_type] = {
+            "children_of_a": engine.get_memory_node("/a").children,
+            "keyword_x": sorted(engine.find_memories_by_keyword("x")),
+            "total_nodes": engine.backend.get_memory_statistics()["total_nodes"],
+        }
+        engine.backend.close()
+    assert results["filesystem"] == results["sqlite"]
+    assert results["filesystem"]["children_of_a"] == [{"name": "e", "summary": "se"}]
+
+
+def test_forget_keeps_filesystem_byte_counters_exact(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    engine = MemoryEngine(backend_type="filesystem", base_path=str(tmp_path / "memory"))
+    populate(engine)
+    assert engine.forget_memory("/a/d")
+    assert not engine.backend.get_memory_statistics(verify=True)["reconciled"]
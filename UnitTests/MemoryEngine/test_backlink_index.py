@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+🧪 Index des liens entrants du FileSystemBackend
+
+find_nodes_linking_to répond depuis l'index cible → sources (un par type de
+lien) ; forget_memory s'en sert pour nettoyer les liens vers le nœud oublié.
+"""
+
+import pytest
+
+from MemoryEngine.backends.storage_backends import FileSystemBackend
+from MemoryEngine.core.engine import MemoryEngine
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    engine = MemoryEngine(backend_type="filesystem", base_path=str(tmp_path / "memory"))
+    engine.create_memory("/cible", "cible", "s", ["k"])
+    engine.create_memory("/associé", "a", "s", ["k"], links=["/cible"])
+    engine.create_memory("/abstrait", "b", "s", ["k"], transcendence_links=["cible"])
+    engine.create_memory("/concret", "c", "s", ["k"], immanence_links=["/cible/"])
+    engine.create_memory("/isolé", "d", "s", ["k"])
+    yield engine
+    engine.backend.close()
+
+
+def test_backlinks_of_every_link_type(engine):
+    backend = engine.backend
+    assert sorted(backend.find_nodes_linking_to("/cible")) == ["abstrait", "associé", "concret"]
+    assert backend.backlink_indexes["immanence_links"].get("cible") == ["concret"]
+    assert backend.find_nodes_linking_to("/isolé") == []
+
+    # Index persistant : relu tel quel à la réouverture
+    reopened = FileSystemBackend(base_path=str(backend.base_path))
+    assert sorted(reopened.find_nodes_linking_to("cible")) == ["abstrait", "associé", "concret"]
+
+
+def test_rewrite_without_link_drops_backlink(engine):
+    engine.create_memory("/abstrait", "b", "s", ["k"])
+    assert sorted(engine.backend.find_nodes_linking_to("/cible")) == ["associé", "concret"]
+
+
+def test_forget_cleans_incoming_links(engine):
+    assert engine.forget_memory("/cible")
+
+    backend = engine.backend
+    assert backend.find_nodes_linking_to("/cible") == []
+    for path in ("/associé", "/abstrait", "/concret"):
+        node = engine.get_memory_node(path)
+        assert node.linked_memories == []
+        assert not node.metadata.get("transcendence_links")
+        assert not node.metadata.get("immanence_links")
+    assert backend.get_memory_statistics()["total_links"] == 0
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+🧪 Index inversé des mots-clés du FileSystemBackend
+
+find_by_keyword répond depuis l'index persistant, tenu à jour par les
+réécritures et suppressions, et reconstruit depuis le store s'il manque.
+"""
+
+import shutil
+
+import pytest
+
+from MemoryEngine.backends.storage_backends import FileSystemBackend
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path / "store"
+
+
+def test_rewrite_moves_node_between_keywords(store):
+    backend = FileSystemBackend(base_path=str(store))
+    backend.write("/rêve", "contenu", "résumé", ["nuit", "lune"], [], "somatic")
+    backend.write("/veille", "contenu", "résumé", ["lune"], [], "somatic")
+
+    backend.write("/rêve", "contenu", "résumé", ["soleil", "lune"], [], "somatic")
+    assert backend.find_by_keyword("nuit") == []
+    assert backend.find_by_keyword("soleil") == ["rêve"]
+    assert sorted(backend.find_by_keyword("lune")) == ["rêve", "veille"]
+
+    backend.delete("/veille")
+    assert backend.find_by_keyword("lune") == ["rêve"]
+    assert backend.find_by_keyword("inconnu") == []
+
+
+def test_index_survives_reopen_and_is_rebuilt_when_missing(store):
+    backend = FileSystemBackend(base_path=str(store))
+    for index in range(5):
+        backend.write(f"/n{index}", "contenu", "résumé", ["commun", f"k{index}"], [], "somatic")
+
+    reopened = FileSystemBackend(base_path=str(store))
+    assert sorted(reopened.find_by_keyword("commun")) == [f"n{index}" for index in range(5)]
+
+    shutil.rmtree(reopened.keyword_index.index_dir)
+    rebuilt = FileSystemBackend(base_path=str(store))
+    assert rebuilt.keyword_index.is_built()
+    assert sorted(rebuilt.find_by_keyword("commun")) == [f"n{index}" for index in range(5)]
+    assert rebuilt.find_by_keyword("k3") == ["n3"]
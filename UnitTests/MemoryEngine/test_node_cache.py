@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+🧪 Tests du cache LRU des nœuds mémoire (NodeCache)
+
+Invalidation par MemoryEngine (create_memory, forget_memory), compteurs
+d'éviction et isolation des nœuds retournés.
+"""
+
+import pytest
+
+from MemoryEngine.core.engine import MemoryEngine
+from MemoryEngine.core.node_cache import NodeCache
+from MemoryEngine.core.memory_node import FractalMemoryNode
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return MemoryEngine(backend_type="filesystem", base_path=str(tmp_path / "memory"))
+
+
+def cache_stats(engine):
+    return engine.node_cache.get_statistics()
+
+
+def test_read_through_hit_after_miss(engine):
+    engine.create_memory("/a", "racine", "racine", ["a"])
+    assert engine.get_memory_node("/a") is not None
+    assert engine.get_memory_node("/a") is not None
+    stats = cache_stats(engine)
+    assert (stats["misses"], stats["hits"]) == (1, 1)
+
+
+def test_returned_nodes_are_independent(engine):
+    engine.create_memory("/a", "racine", "racine", ["a"])
+    first = engine.get_memory_node("/a")
+    first.keywords.append("modifié")
+    first.metadata["summary"] = "modifié"
+    second = engine.get_memory_node("/a")
+    assert "modifié" not in second.keywords
+    assert second.metadata.get("summary") != "modifié"
+    assert second is not first
+
+
+def test_create_memory_invalidates_node_and_parent(engine):
+    engine.create_memory("/a", "racine", "racine", ["a"])
+    engine.get_memory_node("/a")
+    engine.create_memory("/a/b", "enfant", "enfant", ["b"])
+    assert cache_stats(engine)["invalidations"] >= 1
+
+    parent = engine.get_memory_node("/a")
+    assert [child["name"] for child in parent.children] == ["b"]
+
+    engine.get_memory_node("/a/b")
+    engine.create_memory("/a/b", "enfant v2", "enfant v2", ["b"])
+    assert engine.get_memory_node("/a/b").content == "enfant v2"
+
+
+def test_forget_memory_invalidates(engine):
+    engine.create_memory("/a", "racine", "racine", ["a"])
+    engine.create_memory("/a/b", "enfant", "enfant", ["b"])
+    assert engine.get_memory_node("/a/b") is not None
+    invalidations = cache_stats(engine)["invalidations"]
+
+    assert engine.forget_memory("/a/b")
+    assert cache_stats(engine)["invalidations"] > invalidations
+    # Plus servi par le cache : le backend signale le nœud absent
+    with pytest.raises(FileNotFoundError):
+        engine.get_memory_node("/a/b")
+
+
+def test_eviction_by_entry_count():
+    cache = NodeCache(max_entries=2)
+    for name in ("a", "b", "c"):
+        cache.put(name, FractalMemoryNode(content=name))
+    stats = cache.get_statistics()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert cache.get("a") is None  # le moins récemment utilisé
+    assert cache.get("c").content == "c"
+
+
+def test_eviction_by_bytes_and_oversized_nodes():
+    node = FractalMemoryNode(content="x" * 200)
+    cache = NodeCache(max_entries=100, max_bytes=1)
+    cache.put("trop_gros", node)
+    assert cache.get_statistics()["entries"] == 0
+
+    probe = NodeCache(max_entries=100)
+    probe.put("x", node)
+    size = probe.get_statistics()["bytes"]
+
+    cache = NodeCache(max_entries=100, max_bytes=size * 2)
+    for name in ("a", "b", "c"):
+        cache.put(name, FractalMemoryNode(content="x" * 200))
+    stats = cache.get_statistics()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert stats["bytes"] <= size * 2
+
+
+def test_lru_order_refreshed_on_get():
+    cache = NodeCache(max_entries=2)
+    cache.put("a", FractalMemoryNode(content="a"))
+    cache.put("b", FractalMemoryNode(content="b"))
+    cache.get("a")
+    cache.put("c", FractalMemoryNode(content="c"))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+
+def test_engine_statistics_expose_counters(engine):
+    engine.create_memory("/a", "racine", "racine", ["a"])
+    engine.get_memory_node("/a")
+    stats = engine.get_statistics()["node_cache"]
+    for key in ("hits", "misses", "evictions", "invalidations", "bytes", "entries"):
+        assert key in stats
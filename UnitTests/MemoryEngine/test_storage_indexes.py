@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+🧪 Index persistants du FileSystemBackend
+
+Une écriture n'ajoute qu'en fin de journal (jamais de relecture des
+postings), et retrieve/search ne lisent que les journaux et les fichiers
+nœuds de leurs candidats.
+"""
+
+import pytest
+
+from MemoryEngine.backends.disk_index import DiskInvertedIndex
+from MemoryEngine.backends.storage_backends import FileSystemBackend
+
+STRATA = ["somatic", "cognitive", "metaphysical"]
+NODES = 60
+
+
+def write_node(backend, index, strata=None):
+    backend.write(f"/n{index}", f"contenu {index}", f"résumé {index}",
+                  ["partagé", f"k{index}"], [], strata or STRATA[index % 3])
+
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    backend = FileSystemBackend(base_path=str(tmp_path / "store"))
+    for index in range(NODES):
+        write_node(backend, index)
+    return backend
+
+
+@pytest.fixture
+def reads(backend, monkeypatch):
+    """Espionne les journaux d'index et les fichiers nœuds lus."""
+    seen = {"keys": [], "nodes": []}
+    load, read_raw = DiskInvertedIndex._load, FileSystemBackend._read_raw
+
+    def spy_load(index, key):
+        seen["keys"].append(key)
+        return load(index, key)
+
+    def spy_read_raw(self, path):
+        seen["nodes"].append(path)
+        return read_raw(self, path)
+
+    monkeypatch.setattr(DiskInvertedIndex, "_load", spy_load)
+    monkeypatch.setattr(FileSystemBackend, "_read_raw", spy_read_raw)
+    return seen
+
+
+def test_writes_append_without_reading_postings(backend, reads):
+    shared = backend.keyword_index._key_file("partagé")
+    sizes = [shared.stat().st_size]
+    for index in range(NODES, NODES + 20):
+        write_node(backend, index)
+        sizes.append(shared.stat().st_size)
+
+    assert reads["keys"] == []
+    growth = [after - before for before, after in zip(sizes, sizes[1:])]
+    # Coût constant par écriture, quelle que soit la taille de la posting
+    assert max(growth) - min(growth) <= 2
+    assert len(backend.find_by_keyword("partagé")) == NODES + 20
+
+
+def test_retrieve_reads_only_its_candidate(backend, reads):
+    node_id = backend._read_raw("/n17")["id"]
+    reads["keys"].clear()
+    reads["nodes"].clear()
+
+    assert backend.retrieve(node_id).metadata["path"] == "/n17"
+    assert reads["keys"] == [node_id]
+    assert reads["nodes"] == ["n17"]
+
+
+def test_search_reads_only_candidates(backend, reads):
+    results = backend.search(strata="cognitive")
+    assert len(results) == NODES // 3
+    assert sorted(reads["nodes"]) == sorted(f"n{index}" for index in range(1, NODES, 3))
+
+    reads["nodes"].clear()
+    results = backend.search(metadata_filter={"path": "/n5"})
+    assert [node["metadata"]["path"] for node in results] == ["/n5"]
+    assert reads["nodes"] == ["n5"]
+
+    reads["nodes"].clear()
+    results = backend.search(strata="somatic", metadata_filter={"strata": "cognitive"})
+    assert results == []
+    assert reads["nodes"] == []
+
+
+def test_unique_metadata_fields_are_not_indexed(backend):
+    for field, value in (("path", "/n3"), ("summary", "résumé 3"), ("strata", "somatic")):
+        assert backend.metadata_index.get(backend._metadata_key(field, value)) == []
+    assert backend.metadata_index.keys() == []
+
+
+def test_search_without_criteria_includes_unknown_strata(backend):
+    write_node(backend, 999, strata="onirique")
+
+    paths = {node["metadata"]["path"] for node in backend.search()}
+    assert "/n999" in paths
+    assert len(paths) == NODES + 1
+
+
+def test_log_compaction_and_reload(tmp_path):
+    index = DiskInvertedIndex(tmp_path / "index")
+    for round_ in range(100):
+        index.update_many([("a", [], ["k"]), ("b", [], ["k"])])
+        index.update_many([("a", ["k"], [])])
+    assert index.get("k") == ["b"]
+
+    key_file = index._key_file("k")
+    # Le journal a été compacté : en-tête + une seule valeur vivante
+    assert len(key_file.read_text(encoding="utf-8").splitlines()) == 2
+    assert DiskInvertedIndex(tmp_path / "index").get("k") == ["b"]
+
+
+def test_truncated_log_line_is_ignored(tmp_path):
+    index = DiskInvertedIndex(tmp_path / "index")
+    index.add("k", "a")
+    with open(index._key_file("k"), "a", encoding="utf-8") as f:
+        f.write('["+", "b')
+    index.add("k", "c")
+
+    assert index.get("k") == ["a", "c"]
+
+
+def test_previous_index_format_is_rebuilt(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    backend = FileSystemBackend(base_path=str(tmp_path / "store"))
+    write_node(backend, 1)
+    for index in backend.indexes.values():
+        (index.index_dir / DiskInvertedIndex.BUILT_MARKER).unlink()
+        (index.index_dir / ".built").touch()
+
+    reopened = FileSystemBackend(base_path=str(tmp_path / "store"))
+    assert reopened.find_by_keyword("k1") == ["n1"]
+    assert all(index.is_built() for index in reopened.indexes.values())
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+🧪 Compteurs maintenus du store (StoreStatistics)
+
+Les statistiques sont tenues à jour à l'écriture et à la suppression,
+persistées à côté des index, et réconciliées par un rescan sur demande.
+"""
+
+import os
+
+import pytest
+
+from MemoryEngine.backends.storage_backends import FileSystemBackend
+from MemoryEngine.core.engine import MemoryEngine
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    engine = MemoryEngine(backend_type="filesystem", base_path=str(tmp_path / "memory"))
+    engine.create_memory("/c", "concept", "sc", ["k"], strata="metaphysical")
+    engine.create_memory("/b", "idée", "sb", ["k"], strata="cognitive", transcendence_links=["/c"])
+    engine.create_memory("/a", "fait", "sa", ["k"], links=["/b"], transcendence_links=["/b"])
+    yield engine
+    engine.backend.close()
+
+
+def scanned_bytes(backend):
+    return sum(os.path.getsize(node_file) for node_file in backend._iter_node_files())
+
+
+def test_counters_follow_writes_rewrites_and_deletes(engine):
+    backend = engine.backend
+    stats = backend.get_memory_statistics()
+    assert stats["total_nodes"] == 3
+    assert stats["nodes_by_strata"] == {"somatic": 1, "cognitive": 1, "metaphysical": 1}
+    assert stats["links_by_type"]["transcendence_links"] == 2
+    assert stats["total_bytes"] == scanned_bytes(backend)
+
+    engine.create_memory("/c", "concept réécrit, plus long", "sc", ["k"], strata="cognitive")
+    backend.delete("/a")
+    stats = backend.get_memory_statistics()
+    assert stats["total_nodes"] == 2
+    assert stats["nodes_by_strata"] == {"somatic": 0, "cognitive": 2, "metaphysical": 0}
+    assert stats["links_by_type"]["transcendence_links"] == 1
+    assert stats["total_bytes"] == scanned_bytes(backend)
+    assert backend.get_memory_statistics(verify=True)["reconciled"] is False
+
+
+def test_counters_are_persisted_and_drift_is_reconciled(engine):
+    base_path = engine.backend.base_path
+    reopened = FileSystemBackend(base_path=str(base_path))
+    assert reopened.statistics.loaded
+    assert reopened.get_memory_statistics() == engine.backend.get_memory_statistics()
+
+    reopened.statistics.record_node({"strata": "somatic"}, 10)
+    verified = reopened.get_memory_statistics(verify=True)
+    assert verified["reconciled"] is True
+    assert verified["total_nodes"] == 3
+    assert FileSystemBackend(base_path=str(base_path)).get_memory_statistics()["total_nodes"] == 3
+
+
+def test_engine_statistics_report_backend_counters(engine):
+    stats = engine.get_statistics()
+    assert stats["total_nodes"] == 3
+    assert stats["nodes_by_strata"]["cognitive"] == 1
+    assert stats["total_links"] == engine.backend.get_memory_statistics()["total_links"]
+    assert stats["advanced_stats"] is True
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+🧪 TemporalChain : recherches par dichotomie sur les fichiers de clés triés
+
+Les recherches par uuid et par chemin ne chargent pas la chaîne en mémoire :
+seule la queue non fusionnée (au plus TAIL_LIMIT records) y est gardée.
+"""
+
+import uuid
+
+import pytest
+
+from MemoryEngine.core import temporal_chain
+from MemoryEngine.core.temporal_chain import TemporalChain
+
+
+def make_entries(count, start_seq=1, paths=None):
+    return [{"seq": start_seq + index, "uuid": str(uuid.uuid4()), "timestamp": f"2025-01-01T00:00:{index % 60:02d}",
+             "fractal_path": paths[index] if paths else f"/mémoire/{start_seq + index}",
+             "strata": "somatic", "intent": None}
+            for index in range(count)]
+
+
+@pytest.fixture
+def chain(tmp_path):
+    chain = TemporalChain(tmp_path / "chain")
+    yield chain
+    chain.close()
+
+
+def test_lookups_after_rebuild_use_key_files_only(chain, tmp_path):
+    entries = make_entries(500)
+    chain.rebuild(entries, last_seq=500)
+    chain.close()
+
+    reopened = TemporalChain(tmp_path / "chain")
+    assert reopened.is_consistent(500, 500)
+    for position in (0, 137, 499):
+        assert reopened.find_uuid(entries[position]["uuid"]) == position
+        assert reopened.find_path(entries[position]["fractal_path"]) == position
+    assert reopened.find_uuid(str(uuid.uuid4())) is None
+    assert reopened.find_path("/absent") is None
+    # Rien n'est chargé au-delà de la queue (vide ici)
+    assert reopened._tail_uuid == {} and reopened._tail_path == {}
+    reopened.close()
+
+
+def test_latest_position_wins_for_repeated_paths(chain):
+    paths = ["/a", "/b", "/a", "/c", "/a"]
+    chain.rebuild(make_entries(5, paths=paths), last_seq=5)
+    assert chain.find_path("/a") == 4
+
+    chain.append(make_entries(2, start_seq=6, paths=["/b", "/d"]))
+    assert chain.find_path("/b") == 5
+    assert chain.find_path("/a") == 4
+
+
+def test_tail_is_merged_past_the_limit(chain, monkeypatch):
+    monkeypatch.setattr(temporal_chain, "TAIL_LIMIT", 8)
+    entries = make_entries(10)
+    chain.rebuild(entries[:2], last_seq=2)
+    chain.find_uuid(entries[0]["uuid"])
+
+    for index in range(2, 10):
+        chain.append([entries[index]])
+    assert chain.sorted_count == 2
+    assert len(chain._tail_uuid) == 8
+
+    more = make_entries(1, start_seq=11)
+    chain.append(more)
+    assert chain.sorted_count == chain.count == 11
+    assert chain._tail_uuid == {}
+    assert chain.is_consistent(11, 11)
+    for position, entry in enumerate(entries + more):
+        assert chain.find_uuid(entry["uuid"]) == position
+        assert chain.find_path(entry["fractal_path"]) == position
+
+
+def test_chain_without_key_files_is_merged_on_first_lookup(chain, tmp_path, monkeypatch):
+    monkeypatch.setattr(temporal_chain, "TAIL_LIMIT", 4)
+    entries = make_entries(20)
+    chain.rebuild(entries, last_seq=20)
+    chain.close()
+    # Chaîne d'un format antérieur : pas de fichiers de clés ni de "sorted"
+    for name in ("chain.uuid", "chain.path"):
+        (tmp_path / "chain" / name).unlink()
+    reopened = TemporalChain(tmp_path / "chain")
+    reopened.meta.pop("sorted")
+    reopened._save_meta()
+
+    reopened = TemporalChain(tmp_path / "chain")
+    assert reopened.is_consistent(20, 20)
+    assert reopened.find_uuid(entries[7]["uuid"]) == 7
+    assert reopened.sorted_count == 20
+    assert reopened._tail_uuid == {}
+    reopened.close()
+
+
+def test_truncated_key_file_is_inconsistent(chain, tmp_path):
+    chain.rebuild(make_entries(10), last_seq=10)
+    chain.close()
+    key_file = tmp_path / "chain" / "chain.path"
+    key_file.write_bytes(key_file.read_bytes()[:-5])
+    assert not TemporalChain(tmp_path / "chain").is_consistent(10, 10)
+
+
+def test_path_key_collisions_are_resolved_on_payload(chain, monkeypatch):
+    monkeypatch.setattr(temporal_chain, "path_key", lambda path: b"\x00" * 16)
+    chain.rebuild(make_entries(4, paths=["/a", "/b", "/c", "/b"]), last_seq=4)
+
+    assert chain.find_path("/a") == 0
+    assert chain.find_path("/c") == 2
+    assert chain.find_path("/b") == 3
+    assert chain.find_path("/z") is None
+    assert chain.count_path("/b") == 2
+    chain.append(make_entries(1, start_seq=5, paths=["/b"]))
+    assert chain.count_path("/b") == 3
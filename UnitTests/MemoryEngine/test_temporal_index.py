@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+🧪 TemporalIndex : timeline par jour, intervalles de temps et statistiques
+
+Les entrées compactées et récentes sont vues ensemble ; une suppression
+rejouée depuis le journal (pas encore compactée) disparaît des recherches
+comme des statistiques.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from MemoryEngine.core import temporal_index as temporal_index_module
+from MemoryEngine.core.temporal_index import TemporalIndex
+
+START = datetime(2025, 8, 10, 12, 0, 0)
+
+
+class FakeClock:
+    """Horloge à pas fixe : une entrée toutes les 12 heures."""
+    current = START
+
+    @classmethod
+    def now(cls):
+        value = cls.current
+        cls.current += timedelta(hours=12)
+        return value
+
+
+@pytest.fixture
+def index(tmp_path, monkeypatch):
+    FakeClock.current = START
+    monkeypatch.setattr(temporal_index_module, "datetime", FakeClock)
+    index = TemporalIndex("filesystem", str(tmp_path), compact_threshold=1000)
+    yield index
+    index.close()
+
+
+def record(index, count, start=0):
+    index.auto_record_many([(f"/n{number}", {"strata": "somatic" if number % 2 else "cognitive",
+                                             "keywords": [f"k{number}"]})
+                            for number in range(start, start + count)])
+
+
+def test_time_range_spans_compacted_and_recent_entries(index):
+    record(index, 6)
+    index.compact()
+    record(index, 4, start=6)
+
+    # 2025-08-11T00:00 → 2025-08-13T00:00 : /n1 à /n4
+    paths = [entry["fractal_path"] for entry in
+             index.search_by_time_range("2025-08-11T00:00:00", "2025-08-13T00:00:00")]
+    assert paths == ["/n1", "/n2", "/n3", "/n4"]
+
+    # Préfixe de date : /n7 (00:00) et /n8 (12:00), entrées récentes
+    assert index.search_by_timeline("2025-08-14") == ["/n7", "/n8"]
+    assert index.search_by_timeline("2025-08-13T00:00:00/2025-08-14T00:00:00") == ["/n5", "/n6"]
+    assert [entry["fractal_path"] for entry in index.last_entries(3)] == ["/n9", "/n8", "/n7"]
+    assert [entry["fractal_path"] for entry in index.last_entries(2, strata="cognitive")] == ["/n8", "/n6"]
+
+
+def test_statistics_exclude_pending_removals(index, tmp_path):
+    record(index, 5)
+    index.compact()
+    record(index, 1, start=0)  # /n0 à nouveau, non compacté
+    index.journal.append({"op": "remove", "path": "/n0"})
+    index.journal.append({"op": "remove", "path": "/n3"})
+    index.close()
+
+    # Rejeu du journal : les suppressions attendent la compaction
+    reopened = TemporalIndex("filesystem", str(tmp_path), compact_threshold=1000)
+    try:
+        assert reopened.removed_paths == {"/n0", "/n3"}
+        live = [entry["fractal_path"] for entry in reopened.iter_timeline()]
+        assert live == ["/n1", "/n2", "/n4"]
+        assert reopened.get_statistics()["total_entries"] == len(live)
+
+        reopened.compact()
+        assert reopened.get_statistics()["total_entries"] == len(live)
+    finally:
+        reopened.close()
+
+
+def test_statistics_count_recent_entries(index):
+    record(index, 3)
+    stats = index.get_statistics()
+    assert stats["total_entries"] == 3
+    assert stats["strata_count"] == 2
+    assert stats["keyword_count"] == 3
+    assert stats["latest_entry"]["fractal_path"] == "/n2"
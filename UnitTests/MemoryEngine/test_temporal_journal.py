@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+🧪 Journal du TemporalIndex : commit groupé, relecture et compaction
+
+Les mutations sont ajoutées au journal puis repliées dans les snapshots ;
+un crash avant ou pendant la compaction ne perd ni ne duplique d'entrée.
+"""
+
+from MemoryEngine.core import temporal_journal
+from MemoryEngine.core.temporal_index import TemporalIndex
+from MemoryEngine.core.temporal_journal import TemporalJournal
+
+
+def record(index, start, count):
+    index.auto_record_many([(f"/n{number}", {"strata": "cognitive", "keywords": ["commun", f"k{number}"]})
+                            for number in range(start, start + count)])
+
+
+def paths(index):
+    return [entry["fractal_path"] for entry in index.iter_timeline()]
+
+
+def test_fsync_is_grouped_by_batch(tmp_path, monkeypatch):
+    syncs = []
+    monkeypatch.setattr(temporal_journal.os, "fsync", syncs.append)
+    journal = TemporalJournal(tmp_path / "journal.log", fsync_interval=3600, batch_size=4)
+
+    for number in range(10):
+        journal.append({"op": "record", "n": number})
+    assert len(syncs) == 2
+    journal.close()
+    assert len(syncs) == 3
+    assert [record["n"] for record in TemporalJournal(tmp_path / "journal.log").replay()] == list(range(10))
+
+
+def test_truncated_last_line_is_dropped_on_replay(tmp_path):
+    journal = TemporalJournal(tmp_path / "journal.log", fsync_interval=0)
+    journal.append_many([{"n": 1}, {"n": 2}])
+    journal.close()
+    with open(tmp_path / "journal.log", "a", encoding="utf-8") as f:
+        f.write('{"n": 3')
+
+    reopened = TemporalJournal(tmp_path / "journal.log")
+    assert [record["n"] for record in reopened.replay()] == [1, 2]
+    assert reopened.record_count == 2
+    reopened.append({"n": 4})
+    reopened.close()
+    assert [record["n"] for record in TemporalJournal(tmp_path / "journal.log").replay()] == [1, 2, 4]
+
+
+def test_uncompacted_records_are_replayed_after_crash(tmp_path):
+    index = TemporalIndex("filesystem", str(tmp_path), compact_threshold=1000)
+    record(index, 0, 3)
+    # Crash : ni compaction ni close, le journal a seulement été flushé
+    recovered = TemporalIndex("filesystem", str(tmp_path), compact_threshold=1000)
+    try:
+        assert paths(recovered) == ["/n0", "/n1", "/n2"]
+        assert recovered.search_by_keywords("k1") == ["/n1"]
+        assert recovered.get_statistics()["total_entries"] == 3
+    finally:
+        recovered.close()
+        index.close()
+
+
+def test_threshold_compacts_journal_into_snapshot(tmp_path):
+    index = TemporalIndex("filesystem", str(tmp_path), compact_threshold=4)
+    record(index, 0, 3)
+    assert index.journal.record_count == 3
+    record(index, 3, 2)
+    assert index.journal.record_count == 0
+    assert index.recent_entries == []
+    index.close()
+
+    reopened = TemporalIndex("filesystem", str(tmp_path), compact_threshold=4)
+    try:
+        assert paths(reopened) == [f"/n{number}" for number in range(5)]
+        assert sorted(reopened.temporal_index["keyword_index"]["commun"]) == [f"/n{number}" for number in range(5)]
+    finally:
+        reopened.close()
+
+
+def test_interrupted_compaction_does_not_duplicate_entries(tmp_path, monkeypatch):
+    index = TemporalIndex("filesystem", str(tmp_path), compact_threshold=1000)
+    record(index, 0, 3)
+    # Crash entre l'écriture du snapshot et la remise à zéro du journal
+    monkeypatch.setattr(index.journal, "reset", lambda: None)
+    index.compact()
+    index.close()
+
+    reopened = TemporalIndex("filesystem", str(tmp_path), compact_threshold=1000)
+    try:
+        assert paths(reopened) == ["/n0", "/n1", "/n2"]
+        assert reopened.temporal_index["keyword_index"]["commun"] == ["/n0", "/n1", "/n2"]
+        record(reopened, 3, 1)
+        assert paths(reopened)[-1] == "/n3"
+        assert reopened.get_statistics()["total_entries"] == 4
+    finally:
+        reopened.close()
+
+
+def test_removal_is_journaled_and_compacted(tmp_path):
+    index = TemporalIndex("filesystem", str(tmp_path), compact_threshold=1000)
+    record(index, 0, 2)
+    index._remove_from_all_indexes("/n0")
+    index.journal.append({"op": "remove", "path": "/n0"})
+    index.compact()
+    index.close()
+
+    reopened = TemporalIndex("filesystem", str(tmp_path), compact_threshold=1000)
+    try:
+        assert paths(reopened) == ["/n1"]
+        assert reopened.temporal_index["keyword_index"]["commun"] == ["/n1"]
+    finally:
+        reopened.close()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+⏱️ Benchmark du graphe d'imports sur un arbre de dépendances en diamant
+
+Génère un projet synthétique de N couches de W modules où chaque module
+importe tous les modules de la couche suivante : le nombre de chemins croît
+en W^N, alors que l'ImportAnalyzer mémoïsé ne doit parser chaque fichier
+qu'une seule fois et rester linéaire en fichiers + imports. Avec --workers,
+le parsing de chaque niveau est réparti sur un pool de processus.
+
+Usage:
+    python UnitTests/Partitioning/ImportAnalyzer/benchmark_import_graph.py --width 4 --layers 5 10 20 40
+    python UnitTests/Partitioning/ImportAnalyzer/benchmark_import_graph.py --width 64 --layers 10 --workers 4
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+# Ajouter le répertoire racine pour les imports Core
+sys.path.append('.')
+
+from Core.Partitioner.analyzers.import_analyzer import ImportAnalyzer
+
+
+def generate_diamond_project(root: Path, layers: int, width: int) -> Path:
+    """Crée le projet synthétique et retourne le fichier d'entrée."""
+    package = root / "diamond"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+
+    for layer in range(layers):
+        for index in range(width):
+            lines = []
+            if layer + 1 < layers:
+                lines = [f"from diamond.m{layer + 1}_{target} import VALUE as V{target}"
+                         for target in range(width)]
+            lines.append(f"VALUE = {layer * width + index}")
+            (package / f"m{layer}_{index}.py").write_text("\n".join(lines) + "\n")
+
+    entry = package / "main.py"
+    entry.write_text("\n".join(f"from diamond.m0_{target} import VALUE as V{target}"
+                               for target in range(width)) + "\n")
+    return entry
+
+
+def run(layers: int, width: int, workers: int = 1) -> dict:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        entry = generate_diamond_project(root, layers, width)
+
+        analyzer = ImportAnalyzer(project_root=str(root), workers=workers)
+        start = time.perf_counter()
+        report = analyzer.analyze_files([str(entry)], max_depth=layers + 1)
+        duration = time.perf_counter() - start
+
+    files = layers * width + 1
+    return {
+        "layers": layers,
+        "files": files,
+        "analyzed": report['statistics']['files_analyzed'],
+        "parses": analyzer.parse_count,
+        "paths": width ** layers,
+        "duration": duration,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ImportAnalyzer sur dépendances en diamant")
+    parser.add_argument("--width", type=int, default=4, help="Modules par couche")
+    parser.add_argument("--layers", type=int, nargs="+", default=[5, 10, 20, 40],
+                        help="Nombres de couches à mesurer")
+    parser.add_argument("--workers", type=int, default=1, help="Processus de parsing (1 = série)")
+    args = parser.parse_args()
+
+    print(f"{'couches':>8} {'fichiers':>9} {'analysés':>9} {'parses':>7} {'chemins':>12} {'durée (s)':>10} {'ms/fichier':>11}")
+    for layers in args.layers:
+        result = run(layers, args.width, args.workers)
+        print(f"{result['layers']:>8} {result['files']:>9} {result['analyzed']:>9} "
+              f"{result['parses']:>7} {result['paths']:>12.2e} {result['duration']:>10.3f} "
+              f"{1000 * result['duration'] / result['files']:>11.2f}")
+        assert result['parses'] == result['files'], "Un fichier a été parsé plusieurs fois"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+🧪 IndexedGraph : composantes fortement connexes, chemins et couches
+
+Les parcours sont itératifs : une chaîne plus profonde que la limite de
+récursion de Python ne doit rien changer aux résultats.
+"""
+
+import sys
+
+from Core.Partitioner.analyzers.graph_index import IndexedGraph
+from Core.Partitioner.analyzers.import_analyzer import DependencyGraph, ImportAnalysisResult
+
+EDGES = [
+    ("main", "a"), ("a", "b"), ("b", "c"), ("c", "a"),  # cycle a → b → c → a
+    ("main", "utils"), ("b", "utils"), ("utils", "base"),
+    ("boucle", "boucle"),  # auto-import
+]
+
+
+def graph():
+    return IndexedGraph.from_edges(EDGES, nodes=["isolé"])
+
+
+def test_strongly_connected_components_and_cycles():
+    index = graph()
+    assert index.strongly_connected_components() == [["a", "b", "c"], ["boucle"]]
+    assert len(index.strongly_connected_components(include_trivial=True)) == 6
+    assert index.cycles() == [["a", "b", "c", "a"], ["boucle", "boucle"]]
+
+
+def test_duplicate_edges_are_ignored():
+    index = graph()
+    assert not index.add_edge("a", "b")
+    assert index.edge_count == len(EDGES)
+    assert len(index) == 8
+
+
+def test_shortest_path_and_reachability():
+    index = graph()
+    assert index.shortest_path("main", "base") == ["main", "utils", "base"]
+    assert index.shortest_path("c", "utils") == ["c", "a", "b", "utils"]
+    assert index.shortest_path("base", "main") == []
+    assert index.shortest_path("main", "inconnu") == []
+
+    assert index.reachable("a") == {"a", "b", "c", "utils", "base"}
+    assert index.reachable("utils", reverse=True) == {"main", "a", "b", "c"}
+    assert index.reachable("isolé") == set()
+
+
+def test_topological_layers_put_dependencies_first():
+    layers = graph().topological_layers()
+    assert layers == [["base", "boucle", "isolé"], ["utils"], ["a", "b", "c"], ["main"]]
+
+
+def test_components_are_recomputed_after_mutation():
+    index = graph()
+    assert index.strongly_connected_components() == [["a", "b", "c"], ["boucle"]]
+    index.add_edge("base", "main")
+    assert index.strongly_connected_components() == [["a", "b", "base", "c", "main", "utils"], ["boucle"]]
+
+
+def test_deep_chain_does_not_recurse():
+    depth = sys.getrecursionlimit() * 5
+    index = IndexedGraph.from_edges((f"n{i}", f"n{i + 1}") for i in range(depth))
+    index.add_edge(f"n{depth}", "n0")
+
+    assert len(index.strongly_connected_components()) == 1
+    assert len(index.shortest_path("n0", f"n{depth}")) == depth + 1
+    assert len(index.cycles()[0]) == depth + 2
+
+
+def test_dependency_graph_delegates_to_the_index():
+    dependency_graph = DependencyGraph()
+    for source, target in EDGES:
+        for node in (source, target):
+            dependency_graph.add_node(node, ImportAnalysisResult(file_path=node))
+        dependency_graph.add_edge(source, target)
+    dependency_graph.add_edge("a", "b")
+
+    assert len(dependency_graph.edges) == len(EDGES)
+    assert dependency_graph.detect_cycles() == [["a", "b", "c", "a"], ["boucle", "boucle"]]
+    assert dependency_graph.dependents_of("base") == {"main", "a", "b", "c", "utils"}
+    assert dependency_graph.topological_layers()[0] == ["base", "boucle"]
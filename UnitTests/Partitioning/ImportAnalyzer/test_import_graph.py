@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+🧪 Graphe d'imports mémoïsé de l'ImportAnalyzer
+
+Chaque fichier est parsé une seule fois par parcours, même atteint par
+plusieurs chemins ; une nouvelle analyse refait les résolutions (l'arborescence
+a pu changer) sans reparser les fichiers inchangés.
+"""
+
+import os
+
+import pytest
+
+from Core.Partitioner.analyzers.import_analyzer import ImportAnalyzer
+
+
+def write(root, relative_path, content=""):
+    path = root / relative_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    root = tmp_path / "projet"
+    write(root, "pkg/__init__.py")
+    # Diamant : main → gauche, droite → base
+    write(root, "pkg/gauche.py", "from pkg.base import socle\n")
+    write(root, "pkg/droite.py", "from pkg.base import socle\n")
+    write(root, "pkg/base.py", "def socle():\n    pass\n")
+    main = write(root, "main.py", "from pkg.gauche import g\nfrom pkg.droite import d\n")
+    return root, main
+
+
+def test_diamond_dependencies_are_parsed_once(project):
+    root, main = project
+    analyzer = ImportAnalyzer(project_root=str(root))
+    analyzer.analyze_files([main])
+
+    graph = analyzer.dependency_graph
+    base = str(root / "pkg" / "base.py")
+    assert base in graph.nodes
+    assert analyzer.parse_count == len(graph.nodes) == 4
+    assert graph.file_depths[base] == 2
+    assert graph.shortest_path(main, base)[0] == main
+
+
+def test_new_run_resolves_again_without_reparsing(project):
+    root, main = project
+    write(root, "outils.py", "from pkg.manquant import absent\n")
+    outils = str(root / "outils.py")
+    analyzer = ImportAnalyzer(project_root=str(root))
+    analyzer.analyze_files([outils])
+    assert list(analyzer.dependency_graph.nodes) == [outils]
+
+    # Le module importé apparaît entre deux analyses
+    manquant = write(root, "pkg/manquant.py", "def absent():\n    pass\n")
+    parsed = analyzer.parse_count
+    analyzer.analyze_files([outils])
+
+    assert manquant in analyzer.dependency_graph.nodes
+    assert (outils, manquant) in analyzer.dependency_graph.edges
+    # Seul le nouveau fichier est parsé : outils.py n'a pas changé
+    assert analyzer.parse_count == parsed + 1
+
+
+def test_edited_file_is_reparsed_on_next_run(project):
+    root, main = project
+    analyzer = ImportAnalyzer(project_root=str(root))
+    analyzer.analyze_files([main])
+    parsed = analyzer.parse_count
+
+    write(root, "main.py", "from pkg.base import socle\n")
+    mtime = os.path.getmtime(main) + 5
+    os.utime(main, (mtime, mtime))
+    analyzer.analyze_files([main])
+
+    assert analyzer.parse_count == parsed + 1
+    assert analyzer.dependency_graph.nodes[main].local_imports == ["pkg.base.socle"]
+    assert analyzer.dependency_graph.file_depths[str(root / "pkg" / "base.py")] == 1
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+🧪 Index incrémental des modules (ModuleIndex)
+
+L'index est construit une fois, relu depuis le disque aux démarrages
+suivants, et seuls les dossiers dont le mtime a changé sont relus.
+"""
+
+import os
+import shutil
+
+import pytest
+
+from Core.Partitioner.resolvers.import_resolver import ImportResolver
+from Core.Partitioner.resolvers.module_index import ModuleIndex
+
+
+def write(path, content=""):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def bump_dir_mtime(directory):
+    """Les mtimes de dossier n'avancent pas toujours d'un tick entre deux écritures rapides."""
+    mtime = os.stat(directory).st_mtime + 5
+    os.utime(directory, (mtime, mtime))
+
+
+@pytest.fixture
+def root(tmp_path):
+    root = tmp_path / "projet"
+    write(root / "pkg" / "__init__.py")
+    write(root / "pkg" / "outils.py", "def outil():\n    pass\n")
+    write(root / "pkg" / "sous" / "__init__.py")
+    write(root / "pkg" / "sous" / "profond.py")
+    write(root / "pkg" / "__pycache__" / "ignore.py")
+    write(root / "main.py", "from pkg.outils import outil\n")
+    return root
+
+
+def index_for(root):
+    return ModuleIndex(str(root), refresh_interval=0)
+
+
+def test_build_maps_module_names_to_files(root):
+    index = index_for(root)
+    assert index.lookup("pkg") == str(root / "pkg" / "__init__.py")
+    assert index.lookup("pkg.sous.profond") == str(root / "pkg" / "sous" / "profond.py")
+    assert index.lookup("main") == str(root / "main.py")
+    assert index.lookup("pkg.__pycache__.ignore") is None
+    assert (root / ".shadeos" / "module_index.json").exists()
+
+
+def test_persisted_index_is_reloaded_without_rebuild(root, monkeypatch):
+    index_for(root).ensure_loaded()
+    monkeypatch.setattr(ModuleIndex, "rebuild", lambda self: pytest.fail("index reconstruit"))
+
+    reloaded = index_for(root)
+    assert reloaded.lookup("pkg.outils") == str(root / "pkg" / "outils.py")
+
+
+def test_refresh_rescans_only_changed_directories(root):
+    index = index_for(root)
+    index.ensure_loaded()
+
+    write(root / "pkg" / "sous" / "nouveau.py")
+    bump_dir_mtime(root / "pkg" / "sous")
+    assert index.refresh(force=True) == 1
+    assert index.lookup("pkg.sous.nouveau") == str(root / "pkg" / "sous" / "nouveau.py")
+
+    (root / "pkg" / "outils.py").unlink()
+    write(root / "pkg" / "neuf" / "module.py")
+    bump_dir_mtime(root / "pkg")
+    assert index.refresh(force=True) == 1
+    assert index.lookup("pkg.outils") is None
+    # Un nouveau sous-dossier est parcouru entièrement
+    assert index.lookup("pkg.neuf.module") == str(root / "pkg" / "neuf" / "module.py")
+
+    shutil.rmtree(root / "pkg" / "sous")
+    index.refresh(force=True)
+    assert index.lookup("pkg.sous.profond") is None
+    assert "pkg/sous" not in index.dir_mtimes
+
+
+def test_resolver_resolves_through_the_index(root):
+    resolver = ImportResolver(project_root=str(root), module_index=index_for(root))
+    # Le dernier élément est le nom importé (from pkg.outils import outil)
+    assert resolver.resolve_import("pkg.outils.outil", str(root / "main.py")) == str(root / "pkg" / "outils.py")
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+🧪 Parsing parallèle du graphe d'imports
+
+Avec plusieurs workers, chaque niveau du parcours est parsé dans un pool de
+processus ; le graphe obtenu est identique à celui de l'analyse en série.
+"""
+
+import pytest
+
+from Core.Partitioner.analyzers.import_analyzer import ImportAnalyzer
+from Core.Partitioner.resolvers.import_resolver import ImportResolver
+from UnitTests.Partitioning.ImportAnalyzer.benchmark_import_graph import generate_diamond_project
+
+LAYERS, WIDTH = 3, 5
+
+
+@pytest.fixture
+def diamond(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    root = tmp_path / "projet"
+    return root, str(generate_diamond_project(root, LAYERS, WIDTH))
+
+
+def analyze(root, entry, workers):
+    analyzer = ImportAnalyzer(project_root=str(root), workers=workers)
+    analyzer.analyze_files([entry], max_depth=LAYERS + 1)
+    graph = analyzer.dependency_graph
+    return analyzer, {
+        "nodes": list(graph.nodes),
+        "edges": list(graph.edges),
+        "depths": dict(graph.file_depths),
+        "local_imports": {path: node.local_imports for path, node in graph.nodes.items()},
+    }
+
+
+def test_parallel_graph_matches_serial_graph(diamond):
+    root, entry = diamond
+    serial_analyzer, serial = analyze(root, entry, workers=1)
+    parallel_analyzer, parallel = analyze(root, entry, workers=2)
+
+    assert parallel == serial
+    # Le pool a bien servi (pas de retour au mode série)
+    assert parallel_analyzer.workers == 2
+    assert len(serial["nodes"]) == LAYERS * WIDTH + 1
+    # Chaque fichier n'est parsé qu'une fois, dans le pool ou en série
+    assert parallel_analyzer.parse_count == serial_analyzer.parse_count == LAYERS * WIDTH + 1
+    assert parallel_analyzer.stats['local_imports'] == serial_analyzer.stats['local_imports']
+
+
+def test_small_levels_stay_serial(diamond, monkeypatch):
+    root, entry = diamond
+    analyzer = ImportAnalyzer(project_root=str(root), workers=2)
+    analyzer.parallel_min_batch = WIDTH + 1
+    monkeypatch.setattr("Core.Partitioner.analyzers.import_analyzer.ProcessPoolExecutor",
+                        lambda *args, **kwargs: pytest.fail("pool lancé pour un petit niveau"))
+
+    analyzer.analyze_files([entry], max_depth=LAYERS + 1)
+    assert len(analyzer.dependency_graph.nodes) == LAYERS * WIDTH + 1
+
+
+def test_resolver_recursive_analysis_is_independent_of_workers(diamond):
+    root, entry = diamond
+    results = []
+    for workers in (1, 2):
+        dependencies = ImportResolver(project_root=str(root)).analyze_recursive_dependencies([entry], workers=workers)
+        results.append({path: sorted(node.dependencies) for path, node in dependencies.items()})
+
+    assert results[0] == results[1]
+    assert len(results[0]) == LAYERS * WIDTH + 1
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+🧪 Cache disque des analyses d'imports (PersistentImportCache)
+
+Les entrées sont clés par hash du contenu : un simple touch les garde, une
+modification les invalide avec leurs dépendants, et une nouvelle invocation
+de l'ImportAnalyzer ne reparse que les fichiers réellement modifiés.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from Core.Partitioner.analyzers.import_analysis_cache import PersistentImportCache
+from Core.Partitioner.analyzers.import_analyzer import ImportAnalyzer
+
+
+def write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return str(path)
+
+
+def bump_mtime(file_path, seconds=5):
+    mtime = os.path.getmtime(file_path) + seconds
+    os.utime(file_path, (mtime, mtime))
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    root = tmp_path / "projet"
+    write(root / "pkg" / "__init__.py", "")
+    files = {
+        "c": write(root / "pkg" / "c.py", "VALEUR = 1\n"),
+        "b": write(root / "pkg" / "b.py", "from pkg.c import VALEUR\n"),
+        "a": write(root / "pkg" / "a.py", "from pkg.b import VALEUR\n"),
+    }
+    return root, files
+
+
+@pytest.fixture
+def cache(project, tmp_path):
+    root, _ = project
+    return PersistentImportCache(cache_dir=str(tmp_path / "cache"), project_root=str(root))
+
+
+def put_chain(cache, files):
+    cache.put_file(files["c"], {"imports": []})
+    cache.put_file(files["b"], {"imports": ["pkg.c"]}, resolved={"pkg.c": files["c"]})
+    cache.put_file(files["a"], {"imports": ["pkg.b"]}, resolved={"pkg.b": files["b"]})
+
+
+def test_touch_keeps_entry_and_edit_invalidates_dependents(project, cache):
+    _, files = project
+    put_chain(cache, files)
+
+    bump_mtime(files["c"])
+    assert cache.get_file(files["c"])["analysis"] == {"imports": []}
+
+    write(Path(files["c"]), "VALEUR = 2\n")
+    assert cache.get_file(files["c"]) is None
+    assert not cache.has_file(files["b"])
+    assert not cache.has_file(files["a"])
+    assert cache.get_stats()["invalidations"] == 3
+
+
+def test_other_configuration_uses_another_namespace(project, cache, tmp_path):
+    root, files = project
+    cache.put_file(files["c"], {"imports": []})
+    other = PersistentImportCache(cache_dir=str(tmp_path / "cache"), project_root=str(root),
+                                  config={"use_import_resolver": False})
+
+    assert other.cache_dir != cache.cache_dir
+    assert other.get_file(files["c"]) is None
+    assert cache.get_file(files["c"]) is not None
+
+
+def test_graph_is_invalid_once_its_closure_changes(project, cache):
+    _, files = project
+    cache.put_graph(files["a"], {"max_depth": 3}, {"noeuds": 3}, closure=files.values())
+    assert cache.get_graph(files["a"], {"max_depth": 3}) == {"noeuds": 3}
+    assert cache.get_graph(files["a"], {"max_depth": 4}) is None
+
+    write(Path(files["b"]), "from pkg.c import VALEUR as V\n")
+    assert cache.get_graph(files["a"], {"max_depth": 3}) is None
+
+
+def test_new_invocation_only_reparses_edited_files(project, tmp_path):
+    root, files = project
+
+    def run():
+        cache = PersistentImportCache(cache_dir=str(tmp_path / "cache"), project_root=str(root))
+        analyzer = ImportAnalyzer(project_root=str(root), persistent_cache=cache)
+        analyzer.analyze_files([files["a"]])
+        return analyzer
+
+    first = run()
+    assert first.parse_count == 3
+
+    second = run()
+    assert second.parse_count == 0
+    assert set(second.dependency_graph.nodes) == set(first.dependency_graph.nodes)
+
+    write(Path(files["c"]), "VALEUR = 3\n")
+    bump_mtime(files["c"])
+    third = run()
+    assert third.parse_count == 1
+    # Les dépendants invalidés en cascade sont réécrits tels quels : rien à reparser ensuite
+    assert run().parse_count == 0
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+🧪 Timeout de l'ImportResolver dans ImportAnalyzer
+
+Une résolution lente ne doit coûter qu'un seul timeout : le disjoncteur
+renvoie les résolutions suivantes vers le résolveur simple au lieu de les
+faire attendre derrière le worker bloqué. Le verrou et le worker sont
+partagés par tous les analyseurs du processus (sys.path est global).
+"""
+
+import threading
+import time
+
+import pytest
+
+from Core.Partitioner.analyzers.import_analyzer import ImportAnalyzer
+from Core.Partitioner.resolvers.import_resolver import ImportResolver
+
+
+class SlowResolverStub:
+    """Bloque sur 'lent' jusqu'à release, répond immédiatement sinon."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = []
+
+    def resolve_import(self, import_name, current_file):
+        self.calls.append(import_name)
+        if import_name == "lent":
+            self.release.wait(10)
+        return f"/stub/{import_name}.py"
+
+
+def wait_for_idle_worker(lock, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while lock.locked() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def analyzer(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    analyzer = ImportAnalyzer(project_root=str(tmp_path), resolve_timeout=0.2)
+    analyzer.import_resolver = SlowResolverStub()
+    yield analyzer
+    analyzer.import_resolver.release.set()
+    # Le worker est partagé : le test suivant ne doit pas hériter d'une résolution bloquée
+    wait_for_idle_worker(analyzer._resolver_lock)
+
+
+def resolver_threads():
+    return [thread for thread in threading.enumerate() if thread.name == "import-resolve"]
+
+
+def test_real_import_resolver_is_loaded(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    analyzer = ImportAnalyzer(project_root=str(tmp_path))
+    assert isinstance(analyzer.import_resolver, ImportResolver)
+
+
+def test_resolves_on_a_single_long_lived_worker(analyzer):
+    current_file = "/projet/module.py"
+    results = [analyzer.find_file_for_import(f"mod{index}", current_file) for index in range(20)]
+
+    assert results == [f"/stub/mod{index}.py" for index in range(20)]
+    assert len(resolver_threads()) == 1
+    assert analyzer.stats['resolve_timeouts'] == 0
+
+
+def test_analyzers_share_one_worker_and_lock(analyzer, tmp_path):
+    others = [ImportAnalyzer(project_root=str(tmp_path)) for _ in range(5)]
+    for other in others:
+        other.import_resolver = SlowResolverStub()
+        assert other.find_file_for_import("mod", "/projet/module.py") == "/stub/mod.py"
+
+    assert {id(other._resolver_lock) for other in others} == {id(analyzer._resolver_lock)}
+    assert len(resolver_threads()) == 1
+
+
+def test_resolver_lock_serializes_across_analyzers(analyzer, tmp_path):
+    blocked = threading.Thread(target=analyzer.find_file_for_import, args=("lent", "/projet/module.py"))
+    blocked.start()
+    time.sleep(0.05)
+
+    # Un second analyseur (autre thread, même sys.path) attend le même verrou
+    other = ImportAnalyzer(project_root=str(tmp_path), resolve_timeout=0.1)
+    other.import_resolver = SlowResolverStub()
+    assert other._resolve_import_with_resolver("autre", "/projet/autre.py") is None
+    assert other.import_resolver.calls == []
+    assert other.stats['resolve_timeouts'] == 1
+    blocked.join()
+
+
+def test_slow_resolve_trips_the_circuit_breaker(analyzer):
+    current_file = "/projet/module.py"
+    start = time.monotonic()
+    assert analyzer.find_file_for_import("lent", current_file) is None
+    assert 0.15 <= time.monotonic() - start < 1.0
+
+    # Les résolutions suivantes n'attendent plus le worker bloqué
+    start = time.monotonic()
+    for index in range(10):
+        analyzer.find_file_for_import(f"mod{index}", current_file)
+    assert time.monotonic() - start < 0.1
+    assert analyzer.import_resolver.calls == ["lent"]
+    assert analyzer.stats['resolve_timeouts'] == 1
+    assert analyzer.timed_out_imports == ["lent"]
+
+
+def test_concurrent_callers_wait_within_their_budget(analyzer):
+    current_file = "/projet/module.py"
+    blocked = threading.Thread(target=analyzer.find_file_for_import, args=("lent", current_file))
+    blocked.start()
+    time.sleep(0.05)
+
+    # Un autre thread n'attend le verrou que dans son propre délai
+    start = time.monotonic()
+    assert analyzer._resolve_import_with_resolver("autre", "/projet/autre.py") is None
+    assert time.monotonic() - start < 1.0
+    blocked.join()
+    assert "autre" not in analyzer.import_resolver.calls
+
+
+def test_breaker_stays_open_while_worker_is_stuck(analyzer, tmp_path):
+    source = tmp_path / "main.py"
+    source.write_text("import json\n", encoding="utf-8")
+    assert analyzer.find_file_for_import("lent", str(source)) is None
+
+    analyzer.analyze_files([str(source)], max_depth=1)
+    assert analyzer._resolver_tripped
+
+    analyzer.import_resolver.release.set()
+    wait_for_idle_worker(analyzer._resolver_lock)
+    analyzer.analyze_files([str(source)], max_depth=1)
+    assert not analyzer._resolver_tripped
+    assert analyzer.find_file_for_import("mod", str(source)) == "/stub/mod.py"
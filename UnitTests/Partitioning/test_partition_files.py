@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+🧪 LanguageRegistry.partition_files : lot de fichiers, en série ou en pool
+
+Les résultats sont produits au fil de l'eau ; un échec donne un résultat
+success=False au lieu d'interrompre le lot, et le pool de processus rend
+les mêmes partitions que le mode série.
+"""
+
+import pytest
+
+from Core.Partitioner.schemas.language_registry import LanguageRegistry
+
+SOURCE = '''import os
+
+
+def lire(chemin):
+    with open(chemin) as f:
+        return f.read()
+
+
+class Gardien:
+    def veiller(self):
+        return lire(os.devnull)
+'''
+
+
+@pytest.fixture
+def files(tmp_path):
+    paths = []
+    for index in range(4):
+        path = tmp_path / f"module_{index}.py"
+        path.write_text(SOURCE * (index + 1), encoding="utf-8")
+        paths.append(str(path))
+    return paths + [str(tmp_path / "absent.py")]
+
+
+def summary(results):
+    return {result.file_path: (result.success, [block.content for block in result.partitions])
+            for result in results}
+
+
+def test_parallel_results_match_serial_results(files):
+    # Seuil de flux minimal : chaque fichier passe par le StreamingPartitioner
+    registry = LanguageRegistry(streaming_threshold=1)
+    serial = list(registry.partition_files(files, workers=1))
+    parallel = list(registry.partition_files(files, workers=2))
+
+    assert [result.file_path for result in serial] == files
+    assert summary(parallel) == summary(serial)
+    assert all(summary(serial)[path][0] for path in files[:-1])
+    assert {result.metadata["worker_pid"] for result in parallel} != {serial[0].metadata["worker_pid"]}
+
+
+def test_failures_are_reported_not_raised(files):
+    results = {result.file_path: result for result in LanguageRegistry().partition_files(files[-1:] * 2)}
+
+    failed = results[files[-1]]
+    assert not failed.success
+    assert failed.errors[0]["details"]["exception"] == "FileNotFoundError"
+    assert failed.metadata["partition_time"] >= 0
+
+
+def test_consumer_can_stop_early(files):
+    registry = LanguageRegistry(streaming_threshold=1)
+    results = registry.partition_files(files, workers=2)
+    first = next(results)
+    results.close()
+    assert first.file_path in files
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+🧪 Index d'intervalles des partitions (PartitionIntervalIndex)
+
+Les requêtes par position ou par plage de lignes rendent exactement ce que
+rendrait un parcours complet, dans l'ordre d'origine, et l'index est
+reconstruit dès que la liste des blocs change.
+"""
+
+import pickle
+import random
+
+from Core.Partitioner.schemas.partition_schemas import (
+    BlockType, PartitionBlock, PartitionLocation, PartitionResult
+)
+
+
+def block(name, start_line, end_line, start_char=0, end_char=80):
+    return PartitionBlock(
+        block_type=BlockType.FUNCTION,
+        content=name,
+        location=PartitionLocation(start_line=start_line, end_line=end_line,
+                                   start_char=start_char, end_char=end_char,
+                                   total_lines=end_line - start_line + 1),
+    )
+
+
+def result(partitions):
+    return PartitionResult(file_path="module.py", file_type="python", total_lines=500,
+                           total_chars=0, partitions=partitions, success=True)
+
+
+def random_blocks(count, seed=7):
+    """Blocs imbriqués et chevauchants, volontairement non triés."""
+    rng = random.Random(seed)
+    blocks = []
+    for index in range(count):
+        start = rng.randint(1, 400)
+        blocks.append(block(f"b{index}", start, start + rng.randint(0, 60),
+                            start_char=rng.randint(0, 8), end_char=rng.randint(0, 80)))
+    return blocks
+
+
+def scan_overlapping(partitions, start_line, end_line):
+    return [p for p in partitions
+            if p.location.start_line <= end_line and p.location.end_line >= start_line]
+
+
+def scan_by_location(partitions, line, char):
+    return next((p for p in partitions if p.location.contains_position(line, char)), None)
+
+
+def test_queries_match_a_linear_scan():
+    partitions = random_blocks(300)
+    indexed = result(partitions)
+    rng = random.Random(11)
+
+    for _ in range(500):
+        start = rng.randint(-5, 470)
+        end = start + rng.randint(0, 30)
+        assert indexed.get_overlapping_partitions(start, end) == scan_overlapping(partitions, start, end)
+
+        line, char = rng.randint(0, 470), rng.randint(0, 10)
+        assert indexed.get_partition_by_location(line, char) is scan_by_location(partitions, line, char)
+
+
+def test_first_block_in_original_order_wins():
+    outer = block("outer", 1, 50)
+    inner = block("inner", 10, 20)
+    assert result([inner, outer]).get_partition_by_location(15) is inner
+    assert result([outer, inner]).get_partition_by_location(15) is outer
+    assert result([]).get_partition_by_location(1) is None
+
+
+def test_index_follows_list_mutations():
+    indexed = result([block("a", 1, 10)])
+    assert indexed.get_partition_by_location(30) is None
+
+    late = block("b", 25, 40)
+    indexed.partitions.append(late)
+    assert indexed.get_partition_by_location(30) is late
+
+    replacement = block("c", 28, 32)
+    indexed.partitions[1] = replacement
+    assert indexed.get_overlapping_partitions(30, 30) == [replacement]
+
+    del indexed.partitions[1]
+    assert indexed.get_overlapping_partitions(30, 30) == []
+
+    indexed.partitions = [late]
+    assert indexed.get_overlapping_partitions(1, 100) == [late]
+
+
+def test_in_place_location_edit_needs_explicit_invalidation():
+    moved = block("a", 1, 10)
+    indexed = result([moved])
+    assert indexed.get_partition_by_location(5) is moved
+
+    moved.location.start_line, moved.location.end_line = 100, 110
+    indexed.invalidate_location_index()
+    assert indexed.get_partition_by_location(5) is None
+    assert indexed.get_partition_by_location(105) is moved
+
+
+def test_pickle_drops_the_index():
+    indexed = result(random_blocks(20))
+    indexed.get_overlapping_partitions(1, 10)
+
+    copy = pickle.loads(pickle.dumps(indexed))
+    assert copy._location_index is None
+    assert [p.content for p in copy.get_overlapping_partitions(1, 500)] == \
+        [p.content for p in indexed.get_overlapping_partitions(1, 500)]
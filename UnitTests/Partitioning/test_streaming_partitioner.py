@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+🧪 StreamingPartitioner : unités et points d'entrée du registre
+
+Les offsets des blocs et total_chars comptent des caractères (et non des
+octets), y compris pour un fichier non ASCII.
+"""
+
+import pytest
+
+from Core.Partitioner.fallback_strategies.streaming_partitioner import StreamingPartitioner, _ScopeTracker
+from Core.Partitioner.schemas.language_registry import LanguageRegistry
+
+SOURCE = '''"""Module accentué : éàü — ✨"""
+import os
+
+
+class Démon:
+    """Invoque des rêves."""
+
+    def rêver(self):
+        return "ψ∞"
+
+
+def éveil():
+    return Démon().rêver()
+'''
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    path = tmp_path / "demon.py"
+    path.write_text(SOURCE * 20, encoding="utf-8")
+    return path
+
+
+def test_total_chars_counts_characters_not_bytes(source_file):
+    content = source_file.read_text(encoding="utf-8")
+    assert len(content.encode("utf-8")) > len(content)
+
+    partitioner = StreamingPartitioner(max_tokens=50, read_size=64)
+    blocks = list(partitioner.iter_blocks(str(source_file), "python"))
+
+    assert {block.location.total_chars for block in blocks} == {len(content)}
+    assert blocks[-1].location.end_offset == len(content)
+    for block in blocks:
+        assert content[block.location.start_offset:block.location.end_offset] == block.content
+
+
+def test_collect_reports_full_coverage(source_file):
+    result = StreamingPartitioner(max_tokens=50).collect(str(source_file), "python")
+
+    assert result.success
+    assert result.total_chars == len(source_file.read_text(encoding="utf-8"))
+    assert result._calculate_coverage() == pytest.approx(100.0)
+
+
+def test_registry_auto_path_matches_bounded_iterator(source_file):
+    registry = LanguageRegistry(streaming_threshold=1)
+    collected = registry.partition_path(str(source_file))
+    streamed = list(registry.iter_partition_blocks(str(source_file)))
+
+    assert collected.metadata['partitioner_type'] == "StreamingPartitioner"
+    assert [block.content for block in collected.partitions] == [block.content for block in streamed]
+
+
+def test_scope_tracker_requires_block_type():
+    with pytest.raises(TypeError):
+        _ScopeTracker()
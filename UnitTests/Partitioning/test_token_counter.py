@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+🧪 Comptage de tokens partagé (TokenCounter, LineTokenIndex)
+
+Les sommes préfixes découpent les lignes exactement comme l'ancienne boucle
+gloutonne, et le compteur n'encode chaque texte qu'une fois, les absents
+d'une liste en un seul lot.
+"""
+
+import random
+
+from Core.Partitioner.ast_partitioners.token_counter import LineTokenIndex, TokenCounter
+
+
+class WordEncoder:
+    """Encodeur déterministe : un token par mot, journal des appels."""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode_ordinary(self, text):
+        self.calls.append([text])
+        return text.split()
+
+    def encode_ordinary_batch(self, texts):
+        self.calls.append(list(texts))
+        return [text.split() for text in texts]
+
+
+def greedy_chunks(line_counts, budget):
+    """Référence : la boucle ligne à ligne remplacée par LineTokenIndex.fit."""
+    chunks, current, tokens = [], [], 0
+    for line_number, count in enumerate(line_counts, start=1):
+        if tokens + count > budget and current:
+            chunks.append((current[0], current[-1], tokens))
+            current, tokens = [], 0
+        current.append(line_number)
+        tokens += count
+    if current:
+        chunks.append((current[0], current[-1], tokens))
+    return chunks
+
+
+def fitted_chunks(line_counts, budget):
+    index = LineTokenIndex(line_counts)
+    chunks, start_line = [], 1
+    while start_line <= len(index):
+        end_line = index.fit(start_line, budget)
+        chunks.append((start_line, end_line, index.count(start_line, end_line)))
+        start_line = end_line + 1
+    return chunks
+
+
+def test_fit_matches_the_greedy_loop():
+    rng = random.Random(3)
+    for _ in range(200):
+        line_counts = [rng.choice([0, 0, 1, 3, 8, 20, 45]) for _ in range(rng.randint(1, 80))]
+        budget = rng.randint(1, 60)
+        assert fitted_chunks(line_counts, budget) == greedy_chunks(line_counts, budget)
+
+
+def test_line_index_ranges():
+    index = LineTokenIndex([2, 0, 5, 1])
+    assert len(index) == 4
+    assert index.line(3) == 5
+    assert index.count(1, 4) == 8
+    assert index.count(2, 3) == 5
+    # Les bornes hors contenu sont rognées
+    assert index.count(-3, 2) == 2
+    assert index.count(3, 99) == 6
+    assert index.count(4, 2) == 0
+    # Une ligne plus grosse que le budget forme son propre morceau
+    assert index.fit(3, 1) == 3
+    assert index.fit(1, 100) == 4
+
+
+def test_count_is_memoized_per_text():
+    encoder = WordEncoder()
+    counter = TokenCounter(encoder=encoder)
+
+    assert counter.count("def veiller(self):") == 2
+    assert counter.count("def veiller(self):") == 2
+    assert encoder.calls == [["def veiller(self):"]]
+    assert counter.stats["hits"] == 1
+    assert counter.stats["misses"] == 1
+
+
+def test_count_many_encodes_missing_texts_in_one_batch():
+    encoder = WordEncoder()
+    counter = TokenCounter(encoder=encoder)
+    counter.count("a b")
+
+    counts = counter.count_many(["a b", "c d e", "f", "c d e", ""])
+    assert counts == [2, 3, 1, 3, 0]
+    # Une seule requête par texte absent, doublons compris
+    assert encoder.calls[-1] == ["c d e", "f", ""]
+    assert counter.stats["encoded_batches"] == 1
+    assert counter.stats["hits"] == 1
+
+
+def test_memo_is_bounded():
+    encoder = WordEncoder()
+    counter = TokenCounter(encoder=encoder, memo_size=2)
+    counter.count_many(["un", "deux", "trois"])
+    encoder.calls.clear()
+
+    counter.count("un")
+    counter.count("trois")
+    assert encoder.calls == [["un"]]
+
+
+def test_line_index_is_memoized_per_content():
+    encoder = WordEncoder()
+    counter = TokenCounter(encoder=encoder, line_index_size=1)
+    content = "import os\n\ndef lire(chemin):\n    return chemin"
+
+    index = counter.line_index(content)
+    assert counter.line_index(content) is index
+    assert [index.line(n) for n in range(1, 5)] == [2, 0, 2, 2]
+
+    counter.line_index("autre")
+    assert counter.line_index(content) is not index
+    # Les lignes restent dans la mémoïsation des textes
+    assert len(encoder.calls) == 2
+
+
+def test_shared_instance_per_encoding():
+    assert TokenCounter.shared("cl100k_base") is TokenCounter.shared("cl100k_base")
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+⏱️ Benchmark LocalProviderHTTP : session par appel contre pool keep-alive
+
+Lance un faux serveur Ollama local, puis envoie N requêtes generate avec C
+requêtes concurrentes, d'abord en ouvrant une ClientSession par appel
+(ancien comportement), puis avec la session partagée du provider. Affiche
+les requêtes par seconde et le nombre de connexions TCP ouvertes côté client.
+
+Usage:
+    python UnitTests/Providers/benchmark_local_provider_http.py --requests 2000 --concurrency 16
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+
+import aiohttp
+
+# Ajouter le répertoire racine pour les imports Core
+sys.path.append('.')
+
+from Core.Providers.LLMProviders.local_provider_http import LocalProviderHTTP
+from UnitTests.Providers.fake_ollama_server import FakeOllamaServer
+
+
+async def _run(concurrency: int, total: int, call):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(index):
+        async with semaphore:
+            return await call(index)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(one(index) for index in range(total)))
+    return time.perf_counter() - start, results
+
+
+async def bench_session_per_call(provider: LocalProviderHTTP, total: int, concurrency: int):
+    """Ancien comportement : une ClientSession (donc une connexion TCP) par appel."""
+    connections = 0
+
+    async def call(index):
+        nonlocal connections
+        connections += 1
+        async with aiohttp.ClientSession() as session:
+            return await provider._call_api_generate(session, f"prompt {index}")
+
+    duration, results = await _run(concurrency, total, call)
+    return duration, connections, results
+
+
+async def bench_pooled(provider: LocalProviderHTTP, total: int, concurrency: int):
+    """Session du provider : connexions keep-alive réutilisées."""
+    async def call(index):
+        response = await provider.generate_response(f"prompt {index}")
+        return response.content
+
+    duration, results = await _run(concurrency, total, call)
+    connector = provider._session.connector if provider._session else None
+    opened = sum(len(conns) for conns in connector._conns.values()) if connector else 0
+    return duration, opened, results
+
+
+async def main_async(args):
+    async with FakeOllamaServer() as server:
+        config = {'model': server.model, 'ollama_host': server.url,
+                  'pool_size': args.pool_size, 'per_host_limit': args.per_host_limit}
+
+        async with LocalProviderHTTP(config) as provider:
+            before, before_conns, before_results = await bench_session_per_call(
+                provider, args.requests, args.concurrency)
+        async with LocalProviderHTTP(config) as provider:
+            after, idle_conns, after_results = await bench_pooled(
+                provider, args.requests, args.concurrency)
+
+        assert before_results == after_results, "Les deux modes doivent donner les mêmes réponses"
+        print(f"{'mode':<22} {'requêtes':>9} {'durée (s)':>10} {'req/s':>9} {'connexions':>11}")
+        print(f"{'session par appel':<22} {args.requests:>9} {before:>10.3f} "
+              f"{args.requests / before:>9.0f} {before_conns:>11}")
+        print(f"{'pool keep-alive':<22} {args.requests:>9} {after:>10.3f} "
+              f"{args.requests / after:>9.0f} {'<= ' + str(args.per_host_limit):>11}")
+        print(f"accélération: x{before / after:.2f} (connexions inactives en fin de run: {idle_conns})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du pool HTTP de LocalProviderHTTP")
+    parser.add_argument("--requests", type=int, default=2000, help="Nombre de requêtes par mode")
+    parser.add_argument("--concurrency", type=int, default=16, help="Requêtes simultanées")
+    parser.add_argument("--pool-size", type=int, default=32, help="Taille du pool de connexions")
+    parser.add_argument("--per-host-limit", type=int, default=8, help="Connexions max par hôte")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+⏱️ Benchmark LocalProvider : ``ollama run`` par appel contre worker persistant
+
+Génère un faux binaire ``ollama`` dans un dossier temporaire :
+- ``ollama run <modèle> <prompt>`` paie le chargement du modèle à chaque appel,
+- ``ollama serve`` lance le faux serveur Ollama (chargement payé une fois).
+Compare ensuite LocalProvider en mode subprocess (``persistent_worker: False``)
+et avec le worker persistant, puis vérifie la relance après un crash du serveur.
+
+Usage:
+    python UnitTests/Providers/benchmark_local_worker.py --calls 20 --load-delay 0.3
+"""
+
+import os
+import sys
+import time
+import signal
+import socket
+import asyncio
+import argparse
+import tempfile
+
+# Ajouter le répertoire racine pour les imports Core
+sys.path.append('.')
+
+from Core.Providers.LLMProviders.local_provider import LocalProvider
+from Core.Providers.LLMProviders.local_worker import LocalModelWorkerManager
+
+FAKE_OLLAMA = """#!{python}
+import os, sys, time
+if sys.argv[1:2] == ["serve"]:
+    os.execv({python!r}, [{python!r}, {server!r}, "serve"])
+time.sleep(float(os.environ.get("FAKE_OLLAMA_LOAD_DELAY", "0")))
+print("OK, réponse factice du modèle.")
+"""
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def replay(provider: LocalProvider, calls: int):
+    start = time.perf_counter()
+    responses = [await provider.generate_response(f"prompt {index}") for index in range(calls)]
+    return time.perf_counter() - start, responses
+
+
+async def main_async(args):
+    os.environ["FAKE_OLLAMA_LOAD_DELAY"] = str(args.load_delay)
+    server_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_ollama_server.py")
+    with tempfile.TemporaryDirectory() as tmp:
+        binary = os.path.join(tmp, "ollama")
+        with open(binary, "w") as f:
+            f.write(FAKE_OLLAMA.format(python=sys.executable, server=server_script))
+        os.chmod(binary, 0o755)
+
+        host = f"http://127.0.0.1:{free_port()}"
+        config = {'model': 'fake-model', 'ollama_host': host, 'ollama_binary': binary,
+                  'spawn_ollama_server': True}
+        subprocess_time, subprocess_responses = await replay(
+            LocalProvider({**config, 'persistent_worker': False}), args.calls)
+
+        provider = LocalProvider(config)
+        worker_time, worker_responses = await replay(provider, args.calls)
+        manager = LocalModelWorkerManager.shared(host)
+
+        # Crash du serveur : la requête suivante le relance
+        os.kill(manager.server_process.pid, signal.SIGKILL)
+        manager.server_process.wait()
+        start = time.perf_counter()
+        recovered = await provider.generate_response("après crash")
+        recovery_time = time.perf_counter() - start
+        stats = manager.get_stats()
+        manager.shutdown()
+
+    assert [r.content for r in worker_responses] == [r.content for r in subprocess_responses], \
+        "Réponses différentes entre les modes"
+    assert recovered.metadata['worker'] and recovered.metadata['cold_start'], "Relance non détectée"
+    first_token = [r.metadata['first_token_latency'] for r in worker_responses]
+    print(f"{'mode':<24} {'appels':>7} {'durée (s)':>10} {'par appel (s)':>14}")
+    print(f"{'ollama run par appel':<24} {args.calls:>7} {subprocess_time:>10.3f} "
+          f"{subprocess_time / args.calls:>14.3f}")
+    print(f"{'worker persistant':<24} {args.calls:>7} {worker_time:>10.3f} {worker_time / args.calls:>14.3f}")
+    print(f"premier token: à froid {first_token[0]:.3f}s, chaud {sum(first_token[1:]) / (len(first_token) - 1):.3f}s")
+    print(f"relance après crash: {recovery_time:.3f}s, démarrages serveur: {stats['server_starts']}, "
+          f"démarrages à froid: {stats['cold_starts']}, accélération: x{subprocess_time / worker_time:.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark des workers Ollama persistants")
+    parser.add_argument("--calls", type=int, default=20, help="Nombre d'appels")
+    parser.add_argument("--load-delay", type=float, default=0.3, help="Chargement du modèle (s)")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
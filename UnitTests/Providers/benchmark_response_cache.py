@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+⏱️ Benchmark CachedLLMProvider : prompts répétés avec et sans cache
+
+Rejoue une charge où un petit ensemble de prompts revient souvent (comme la
+boucle de réflexion ou l'enrichissement de requêtes) contre un faux serveur
+Ollama qui simule le temps de génération. Compare le provider nu, le cache
+à froid, puis un second processus logique qui ne dispose que du niveau
+disque. Vérifie que les réponses sont identiques et que les appels à
+température non nulle contournent le cache.
+
+Usage:
+    python UnitTests/Providers/benchmark_response_cache.py --calls 200 --distinct 20
+"""
+
+import sys
+import time
+import random
+import asyncio
+import argparse
+import tempfile
+
+# Ajouter le répertoire racine pour les imports Core
+sys.path.append('.')
+
+from Core.Providers.LLMProviders.local_provider_http import LocalProviderHTTP
+from Core.Providers.LLMProviders.cached_provider import CachedLLMProvider
+from UnitTests.Providers.fake_ollama_server import FakeOllamaServer
+
+
+async def replay(provider, prompts):
+    start = time.perf_counter()
+    contents = [(await provider.generate_response(prompt, temperature=0)).content for prompt in prompts]
+    return time.perf_counter() - start, contents
+
+
+async def main_async(args):
+    rng = random.Random(args.seed)
+    distinct = [f"Analyse la requête {index} et retourne un JSON." for index in range(args.distinct)]
+    # Variantes d'espaces : même prompt normalisé
+    prompts = [rng.choice(distinct) + rng.choice(["", "  ", "\n"]) for _ in range(args.calls)]
+
+    async with FakeOllamaServer(token_delay=args.token_delay) as server:
+        config = {'model': server.model, 'ollama_host': server.url}
+        with tempfile.TemporaryDirectory() as cache_dir:
+            async with LocalProviderHTTP(config) as provider:
+                uncached, reference = await replay(provider, prompts)
+
+            async with CachedLLMProvider(LocalProviderHTTP(config), cache_dir=cache_dir) as provider:
+                cold, cold_contents = await replay(provider, prompts)
+                await provider.generate_response(distinct[0], temperature=0.7)
+                cold_stats = provider.get_cache_stats()
+
+            # Nouveau provider, mémoire vide : seul le niveau disque sert
+            async with CachedLLMProvider(LocalProviderHTTP(config), cache_dir=cache_dir) as provider:
+                warm, warm_contents = await replay(provider, prompts)
+                warm_stats = provider.get_cache_stats()
+
+    assert cold_contents == reference and warm_contents == reference, "Réponses différentes avec le cache"
+    assert cold_stats['bypassed'] == 1, "La température 0.7 doit contourner le cache"
+    print(f"{'mode':<24} {'appels':>7} {'durée (s)':>10} {'hit rate':>9} {'générations':>12}")
+    print(f"{'sans cache':<24} {args.calls:>7} {uncached:>10.3f} {'-':>9} {args.calls:>12}")
+    print(f"{'cache à froid':<24} {args.calls:>7} {cold:>10.3f} {cold_stats['hit_rate']:>9.1%} "
+          f"{cold_stats['misses']:>12}")
+    print(f"{'disque seul (relance)':<24} {args.calls:>7} {warm:>10.3f} {warm_stats['hit_rate']:>9.1%} "
+          f"{warm_stats['misses']:>12}")
+    print(f"succès disque: {warm_stats['disk_hits']}, mémoire: {warm_stats['memory_hits']}, "
+          f"accélération à froid: x{uncached / cold:.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du cache de réponses LLM")
+    parser.add_argument("--calls", type=int, default=200, help="Nombre d'appels")
+    parser.add_argument("--distinct", type=int, default=20, help="Prompts distincts")
+    parser.add_argument("--token-delay", type=float, default=0.002, help="Délai par jeton (s)")
+    parser.add_argument("--seed", type=int, default=7, help="Graine du tirage des prompts")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
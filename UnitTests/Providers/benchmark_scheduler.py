@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+⏱️ Benchmark ScheduledLLMProvider : rafale de daemons avec et sans ordonnanceur
+
+Simule plusieurs daemons qui frappent le même modèle en même temps : des
+appels de fond (réflexion, Légion), dont une partie répète le même prompt,
+et des appels interactifs qui arrivent pendant la rafale. Le faux serveur
+Ollama ralentit chaque génération avec la charge (contention). Compare la
+latence interactive, le nombre de générations et la concurrence maximale
+subie par le serveur, sans puis avec l'ordonnanceur.
+
+Usage:
+    python UnitTests/Providers/benchmark_scheduler.py --background 24 --interactive 6
+"""
+
+import sys
+import time
+import random
+import asyncio
+import argparse
+import statistics
+
+# Ajouter le répertoire racine pour les imports Core
+sys.path.append('.')
+
+from Core.Providers.LLMProviders.local_provider_http import LocalProviderHTTP
+from Core.Providers.LLMProviders.scheduled_provider import LLMScheduler, ScheduledLLMProvider
+from UnitTests.Providers.fake_ollama_server import FakeOllamaServer
+
+
+def percentile(values, ratio):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * ratio))]
+
+
+async def burst(background, interactive, args, seed):
+    """Rafale : latences interactives, latences de fond, durée totale."""
+    rng = random.Random(seed)
+    prompts = [f"Réflexion sur la mémoire {rng.randrange(args.distinct)}" for _ in range(args.background)]
+
+    async def timed(call):
+        start = time.perf_counter()
+        await call
+        return time.perf_counter() - start
+
+    async def interactive_calls():
+        latencies = []
+        for index in range(args.interactive):
+            await asyncio.sleep(args.interval)
+            latencies.append(await timed(interactive.generate_response(f"Question utilisateur {index}")))
+        return latencies
+
+    start = time.perf_counter()
+    background_latencies, interactive_latencies = await asyncio.gather(
+        asyncio.gather(*[timed(background.generate_response(prompt)) for prompt in prompts]),
+        interactive_calls()
+    )
+    return interactive_latencies, background_latencies, time.perf_counter() - start
+
+
+async def main_async(args):
+    rows = []
+    response = " ".join(f"mot{index}" for index in range(args.tokens))
+    for mode in ("sans ordonnanceur", "ordonnanceur"):
+        async with FakeOllamaServer(response=response, token_delay=args.token_delay,
+                                    contention=args.contention) as server:
+            config = {'model': server.model, 'ollama_host': server.url}
+            async with LocalProviderHTTP(config) as provider:
+                if mode == "ordonnanceur":
+                    scheduler = LLMScheduler(max_in_flight=args.max_in_flight, name=server.url)
+                    background = ScheduledLLMProvider(provider, scheduler=scheduler, priority="background")
+                    interactive = ScheduledLLMProvider(provider, scheduler=scheduler, priority="interactive")
+                else:
+                    scheduler = None
+                    background = interactive = provider
+                interactive_latencies, background_latencies, total = await burst(background, interactive,
+                                                                                 args, args.seed)
+            rows.append((mode, interactive_latencies, background_latencies, total,
+                         server.requests, server.max_active, scheduler.get_stats() if scheduler else None))
+
+    print(f"{'mode':<18} {'interactif p50':>15} {'interactif max':>15} {'fond p95':>9} "
+          f"{'total (s)':>10} {'générations':>12} {'concurrence max':>16}")
+    for mode, interactive_latencies, background_latencies, total, requests, max_active, _ in rows:
+        print(f"{mode:<18} {statistics.median(interactive_latencies):>15.3f} {max(interactive_latencies):>15.3f} "
+              f"{percentile(background_latencies, 0.95):>9.3f} {total:>10.3f} {requests:>12} {max_active:>16}")
+
+    stats = rows[1][6]
+    print(f"fusions: {stats['coalesced']}, file max: {stats['max_queue_depth']}, "
+          f"attente interactive moy.: {stats['wait_time']['interactive']['mean']:.3f}s, "
+          f"attente de fond p95: {stats['wait_time']['background']['p95']:.3f}s")
+    print(f"accélération interactive (max): x{max(rows[0][1]) / max(rows[1][1]):.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de l'ordonnanceur d'appels LLM")
+    parser.add_argument("--background", type=int, default=24, help="Appels de fond dans la rafale")
+    parser.add_argument("--distinct", type=int, default=8, help="Prompts de fond distincts")
+    parser.add_argument("--interactive", type=int, default=6, help="Appels interactifs")
+    parser.add_argument("--interval", type=float, default=0.05, help="Intervalle entre appels interactifs (s)")
+    parser.add_argument("--max-in-flight", type=int, default=2, help="Appels simultanés admis")
+    parser.add_argument("--tokens", type=int, default=40, help="Jetons par réponse")
+    parser.add_argument("--token-delay", type=float, default=0.002, help="Délai par jeton (s)")
+    parser.add_argument("--contention", type=float, default=0.5, help="Ralentissement par génération simultanée")
+    parser.add_argument("--seed", type=int, default=7, help="Graine du tirage des prompts")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
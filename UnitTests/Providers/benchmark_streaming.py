@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+⏱️ Benchmark stream_response : latence du premier token contre temps total
+
+Lance un faux serveur Ollama qui retarde chaque jeton, puis compare pour
+LocalProviderHTTP le temps avant le premier contenu disponible avec
+generate_response (réponse entière) et stream_response (premier fragment).
+Vérifie que la réponse assemblée par le flux est identique.
+
+Usage:
+    python UnitTests/Providers/benchmark_streaming.py --token-delay 0.02 --runs 5
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+
+# Ajouter le répertoire racine pour les imports Core
+sys.path.append('.')
+
+from Core.Providers.LLMProviders.local_provider_http import LocalProviderHTTP
+from UnitTests.Providers.fake_ollama_server import FakeOllamaServer
+
+
+async def measure(provider: LocalProviderHTTP, prompt: str):
+    start = time.perf_counter()
+    full = await provider.generate_response(prompt)
+    blocking = time.perf_counter() - start
+
+    start = time.perf_counter()
+    first_token = None
+    final = None
+    async for chunk in provider.stream_response(prompt):
+        if first_token is None and not chunk.done:
+            first_token = time.perf_counter() - start
+        if chunk.done:
+            final = chunk.response
+    streamed_total = time.perf_counter() - start
+
+    assert final.content == full.content, "La réponse assemblée doit être identique"
+    return blocking, first_token, streamed_total, final
+
+
+async def main_async(args):
+    response = " ".join(f"mot{index}" for index in range(args.tokens))
+    async with FakeOllamaServer(response=response, token_delay=args.token_delay,
+                                first_token_delay=args.first_token_delay) as server:
+        async with LocalProviderHTTP({'model': server.model, 'ollama_host': server.url}) as provider:
+            rows = [await measure(provider, f"prompt {run}") for run in range(args.runs)]
+
+    blocking = sum(row[0] for row in rows) / len(rows)
+    first_token = sum(row[1] for row in rows) / len(rows)
+    streamed_total = sum(row[2] for row in rows) / len(rows)
+    final = rows[-1][3]
+    print(f"{'mode':<28} {'premier contenu (s)':>20} {'total (s)':>10}")
+    print(f"{'generate_response':<28} {blocking:>20.3f} {blocking:>10.3f}")
+    print(f"{'stream_response':<28} {first_token:>20.3f} {streamed_total:>10.3f}")
+    print(f"fragments: {final.metadata['chunks']}, tokens: {final.tokens_used}, "
+          f"premier token (métadonnées): {final.metadata['first_token_latency']:.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du streaming de LocalProviderHTTP")
+    parser.add_argument("--tokens", type=int, default=100, help="Jetons par réponse")
+    parser.add_argument("--token-delay", type=float, default=0.02, help="Délai par jeton (s)")
+    parser.add_argument("--first-token-delay", type=float, default=0.05, help="Délai avant le premier jeton (s)")
+    parser.add_argument("--runs", type=int, default=3, help="Nombre de mesures")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+🧪 Faux serveur Ollama pour les tests et benchmarks des providers
+
+Implémente le sous-ensemble de l'API HTTP utilisé par LocalProviderHTTP
+(/api/version, /api/tags, /api/generate, avec ou sans stream) sur un port
+local libre. La réponse est découpée en jetons et chaque jeton peut être
+retardé pour simuler le temps de génération ; le premier appel d'un modèle
+paie load_delay (chargement), jusqu'à son déchargement (keep_alive: 0).
+Avec contention > 0, chaque génération simultanée ralentit les autres.
+
+Usage:
+    async with FakeOllamaServer(token_delay=0.01) as server:
+        provider = LocalProviderHTTP({'model': server.model, 'ollama_host': server.url})
+
+En ligne de commande, imite ``ollama serve`` (adresse lue dans OLLAMA_HOST) :
+    OLLAMA_HOST=127.0.0.1:11500 python UnitTests/Providers/fake_ollama_server.py serve
+"""
+
+import os
+import sys
+import asyncio
+import json
+from aiohttp import web
+
+
+class FakeOllamaServer:
+    """Serveur Ollama factice lancé dans la boucle courante."""
+
+    def __init__(self, model: str = "fake-model:latest", response: str = "OK, réponse factice du modèle.",
+                 token_delay: float = 0.0, first_token_delay: float = 0.0, load_delay: float = 0.0,
+                 contention: float = 0.0, host: str = "127.0.0.1", port: int = 0):
+        self.model = model
+        self.response = response
+        self.token_delay = token_delay
+        self.first_token_delay = first_token_delay
+        self.load_delay = load_delay
+        self.contention = contention
+        self.host = host
+        self.port = port
+        self.loaded = set()
+        self.loads = 0
+        self.unloads = 0
+        self.requests = 0
+        self.active = 0
+        self.max_active = 0
+        self.peers = set()
+        self.url = None
+        self._runner = None
+
+    def _tokens(self, prompt: str):
+        words = self.response.split(' ')
+        return [word if index == 0 else ' ' + word for index, word in enumerate(words)]
+
+    def _seen(self, request):
+        # Un port client distinct par connexion TCP ouverte
+        self.peers.add(request.transport.get_extra_info("peername"))
+
+    async def _version(self, request):
+        self._seen(request)
+        return web.json_response({"version": "0.0.0-fake"})
+
+    async def _tags(self, request):
+        self._seen(request)
+        return web.json_response({"models": [{"name": self.model}]})
+
+    async def _load(self, model: str):
+        if model not in self.loaded:
+            self.loads += 1
+            if self.load_delay:
+                await asyncio.sleep(self.load_delay)
+            self.loaded.add(model)
+
+    async def _generate(self, request):
+        self._seen(request)
+        payload = await request.json()
+        model = payload.get("model")
+        if payload.get("keep_alive") in (0, "0", "0s"):
+            if model in self.loaded:
+                self.loaded.discard(model)
+                self.unloads += 1
+            return web.json_response({"model": model, "response": "", "done": True, "done_reason": "unload"})
+        await self._load(model)
+        if "prompt" not in payload or payload["prompt"] == "":
+            # Chargement seul
+            return web.json_response({"model": model, "response": "", "done": True, "done_reason": "load"})
+
+        self.requests += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            return await self._respond(request, payload)
+        finally:
+            self.active -= 1
+
+    def _token_delay(self) -> float:
+        # Générations simultanées : chaque jeton ralentit avec la charge (contention)
+        return self.token_delay * (1 + self.contention * (self.active - 1))
+
+    async def _respond(self, request, payload):
+        tokens = self._tokens(payload.get("prompt", ""))
+        if self.first_token_delay:
+            await asyncio.sleep(self.first_token_delay)
+
+        if not payload.get("stream", True):
+            if self.token_delay:
+                await asyncio.sleep(self._token_delay() * len(tokens))
+            return web.json_response({"model": payload.get("model"), "response": "".join(tokens),
+                                      "done": True, "eval_count": len(tokens)})
+
+        stream = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+        await stream.prepare(request)
+        try:
+            for token in tokens:
+                if self.token_delay:
+                    await asyncio.sleep(self._token_delay())
+                await stream.write((json.dumps({"model": payload.get("model"), "response": token,
+                                                "done": False}) + "\n").encode("utf-8"))
+            await stream.write((json.dumps({"model": payload.get("model"), "response": "", "done": True,
+                                            "eval_count": len(tokens)}) + "\n").encode("utf-8"))
+            await stream.write_eof()
+        except ConnectionResetError:
+            # Client parti avant la fin (timeout, flux interrompu)
+            pass
+        return stream
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_get("/api/version", self._version)
+        app.router.add_get("/api/tags", self._tags)
+        app.router.add_post("/api/generate", self._generate)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://{self.host}:{port}"
+        return self.url
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> 'FakeOllamaServer':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+
+async def _serve_forever():
+    host, _, port = os.environ.get("OLLAMA_HOST", "127.0.0.1:11434").rpartition(":")
+    server = FakeOllamaServer(
+        token_delay=float(os.environ.get("FAKE_OLLAMA_TOKEN_DELAY", "0")),
+        load_delay=float(os.environ.get("FAKE_OLLAMA_LOAD_DELAY", "0")),
+        host=host or "127.0.0.1",
+        port=int(port)
+    )
+    async with server:
+        await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["serve"]:
+        asyncio.run(_serve_forever())
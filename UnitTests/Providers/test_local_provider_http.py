@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+🧪 Session keep-alive de LocalProviderHTTP
+
+Le provider garde une seule session HTTP : les appels successifs réutilisent
+la même connexion TCP, aclose() la ferme, et une nouvelle boucle en recrée une.
+"""
+
+import asyncio
+
+from Core.Providers.LLMProviders.local_provider_http import LocalProviderHTTP
+from UnitTests.Providers.fake_ollama_server import FakeOllamaServer
+
+
+def provider_for(server, **config):
+    return LocalProviderHTTP({'model': server.model, 'ollama_host': server.url, **config})
+
+
+def test_sequential_calls_reuse_one_connection():
+    async def scenario():
+        async with FakeOllamaServer() as server:
+            provider = provider_for(server)
+            status = await provider.test_connection()
+            assert status.valid, status.error
+
+            session = provider._session
+            for index in range(5):
+                response = await provider.generate_response(f"prompt {index}")
+                assert response.content == server.response, response.content
+            chunks = [chunk async for chunk in provider.stream_response("flux")]
+            assert chunks[-1].done and chunks[-1].response.content == server.response
+
+            assert provider._session is session
+            assert server.requests == 7  # test_connection + 5 générations + flux
+            assert len(server.peers) == 1
+
+            await provider.aclose()
+            assert session.closed
+            assert provider._session is None
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_calls_are_bounded_by_the_per_host_limit():
+    async def scenario():
+        async with FakeOllamaServer(token_delay=0.01) as server:
+            async with provider_for(server, per_host_limit=2) as provider:
+                responses = await asyncio.gather(*(provider.generate_response(f"p{i}") for i in range(6)))
+                assert all(response.content == server.response for response in responses)
+                assert server.max_active == 2
+                assert len(server.peers) == 2
+
+    asyncio.run(scenario())
+
+
+def test_session_is_recreated_in_a_new_event_loop():
+    server = FakeOllamaServer()
+    provider = None
+    sessions = []
+
+    async def call(close):
+        nonlocal provider
+        await server.start()
+        # Même port d'une boucle à l'autre : le provider garde son URL
+        server.port = int(server.url.rpartition(":")[2])
+        try:
+            provider = provider or provider_for(server)
+            response = await provider.generate_response("prompt")
+            assert response.content == server.response, response.content
+            sessions.append(provider._session)
+            if close:
+                await provider.aclose()
+        finally:
+            await server.stop()
+
+    asyncio.run(call(close=False))
+    asyncio.run(call(close=True))
+
+    assert sessions[0] is not sessions[1]
+    assert sessions[1].closed
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+🧪 Cycle de vie des workers Ollama persistants
+
+Un serveur déjà lancé est réutilisé ; ``ollama serve`` n'est lancé que sur
+demande explicite, et le serveur possédé est arrêté par aclose() du dernier
+provider ou à la sortie de l'interpréteur.
+"""
+
+import os
+import socket
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+from Core.Providers.LLMProviders.local_provider import LocalProvider
+from Core.Providers.LLMProviders.local_worker import LocalModelWorkerManager, LocalWorkerUnavailable
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SERVER_SCRIPT = os.path.join(ROOT, "UnitTests", "Providers", "fake_ollama_server.py")
+
+FAKE_OLLAMA = """#!{python}
+import os, sys
+if sys.argv[1:2] == ["serve"]:
+    with open({marker!r}, "a") as marker:
+        marker.write("serve\\n")
+    os.execv({python!r}, [{python!r}, {server!r}, "serve"])
+print("OK, réponse factice du modèle.")
+"""
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    # Zombie d'un processus fils déjà terminé
+    try:
+        with open(f"/proc/{pid}/stat") as stat:
+            return stat.read().split()[2] != "Z"
+    except OSError:
+        return True
+
+
+@pytest.fixture
+def fake_ollama(tmp_path):
+    """Faux binaire ollama (``serve`` lance le faux serveur) et hôte libre."""
+    marker = tmp_path / "serve_calls"
+    binary = tmp_path / "ollama"
+    binary.write_text(FAKE_OLLAMA.format(python=sys.executable, server=SERVER_SCRIPT, marker=str(marker)))
+    binary.chmod(0o755)
+    host = f"http://127.0.0.1:{free_port()}"
+    yield {'binary': str(binary), 'host': host, 'marker': marker}
+    manager = LocalModelWorkerManager._shared.get(host)
+    if manager is not None:
+        manager.shutdown()
+
+
+def provider_config(fake_ollama, **options):
+    return {'model': 'fake-model', 'ollama_host': fake_ollama['host'],
+            'ollama_binary': fake_ollama['binary'], 'timeout': 20, **options}
+
+
+def test_server_is_not_spawned_without_opt_in(fake_ollama):
+    manager = LocalModelWorkerManager(fake_ollama['host'], ollama_binary=fake_ollama['binary'],
+                                      startup_timeout=5)
+    try:
+        with pytest.raises(LocalWorkerUnavailable):
+            manager.generate_sync('fake-model', 'bonjour', timeout=10)
+        assert manager.server_process is None
+        assert not fake_ollama['marker'].exists()
+    finally:
+        manager.shutdown()
+
+
+def test_provider_aclose_stops_the_spawned_server(fake_ollama):
+    import asyncio
+
+    async def scenario():
+        first = LocalProvider(provider_config(fake_ollama, spawn_ollama_server=True))
+        second = LocalProvider(provider_config(fake_ollama, spawn_ollama_server=True))
+        response = await first.generate_response("bonjour")
+        assert response.metadata['worker']
+        await second.generate_response("encore")
+
+        manager = first._worker_manager
+        assert manager is second._worker_manager
+        server = manager.server_process
+        assert server is not None and server.poll() is None
+
+        # Un utilisateur reste : le serveur continue de tourner
+        await first.aclose()
+        assert server.poll() is None
+        await second.aclose()
+        assert server.poll() is not None
+        assert manager._loop is None
+        assert LocalModelWorkerManager._shared.get(fake_ollama['host']) is None
+
+    asyncio.run(scenario())
+
+
+def test_owned_server_is_stopped_at_interpreter_exit(fake_ollama):
+    script = textwrap.dedent(f"""
+        import sys
+        sys.path.insert(0, {ROOT!r})
+        from Core.Providers.LLMProviders.local_worker import LocalModelWorkerManager
+        manager = LocalModelWorkerManager.shared({fake_ollama['host']!r},
+                                                 ollama_binary={fake_ollama['binary']!r},
+                                                 spawn_server=True)
+        manager.generate_sync('fake-model', 'bonjour', timeout=20)
+        print(manager.server_process.pid, flush=True)
+        # Pas de shutdown() explicite : atexit doit arrêter le serveur
+    """)
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    pid = int(result.stdout.strip().splitlines()[-1])
+
+    deadline = time.monotonic() + 5
+    while process_alive(pid) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not process_alive(pid)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+🧪 Cache de réponses aux sites d'appel internes
+
+Sous LLM_CACHE=1, les appels du moteur de mémoire et du parser introspectif
+passent par le cache sans changer leur température : deux appels identiques
+ne coûtent qu'une génération si la température est sous le seuil
+LLM_CACHE_MAX_TEMPERATURE, sinon le cache est contourné.
+"""
+
+import asyncio
+
+import pytest
+
+from Core.IntrospectiveParser.intelligent_parser import IntelligentIntrospectiveParser
+from Core.Providers.LLMProviders.cached_provider import CachedLLMProvider, LLMResponseCache
+from Core.Providers.LLMProviders.llm_provider import LLMProvider, ProviderStatus, ProviderType
+from Core.Providers.LLMProviders.provider_factory import ProviderFactory
+from MemoryEngine.core.fractal_search_engine import FractalSearchEngine
+from MemoryEngine.core.query_enrichment_system import QueryEnrichmentSystem
+from TemporalFractalMemoryEngine.core.fractal_search_engine import (
+    FractalSearchEngine as TemporalFractalSearchEngine
+)
+from TemporalFractalMemoryEngine.core.query_enrichment_system import (
+    QueryEnrichmentSystem as TemporalQueryEnrichmentSystem
+)
+
+
+class CountingProvider(LLMProvider):
+    """Réponse fixe ; compte les générations réelles et leurs paramètres."""
+
+    def __init__(self, content: str, temperature: float = 0.0):
+        super().__init__(ProviderType.LOCAL, {'temperature': temperature})
+        self.model = "fake-model"
+        self.content = content
+        self.calls = 0
+        self.kwargs = []
+
+    async def test_connection(self) -> ProviderStatus:
+        return ProviderStatus(valid=True, provider_type=self.provider_type, capabilities=[])
+
+    async def generate_response(self, prompt: str, **kwargs):
+        self.calls += 1
+        self.kwargs.append(kwargs)
+        return self._create_success_response(self.content, self.model, 0.01)
+
+
+@pytest.fixture(autouse=True)
+def llm_cache(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("LLM_CACHE", "1")
+    monkeypatch.delenv("LLM_CACHE_MAX_TEMPERATURE", raising=False)
+    monkeypatch.setattr(LLMResponseCache, "_shared", {})
+
+
+def call_twice(method, *args):
+    async def scenario():
+        return [await method(*args), await method(*args)]
+    return asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("system_class", [QueryEnrichmentSystem, TemporalQueryEnrichmentSystem])
+def test_query_enrichment_method_choice_is_cached(system_class):
+    provider = CountingProvider("fractal")
+    system = system_class(provider)
+
+    assert call_twice(system._simple_method_choice, "relations entre démons") == ["fractal", "fractal"]
+    assert provider.calls == 1
+
+
+@pytest.mark.parametrize("engine_class", [FractalSearchEngine, TemporalFractalSearchEngine])
+def test_search_type_detection_is_cached(engine_class):
+    provider = CountingProvider("temporal 0.9")
+    engine = engine_class(None, provider)
+
+    first, second = call_twice(engine._detect_search_type, "historique du daemon")
+    assert first.search_type == second.search_type
+    assert provider.calls == 1
+
+
+def test_call_site_temperature_is_unchanged_and_bypasses_cache():
+    provider = CountingProvider("fractal", temperature=0.7)
+    system = QueryEnrichmentSystem(provider)
+
+    call_twice(system._simple_method_choice, "relations entre démons")
+    assert provider.calls == 2
+    assert provider.kwargs == [{}, {}]
+    assert system.llm_provider.get_cache_stats()['bypassed'] == 2
+
+
+INTROSPECTION = ('{"thoughts": [], "actions": [], "observations": [], '
+                 '"decisions": [], "overall_confidence": 0.8}')
+
+
+def test_introspective_parse_bypasses_cache_above_threshold():
+    provider = CountingProvider(INTROSPECTION)
+    parser = IntelligentIntrospectiveParser(provider)
+
+    call_twice(parser.parse_response, "Je pense donc je suis.", "daemon-1", "daemon")
+    assert provider.calls == 2
+    assert [kwargs['temperature'] for kwargs in provider.kwargs] == [0.1, 0.1]
+
+
+def test_introspective_parse_is_cached_under_configured_threshold(monkeypatch):
+    monkeypatch.setenv("LLM_CACHE_MAX_TEMPERATURE", "0.1")
+    provider = CountingProvider(INTROSPECTION)
+    parser = IntelligentIntrospectiveParser(provider)
+
+    first, second = call_twice(parser.parse_response, "Je pense donc je suis.", "daemon-1", "daemon")
+    assert first.overall_confidence == second.overall_confidence == 0.8
+    assert provider.calls == 1
+
+
+def test_call_sites_are_not_wrapped_without_flag(monkeypatch):
+    monkeypatch.setenv("LLM_CACHE", "0")
+    provider = CountingProvider("grep")
+    system = QueryEnrichmentSystem(provider)
+
+    assert system.llm_provider is provider
+    call_twice(system._simple_method_choice, "def main")
+    assert provider.calls == 2
+
+
+def test_factory_threshold_comes_from_flag(monkeypatch):
+    monkeypatch.setenv("LLM_CACHE_MAX_TEMPERATURE", "0.7")
+    provider = ProviderFactory.create_provider("local", model="fake-model")
+
+    assert isinstance(provider, CachedLLMProvider)
+    assert provider.max_temperature == 0.7
+    assert provider._cache_key("prompt", {'temperature': 0.7}) is not None
+    assert provider._cache_key("prompt", {'temperature': 0.9}) is None
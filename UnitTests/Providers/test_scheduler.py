@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+🧪 LLMScheduler : admission, priorités et fusion des appels identiques
+
+Les prompts identiques en cours ne coûtent qu'un appel amont, en réponse
+complète comme en streaming ; une place libérée va à l'attente la plus
+prioritaire.
+"""
+
+import asyncio
+
+import pytest
+
+from Core.Providers.LLMProviders.llm_provider import (
+    LLMProvider, ProviderStatus, ProviderType, StreamingResponseBuilder
+)
+from Core.Providers.LLMProviders.scheduled_provider import LLMScheduler, Priority, ScheduledLLMProvider
+
+
+class GatedProvider(LLMProvider):
+    """
+    Génère l'écho du prompt une fois la porte ouverte ; compte les appels amont.
+    En streaming, le second fragment attend en plus resume.
+    """
+
+    def __init__(self):
+        super().__init__(ProviderType.LOCAL, {'temperature': 0.0})
+        self.model = "fake-model"
+        self.gate = asyncio.Event()
+        self.resume = asyncio.Event()
+        self.calls = []
+        self.closed = 0
+
+    async def test_connection(self) -> ProviderStatus:
+        return ProviderStatus(valid=True, provider_type=self.provider_type, capabilities=[])
+
+    async def generate_response(self, prompt: str, **kwargs):
+        self.calls.append(prompt)
+        await self.gate.wait()
+        return self._create_success_response(f"écho {prompt}", self.model, 0.01)
+
+    async def stream_response(self, prompt: str, **kwargs):
+        self.calls.append(prompt)
+        builder = StreamingResponseBuilder(self.provider_type, self.model, len(prompt))
+        try:
+            await self.gate.wait()
+            yield builder.add("écho ")
+            await self.resume.wait()
+            yield builder.add(prompt)
+            yield builder.finish()
+        finally:
+            self.closed += 1
+
+
+def scheduled(max_in_flight=1):
+    inner = GatedProvider()
+    scheduler = LLMScheduler(max_in_flight=max_in_flight, name="test-scheduler")
+    return inner, scheduler, ScheduledLLMProvider(inner, scheduler=scheduler)
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_identical_prompts_are_coalesced():
+    async def scenario():
+        inner, scheduler, provider = scheduled()
+        tasks = [asyncio.ensure_future(provider.generate_response("même")) for _ in range(3)]
+        await settle()
+        inner.gate.set()
+        responses = await asyncio.gather(*tasks)
+
+        assert inner.calls == ["même"]
+        assert {response.content for response in responses} == {"écho même"}
+        assert sorted(response.metadata['coalesced'] for response in responses) == [False, True, True]
+        assert scheduler.get_stats()['coalesced'] == 2
+
+    asyncio.run(scenario())
+
+
+def test_released_slot_goes_to_highest_priority():
+    async def scenario():
+        inner, scheduler, provider = scheduled()
+        order = []
+
+        async def call(prompt, priority):
+            await provider.generate_response(prompt, priority=priority)
+            order.append(prompt)
+
+        first = asyncio.ensure_future(call("occupe", Priority.NORMAL))
+        await settle()
+        waiting = [asyncio.ensure_future(call(prompt, priority)) for prompt, priority in
+                   [("fond", Priority.BACKGROUND), ("normal", Priority.NORMAL),
+                    ("interactif", Priority.INTERACTIVE)]]
+        await settle()
+        assert scheduler.get_stats()['queue_depth'] == 3
+
+        inner.gate.set()
+        await asyncio.gather(first, *waiting)
+        assert order == ["occupe", "interactif", "normal", "fond"]
+        assert scheduler.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_identical_streams_share_one_upstream_call():
+    async def scenario():
+        inner, scheduler, provider = scheduled()
+        received = [[], []]
+        tasks = [asyncio.ensure_future(provider.generate_streaming("même", on_chunk=chunks.append))
+                 for chunks in received]
+        await settle()
+        inner.gate.set()
+        inner.resume.set()
+        responses = await asyncio.gather(*tasks)
+
+        assert inner.calls == ["même"]
+        assert [response.content for response in responses] == ["écho même", "écho même"]
+        assert [[chunk.content for chunk in chunks] for chunks in received] == [["écho ", "même"]] * 2
+        assert sorted(response.metadata['coalesced'] for response in responses) == [False, True]
+        assert scheduler.in_flight == 0
+        assert inner.closed == 1
+
+    asyncio.run(scenario())
+
+
+def test_late_follower_replays_chunks_already_streamed():
+    async def scenario():
+        inner, scheduler, provider = scheduled()
+        inner.gate.set()
+        leader = provider.stream_response("même")
+        first = await leader.__anext__()
+
+        follower = asyncio.ensure_future(provider.generate_streaming("même"))
+        await settle()
+        inner.resume.set()
+        follower = await follower
+        rest = [chunk async for chunk in leader]
+
+        assert inner.calls == ["même"]
+        assert follower.content == "écho même"
+        assert first.content + rest[0].content == "écho même"
+
+    asyncio.run(scenario())
+
+
+def test_follower_survives_leader_leaving_early():
+    async def scenario():
+        inner, scheduler, provider = scheduled()
+        leader = provider.stream_response("même")
+        inner.gate.set()
+        await leader.__anext__()
+        follower = asyncio.ensure_future(provider.generate_streaming("même"))
+        await settle()
+        await leader.aclose()
+        inner.resume.set()
+
+        response = await follower
+        assert response.content == "écho même"
+        assert inner.calls == ["même"]
+        assert scheduler.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_different_prompts_are_not_coalesced():
+    async def scenario():
+        inner, scheduler, provider = scheduled(max_in_flight=2)
+        inner.gate.set()
+        inner.resume.set()
+        responses = await asyncio.gather(provider.generate_streaming("un"), provider.generate_streaming("deux"))
+
+        assert sorted(inner.calls) == ["deux", "un"]
+        assert [response.content for response in responses] == ["écho un", "écho deux"]
+        assert scheduler.get_stats()['coalesced'] == 0
+
+    asyncio.run(scenario())
+
+
+def test_upstream_error_reaches_every_consumer():
+    class FailingProvider(GatedProvider):
+        async def stream_response(self, prompt: str, **kwargs):
+            self.calls.append(prompt)
+            await self.gate.wait()
+            raise RuntimeError("amont indisponible")
+            yield  # pragma: no cover
+
+    async def scenario():
+        inner = FailingProvider()
+        scheduler = LLMScheduler(max_in_flight=1, name="test-scheduler-errors")
+        provider = ScheduledLLMProvider(inner, scheduler=scheduler)
+        tasks = [asyncio.ensure_future(provider.generate_streaming("même")) for _ in range(2)]
+        await settle()
+        inner.gate.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert inner.calls == ["même"]
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert scheduler.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("value, expected", [(None, Priority.NORMAL), ("interactive", Priority.INTERACTIVE),
+                                             (2, Priority.BACKGROUND)])
+def test_priority_coercion(value, expected):
+    assert Priority.coerce(value) is expected
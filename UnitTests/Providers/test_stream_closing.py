@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+🧪 Fermeture des flux : generate_streaming et providers enveloppants
+
+Dès le retour de generate_streaming(), les blocs finally du flux (place de
+l'ordonnanceur, nettoyage du provider enveloppé) ont été exécutés, sans
+attendre le ramasse-miettes ni un tour de boucle.
+"""
+
+import asyncio
+
+from Core.Providers.LLMProviders.cached_provider import CachedLLMProvider, LLMResponseCache
+from Core.Providers.LLMProviders.llm_provider import (
+    LLMProvider, ProviderStatus, ProviderType, StreamingResponseBuilder
+)
+from Core.Providers.LLMProviders.scheduled_provider import LLMScheduler, ScheduledLLMProvider
+
+
+class FakeStreamingProvider(LLMProvider):
+    """Flux de trois fragments ; compte les flux ouverts et fermés."""
+
+    def __init__(self):
+        super().__init__(ProviderType.LOCAL, {'temperature': 0.0})
+        self.model = "fake-model"
+        self.opened = 0
+        self.closed = 0
+
+    async def test_connection(self) -> ProviderStatus:
+        return ProviderStatus(valid=True, provider_type=self.provider_type, capabilities=[])
+
+    async def generate_response(self, prompt: str, **kwargs):
+        raise NotImplementedError
+
+    async def stream_response(self, prompt: str, **kwargs):
+        self.opened += 1
+        builder = StreamingResponseBuilder(self.provider_type, self.model, len(prompt))
+        try:
+            for word in ("un ", "deux ", "trois"):
+                chunk = builder.add(word)
+                if chunk is not None:
+                    yield chunk
+            yield builder.finish()
+            # Comme un provider qui attend la fin de son processus après le fragment final
+            await asyncio.sleep(0)
+        finally:
+            self.closed += 1
+
+
+def test_generate_streaming_releases_scheduler_slot_before_returning():
+    async def scenario():
+        inner = FakeStreamingProvider()
+        scheduler = LLMScheduler(max_in_flight=1, name="test-stream-closing")
+        provider = ScheduledLLMProvider(inner, scheduler=scheduler)
+        chunks = []
+
+        response = await provider.generate_streaming("prompt", on_chunk=chunks.append)
+        assert response.content == "un deux trois"
+        assert [chunk.content for chunk in chunks] == ["un ", "deux ", "trois"]
+        assert scheduler.in_flight == 0
+        assert (inner.opened, inner.closed) == (1, 1)
+
+        # La place libérée sert immédiatement l'appel suivant
+        await asyncio.wait_for(provider.generate_streaming("suivant"), timeout=1)
+        assert scheduler.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_cached_wrapper_closes_inner_streams(tmp_path):
+    async def scenario():
+        inner = FakeStreamingProvider()
+        scheduler = LLMScheduler(max_in_flight=1, name="test-stream-closing-cache")
+        cache = LLMResponseCache(cache_dir=str(tmp_path / "llm_cache"))
+        provider = CachedLLMProvider(ScheduledLLMProvider(inner, scheduler=scheduler), cache=cache)
+
+        first = await provider.generate_streaming("prompt")
+        assert scheduler.in_flight == 0
+        assert inner.closed == 1
+
+        second = await provider.generate_streaming("prompt")
+        assert second.content == first.content
+        assert inner.opened == 1
+
+    asyncio.run(scenario())
+
+
+def test_iterate_with_timeout_closes_source_on_early_exit():
+    closed = []
+
+    async def source():
+        try:
+            for index in range(10):
+                yield index
+        finally:
+            closed.append(True)
+
+    async def scenario():
+        provider = FakeStreamingProvider()
+        for timeout in (None, 5.0):
+            stream = provider._iterate_with_timeout(source(), timeout)
+            async for item in stream:
+                if item == 2:
+                    break
+            await stream.aclose()
+        assert closed == [True, True]
+
+    asyncio.run(scenario())